@@ -0,0 +1,106 @@
+-- Migration: Keep the artists_search FTS5 index in sync (maintained by scripts/artist-search.py)
+-- Run this with: wrangler d1 execute gearsh_db --file="database/add_artists_search_sync.sql" --remote
+-- Then fill it with: python scripts/artist-search.py --db <replica> rebuild
+
+-- schema.sql declared artists_search with content='artist_profiles', but
+-- display_name, bio and location live on users, so every read of it failed
+-- and nothing ever wrote to it. Recreate it over a view joining the two,
+-- plus the unclaimed showcase listings.
+DROP TABLE IF EXISTS artists_search;
+
+-- Showcase listings (functions/api/sa-showcase-data.js), loaded by the tool.
+-- They are indexed under negative rowids so they never clash with profiles.
+CREATE TABLE IF NOT EXISTS showcase_search (
+  id INTEGER PRIMARY KEY,
+  username TEXT UNIQUE NOT NULL,
+  display_name TEXT NOT NULL,
+  bio TEXT,
+  category TEXT,
+  genre TEXT,
+  location TEXT,
+  skills TEXT,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
+
+CREATE VIEW IF NOT EXISTS artists_search_source AS
+SELECT ap.rowid AS rid, ap.user_id, u.display_name, u.bio, ap.category, ap.genre, u.location, ap.skills
+FROM artist_profiles ap
+LEFT JOIN users u ON u.id = ap.user_id
+UNION ALL
+SELECT -s.id, NULL, s.display_name, s.bio, s.category, s.genre, s.location, s.skills
+FROM showcase_search s;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS artists_search USING fts5(
+  user_id UNINDEXED,
+  display_name,
+  bio,
+  category,
+  genre,
+  location,
+  skills,
+  content='artists_search_source',
+  content_rowid='rid',
+  tokenize='unicode61 remove_diacritics 2',
+  prefix='2 3'
+);
+
+-- External content: every change must delete the exact values that were
+-- indexed, then insert the new ones.
+
+CREATE TRIGGER IF NOT EXISTS artists_search_profile_insert AFTER INSERT ON artist_profiles BEGIN
+  INSERT INTO artists_search (rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT new.rowid, new.user_id, u.display_name, u.bio, new.category, new.genre, u.location, new.skills
+  FROM (SELECT 1) LEFT JOIN users u ON u.id = new.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artists_search_profile_delete AFTER DELETE ON artist_profiles BEGIN
+  INSERT INTO artists_search (artists_search, rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT 'delete', old.rowid, old.user_id, u.display_name, u.bio, old.category, old.genre, u.location, old.skills
+  FROM (SELECT 1) LEFT JOIN users u ON u.id = old.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artists_search_profile_update AFTER UPDATE OF user_id, category, genre, skills ON artist_profiles BEGIN
+  INSERT INTO artists_search (artists_search, rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT 'delete', old.rowid, old.user_id, u.display_name, u.bio, old.category, old.genre, u.location, old.skills
+  FROM (SELECT 1) LEFT JOIN users u ON u.id = old.user_id;
+  INSERT INTO artists_search (rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT new.rowid, new.user_id, u.display_name, u.bio, new.category, new.genre, u.location, new.skills
+  FROM (SELECT 1) LEFT JOIN users u ON u.id = new.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artists_search_user_update AFTER UPDATE OF display_name, bio, location ON users BEGIN
+  INSERT INTO artists_search (artists_search, rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT 'delete', ap.rowid, ap.user_id, old.display_name, old.bio, ap.category, ap.genre, old.location, ap.skills
+  FROM artist_profiles ap WHERE ap.user_id = old.id;
+  INSERT INTO artists_search (rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT ap.rowid, ap.user_id, new.display_name, new.bio, ap.category, ap.genre, new.location, ap.skills
+  FROM artist_profiles ap WHERE ap.user_id = new.id;
+END;
+
+-- Runs before the ON DELETE CASCADE removes the profile, whose own trigger
+-- then sees no user row; re-index with the user fields empty to match.
+CREATE TRIGGER IF NOT EXISTS artists_search_user_delete BEFORE DELETE ON users BEGIN
+  INSERT INTO artists_search (artists_search, rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT 'delete', ap.rowid, ap.user_id, old.display_name, old.bio, ap.category, ap.genre, old.location, ap.skills
+  FROM artist_profiles ap WHERE ap.user_id = old.id;
+  INSERT INTO artists_search (rowid, user_id, display_name, bio, category, genre, location, skills)
+  SELECT ap.rowid, ap.user_id, NULL, NULL, ap.category, ap.genre, NULL, ap.skills
+  FROM artist_profiles ap WHERE ap.user_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artists_search_showcase_insert AFTER INSERT ON showcase_search BEGIN
+  INSERT INTO artists_search (rowid, user_id, display_name, bio, category, genre, location, skills)
+  VALUES (-new.id, NULL, new.display_name, new.bio, new.category, new.genre, new.location, new.skills);
+END;
+
+CREATE TRIGGER IF NOT EXISTS artists_search_showcase_delete AFTER DELETE ON showcase_search BEGIN
+  INSERT INTO artists_search (artists_search, rowid, user_id, display_name, bio, category, genre, location, skills)
+  VALUES ('delete', -old.id, NULL, old.display_name, old.bio, old.category, old.genre, old.location, old.skills);
+END;
+
+CREATE TRIGGER IF NOT EXISTS artists_search_showcase_update AFTER UPDATE ON showcase_search BEGIN
+  INSERT INTO artists_search (artists_search, rowid, user_id, display_name, bio, category, genre, location, skills)
+  VALUES ('delete', -old.id, NULL, old.display_name, old.bio, old.category, old.genre, old.location, old.skills);
+  INSERT INTO artists_search (rowid, user_id, display_name, bio, category, genre, location, skills)
+  VALUES (-new.id, NULL, new.display_name, new.bio, new.category, new.genre, new.location, new.skills);
+END;
@@ -0,0 +1,22 @@
+-- Migration: Materialized following feed (maintained by scripts/follower-feed.py)
+-- Run this with: wrangler d1 execute gearsh_db --file="database/add_follower_feed.sql" --remote
+
+-- One row per (follower, public activity) for artists below the fan-out cap.
+-- The primary key is the read path: WHERE follower_user_id = ? AND created_at < ?
+CREATE TABLE IF NOT EXISTS follower_feed (
+  follower_user_id TEXT NOT NULL,
+  created_at TEXT NOT NULL,
+  activity_id TEXT NOT NULL,
+  artist_id TEXT NOT NULL,
+  PRIMARY KEY (follower_user_id, created_at, activity_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_follower_feed_artist ON follower_feed(artist_id, follower_user_id);
+
+-- Artists with too many followers to fan out to; their activities are
+-- pulled at read time from idx_artist_activities_artist instead.
+CREATE TABLE IF NOT EXISTS feed_pull_artists (
+  artist_id TEXT PRIMARY KEY,
+  follower_count INTEGER NOT NULL,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
@@ -0,0 +1,16 @@
+-- Migration: Precomputed artist coordinates (maintained by scripts/geocode-locations.py)
+-- Run this with: wrangler d1 execute gearsh_db --file="database/add_location_geohash.sql" --remote
+
+-- users.location is free text; the geocoder resolves it against
+-- scripts/sa-gazetteer.csv once instead of location-utils.js on every request.
+-- location_geocoded is the normalized location the row was resolved from, so
+-- reruns only touch rows whose location changed. A bare country gets
+-- coordinates but no geohash.
+ALTER TABLE users ADD COLUMN location_lat REAL;
+ALTER TABLE users ADD COLUMN location_lng REAL;
+ALTER TABLE users ADD COLUMN location_geohash TEXT;
+ALTER TABLE users ADD COLUMN location_geocoded TEXT;
+
+-- Nearby queries are prefix range scans over neighbouring cells:
+--   WHERE (location_geohash >= 'ke7m' AND location_geohash < 'ke7m~') OR ...
+CREATE INDEX IF NOT EXISTS idx_users_location_geohash ON users(location_geohash) WHERE location_geohash IS NOT NULL;
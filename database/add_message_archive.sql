@@ -0,0 +1,41 @@
+-- Migration: Message indexes and cold-storage archive bookkeeping (maintained by scripts/archive-messages.py)
+-- Run this with: wrangler d1 execute gearsh_db --file="database/add_message_archive.sql" --remote
+
+-- Conversation view: latest message per booking, and the thread itself in order.
+CREATE INDEX IF NOT EXISTS idx_messages_booking_created ON messages(booking_id, created_at);
+
+-- Unread counts per conversation (booking_id, receiver_id, is_read = 0).
+CREATE INDEX IF NOT EXISTS idx_messages_unread ON messages(booking_id, receiver_id, is_read);
+
+-- Keyset order the archiver pages through.
+CREATE INDEX IF NOT EXISTS idx_messages_created ON messages(created_at, id);
+
+-- One row per archive file: a day of messages older than the retention
+-- window, as gzipped JSON lines. A day archived again later (a message
+-- backdated past the cutoff) gets the next part number.
+-- status: written -> verified -> deleted
+CREATE TABLE IF NOT EXISTS message_archive (
+  day TEXT NOT NULL,
+  part INTEGER NOT NULL DEFAULT 1,
+  path TEXT NOT NULL,
+  rows INTEGER NOT NULL,
+  first_id TEXT,
+  last_id TEXT,
+  sha256 TEXT NOT NULL,
+  file_sha256 TEXT NOT NULL,
+  bytes INTEGER NOT NULL,
+  status TEXT NOT NULL DEFAULT 'written',
+  archived_at TEXT DEFAULT (datetime('now')),
+  deleted_at TEXT,
+  PRIMARY KEY (day, part)
+);
+
+-- Which archive files hold a thread: a booking_id, or 'dm:<user>:<user>'
+-- for messages outside a booking.
+CREATE TABLE IF NOT EXISTS message_archive_threads (
+  thread TEXT NOT NULL,
+  day TEXT NOT NULL,
+  part INTEGER NOT NULL,
+  rows INTEGER NOT NULL,
+  PRIMARY KEY (thread, day, part)
+);
@@ -0,0 +1,22 @@
+-- Migration: Escrow balance snapshots and reconciliation indexes (maintained by scripts/escrow-ledger.py)
+-- Run this with: wrangler d1 execute gearsh_db --file="database/add_payment_reconciliation.sql" --remote
+
+-- Running totals of escrow_ledger per booking, folded in up to the
+-- high-water mark kept in job_checkpoints ('escrow-balances'). A current
+-- balance is this row plus the ledger entries above the mark.
+CREATE TABLE IF NOT EXISTS escrow_balances (
+  booking_id TEXT PRIMARY KEY,
+  held REAL NOT NULL DEFAULT 0,
+  released REAL NOT NULL DEFAULT 0,
+  refunded REAL NOT NULL DEFAULT 0,
+  entries INTEGER NOT NULL DEFAULT 0,
+  last_rowid INTEGER NOT NULL DEFAULT 0,
+  last_event_at TEXT,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Holds by payment, for matching the ledger against payments.
+CREATE INDEX IF NOT EXISTS idx_escrow_ledger_payment ON escrow_ledger(payment_id);
+
+-- Payments by order: reconciliation, and the latest-payment lookup in fulfillTicketOrder().
+CREATE INDEX IF NOT EXISTS idx_ticket_payments_order ON ticket_payments(ticket_order_id, created_at);
@@ -0,0 +1,12 @@
+-- Migration: Indexes for expiring stale ticket orders (scripts/sweep-expired-orders.py)
+-- Run this with: wrangler d1 execute gearsh_db --file="database/add_ticket_expiry_indexes.sql" --remote
+
+-- Serves WHERE status = 'pending_payment' AND expires_at < ? ORDER BY expires_at,
+-- in the sweeper and in expireStaleOrders().
+CREATE INDEX IF NOT EXISTS idx_ticket_orders_status_expires ON ticket_orders(status, expires_at);
+
+-- Order items by order, for releasing inventory of the expired orders.
+CREATE INDEX IF NOT EXISTS idx_ticket_order_items_order ON ticket_order_items(order_id);
+
+-- Oldest un-notified waitlist entries per event.
+CREATE INDEX IF NOT EXISTS idx_gig_waitlist_pending ON gig_waitlist(event_id, notified, created_at);
@@ -54,9 +54,17 @@ function Build-FlutterWeb {
     # Get dependencies
     flutter pub get
 
+    # Share cards and static showcase profiles land in web/, which the build copies
+    python scripts/og-cards.py
+    python scripts/prerender-showcase.py
+
     # Build for web with optimizations
     flutter build web --release --web-renderer canvaskit
 
+    # Subset the Syne fonts, then hashed names, .gz/.br siblings and cache rules for the build output
+    python scripts/subset-fonts.py $WebBuildDir
+    python scripts/optimize-web-build.py $WebBuildDir
+
     Write-Host "Flutter web build complete!" -ForegroundColor Green
 }
 
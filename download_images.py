@@ -11,6 +11,10 @@ from pathlib import Path
 from PIL import Image
 from io import BytesIO
 import shutil
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from imaging import flatten_rgb, save_image
 
 # Direct image sources for artists (artist name -> image URL)
 IMAGE_SOURCES = {
@@ -40,17 +44,8 @@ def download_and_resize(url, filename, size=400):
         response = requests.get(url, headers=HEADERS, timeout=15)
         response.raise_for_status()
 
-        # Open image
-        img = Image.open(BytesIO(response.content))
-
-        # Convert to RGB if needed
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'RGBA':
-                background.paste(img, mask=img.split()[-1])
-            else:
-                background.paste(img)
-            img = background
+        # Open image and convert to RGB if needed
+        img = flatten_rgb(Image.open(BytesIO(response.content)))
 
         # Resize to 400x400
         img = img.resize((size, size), Image.Resampling.LANCZOS)
@@ -58,11 +53,7 @@ def download_and_resize(url, filename, size=400):
         filepath = ARTISTS_DIR / filename
 
         # Determine format from extension
-        ext = filename.split('.')[-1].lower()
-        if ext == 'webp':
-            img.save(filepath, 'WEBP', quality=90)
-        else:
-            img.save(filepath, 'JPEG' if ext == 'jpg' else 'PNG', quality=90)
+        save_image(img, filepath)
 
         print(f"  ✅ Saved: {filename}")
         return True
@@ -70,20 +61,6 @@ def download_and_resize(url, filename, size=400):
         print(f"  ❌ Error: {str(e)}")
         return False
 
-def create_placeholder(filename, artist_name):
-    """Create a placeholder image if download fails"""
-    try:
-        # Create simple colored placeholder
-        img = Image.new('RGB', (400, 400), color=(70, 130, 180))
-
-        filepath = ARTISTS_DIR / filename
-        img.save(filepath, 'JPEG', quality=90)
-        print(f"  📍 Created placeholder: {filename}")
-        return True
-    except Exception as e:
-        print(f"  ❌ Placeholder failed: {str(e)}")
-        return False
-
 def main():
     print("=" * 70)
     print("🎵 GEARSH ARTIST IMAGE DOWNLOADER")
@@ -110,20 +87,19 @@ def main():
             downloaded += 1
             time.sleep(1)  # Rate limiting
         else:
-            print(f"   Trying placeholder...")
-            if create_placeholder(filename, filename.replace('.jpg', '')):
-                failed += 1
-            else:
-                failed += 1
+            # No flat-colour stand-in on disk: the showcase falls back to
+            # artists.png and paints its blur placeholder from placeholders.json
+            failed += 1
 
     print("\n" + "=" * 70)
     print(f"✅ Downloaded: {downloaded} images")
-    print(f"❌ Failed/Placeholders: {failed} images")
+    print(f"❌ Failed (using fallback): {failed} images")
     print("=" * 70)
     print("\n📌 FOR REMAINING IMAGES:")
     print("   1. Run: search_artist_images.bat")
     print("   2. Manually download good quality images")
     print("   3. Save with correct filenames to: assets/images/artists/")
+    print("   4. Run: python scripts/lqip.py to refresh blur placeholders")
     print("=" * 70)
 
 if __name__ == "__main__":
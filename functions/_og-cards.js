@@ -0,0 +1,4 @@
+// Auto-generated by scripts/og-cards.py — pre-rendered 1200x630 share cards
+// OG_CARDS[username] = path under the site root
+export const OG_CARDS = {
+};
@@ -1,3 +1,5 @@
+import { OG_CARDS } from './_og-cards.js';
+
 const SITE_ORIGIN = 'https://thegearsh.com';
 export const DEFAULT_OG_IMAGE = `${SITE_ORIGIN}/icons/og-banner.png`;
 
@@ -18,6 +20,12 @@ export function absoluteUrl(request, path) {
   return new URL(normalized, `${base.protocol}//${base.host}`).toString();
 }
 
+/** Pre-rendered 1200x630 card for a showcase artist (scripts/og-cards.py), or null. */
+export function artistCardUrl(username) {
+  const path = OG_CARDS[String(username || '').toLowerCase()];
+  return path ? `${SITE_ORIGIN}${path}` : null;
+}
+
 export function resolveMediaUrl(request, path) {
   if (!path) return DEFAULT_OG_IMAGE;
   if (/^https?:\/\//i.test(path)) return path;
@@ -10,6 +10,7 @@ import {
   ensureAuthTables,
   formatUserResponse,
 } from '../auth-utils.js';
+import { refreshUserLocation } from '../location-utils.js';
 
 export async function onRequestPost(context) {
   try {
@@ -101,6 +102,8 @@ async function handleRegister(context, body) {
       country
     ).run();
 
+    await refreshUserLocation(context.env.DB, userId);
+
     if (user_type === 'artist') {
       const artistId = `artist_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
       await context.env.DB.prepare(`
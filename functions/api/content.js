@@ -7,6 +7,30 @@ import { corsPreflightResponse, jsonResponse } from './auth-utils.js';
 import { ensureRenovationTables } from './renovation-schema.js';
 import { ensureContentSeeded, DEFAULT_COPY, DEFAULT_THEME } from './content-seed.js';
 
+// Bundle exported by scripts/publish-content.py and shipped with the last deploy.
+// It is only served while content_live still carries the version it was cut from;
+// a founder publish or rollback since then changes the row, so D1 answers instead.
+async function loadPublishedContent(env, requestUrl) {
+  if (!env.ASSETS) return null;
+  try {
+    const pointer = await env.ASSETS.fetch(new URL('/content/live.json', requestUrl));
+    if (!pointer.ok) return null;
+    const { version, published_at: publishedAt, url } = await pointer.json();
+
+    const live = await env.DB.prepare(
+      `SELECT version, published_at FROM content_live WHERE id = 'live'`
+    ).first();
+    if (!live || (live.version || 1) !== version || (live.published_at || null) !== (publishedAt || null)) {
+      return null;
+    }
+
+    const bundle = await env.ASSETS.fetch(new URL(url, requestUrl));
+    return bundle.ok ? await bundle.json() : null;
+  } catch (_) {
+    return null;
+  }
+}
+
 async function loadLiveContent(db) {
   await ensureRenovationTables(db);
   await ensureContentSeeded(db);
@@ -33,7 +57,8 @@ export async function onRequestGet(context) {
   try {
     const url = new URL(context.request.url);
     const path = url.pathname.replace(/\/+$/, '');
-    const content = await loadLiveContent(context.env.DB);
+    const content = await loadPublishedContent(context.env, context.request.url)
+      || await loadLiveContent(context.env.DB);
 
     if (path.endsWith('/copy')) {
       const locale = url.searchParams.get('locale') || 'en';
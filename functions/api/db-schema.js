@@ -55,10 +55,19 @@ export async function ensureMarketplaceTables(db) {
   await db.prepare(`
     CREATE INDEX IF NOT EXISTS idx_escrow_booking ON escrow_ledger(booking_id);
   `).run();
+  await db.prepare(`
+    CREATE INDEX IF NOT EXISTS idx_escrow_ledger_payment ON escrow_ledger(payment_id);
+  `).run();
   await db.prepare(`
     CREATE INDEX IF NOT EXISTS idx_disputes_booking ON disputes(booking_id);
   `).run();
   await db.prepare(`
     CREATE INDEX IF NOT EXISTS idx_messages_booking ON messages(booking_id);
   `).run();
+  await db.prepare(`
+    CREATE INDEX IF NOT EXISTS idx_messages_booking_created ON messages(booking_id, created_at);
+  `).run();
+  await db.prepare(`
+    CREATE INDEX IF NOT EXISTS idx_messages_unread ON messages(booking_id, receiver_id, is_read);
+  `).run();
 }
@@ -1,4 +1,5 @@
 import { hashPassword, buildProfileUrl } from './auth-utils.js';
+import { refreshUserLocation } from './location-utils.js';
 
 export const RIX_ELTON = {
   userId: 'user_demo_rixelton',
@@ -100,6 +101,8 @@ export async function seedRixElton(db) {
     ).run();
   }
 
+  await refreshUserLocation(db, RIX_ELTON.userId);
+
   const profileExists = await db.prepare(`
     SELECT id FROM artist_profiles WHERE id = ? OR user_id = ?
   `).bind(RIX_ELTON.artistId, RIX_ELTON.userId).first();
@@ -1,4 +1,8 @@
 // SA place coordinates for distance sorting from free-text artist locations.
+// scripts/geocode-locations.py resolves locations offline into users.location_lat/lng/geohash
+// and sa-showcase-geo.js; SA_PLACES is the fallback for rows it has not reached yet.
+
+import { SA_SHOWCASE_GEO } from './sa-showcase-geo.js';
 
 const SA_PLACES = [
   { keys: ['johannesburg', 'joburg', 'jhb', 'sandton', 'midrand', 'randburg', 'roodepoort'], lat: -26.2041, lng: 28.0473 },
@@ -31,6 +35,88 @@ const SA_PLACES = [
 
 const SA_COUNTRY_TOKENS = new Set(['south africa', 'za', 'rsa']);
 
+const SHOWCASE_COORDS = new Map(
+  SA_SHOWCASE_GEO.map(([geohash, username, lat, lng]) => [username, { lat, lng, geohash }])
+);
+
+// Same encoding and precision as scripts/geocode-locations.py
+const GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz';
+const GEOHASH_PRECISION = 7;
+
+export const NEARBY_RADIUS_KM = 100;
+
+let locationColumnsEnsured = false;
+
+export async function ensureLocationColumns(db) {
+  if (locationColumnsEnsured) return;
+  for (const column of ['location_lat REAL', 'location_lng REAL', 'location_geohash TEXT', 'location_geocoded TEXT']) {
+    try {
+      await db.prepare(`ALTER TABLE users ADD COLUMN ${column}`).run();
+    } catch (_) {}
+  }
+  await db.prepare(`
+    CREATE INDEX IF NOT EXISTS idx_users_location_geohash
+    ON users(location_geohash) WHERE location_geohash IS NOT NULL
+  `).run();
+  locationColumnsEnsured = true;
+}
+
+export function geohashEncode(lat, lng, precision = GEOHASH_PRECISION) {
+  let latLo = -90, latHi = 90, lngLo = -180, lngHi = 180;
+  let hash = '', bits = 0, ch = 0, even = true;
+  while (hash.length < precision) {
+    if (even) {
+      const mid = (lngLo + lngHi) / 2;
+      ch = (ch << 1) | (lng >= mid ? 1 : 0);
+      if (lng >= mid) lngLo = mid; else lngHi = mid;
+    } else {
+      const mid = (latLo + latHi) / 2;
+      ch = (ch << 1) | (lat >= mid ? 1 : 0);
+      if (lat >= mid) latLo = mid; else latHi = mid;
+    }
+    even = !even;
+    if (++bits === 5) {
+      hash += GEOHASH_BASE32[ch];
+      bits = 0;
+      ch = 0;
+    }
+  }
+  return hash;
+}
+
+function geohashCellSize(precision) {
+  const lngBits = Math.ceil((5 * precision) / 2);
+  const latBits = Math.floor((5 * precision) / 2);
+  return { lat: 180 / 2 ** latBits, lng: 360 / 2 ** lngBits };
+}
+
+/**
+ * [lo, hi) geohash ranges covering everything within radiusKm of a point: the
+ * 3x3 block of the smallest cells at least radiusKm wide. Each range is an
+ * index range scan of idx_users_location_geohash.
+ */
+export function geohashRanges(lat, lng, radiusKm) {
+  let precision = 1;
+  for (let p = GEOHASH_PRECISION; p > 0; p -= 1) {
+    const size = geohashCellSize(p);
+    const km = Math.min(size.lat * 111.32, size.lng * 111.32 * Math.cos((lat * Math.PI) / 180));
+    if (km >= radiusKm) {
+      precision = p;
+      break;
+    }
+  }
+  const size = geohashCellSize(precision);
+  const cells = new Set();
+  for (const dy of [-1, 0, 1]) {
+    for (const dx of [-1, 0, 1]) {
+      const cellLat = Math.max(-90, Math.min(90, lat + dy * size.lat));
+      const cellLng = ((lng + dx * size.lng + 540) % 360) - 180;
+      cells.add(geohashEncode(cellLat, cellLng, precision));
+    }
+  }
+  return [...cells].sort().map((cell) => [cell, `${cell}~`]);
+}
+
 export function normalizePlaceText(value) {
   return String(value || '').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
 }
@@ -39,7 +125,7 @@ export function isSouthAfricaCountry(country) {
   return SA_COUNTRY_TOKENS.has(normalizePlaceText(country));
 }
 
-export function resolvePlaceCoords(location, country) {
+function matchPlace(location, country) {
   const hay = normalizePlaceText([location, country].filter(Boolean).join(' '));
   if (!hay) return null;
 
@@ -51,9 +137,51 @@ export function resolvePlaceCoords(location, country) {
       }
     }
   }
+  return best;
+}
+
+export function resolvePlaceCoords(location, country) {
+  const best = matchPlace(location, country);
   return best ? { lat: best.lat, lng: best.lng } : null;
 }
 
+/**
+ * Re-derive users.location_lat/lng/geohash after a write to location or country, so a
+ * row never keeps the coordinates of its old location and new artists show up in
+ * sort=nearby straight away. The showcase seeder passes { showcase: true } to take
+ * the artist's entry in sa-showcase-geo.js instead; like the offline geocoder, a bare country gets no geohash.
+ * location_geocoded is cleared so scripts/geocode-locations.py refines the
+ * row against its gazetteer on its next run.
+ */
+export async function refreshUserLocation(db, userId, { showcase = false } = {}) {
+  await ensureLocationColumns(db);
+  const user = await db.prepare(
+    `SELECT username, location, country FROM users WHERE id = ?`
+  ).bind(userId).first();
+  if (!user) return;
+
+  let coords = showcase
+    ? SHOWCASE_COORDS.get(String(user.username || '').toLowerCase()) || null
+    : null;
+  if (!coords) {
+    // The location text first, as the offline geocoder does: "Soweto, South Africa" is Soweto
+    const best = matchPlace(user.location) || matchPlace(null, user.country);
+    if (best) {
+      coords = {
+        lat: best.lat,
+        lng: best.lng,
+        geohash: SA_COUNTRY_TOKENS.has(best.key) ? null : geohashEncode(best.lat, best.lng),
+      };
+    }
+  }
+
+  await db.prepare(`
+    UPDATE users
+    SET location_lat = ?, location_lng = ?, location_geohash = ?, location_geocoded = NULL
+    WHERE id = ?
+  `).bind(coords?.lat ?? null, coords?.lng ?? null, coords?.geohash ?? null, userId).run();
+}
+
 export function haversineKm(lat1, lng1, lat2, lng2) {
   const toRad = (deg) => (deg * Math.PI) / 180;
   const dLat = toRad(lat2 - lat1);
@@ -63,9 +191,19 @@ export function haversineKm(lat1, lng1, lat2, lng2) {
   return 6371 * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
 }
 
+export function artistCoords(artist) {
+  const lat = artist.location_lat;
+  const lng = artist.location_lng;
+  if (lat != null && lng != null && Number.isFinite(Number(lat)) && Number.isFinite(Number(lng))) {
+    return { lat: Number(lat), lng: Number(lng) };
+  }
+  return SHOWCASE_COORDS.get(String(artist.username || '').toLowerCase())
+    || resolvePlaceCoords(artist.location, artist.country);
+}
+
 export function artistDistanceKm(artist, userLat, userLng) {
   if (!Number.isFinite(userLat) || !Number.isFinite(userLng)) return null;
-  const coords = resolvePlaceCoords(artist.location, artist.country);
+  const coords = artistCoords(artist);
   if (!coords) {
     if (artist.country && !isSouthAfricaCountry(artist.country)) return 12000;
     return null;
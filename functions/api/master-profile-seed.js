@@ -2,6 +2,7 @@
 import { hashPassword } from './auth-utils.js';
 import { ensureMasterProfileColumns } from './master-profile-schema.js';
 import { GEARSH_DEFAULT, GEARSH_USERNAME, buildAvailabilitySlots } from './master-profile-data.js';
+import { refreshUserLocation } from './location-utils.js';
 
 function newId(prefix) {
   return prefix + '_' + Date.now() + '_' + Math.random().toString(36).slice(2, 9);
@@ -83,6 +84,7 @@ export async function seedGearshMasterProfile(db, founderEmail) {
       now,
       now
     ).run();
+    await refreshUserLocation(db, userId);
     user = { id: userId, username: GEARSH_USERNAME };
   } else if (!user.username || user.username.toLowerCase() !== GEARSH_USERNAME) {
     await db.prepare(`
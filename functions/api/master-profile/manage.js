@@ -3,6 +3,7 @@
 import { jsonResponse, corsPreflightResponse, requireAuth } from '../auth-utils.js';
 import { ensureMasterProfileColumns, isMasterProfile } from '../master-profile-schema.js';
 import { GEARSH_USERNAME } from '../master-profile-data.js';
+import { refreshUserLocation } from '../location-utils.js';
 
 export async function onRequestPatch(context) {
   try {
@@ -47,6 +48,10 @@ export async function onRequestPatch(context) {
         now,
         auth.userId
       ).run();
+
+      if (u.location) {
+        await refreshUserLocation(context.env.DB, auth.userId);
+      }
     }
 
     if (body.profile && typeof body.profile === 'object') {
@@ -11,6 +11,7 @@ import {
   categoryFromSkills,
   parseSkills,
 } from './auth-utils.js';
+import { refreshUserLocation } from './location-utils.js';
 
 export async function ensureOnboardingTables(db) {
   await ensureAuthTables(db);
@@ -315,6 +316,10 @@ export async function saveProfile(context, body) {
     auth.userId
   ).run();
 
+  if (location !== undefined || country !== undefined) {
+    await refreshUserLocation(context.env.DB, auth.userId);
+  }
+
   const skillValue = skills !== undefined
     ? (Array.isArray(skills) ? JSON.stringify(skills) : skills)
     : null;
@@ -1,6 +1,7 @@
 import { hashPassword, buildProfileUrl } from './auth-utils.js';
 import { SA_SHOWCASE_ARTISTS, PRIORITY_SHOWCASE_USERNAMES } from './sa-showcase-data.js';
 import { ensureDemoColumns } from './demo-artists.js';
+import { refreshUserLocation } from './location-utils.js';
 import {
   getBookingFee,
   resolveShowcaseImage,
@@ -114,6 +115,8 @@ export async function seedShowcaseArtist(db, artist, passwordHash) {
     ).run();
   }
 
+  await refreshUserLocation(db, resolvedUserId, { showcase: true });
+
   const profileExists = await db.prepare(`
     SELECT id FROM artist_profiles WHERE id = ? OR user_id = ?
   `).bind(artistId, resolvedUserId).first();
@@ -0,0 +1,130 @@
+// Auto-generated by scripts/geocode-locations.py from sa-showcase-data.js and scripts/sa-gazetteer.csv
+// [geohash, username, lat, lng], sorted by geohash
+export const SA_SHOWCASE_GEO = [
+  ['k3vp520', 'die-antwoord', -33.9249, 18.4241],
+  ['k3vp520', 'gemini-major', -33.9249, 18.4241],
+  ['k3vp520', 'inxolo-m', -33.9249, 18.4241],
+  ['k3vp520', 'jurie-matthee', -33.9249, 18.4241],
+  ['k3vp520', 'lukhanyo-mdingi', -33.9249, 18.4241],
+  ['k3vp520', 'lunatik', -33.9249, 18.4241],
+  ['k3vp520', 'megan-woods', -33.9249, 18.4241],
+  ['k3vp520', 'the-kiffness', -33.9249, 18.4241],
+  ['kd5u5js', 'lloyiso', -33.0153, 27.9116],
+  ['kd6b30w', 'babalwa-m', -32.2968, 26.4194],
+  ['kd6b30w', 'empress-ngqama', -32.2968, 26.4194],
+  ['kd74e91', 'prince-kaybee', -31.8976, 26.8753],
+  ['kdcse4n', 'boohle', -28.7282, 24.7499],
+  ['kdty3xu', 'nomcebo-zikode', -29.796, 30.6586],
+  ['kdvjt9g', 'blaq-diamond', -28.5539, 29.7784],
+  ['kdvvxn1', 'big-zulu', -28.5306, 30.8958],
+  ['kdvvxn1', 'dumi-mkokstad', -28.5306, 30.8958],
+  ['kdvvxn1', 'mduduzi-ncube', -28.5306, 30.8958],
+  ['kdvvxn1', 'mlindo-the-vocalist', -28.5306, 30.8958],
+  ['kdvvxn1', 'mthandeni-sk', -28.5306, 30.8958],
+  ['kdvvxn1', 'nomfundo-moh', -28.5306, 30.8958],
+  ['kdvvxn1', 'q-twins', -28.5306, 30.8958],
+  ['kdvvxn1', 'usimamane', -28.5306, 30.8958],
+  ['kdvvxn1', 'zee-nxumalo', -28.5306, 30.8958],
+  ['kdwn1um', 'azana', -29.8587, 31.0218],
+  ['kdwn1um', 'dbn-gogo', -29.8587, 31.0218],
+  ['kdwn1um', 'de-mthuda', -29.8587, 31.0218],
+  ['kdwn1um', 'dj-tira', -29.8587, 31.0218],
+  ['kdwn1um', 'dj-zinhle', -29.8587, 31.0218],
+  ['kdwn1um', 'dlala-thukzin', -29.8587, 31.0218],
+  ['kdwn1um', 'kwesta', -29.8587, 31.0218],
+  ['kdwn1um', 'lwah-ndlunkulu', -29.8587, 31.0218],
+  ['kdwn1um', 'mawhoo', -29.8587, 31.0218],
+  ['kdwn1um', 'nasty-c', -29.8587, 31.0218],
+  ['kdwn1um', 'nkosazana-daughter', -29.8587, 31.0218],
+  ['kdwn1um', 'shekhinah', -29.8587, 31.0218],
+  ['kdwn1um', 'simmy', -29.8587, 31.0218],
+  ['kdwn1um', 'sun-el-musician', -29.8587, 31.0218],
+  ['kdwn1um', 'zandile-dlamini', -29.8587, 31.0218],
+  ['ke7f9fj', 'blxckie', -26.2678, 27.8585],
+  ['ke7f9fj', 'busta-929', -26.2678, 27.8585],
+  ['ke7f9fj', 'daliwonga', -26.2678, 27.8585],
+  ['ke7f9fj', 'dj-maphorisa', -26.2678, 27.8585],
+  ['ke7f9fj', 'ko', -26.2678, 27.8585],
+  ['ke7f9fj', 'the-soil', -26.2678, 27.8585],
+  ['ke7f9fj', 'toss', -26.2678, 27.8585],
+  ['ke7fyjx', 'artwork-sounds', -26.2041, 28.0473],
+  ['ke7fyjx', 'babalwa-ndlovu', -26.2041, 28.0473],
+  ['ke7fyjx', 'bassie', -26.2041, 28.0473],
+  ['ke7fyjx', 'benjamin-dube', -26.2041, 28.0473],
+  ['ke7fyjx', 'black-coffee', -26.2041, 28.0473],
+  ['ke7fyjx', 'cassper-nyovest', -26.2041, 28.0473],
+  ['ke7fyjx', 'clout-cassette', -26.2041, 28.0473],
+  ['ke7fyjx', 'david-tlale', -26.2041, 28.0473],
+  ['ke7fyjx', 'deborah-lukalu', -26.2041, 28.0473],
+  ['ke7fyjx', 'dj-buhle', -26.2041, 28.0473],
+  ['ke7fyjx', 'don-packwood', -26.2041, 28.0473],
+  ['ke7fyjx', 'emtee', -26.2041, 28.0473],
+  ['ke7fyjx', 'kelly-khumalo', -26.2041, 28.0473],
+  ['ke7fyjx', 'mafikizolo', -26.2041, 28.0473],
+  ['ke7fyjx', 'major-league-djz', -26.2041, 28.0473],
+  ['ke7fyjx', 'morgeez-visuals', -26.2041, 28.0473],
+  ['ke7fyjx', 'rich-mnisi', -26.2041, 28.0473],
+  ['ke7fyjx', 'rixelton', -26.2041, 28.0473],
+  ['ke7fyjx', 'sir-lsg', -26.2041, 28.0473],
+  ['ke7fyjx', 'sir-trill', -26.2041, 28.0473],
+  ['ke7fyjx', 'sol-phenduka', -26.2041, 28.0473],
+  ['ke7fyjx', 'soul-clap-studios', -26.2041, 28.0473],
+  ['ke7fyjx', 'tempo-visuals', -26.2041, 28.0473],
+  ['ke7fyjx', 'thebe-magugu', -26.2041, 28.0473],
+  ['ke7fyjx', 'trevor-stuurman', -26.2041, 28.0473],
+  ['ke7fyjx', 'txc', -26.2041, 28.0473],
+  ['ke7fyjx', 'tyla', -26.2041, 28.0473],
+  ['ke7fyjx', 'tyler-icu', -26.2041, 28.0473],
+  ['ke7fyjx', 'zj90', -26.2041, 28.0473],
+  ['ke7fyjx', 'zoocci-coke-dope', -26.2041, 28.0473],
+  ['ke7gx25', 'aymos', -26.103, 28.0972],
+  ['ke7gx25', 'mr-jazziq', -26.103, 28.0972],
+  ['ke7yz3t', 'pabi-cooper', -25.5232, 28.099],
+  ['kekh47k', 'shimza', -25.9969, 28.2294],
+  ['kekhckq', 'oxii-moron', -25.8603, 28.1894],
+  ['kekjd2e', '2point1', -25.7479, 28.2293],
+  ['kekjd2e', 'a-reece', -25.7479, 28.2293],
+  ['kekjd2e', 'caiiro', -25.7479, 28.2293],
+  ['kekjd2e', 'dj-stokie', -25.7479, 28.2293],
+  ['kekjd2e', 'elaine', -25.7479, 28.2293],
+  ['kekjd2e', 'felo-le-tee', -25.7479, 28.2293],
+  ['kekjd2e', 'focalistic', -25.7479, 28.2293],
+  ['kekjd2e', 'kabza-de-small', -25.7479, 28.2293],
+  ['kekjd2e', 'kaizerbeatz', -25.7479, 28.2293],
+  ['kekjd2e', 'ke-tabz', -25.7479, 28.2293],
+  ['kekjd2e', 'lebo-mokoena', -25.7479, 28.2293],
+  ['kekjd2e', 'leemckrazy', -25.7479, 28.2293],
+  ['kekjd2e', 'mas-musiq', -25.7479, 28.2293],
+  ['kekjd2e', 'mashbeatz', -25.7479, 28.2293],
+  ['kekjd2e', 'mellow-sleazy', -25.7479, 28.2293],
+  ['kekjd2e', 'nadia-nakai', -25.7479, 28.2293],
+  ['kekjd2e', 'oscar-mbo', -25.7479, 28.2293],
+  ['kekjd2e', 'sam-deep', -25.7479, 28.2293],
+  ['kekjd2e', 'seether', -25.7479, 28.2293],
+  ['kekjd2e', 'titom', -25.7479, 28.2293],
+  ['kekjd2e', 'vigro-deep', -25.7479, 28.2293],
+  ['kekjd2e', 'young-stunna', -25.7479, 28.2293],
+  ['kekjd2e', 'yung-swiss', -25.7479, 28.2293],
+  ['kekjwju', 'kamo-mphela', -25.72, 28.395],
+  ['keqp0sp', 'sjava', -25.4653, 30.9703],
+  ['kesyr69', 'shebeshxt', -24.2, 29.5],
+  ['keubn86', 'ba-bethe-gashoazen', -23.9045, 29.4689],
+  ['keubn86', 'dj-janisto', -23.9045, 29.4689],
+  ['keubn86', 'kharishma', -23.9045, 29.4689],
+  ['keubn86', 'king-monada', -23.9045, 29.4689],
+  ['keubn86', 'lebo-sekgobela', -23.9045, 29.4689],
+  ['keubn86', 'makhadzi', -23.9045, 29.4689],
+  ['keubn86', 'master-chuza', -23.9045, 29.4689],
+  ['keubn86', 'master-kg', -23.9045, 29.4689],
+  ['keubn86', 'mr-six21-dj-dance', -23.9045, 29.4689],
+  ['keubn86', 'naqua-sa', -23.9045, 29.4689],
+  ['keubn86', 'shandesh', -23.9045, 29.4689],
+  ['keubn86', 'sho-madjozi', -23.9045, 29.4689],
+  ['kev2qmh', 'joe-shirimani', -23.8335, 30.1635],
+  ['kevg7jb', 'benny-mayengani', -23.3025, 30.7187],
+  ['kevg7jb', 'penny-penny', -23.3025, 30.7187],
+  ['kevkbmp', 'yde', -23.0435, 29.9038],
+  ['kevtkdk', 'dripmaker', -22.9706, 30.4388],
+  ['kevv8c2', 'thomas-chauke', -22.932, 30.62],
+  ['ksxhp6q', 'sha-sha', -18.9707, 32.6709],
+];
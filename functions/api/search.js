@@ -4,6 +4,9 @@
 import {
   artistDistanceKm,
   compareArtistsByDistance,
+  ensureLocationColumns,
+  geohashRanges,
+  NEARBY_RADIUS_KM,
 } from './location-utils.js';
 import { searchMarketplaceServices } from './marketplace-service-utils.js';
 
@@ -19,6 +22,7 @@ export async function onRequestGet(context) {
     offset: parseInt(url.searchParams.get('offset') || '0', 10),
     userLat: parseFloat(url.searchParams.get('lat') || ''),
     userLng: parseFloat(url.searchParams.get('lng') || ''),
+    radiusKm: parseFloat(url.searchParams.get('radius') || ''),
   };
   return runSearch(context, body);
 }
@@ -47,6 +51,7 @@ async function runSearch(context, body) {
       offset = 0,
       userLat,
       userLng,
+      radiusKm,
     } = body;
 
     const lat = Number(userLat);
@@ -65,6 +70,7 @@ async function runSearch(context, body) {
     }
 
     const sortNearby = Number.isFinite(resolvedLat) && Number.isFinite(resolvedLng);
+    await ensureLocationColumns(context.env.DB);
 
     let sql = `
       SELECT
@@ -76,6 +82,8 @@ async function runSearch(context, body) {
         u.bio,
         u.location,
         u.country,
+        u.location_lat,
+        u.location_lng,
         u.is_verified,
         ap.category,
         ap.genre,
@@ -132,32 +140,53 @@ async function runSearch(context, body) {
       sql += ` AND u.is_verified = 1`;
     }
 
+    // Nearby: only artists in the geohash cells around the visitor (prefix range scans)
+    const nearbyRanges = sortBy === 'nearby' && sortNearby
+      ? geohashRanges(resolvedLat, resolvedLng, Number(radiusKm) > 0 ? Number(radiusKm) : NEARBY_RADIUS_KM)
+      : [];
+    const nearbySql = nearbyRanges.length
+      ? ` AND (${nearbyRanges.map(() => '(u.location_geohash >= ? AND u.location_geohash < ?)').join(' OR ')})`
+      : '';
+
     // Sorting
+    let orderSql;
     switch (sortBy) {
       case 'rating':
-        sql += ` ORDER BY ap.avg_rating DESC`;
+        orderSql = ` ORDER BY ap.avg_rating DESC`;
         break;
       case 'price_low':
-        sql += ` ORDER BY ap.base_rate ASC`;
+        orderSql = ` ORDER BY ap.base_rate ASC`;
         break;
       case 'price_high':
-        sql += ` ORDER BY ap.base_rate DESC`;
+        orderSql = ` ORDER BY ap.base_rate DESC`;
         break;
       case 'popular':
-        sql += ` ORDER BY ap.total_reviews DESC`;
+        orderSql = ` ORDER BY ap.total_reviews DESC`;
         break;
       case 'nearby':
-        sql += ` ORDER BY ap.is_trending DESC, ap.avg_rating DESC, ap.total_reviews DESC`;
+        orderSql = ` ORDER BY ap.is_trending DESC, ap.avg_rating DESC, ap.total_reviews DESC`;
         break;
       default:
         // Relevance - prioritize trending, rating, reviews
-        sql += ` ORDER BY ap.is_trending DESC, ap.avg_rating DESC, ap.total_reviews DESC`;
+        orderSql = ` ORDER BY ap.is_trending DESC, ap.avg_rating DESC, ap.total_reviews DESC`;
     }
 
-    sql += ` LIMIT ? OFFSET ?`;
-    params.push(limit, offset);
-
-    const result = await context.env.DB.prepare(sql).bind(...params).all();
+    const runQuery = (extraSql, extraParams) => context.env.DB
+      .prepare(`${sql}${extraSql}${orderSql} LIMIT ? OFFSET ?`)
+      .bind(...params, ...extraParams, limit, offset)
+      .all();
+
+    let result = await runQuery(nearbySql, nearbyRanges.flat());
+    if (nearbySql && !result.results.length) {
+      // Nobody geocoded near the visitor: every page distance-sorts everyone instead.
+      // Past the first page an empty page may just be the end of the nearby list,
+      // so only fall back if the nearby set is empty as a whole.
+      const anyNearby = offset > 0 && await context.env.DB
+        .prepare(`SELECT 1 FROM (${sql}${nearbySql} LIMIT 1)`)
+        .bind(...params, ...nearbyRanges.flat())
+        .first();
+      if (!anyNearby) result = await runQuery('', []);
+    }
 
     // Calculate relevance scores
     const artists = result.results.map(artist => {
@@ -13,6 +13,7 @@ import {
   isValidUsername,
 } from './auth-utils.js';
 import { ensureOnboardingTables, sendWelcomeEmail } from './onboarding-utils.js';
+import { refreshUserLocation } from './location-utils.js';
 
 export async function onRequestPost(context) {
   try {
@@ -151,6 +152,8 @@ export async function onRequestPost(context) {
       }, 500);
     }
 
+    await refreshUserLocation(context.env.DB, userId);
+
     let artistId = null;
 
     // If user is an artist, create artist profile
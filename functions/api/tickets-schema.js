@@ -158,9 +158,13 @@ export async function ensureTicketsTables(db) {
     'CREATE INDEX IF NOT EXISTS idx_gig_ticket_types_event ON gig_ticket_types(event_id)',
     'CREATE INDEX IF NOT EXISTS idx_ticket_orders_buyer ON ticket_orders(buyer_user_id, created_at DESC)',
     'CREATE INDEX IF NOT EXISTS idx_ticket_orders_event ON ticket_orders(event_id)',
+    'CREATE INDEX IF NOT EXISTS idx_ticket_orders_status_expires ON ticket_orders(status, expires_at)',
+    'CREATE INDEX IF NOT EXISTS idx_ticket_order_items_order ON ticket_order_items(order_id)',
     'CREATE INDEX IF NOT EXISTS idx_ticket_instances_code ON ticket_instances(ticket_code)',
     'CREATE INDEX IF NOT EXISTS idx_ticket_instances_order ON ticket_instances(order_id)',
+    'CREATE INDEX IF NOT EXISTS idx_ticket_payments_order ON ticket_payments(ticket_order_id, created_at)',
     'CREATE INDEX IF NOT EXISTS idx_gig_waitlist_event ON gig_waitlist(event_id)',
+    'CREATE INDEX IF NOT EXISTS idx_gig_waitlist_pending ON gig_waitlist(event_id, notified, created_at)',
   ];
   for (const sql of indexes) {
     await db.prepare(sql).run();
@@ -1,5 +1,7 @@
 // POST /api/update-profile - Update user profile
 
+import { refreshUserLocation } from './location-utils.js';
+
 export async function onRequestPost(context) {
   try {
     const corsHeaders = {
@@ -81,6 +83,10 @@ export async function onRequestPost(context) {
         .run();
     }
 
+    if (location) {
+      await refreshUserLocation(context.env.DB, firebase_uid);
+    }
+
     return new Response(JSON.stringify({
       success: true,
       data: {
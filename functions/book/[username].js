@@ -1,6 +1,7 @@
 // GET /book/:username — shareable booking link with Open Graph preview for X/social
 
 import {
+  artistCardUrl,
   buildSharePageHtml,
   htmlResponse,
   resolveMediaUrl,
@@ -39,6 +40,7 @@ async function loadArtistMeta(db, username) {
     bio: data.bio,
     image: data.image || resolveShowcaseImage(showcase),
     category: data.category,
+    card: artistCardUrl(showcase.username),
   };
 }
 
@@ -61,7 +63,7 @@ export async function onRequest(context) {
     if (artist) {
       title = `Book ${artist.name} | Gearsh`;
       description = artist.bio || `Book ${artist.name}${artist.category ? ` (${artist.category})` : ''} for your next event on Gearsh.`;
-      image = resolveMediaUrl(context.request, artist.image);
+      image = artist.card || resolveMediaUrl(context.request, artist.image);
     }
   } catch (err) {
     console.error('Share page artist lookup failed:', err);
@@ -9,33 +9,26 @@ from pathlib import Path
 from PIL import Image
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from imaging import IMAGE_EXTENSIONS, open_rgb, save_image
+from profiling import configure, stage
+
 def resize_image(input_path, output_path, size=400):
     """Resize image to specified size while maintaining aspect ratio"""
     try:
-        img = Image.open(input_path)
-
         # Convert to RGB if necessary (for RGBA, LA, P modes)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'RGBA':
-                background.paste(img, mask=img.split()[-1])
-            else:
-                background.paste(img)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+        with stage("decode", path=Path(input_path).name) as span:
+            span.record(bytes_in=lambda: os.path.getsize(input_path))
+            img = open_rgb(input_path)
 
         # Resize to 400x400
-        img = img.resize((size, size), Image.Resampling.LANCZOS)
+        with stage("resize", size=size):
+            img = img.resize((size, size), Image.Resampling.LANCZOS)
 
         # Save with appropriate format
-        ext = output_path.suffix.lower()
-        if ext == '.webp':
-            img.save(output_path, 'WEBP', quality=90)
-        elif ext == '.png':
-            img.save(output_path, 'PNG', optimize=True)
-        else:  # .jpg, .jpeg
-            img.save(output_path, 'JPEG', quality=90)
+        with stage("encode", path=Path(output_path).name) as span:
+            save_image(img, Path(output_path))
+            span.record(bytes_out=lambda: os.path.getsize(output_path))
 
         return True
     except Exception as e:
@@ -43,6 +36,7 @@ def resize_image(input_path, output_path, size=400):
         return False
 
 def main():
+    configure()
     artists_dir = Path("assets/images/artists")
 
     if not artists_dir.exists():
@@ -55,9 +49,8 @@ def main():
     print(f"\nTarget directory: {artists_dir.absolute()}\n")
 
     # Get all image files
-    image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif'}
     image_files = [f for f in artists_dir.iterdir()
-                   if f.is_file() and f.suffix.lower() in image_extensions]
+                   if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS]
 
     if not image_files:
         print("❌ No image files found!")
@@ -99,6 +92,7 @@ def main():
     print(f"❌ Failed: {failed}")
     print("=" * 60)
     print("\nAll images are now 400x400 pixels!")
+    print("Run: python scripts/lqip.py to refresh blur placeholders")
 
 if __name__ == "__main__":
     try:
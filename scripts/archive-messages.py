@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Move old messages to compressed day files, and read threads back from them.
+
+    python scripts/archive-messages.py --db gearsh.sqlite archive --dest /mnt/cold/messages --older-than 365
+    python scripts/archive-messages.py --db gearsh.sqlite archive --dest /mnt/cold/messages --dry-run
+    python scripts/archive-messages.py --db gearsh.sqlite verify --dest /mnt/cold/messages
+    python scripts/archive-messages.py --db gearsh.sqlite thread --dest /mnt/cold/messages book_000123
+    python scripts/archive-messages.py --db gearsh.sqlite thread --dest /mnt/cold/messages --users user_1 user_2
+
+archive pages through messages older than --older-than days with a keyset
+cursor on (created_at, id), served by idx_messages_created
+(database/add_message_archive.sql), so every page is an index range scan no
+matter how deep it is. Rows are grouped by day and each day is written to
+<dest>/YYYY/MM/YYYY-MM-DD.jsonl.gz through a temporary file and a rename.
+
+A day is recorded in message_archive with its row count and the SHA-256 of
+its JSON lines, then verified: the file is read back and the day's rows are
+read again from the table, and both must match that count and checksum.
+Only then are the archived ids deleted, --delete-batch at a time, each batch
+its own short transaction so the API's writes are never held up for long.
+The status column (written, verified, deleted) makes an interrupted run
+safe to repeat: it picks up each day where it stopped. A day that fails
+verification (a row changed between the write and the check) still has all
+of its rows in the table, so its file and records are dropped and the next
+run archives it again under the same part number.
+
+message_archive_threads maps each thread (booking_id, or the two users of a
+direct conversation) to the days that hold it. thread reads only those files
+and, with --live, merges the rows still in the table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from jobs import Throttle, transaction
+from migrate import connect
+
+COLUMNS = ("id", "sender_id", "receiver_id", "booking_id", "content", "is_read", "created_at")
+
+PAGE = f"""
+SELECT {', '.join(COLUMNS)} FROM messages
+WHERE created_at < :cutoff AND (created_at, id) > (:created_at, :id)
+ORDER BY created_at, id
+LIMIT :page
+"""
+
+DAY_ROWS = f"""
+SELECT {', '.join(COLUMNS)} FROM messages
+WHERE created_at >= :day AND created_at < :next
+ORDER BY created_at, id
+"""
+
+DELETE = "DELETE FROM messages WHERE id IN (SELECT value FROM json_each(?))"
+
+
+def thread_key(message: dict) -> str:
+    if message["booking_id"]:
+        return message["booking_id"]
+    low, high = sorted((message["sender_id"], message["receiver_id"]))
+    return f"dm:{low}:{high}"
+
+
+def encode(row: tuple) -> bytes:
+    return json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+def next_day(day: str) -> str:
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_lines(path: Path):
+    with gzip.open(path, "rb") as f:
+        yield from f
+
+
+class Archiver:
+    def __init__(self, conn, dest: Path, level: int, delete_batch: int, throttle: Throttle, dry_run: bool):
+        self.conn = conn
+        self.dest = dest
+        self.level = level
+        self.delete_batch = delete_batch
+        self.throttle = throttle
+        self.dry_run = dry_run
+        self.totals: Counter = Counter()
+
+    def run(self, cutoff: str, page: int) -> None:
+        # Finish days an earlier run left half done before archiving new ones
+        for day, part in self.conn.execute(
+            "SELECT day, part FROM message_archive WHERE status != 'deleted' ORDER BY day, part"
+        ).fetchall():
+            self.settle(day, part)
+
+        position = ("", "")
+        day, rows = None, []
+        while True:
+            batch = self.conn.execute(
+                PAGE, {"cutoff": cutoff, "created_at": position[0], "id": position[1], "page": page}
+            ).fetchall()
+            for row in batch:
+                row_day = row[6][:10]
+                if row_day != day:
+                    if rows:
+                        self.archive_day(day, rows)
+                    day, rows = row_day, []
+                rows.append(row)
+            if len(batch) < page:
+                break
+            position = (batch[-1][6], batch[-1][0])
+        if rows:
+            self.archive_day(day, rows)
+
+    def archive_day(self, day: str, rows: list[tuple]) -> None:
+        self.totals["days"] += 1
+        self.totals["rows"] += len(rows)
+        if self.dry_run:
+            print(f"{day}: {len(rows):,} messages")
+            return
+        part = self.conn.execute(
+            "SELECT COALESCE(MAX(part), 0) + 1 FROM message_archive WHERE day = ?", (day,)
+        ).fetchone()[0]
+        name = f"{day}.jsonl.gz" if part == 1 else f"{day}.{part}.jsonl.gz"
+        relative = Path(day[:4], day[5:7], name)
+        path = self.dest / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        digest = hashlib.sha256()
+        threads: Counter = Counter()
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as raw:
+            with gzip.GzipFile(filename=path.name, mode="wb", compresslevel=self.level, fileobj=raw, mtime=0) as f:
+                for row in rows:
+                    line = encode(row)
+                    digest.update(line)
+                    f.write(line)
+                    threads[thread_key(dict(zip(COLUMNS, row)))] += 1
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp, path)
+        self.totals["bytes"] += path.stat().st_size
+
+        with transaction(self.conn):
+            self.conn.execute(
+                "INSERT INTO message_archive (day, part, path, rows, first_id, last_id, sha256, file_sha256, bytes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (day, part, relative.as_posix(), len(rows), rows[0][0], rows[-1][0], digest.hexdigest(),
+                 file_digest(path), path.stat().st_size),
+            )
+            self.conn.executemany(
+                "INSERT INTO message_archive_threads (thread, day, part, rows) VALUES (?, ?, ?, ?)",
+                [(thread, day, part, n) for thread, n in threads.items()],
+            )
+        self.settle(day, part)
+
+    def settle(self, day: str, part: int) -> None:
+        """Verify a written day, then delete its rows from messages."""
+        path, rows, sha, file_sha, status = self.conn.execute(
+            "SELECT path, rows, sha256, file_sha256, status FROM message_archive WHERE day = ? AND part = ?",
+            (day, part),
+        ).fetchone()
+        path = self.dest / path
+        if status == "written":
+            problem = check_file(path, rows, sha, file_sha)
+            if not problem:
+                live = self.conn.execute(DAY_ROWS, {"day": day, "next": next_day(day)}).fetchall()
+                if len(live) != rows or hashlib.sha256(b"".join(map(encode, live))).hexdigest() != sha:
+                    problem = f"table holds {len(live):,} rows for the day that do not match the file"
+            if problem:
+                print(f"{day} part {part}: {problem}; discarded, the next run archives it again", file=sys.stderr)
+                self.totals["failed"] += 1
+                self.discard(day, part, path)
+                return
+            self.conn.execute(
+                "UPDATE message_archive SET status = 'verified' WHERE day = ? AND part = ?", (day, part)
+            )
+        ids = [json.loads(line)["id"] for line in read_lines(path)]
+        for start in range(0, len(ids), self.delete_batch):
+            chunk = ids[start:start + self.delete_batch]
+            with transaction(self.conn):
+                self.totals["deleted"] += self.conn.execute(DELETE, (json.dumps(chunk),)).rowcount
+            self.throttle.wait(len(chunk))
+        self.conn.execute(
+            "UPDATE message_archive SET status = 'deleted', deleted_at = datetime('now') WHERE day = ? AND part = ?",
+            (day, part),
+        )
+
+    def discard(self, day: str, part: int, path: Path) -> None:
+        """Forget a day that failed verification; its rows are all still in messages."""
+        with transaction(self.conn):
+            self.conn.execute("DELETE FROM message_archive_threads WHERE day = ? AND part = ?", (day, part))
+            self.conn.execute("DELETE FROM message_archive WHERE day = ? AND part = ?", (day, part))
+        path.unlink(missing_ok=True)
+
+
+def check_file(path: Path, rows: int, sha: str, file_sha: str) -> str | None:
+    if not path.exists():
+        return f"{path} is missing"
+    if file_digest(path) != file_sha:
+        return f"{path} does not match its recorded checksum"
+    digest = hashlib.sha256()
+    count = 0
+    for line in read_lines(path):
+        digest.update(line)
+        count += 1
+    if count != rows or digest.hexdigest() != sha:
+        return f"{path} holds {count:,} rows, {rows:,} recorded"
+    return None
+
+
+def cmd_archive(conn, args) -> None:
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=args.older_than)).date().isoformat()
+    archiver = Archiver(conn, args.dest, args.level, args.delete_batch, Throttle(args.rate), args.dry_run)
+    started = time.perf_counter()
+    archiver.run(cutoff, args.page)
+    t = archiver.totals
+    print(
+        f"{t['rows']:,} messages before {cutoff} in {t['days']:,} day(s): {t['bytes'] / 1e6:,.1f} MB written, "
+        f"{t['deleted']:,} deleted in {time.perf_counter() - started:.1f}s"
+    )
+    if t["failed"]:
+        sys.exit(f"{t['failed']} day(s) failed verification")
+
+
+def cmd_verify(conn, args) -> None:
+    failed = 0
+    checked = conn.execute(
+        "SELECT day, part, path, rows, sha256, file_sha256 FROM message_archive ORDER BY day, part"
+    ).fetchall()
+    for day, part, path, rows, sha, file_sha in checked:
+        problem = check_file(args.dest / path, rows, sha, file_sha)
+        if problem:
+            failed += 1
+            print(f"{day} part {part}: {problem}")
+    print(f"{len(checked):,} archive file(s) checked, {failed} failed")
+    if failed:
+        sys.exit(1)
+
+
+def cmd_thread(conn, args) -> None:
+    if args.users:
+        low, high = sorted(args.users)
+        thread, live_sql, params = (
+            f"dm:{low}:{high}",
+            "booking_id IS NULL AND ((sender_id = ? AND receiver_id = ?) OR (sender_id = ? AND receiver_id = ?))",
+            (low, high, high, low),
+        )
+    elif args.booking:
+        thread, live_sql, params = args.booking, "booking_id = ?", (args.booking,)
+    else:
+        sys.exit("give a booking id or --users A B")
+    files = conn.execute(
+        "SELECT a.path FROM message_archive_threads t "
+        "JOIN message_archive a ON a.day = t.day AND a.part = t.part "
+        "WHERE t.thread = ? ORDER BY t.day, t.part",
+        (thread,),
+    ).fetchall()
+    messages = []
+    for (path,) in files:
+        for line in read_lines(args.dest / path):
+            message = json.loads(line)
+            if thread_key(message) == thread:
+                messages.append(message)
+    if args.live:
+        seen = {m["id"] for m in messages}
+        rows = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM messages WHERE {live_sql} ORDER BY created_at, id", params
+        )
+        messages += [m for m in (dict(zip(COLUMNS, row)) for row in rows) if m["id"] not in seen]
+    messages.sort(key=lambda m: (m["created_at"], m["id"]))
+    for message in messages:
+        print(json.dumps(message, ensure_ascii=False))
+    print(f"{len(messages):,} message(s) from {len(files)} archive file(s)", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    archive = sub.add_parser("archive", help="archive, verify and delete messages past the retention window")
+    archive.add_argument("--dest", type=Path, required=True, help="archive root directory")
+    archive.add_argument("--older-than", type=int, default=365, help="retention window in days")
+    archive.add_argument("--page", type=int, default=5000, help="rows per keyset page")
+    archive.add_argument("--delete-batch", type=int, default=500, help="rows per delete transaction")
+    archive.add_argument("--rate", type=float, default=0, help="max rows deleted per second (0 = unthrottled)")
+    archive.add_argument("--level", type=int, default=6, help="gzip level")
+    archive.add_argument("--dry-run", action="store_true", help="only list the days that would be archived")
+
+    verify = sub.add_parser("verify", help="re-check every archive file against message_archive")
+    verify.add_argument("--dest", type=Path, required=True)
+
+    thread = sub.add_parser("thread", help="print an archived conversation as JSON lines")
+    thread.add_argument("--dest", type=Path, required=True)
+    thread.add_argument("booking", nargs="?", help="booking id")
+    thread.add_argument("--users", nargs=2, metavar="USER", help="direct conversation between two users")
+    thread.add_argument("--live", action="store_true", help="include messages still in the table")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'message_archive'").fetchone():
+            sys.exit("message_archive is missing; apply database/add_message_archive.sql first")
+        {"archive": cmd_archive, "verify": cmd_verify, "thread": cmd_thread}[args.command](conn, args)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Build, check and benchmark the artists_search FTS5 index.
+
+    python scripts/artist-search.py --db gearsh.sqlite rebuild            # bulk build + optimize
+    python scripts/artist-search.py --db gearsh.sqlite check --fix        # triggers + integrity-check
+    python scripts/artist-search.py --db gearsh.sqlite showcase           # load the showcase listings
+    python scripts/artist-search.py --db gearsh.sqlite query "amapiano pta"
+    python scripts/artist-search.py bench --sizes 1000,10000,100000,1000000
+
+The index and its sync triggers come from database/add_artists_search_sync.sql.
+It is an external-content FTS5 table over the artists_search_source view
+(artist_profiles joined to users, plus showcase_search), with 2- and
+3-character prefix indexes for type-ahead. rebuild reads the whole view in
+one pass, merges the b-trees into one segment with 'optimize', and sets
+automerge/crisismerge for the trickle of trigger writes that follows.
+
+check compares the installed triggers with the migration and runs FTS5's
+integrity-check against the content. artist_profiles has no INTEGER
+PRIMARY KEY, so a VACUUM can renumber its rowids; check catches that, and
+rebuild fixes it. showcase loads the listings that generate-sa-showcase.py
+writes to functions/api/sa-showcase-data.js. bench times MATCH against the
+LIKE scan in functions/api/search.js on synthetic corpora.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from jobs import transaction
+from migrate import build_replica, connect, split_statements
+from showcase import load_artists
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = ROOT / "database" / "add_artists_search_sync.sql"
+TRIGGER_NAME = re.compile(r"CREATE TRIGGER IF NOT EXISTS (\w+)")
+
+# functions/api/search.js, text search branch with the default ordering
+LIKE_SEARCH = """
+SELECT ap.id, u.id, u.display_name, u.username, u.location, ap.category, ap.genre, ap.avg_rating
+FROM artist_profiles ap
+JOIN users u ON ap.user_id = u.id
+WHERE u.is_active = 1 AND (
+  LOWER(u.display_name) LIKE ? OR
+  LOWER(u.bio) LIKE ? OR
+  LOWER(ap.category) LIKE ? OR
+  LOWER(ap.genre) LIKE ? OR
+  LOWER(u.location) LIKE ?
+)
+ORDER BY ap.is_trending DESC, ap.avg_rating DESC, ap.total_reviews DESC
+LIMIT ? OFFSET 0
+"""
+
+MATCH_SEARCH = """
+SELECT ap.id, u.id, u.display_name, u.username, u.location, ap.category, ap.genre, ap.avg_rating
+FROM artists_search s
+JOIN artist_profiles ap ON ap.rowid = s.rowid
+JOIN users u ON u.id = ap.user_id
+WHERE artists_search MATCH ? AND u.is_active = 1
+ORDER BY s.rank
+LIMIT ?
+"""
+
+SHOWCASE_MATCH = """
+SELECT s.rowid, s.display_name, s.category, s.location, sc.username
+FROM artists_search s
+LEFT JOIN showcase_search sc ON sc.id = -s.rowid
+WHERE artists_search MATCH ?
+ORDER BY s.rank
+LIMIT ?
+"""
+
+
+def match_expression(text: str) -> str:
+    """Free text to an FTS5 query: every word must match, as a prefix."""
+    words = re.findall(r"\w+", text.lower())
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def command(conn, name: str, value=None) -> None:
+    if value is None:
+        conn.execute(f"INSERT INTO artists_search(artists_search) VALUES('{name}')")
+    else:
+        conn.execute(f"INSERT INTO artists_search(artists_search, rank) VALUES('{name}', ?)", (value,))
+
+
+def require_index(conn) -> None:
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'artists_search'").fetchone()
+    if not sql or "artists_search_source" not in sql[0]:
+        sys.exit(f"artists_search is missing or predates the sync migration; apply {MIGRATION.relative_to(ROOT)} first")
+
+
+def index_bytes(conn) -> int:
+    return conn.execute("SELECT IFNULL(SUM(LENGTH(block)), 0) FROM artists_search_data").fetchone()[0]
+
+
+def rebuild(conn, automerge: int, crisismerge: int, pgsz: int) -> dict:
+    started = time.perf_counter()
+    with transaction(conn):
+        command(conn, "pgsz", pgsz)
+        command(conn, "rebuild")
+    built = time.perf_counter()
+    with transaction(conn):
+        command(conn, "optimize")
+        command(conn, "automerge", automerge)
+        command(conn, "crisismerge", crisismerge)
+    done = time.perf_counter()
+    return {
+        "rows": conn.execute("SELECT COUNT(*) FROM artists_search_docsize").fetchone()[0],
+        "rebuild_s": built - started,
+        "optimize_s": done - built,
+        "bytes": index_bytes(conn),
+    }
+
+
+def expected_triggers() -> dict[str, str]:
+    triggers = {}
+    for statement in split_statements(MIGRATION.read_text(encoding="utf-8")):
+        body = re.sub(r"^(\s*--[^\n]*\n)+", "", statement)
+        match = TRIGGER_NAME.match(body)
+        if match:
+            triggers[match.group(1)] = body
+    return triggers
+
+
+def normalize(sql: str) -> str:
+    return " ".join(sql.replace("IF NOT EXISTS ", "").rstrip(";").split())
+
+
+def check_triggers(conn, fix: bool) -> list[str]:
+    """Names of triggers that are missing or differ from the migration (recreated with ``fix``)."""
+    installed = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"))
+    wrong = [
+        name for name, sql in expected_triggers().items()
+        if name not in installed or normalize(installed[name]) != normalize(sql)
+    ]
+    if fix and wrong:
+        triggers = expected_triggers()
+        with transaction(conn):
+            for name in wrong:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+                conn.execute(triggers[name])
+    return wrong
+
+
+def integrity(conn) -> str | None:
+    try:
+        command(conn, "integrity-check", 1)
+    except sqlite3.DatabaseError as e:
+        return str(e)
+    return None
+
+
+@contextmanager
+def triggers_off(conn):
+    """Drop the sync triggers for a bulk load; they are reinstalled afterwards."""
+    names = list(expected_triggers())
+    for name in names:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    try:
+        yield
+    finally:
+        check_triggers(conn, fix=True)
+
+
+def load_showcase(conn) -> tuple[int, int]:
+    """Upsert the showcase listings; returns (listings, stale rows removed)."""
+    artists = load_artists()
+    rows = [
+        (a["username"], a["name"], a.get("bio"), a.get("category"), a.get("genre"), a.get("location"),
+         json.dumps(a.get("skills") or []))
+        for a in artists
+    ]
+    with transaction(conn):
+        conn.executemany(
+            """INSERT INTO showcase_search (username, display_name, bio, category, genre, location, skills)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(username) DO UPDATE SET
+  display_name = excluded.display_name, bio = excluded.bio, category = excluded.category,
+  genre = excluded.genre, location = excluded.location, skills = excluded.skills,
+  updated_at = datetime('now')
+WHERE (display_name, bio, category, genre, location, skills) IS NOT
+      (excluded.display_name, excluded.bio, excluded.category, excluded.genre, excluded.location, excluded.skills)""",
+            rows,
+        )
+        removed = conn.execute(
+            "DELETE FROM showcase_search WHERE username NOT IN (SELECT value FROM json_each(?))",
+            (json.dumps([r[0] for r in rows]),),
+        ).rowcount
+    return len(rows), removed
+
+
+# -- bench ---------------------------------------------------------------------
+
+SYLLABLES = ["ka", "bza", "ma", "pho", "ri", "sa", "nyo", "ty", "la", "zi", "nhle", "mo", "mbo", "si", "dee", "thu", "lo", "ne"]
+BIO_WORDS = ["live", "sets", "weddings", "corporate", "festival", "studio", "producer", "vocalist", "dance", "club",
+             "private", "events", "township", "soulful", "deep", "groove", "piano", "guitar", "choir", "tour"]
+
+
+def synthetic_corpus(conn, size: int, seed: int) -> None:
+    showcase = load_artists()
+    categories = sorted({a["category"] for a in showcase})
+    genres = sorted({a["genre"] for a in showcase})
+    towns = sorted({a["location"] for a in showcase})
+    skills = sorted({s for a in showcase for s in a.get("skills") or []})
+    rng = random.Random(seed)
+
+    def name() -> str:
+        return " ".join(
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).title()
+            for _ in range(rng.randint(1, 2))
+        )
+
+    batch = 50_000
+    with triggers_off(conn):
+        for start in range(0, size, batch):
+            users, profiles = [], []
+            for i in range(start, min(size, start + batch)):
+                uid = f"user_{i:09d}"
+                users.append((
+                    uid, f"{uid}@synthetic.gearsh.test", "-", "artist", "S", "A", name(),
+                    " ".join(rng.choices(BIO_WORDS, k=rng.randint(4, 12))), rng.choice(towns), 1,
+                ))
+                profiles.append((
+                    f"artist_{i:09d}", uid, rng.choice(categories), rng.choice(genres),
+                    json.dumps(rng.sample(skills, k=min(3, len(skills)))), int(rng.random() < 0.05),
+                    round(rng.uniform(3, 5), 2), rng.randint(0, 400),
+                ))
+            with transaction(conn):
+                conn.executemany(
+                    "INSERT INTO users (id, email, password_hash, user_type, first_name, last_name, display_name, bio, location, is_active) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    users,
+                )
+                conn.executemany(
+                    "INSERT INTO artist_profiles (id, user_id, category, genre, skills, is_trending, avg_rating, total_reviews) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    profiles,
+                )
+
+
+def timed(conn, sql: str, params: tuple, runs: int) -> tuple[float, int]:
+    samples, rows = [], 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        rows = len(conn.execute(sql, params).fetchall())
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), rows
+
+
+def bench(sizes: list[int], queries: list[str], limit: int, runs: int, seed: int) -> None:
+    workdir = Path(tempfile.mkdtemp(prefix="gearsh-artist-search-"))
+    print(f"{'profiles':>10}  {'query':18} {'LIKE ms':>9} {'MATCH ms':>9} {'speedup':>8}  hits (LIKE/MATCH)")
+    for size in sizes:
+        db = workdir / f"corpus-{size}.sqlite"
+        conn = build_replica(db)
+        load_started = time.perf_counter()
+        synthetic_corpus(conn, size, seed)
+        loaded = time.perf_counter() - load_started
+        built = rebuild(conn, automerge=8, crisismerge=16, pgsz=4096)
+        print(
+            f"{size:>10,}  loaded in {loaded:.1f}s, index built in {built['rebuild_s'] + built['optimize_s']:.1f}s "
+            f"({built['bytes'] / 2**20:.1f} MiB)"
+        )
+        for text in queries:
+            term = f"%{text.lower()}%"
+            like_ms, like_rows = timed(conn, LIKE_SEARCH, (term,) * 5 + (limit,), runs)
+            match_ms, match_rows = timed(conn, MATCH_SEARCH, (match_expression(text), limit), runs)
+            print(
+                f"{'':>10}  {text[:18]:18} {like_ms:>9.2f} {match_ms:>9.2f} {like_ms / max(match_ms, 1e-6):>7.0f}x"
+                f"  {like_rows}/{match_rows}"
+            )
+        conn.close()
+        db.unlink()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="database with the sync migration applied")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    build = sub.add_parser("rebuild", help="bulk build the index from the source view and optimize it")
+    build.add_argument("--automerge", type=int, default=8, help="segments per level before an incremental merge")
+    build.add_argument("--crisismerge", type=int, default=16, help="segments per level that force a merge on write")
+    build.add_argument("--pgsz", type=int, default=4096, help="leaf page size of the index b-trees")
+    check = sub.add_parser("check", help="verify sync triggers and run integrity-check")
+    check.add_argument("--fix", action="store_true", help="(re)install triggers that are missing or changed")
+    sub.add_parser("showcase", help="load showcase listings from functions/api/sa-showcase-data.js")
+    query = sub.add_parser("query", help="run a MATCH search")
+    query.add_argument("text")
+    query.add_argument("--limit", type=int, default=10)
+    bench_args = sub.add_parser("bench", help="MATCH vs LIKE on synthetic corpora (temporary databases)")
+    bench_args.add_argument("--sizes", default="1000,10000,100000", help="comma-separated profile counts")
+    bench_args.add_argument("--queries", default="amapiano,pretoria,ka,deep groove,kabza pre",
+                            help="comma-separated search strings")
+    bench_args.add_argument("--limit", type=int, default=20)
+    bench_args.add_argument("--runs", type=int, default=5)
+    bench_args.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.cmd == "bench":
+        bench([int(s) for s in args.sizes.split(",")], args.queries.split(","), args.limit, args.runs, args.seed)
+        return
+    if not args.db:
+        parser.error("--db is required")
+
+    conn = connect(args.db)
+    try:
+        require_index(conn)
+        if args.cmd == "rebuild":
+            built = rebuild(conn, args.automerge, args.crisismerge, args.pgsz)
+            print(
+                f"Indexed {built['rows']:,} rows in {built['rebuild_s']:.1f}s, optimized in {built['optimize_s']:.1f}s "
+                f"({built['bytes'] / 2**20:.1f} MiB)"
+            )
+        elif args.cmd == "check":
+            wrong = check_triggers(conn, args.fix)
+            for name in wrong:
+                print(f"  trigger {name}: {'reinstalled' if args.fix else 'missing or out of date'}")
+            problem = integrity(conn)
+            source = conn.execute("SELECT COUNT(*) FROM artists_search_source").fetchone()[0]
+            indexed = conn.execute("SELECT COUNT(*) FROM artists_search_docsize").fetchone()[0]
+            print(f"{indexed:,} indexed / {source:,} source rows, triggers {'ok' if not wrong or args.fix else 'out of date'}")
+            if problem:
+                print(f"integrity-check failed ({problem}); run: artist-search.py --db {args.db} rebuild")
+            if problem or (wrong and not args.fix):
+                sys.exit(1)
+        elif args.cmd == "showcase":
+            loaded, removed = load_showcase(conn)
+            print(f"{loaded} showcase listings loaded, {removed} stale removed")
+        elif args.cmd == "query":
+            expr = match_expression(args.text)
+            started = time.perf_counter()
+            rows = conn.execute(SHOWCASE_MATCH, (expr, args.limit)).fetchall()
+            elapsed = (time.perf_counter() - started) * 1000
+            for rowid, name, category, location, username in rows:
+                kind = f"showcase @{username}" if rowid < 0 else f"profile rowid {rowid}"
+                print(f"  {name:28} {category or '':14} {location or '':16} {kind}")
+            print(f"{len(rows)} result(s) for {expr} in {elapsed:.2f}ms")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
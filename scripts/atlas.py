@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Pack showcase artist avatars into one WebP sprite sheet per genre row.
+
+Each GENRE_SECTIONS row from generate-sa-showcase.py gets its own sheet(s)
+under web/assets/atlas/, and web/sa-showcase-atlas.js maps every username to
+its sheet and offset so a row costs one image request instead of twenty.
+Rows whose artists and source images are unchanged are not repacked.
+
+marketing.html loads the map, and artist-feed.js paints the story avatars
+from the sheets. The sheets and the map are committed, so rerun this after
+changing the showcase data or images.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from imaging import FALLBACK_IMAGE, open_rgb
+from profiling import configure, traced
+from showcase import ROOT, artists_by_genre, image_path, load_artists
+
+AVATAR_PX = 96
+PADDING = 2
+SHEET_MAX_PX = 1024
+QUALITY = 82
+
+ATLAS_DIR = ROOT / "web" / "assets" / "atlas"
+ATLAS_INDEX = ATLAS_DIR / "atlas.json"
+ATLAS_JS = ROOT / "web" / "sa-showcase-atlas.js"
+WEB_PREFIX = "assets/atlas"
+
+
+@dataclass
+class Placement:
+    sheet: int
+    x: int
+    y: int
+
+
+class ShelfPacker:
+    """Shelf (row) packer: fill left to right, open a new shelf or sheet on overflow."""
+
+    def __init__(self, max_width: int, max_height: int, padding: int = 0):
+        self.max_width = max_width
+        self.max_height = max_height
+        self.padding = padding
+        self.sheet_sizes: list[tuple[int, int]] = [(0, 0)]
+        self._x = self._y = self._shelf_h = 0
+
+    def place(self, w: int, h: int) -> Placement:
+        if w > self.max_width or h > self.max_height:
+            raise ValueError(f"{w}x{h} does not fit a {self.max_width}x{self.max_height} sheet")
+        if self._x + w > self.max_width:
+            self._y += self._shelf_h + self.padding
+            self._x = self._shelf_h = 0
+        if self._y + h > self.max_height:
+            self.sheet_sizes.append((0, 0))
+            self._x = self._y = self._shelf_h = 0
+
+        spot = Placement(len(self.sheet_sizes) - 1, self._x, self._y)
+        used_w, used_h = self.sheet_sizes[-1]
+        self.sheet_sizes[-1] = (max(used_w, self._x + w), max(used_h, self._y + h))
+        self._x += w + self.padding
+        self._shelf_h = max(self._shelf_h, h)
+        return spot
+
+
+def pack(sizes: list[tuple[int, int]], max_px: int = SHEET_MAX_PX, padding: int = PADDING):
+    """Place rects tallest-first; returns (placements in input order, sheet sizes)."""
+    packer = ShelfPacker(max_px, max_px, padding)
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    placements: list[Placement | None] = [None] * len(sizes)
+    for i in order:
+        placements[i] = packer.place(*sizes[i])
+    return placements, packer.sheet_sizes
+
+
+def avatar(path: Path, size: int = AVATAR_PX) -> Image.Image:
+    """Centre-crop to a square and downscale to ``size`` px."""
+    img = open_rgb(path if path.exists() else FALLBACK_IMAGE)
+    side = min(img.size)
+    left = (img.width - side) // 2
+    top = (img.height - side) // 2
+    return img.crop((left, top, left + side, top + side)).resize((size, size), Image.Resampling.LANCZOS)
+
+
+def file_digest(path: Path) -> str:
+    path = path if path.exists() else FALLBACK_IMAGE
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def row_key(artists: list[dict]) -> str:
+    h = hashlib.sha1(f"{AVATAR_PX}:{PADDING}:{SHEET_MAX_PX}:{QUALITY}".encode())
+    for artist in artists:
+        h.update(f"{artist['username']}={artist.get('image', '')}:".encode())
+        h.update(file_digest(image_path(artist)).encode())
+    return h.hexdigest()
+
+
+@traced()
+def build_row(slug: str, artists: list[dict]) -> dict:
+    """Pack one genre row; shared images (e.g. the fallback) get one tile."""
+    for stale in ATLAS_DIR.glob(f"{slug}-[0-9]*.webp"):
+        stale.unlink()
+    images = list(dict.fromkeys(image_path(a) for a in artists))
+    placements, sheet_sizes = pack([(AVATAR_PX, AVATAR_PX)] * len(images))
+
+    sheets = [Image.new("RGB", size) for size in sheet_sizes]
+    for path, spot in zip(images, placements):
+        sheets[spot.sheet].paste(avatar(path), (spot.x, spot.y))
+
+    sheet_refs = []
+    for index, sheet in enumerate(sheets):
+        out = ATLAS_DIR / f"{slug}-{index}.webp"
+        sheet.save(out, "WEBP", quality=QUALITY, method=6)
+        version = hashlib.sha1(out.read_bytes()).hexdigest()[:10]
+        sheet_refs.append(
+            {"src": f"{WEB_PREFIX}/{out.name}?v={version}", "width": sheet.width, "height": sheet.height}
+        )
+
+    tiles = {path: spot for path, spot in zip(images, placements)}
+    coords = {}
+    for artist in artists:
+        spot = tiles[image_path(artist)]
+        coords[artist["username"]] = [spot.sheet, spot.x, spot.y]
+    return {"sheets": sheet_refs, "artists": coords}
+
+
+def write_js(index: dict) -> None:
+    rows = {slug: {"sheets": row["sheets"], "artists": row["artists"]} for slug, row in index["rows"].items()}
+    payload = json.dumps({"size": AVATAR_PX, "rows": rows}, separators=(",", ":"))
+    ATLAS_JS.write_text(
+        "// Auto-generated by scripts/atlas.py — avatar sprite sheets per genre row\n"
+        "// SHOWCASE_ATLAS.rows[genreSlug].artists[username] = [sheetIndex, x, y]\n"
+        f"var SHOWCASE_ATLAS = {payload};\n",
+        encoding="utf-8",
+    )
+
+
+def build(only: set[str] | None = None, force: bool = False) -> tuple[int, int]:
+    """Repack changed genre rows (or just ``only``); returns (packed, skipped)."""
+    ATLAS_DIR.mkdir(parents=True, exist_ok=True)
+    index = json.loads(ATLAS_INDEX.read_text(encoding="utf-8")) if ATLAS_INDEX.exists() else {}
+    rows = index.get("rows", {})
+
+    packed = skipped = 0
+    groups = artists_by_genre(load_artists())
+    for slug, artists in groups.items():
+        if only is not None and slug not in only:
+            continue
+        if not artists:
+            rows.pop(slug, None)
+            for stale in ATLAS_DIR.glob(f"{slug}-[0-9]*.webp"):
+                stale.unlink()
+            continue
+        key = row_key(artists)
+        if not force and rows.get(slug, {}).get("key") == key:
+            skipped += 1
+            continue
+        rows[slug] = {"key": key, **build_row(slug, artists)}
+        packed += 1
+        print(f"  {slug}: {len(artists)} artists -> {len(rows[slug]['sheets'])} sheet(s)")
+
+    for slug in [s for s in rows if s not in groups]:
+        del rows[slug]
+        for stale in ATLAS_DIR.glob(f"{slug}-[0-9]*.webp"):
+            stale.unlink()
+    index = {"size": AVATAR_PX, "rows": dict(sorted(rows.items()))}
+    ATLAS_INDEX.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    write_js(index)
+    return packed, skipped
+
+
+def main() -> None:
+    configure()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--genre", action="append", help="only repack this genre slug (repeatable)")
+    parser.add_argument("--force", action="store_true", help="repack rows even if unchanged")
+    args = parser.parse_args()
+
+    packed, skipped = build(set(args.genre) if args.genre else None, args.force)
+    print(f"Atlas: {packed} rows packed, {skipped} unchanged -> {ATLAS_JS.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Benchmark the Python asset and data tooling on synthetic fixtures.
+
+    python scripts/bench-tooling.py                      # quick profile
+    python scripts/bench-tooling.py --profile full       # 8k logos, 10k images, 50k artists
+    python scripts/bench-tooling.py --save-baseline      # record current numbers
+    python scripts/bench-tooling.py --only logo          # one stage family
+
+Fixtures are generated locally (and cached) under bench-results/fixtures.
+Every case runs in a fresh process so wall time, peak RSS and throughput are
+measured per stage. Results are written as JSON and compared with
+scripts/bench-baseline.json; regressions beyond --threshold exit non-zero.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from showcase import ROOT, load_script
+
+RESULTS_DIR = ROOT / "bench-results"
+FIXTURES_DIR = RESULTS_DIR / "fixtures"
+BASELINE = ROOT / "scripts" / "bench-baseline.json"
+
+PROFILES = {
+    "quick": {"logo": [512, 1024], "resize": [100], "showcase": [100, 1000]},
+    "full": {
+        "logo": [512, 1024, 2048, 4096, 8192],
+        "resize": [100, 1000, 10000],
+        "showcase": [100, 5000, 50000],
+    },
+}
+
+CATEGORIES = ["Amapiano", "Hip Hop", "DJ", "Afropop", "Gospel", "Maskandi", "Gqom", "Rock"]
+TOWNS = ["Johannesburg", "Pretoria", "Durban", "Cape Town", "Soweto", "Limpopo", "KwaZulu-Natal"]
+
+
+# --- fixtures -----------------------------------------------------------------
+
+
+def make_logo(size: int) -> Path:
+    """Cut-out RGBA logo: artwork with a light halo and a thin white matte frame."""
+    from PIL import Image, ImageDraw, ImageFilter
+
+    path = FIXTURES_DIR / f"logo-{size}.png"
+    if path.exists():
+        return path
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    frame = max(2, size // 128)
+    draw.rectangle((0, 0, size - 1, size - 1), outline=(255, 255, 255, 255), width=frame)
+    m = size // 8
+    draw.ellipse((m, m, size - m, size - m), fill=(238, 238, 238, 255))
+    m += max(2, size // 200)
+    draw.ellipse((m, m, size - m, size - m), fill=(24, 28, 40, 255))
+    draw.rectangle((size // 3, size // 3, 2 * size // 3, 2 * size // 3), fill=(230, 80, 30, 255))
+    img = img.filter(ImageFilter.GaussianBlur(radius=max(1, size // 1024)))
+    img.save(path)
+    return path
+
+
+def make_image_folder(count: int) -> Path:
+    from PIL import Image
+
+    folder = FIXTURES_DIR / f"images-{count}"
+    if folder.exists() and len(list(folder.iterdir())) == count:
+        return folder
+    shutil.rmtree(folder, ignore_errors=True)
+    folder.mkdir(parents=True)
+    rng = random.Random(count)
+    suffixes = [".jpg", ".png", ".webp"]
+    for i in range(count):
+        w, h = rng.choice([(640, 480), (800, 800), (1200, 900), (480, 640)])
+        base = Image.linear_gradient("L").resize((w, h)).convert("RGB")
+        tint = Image.new("RGB", (w, h), tuple(rng.randrange(256) for _ in range(3)))
+        img = Image.blend(base, tint, 0.5)
+        suffix = suffixes[i % len(suffixes)]
+        if suffix == ".png":
+            img = img.convert("RGBA")
+        img.save(folder / f"artist-{i:05d}{suffix}")
+    return folder
+
+
+def synthetic_artists(count: int) -> list[tuple]:
+    """Rows in generate-sa-showcase.py ARTISTS format."""
+    rng = random.Random(count)
+    rows = []
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        town = rng.choice(TOWNS)
+        name = f"Artist {i:05d}"
+        rows.append(
+            (name, f"artist-{i:05d}", "artists.png", category, f"{category} · {town}", town, rng.randrange(0, 12000))
+        )
+    return rows
+
+
+def make_showcase(count: int) -> Path:
+    folder = FIXTURES_DIR / f"showcase-{count}"
+    if (folder / "functions" / "api" / "sa-showcase-data.js").exists():
+        return folder
+    (folder / "functions" / "api").mkdir(parents=True, exist_ok=True)
+    (folder / "web").mkdir(exist_ok=True)
+    (folder / "artists.json").write_text(json.dumps(synthetic_artists(count)), encoding="utf-8")
+    _run_generator(folder)
+    return folder
+
+
+def make_dart(count: int) -> Path:
+    path = FIXTURES_DIR / f"gearsh_artists-{count}.dart"
+    if path.exists():
+        return path
+    entries = []
+    for name, username, *_ in sorted(synthetic_artists(count), key=lambda _: random.random()):
+        entries.append(f"  GearshArtist(\n    id: '{username}',\n    name: '{name}',\n    rating: 4.5,\n  ),\n")
+    path.write_text(
+        "class GearshArtist {}\n\nconst List<GearshArtist> gearshArtists = [\n" + "".join(entries) + "];\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+# --- cases (run in a child process) -------------------------------------------
+
+
+def _run_generator(folder: Path) -> None:
+    gen = load_script(ROOT / "scripts" / "generate-sa-showcase.py")
+    gen.ARTISTS = [tuple(row) for row in json.loads((folder / "artists.json").read_text(encoding="utf-8"))]
+    cwd = os.getcwd()
+    os.chdir(folder)
+    try:
+        gen.main()
+    finally:
+        os.chdir(cwd)
+
+
+def case_logo(size: int) -> int:
+    import numpy as np
+    from PIL import Image
+
+    clean = load_script(ROOT / "scripts" / "clean-logo.py")
+    rgba = np.array(Image.open(make_logo(size)).convert("RGBA"))
+    clean.process_logo(rgba)
+    return size * size
+
+
+def case_resize(count: int) -> int:
+    resizer = load_script(ROOT / "resize_images.py")
+    src = make_image_folder(count)
+    work = RESULTS_DIR / f"work-resize-{os.getpid()}"
+    shutil.copytree(src, work)
+    try:
+        ok = sum(resizer.resize_image(p, p, size=400) for p in sorted(work.iterdir()))
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return ok
+
+
+def case_generate(count: int) -> int:
+    with _quiet():
+        _run_generator(make_showcase(count))
+    return count
+
+
+def case_rates(count: int) -> int:
+    rates = load_script(ROOT / "scripts" / "update-showcase-rates.py")
+    src = make_showcase(count) / "functions" / "api" / "sa-showcase-data.js"
+    work = RESULTS_DIR / f"work-rates-{os.getpid()}.js"
+    shutil.copy(src, work)
+    try:
+        rates.patch_file(work)
+    finally:
+        work.unlink(missing_ok=True)
+    return count
+
+
+def case_parse(count: int) -> int:
+    from showcase import load_artists
+
+    return len(load_artists(make_showcase(count) / "functions" / "api" / "sa-showcase-data.js"))
+
+
+def case_sort(count: int) -> int:
+    sorter = load_script(ROOT / "sort_artists.py")
+    _, entries = sorter.sort_content(make_dart(count).read_text(encoding="utf-8"))
+    return len(entries)
+
+
+class _quiet:
+    def __enter__(self):
+        self._stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+
+    def __exit__(self, *exc):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+
+FIXTURES = {
+    "logo": make_logo,
+    "resize": make_image_folder,
+    "showcase": lambda count: (make_showcase(count), make_dart(count)),
+}
+
+CASES = {
+    # family -> [(stage, function, unit)]
+    "logo": [("clean-logo.process_logo", case_logo, "px")],
+    "resize": [("resize_images.resize_image", case_resize, "files")],
+    "showcase": [
+        ("generate-sa-showcase", case_generate, "artists"),
+        ("update-showcase-rates.patch_file", case_rates, "artists"),
+        ("showcase.load_artists", case_parse, "artists"),
+        ("sort_artists.sort_content", case_sort, "artists"),
+    ],
+}
+
+
+def peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / 2**20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _child(fn, size: int, queue) -> None:
+    try:
+        start = time.perf_counter()
+        items = fn(size)
+        wall = time.perf_counter() - start
+        queue.put({"wall_s": wall, "items": items, "peak_rss_mb": peak_rss_mb()})
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_case(fn, size: int, timeout: float) -> dict:
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_child, args=(fn, size, queue))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return {"error": f"timeout after {timeout:.0f}s"}
+    return queue.get() if not queue.empty() else {"error": f"exit code {proc.exitcode}"}
+
+
+# --- reporting ----------------------------------------------------------------
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if not base or "error" in current or "error" in base:
+            continue
+        for metric in ("wall_s", "peak_rss_mb"):
+            old, new = base.get(metric), current.get(metric)
+            if old and new and new > old * (1 + threshold):
+                regressions.append(f"{key}: {metric} {old:.3f} -> {new:.3f} (+{100 * (new / old - 1):.0f}%)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--only", choices=sorted(CASES), action="append", help="limit to a stage family")
+    parser.add_argument("--repeat", type=int, default=1, help="keep the fastest of N runs")
+    parser.add_argument("--timeout", type=float, default=900, help="seconds per case")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown before flagging")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    results: dict[str, dict] = {}
+    for family, sizes in PROFILES[args.profile].items():
+        if args.only and family not in args.only:
+            continue
+        with _quiet():
+            for size in sizes:
+                FIXTURES[family](size)
+        for stage, fn, unit in CASES[family]:
+            for size in sizes:
+                key = f"{stage}[{size}]"
+                runs = [run_case(fn, size, args.timeout) for _ in range(max(1, args.repeat))]
+                ok = [r for r in runs if "error" not in r]
+                best = min(ok, key=lambda r: r["wall_s"]) if ok else runs[0]
+                if "error" not in best:
+                    best[f"{unit}_per_s"] = best["items"] / best["wall_s"] if best["wall_s"] else None
+                    rss = f"{best['peak_rss_mb']:.0f}MB" if best["peak_rss_mb"] else "n/a"
+                    print(f"{key:48} {best['wall_s']:9.3f}s  {rss:>8}  {best[f'{unit}_per_s']:,.0f} {unit}/s")
+                else:
+                    print(f"{key:48} {best['error']}")
+                results[key] = best
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "profile": args.profile,
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": results,
+    }
+    out = RESULTS_DIR / f"bench-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    shutil.copy(out, RESULTS_DIR / "latest.json")
+    print(f"\nResults -> {out.relative_to(ROOT)}")
+
+    if args.save_baseline:
+        merged = json.loads(args.baseline.read_text(encoding="utf-8"))["results"] if args.baseline.exists() else {}
+        merged.update(results)
+        args.baseline.write_text(json.dumps({**report, "results": merged}, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline saved -> {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("No baseline yet; run with --save-baseline to record one.")
+        return
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8"))["results"], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        raise SystemExit(1)
+    print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
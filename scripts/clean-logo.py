@@ -8,6 +8,8 @@ from pathlib import Path
 import numpy as np
 from PIL import Image, ImageFilter
 
+from profiling import configure, stage, traced
+
 ROOT = Path(__file__).resolve().parents[1]
 SOURCE = ROOT / "assets" / "images" / "gearsh-logo.png"
 
@@ -27,6 +29,7 @@ def neighbor_mask(mask: np.ndarray) -> np.ndarray:
     return touches
 
 
+@traced()
 def strict_white_flood(rgba: np.ndarray) -> np.ndarray:
     """Remove only pure/near-pure white regions connected to the image border."""
     h, w, _ = rgba.shape
@@ -67,33 +70,37 @@ def strict_white_flood(rgba: np.ndarray) -> np.ndarray:
     return out
 
 
+@traced()
 def peel_light_fringe(rgba: np.ndarray, passes: int = 12) -> np.ndarray:
     """Remove neutral light halos directly bordering transparency."""
     out = rgba.copy()
     alpha = out[:, :, 3].astype(np.float32)
     rgb = out[:, :, :3].astype(np.float32)
 
-    for _ in range(passes):
-        transparent = alpha < 8
-        if not transparent.any():
-            break
-        touch = neighbor_mask(transparent) & (alpha >= 8)
-        avg = rgb.mean(axis=2)
-        spread = rgb.max(axis=2) - rgb.min(axis=2)
-
-        remove = touch & (
-            ((avg >= 228) & (spread <= 28))
-            | ((avg >= 210) & (spread <= 14))
-            | ((rgb[:, :, 0] >= 236) & (rgb[:, :, 1] >= 236) & (rgb[:, :, 2] >= 236))
-        )
-        if not remove.any():
-            break
-        alpha[remove] = 0
+    for index in range(passes):
+        with stage("peel_light_fringe.pass", index=index) as span:
+            transparent = alpha < 8
+            if not transparent.any():
+                break
+            touch = neighbor_mask(transparent) & (alpha >= 8)
+            avg = rgb.mean(axis=2)
+            spread = rgb.max(axis=2) - rgb.min(axis=2)
+
+            remove = touch & (
+                ((avg >= 228) & (spread <= 28))
+                | ((avg >= 210) & (spread <= 14))
+                | ((rgb[:, :, 0] >= 236) & (rgb[:, :, 1] >= 236) & (rgb[:, :, 2] >= 236))
+            )
+            span.record(removed_px=lambda: int(remove.sum()))
+            if not remove.any():
+                break
+            alpha[remove] = 0
 
     out[:, :, 3] = np.clip(alpha, 0, 255).astype(np.uint8)
     return out
 
 
+@traced()
 def fix_edge_matte(rgba: np.ndarray) -> np.ndarray:
     """Correct semi-transparent neutral edge pixels for dark UI backgrounds."""
     out = rgba.copy().astype(np.float32)
@@ -114,6 +121,7 @@ def fix_edge_matte(rgba: np.ndarray) -> np.ndarray:
     return out.astype(np.uint8)
 
 
+@traced()
 def polish_alpha(rgba: np.ndarray) -> np.ndarray:
     out = rgba.copy()
     alpha = out[:, :, 3].astype(np.float32)
@@ -126,6 +134,7 @@ def polish_alpha(rgba: np.ndarray) -> np.ndarray:
     return out
 
 
+@traced()
 def process_logo(rgba: np.ndarray) -> np.ndarray:
     opaque_before = int((rgba[:, :, 3] > 0).sum())
     out = strict_white_flood(rgba)
@@ -143,10 +152,13 @@ def process_logo(rgba: np.ndarray) -> np.ndarray:
 
 
 def save_png(rgba: np.ndarray, path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    Image.fromarray(rgba, mode="RGBA").save(path, format="PNG", optimize=True)
+    with stage("encode", path=path.name) as span:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(rgba, mode="RGBA").save(path, format="PNG", optimize=True)
+        span.record(bytes_in=rgba.nbytes, bytes_out=lambda: path.stat().st_size)
 
 
+@traced()
 def resize_icon(rgba: np.ndarray, size: int) -> np.ndarray:
     img = Image.fromarray(rgba, mode="RGBA").resize((size, size), Image.Resampling.LANCZOS)
     out = process_logo(np.array(img))
@@ -159,6 +171,7 @@ def resize_icon(rgba: np.ndarray, size: int) -> np.ndarray:
     return out
 
 
+@traced()
 def make_maskable(rgba: np.ndarray, size: int, inset: float = 0.12) -> np.ndarray:
     margin = int(size * inset)
     inner = size - margin * 2
@@ -169,10 +182,13 @@ def make_maskable(rgba: np.ndarray, size: int, inset: float = 0.12) -> np.ndarra
 
 
 def main() -> None:
+    configure()
     if not SOURCE.exists():
         raise SystemExit(f"Missing source logo: {SOURCE}")
 
-    source = np.array(Image.open(SOURCE).convert("RGBA"))
+    with stage("decode", path=SOURCE.name) as span:
+        source = np.array(Image.open(SOURCE).convert("RGBA"))
+        span.record(bytes_in=lambda: SOURCE.stat().st_size, bytes_out=source.nbytes)
     cleaned = process_logo(source)
 
     for name in ("gearsh-logo.png", "gearsh_logo.png", "gearsh.png"):
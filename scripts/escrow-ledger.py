@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Maintain escrow balance snapshots and reconcile the ledger against payments.
+
+    python scripts/escrow-ledger.py --db gearsh.sqlite snapshot            # fold in new ledger entries
+    python scripts/escrow-ledger.py --db gearsh.sqlite snapshot --full     # rebuild from scratch
+    python scripts/escrow-ledger.py --db gearsh.sqlite balance book_123
+    python scripts/escrow-ledger.py --db gearsh.sqlite reconcile --out discrepancies.jsonl
+
+escrow_ledger is append-only, so snapshot folds only entries above a rowid
+high-water mark into escrow_balances (database/add_payment_reconciliation.sql).
+Both the deltas and the new mark are written in one transaction per
+--chunk rows. A balance is then the snapshot row plus the entries for that
+booking above the mark, one seek on idx_escrow_booking. A VACUUM can
+renumber the ledger's rowids; reconcile reports that as snapshot drift, and
+snapshot --full repairs it.
+
+reconcile streams index-ordered cursors through a k-way merge join, so
+memory holds one key's rows at a time whatever the table sizes:
+
+  payments x escrow holds, by payment id: holds without a payment,
+    complete payments without a hold, amount mismatches, duplicate
+    holds, and holds on failed payments
+  bookings x ledger totals x snapshots x fees, by booking id: overdrawn
+    escrow, money left on settled bookings (beyond the retained platform
+    fee), ledger entries for missing bookings, and snapshot drift
+  ticket_orders x ticket_payments, by order id: paid orders without a
+    complete payment, payments on unpaid orders, and amount mismatches
+
+Ticket sales do not go through escrow_ledger, so the third pass checks
+them against their orders instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import sys
+import time
+from collections import Counter
+from itertools import groupby
+from pathlib import Path
+
+from jobs import Checkpoint, Discrepancies, now_iso, transaction
+from migrate import connect
+
+JOB = "escrow-balances"
+CENT = 0.005
+REFUND_TYPES = ("refund", "partial_refund")
+
+SUMS = f"""
+  SUM(CASE WHEN event_type = 'hold' THEN amount ELSE 0 END),
+  SUM(CASE WHEN event_type = 'release' THEN amount ELSE 0 END),
+  SUM(CASE WHEN event_type IN {REFUND_TYPES} THEN amount ELSE 0 END)"""
+
+FOLD = f"""
+INSERT INTO escrow_balances (booking_id, held, released, refunded, entries, last_rowid, last_event_at, updated_at)
+SELECT booking_id, {SUMS},
+  COUNT(*), MAX(rowid), MAX(created_at), :now
+FROM escrow_ledger
+WHERE rowid > :lo AND rowid <= :hi
+GROUP BY booking_id
+ON CONFLICT(booking_id) DO UPDATE SET
+  held = held + excluded.held,
+  released = released + excluded.released,
+  refunded = refunded + excluded.refunded,
+  entries = entries + excluded.entries,
+  last_rowid = MAX(last_rowid, excluded.last_rowid),
+  last_event_at = MAX(IFNULL(last_event_at, ''), excluded.last_event_at),
+  updated_at = excluded.updated_at
+"""
+
+
+def require_tables(conn) -> None:
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'escrow_balances'").fetchone():
+        sys.exit("escrow_balances is missing; apply database/add_payment_reconciliation.sql first")
+
+
+def snapshot(conn, chunk: int, full: bool) -> tuple[int, int, float]:
+    """Fold ledger rows above the mark into escrow_balances; returns (rows folded, new mark, seconds)."""
+    started = time.perf_counter()
+    ckpt = Checkpoint(conn, JOB)
+    if full:
+        with transaction(conn):
+            conn.execute("DELETE FROM escrow_balances")
+            ckpt.save(0)
+    mark = int(ckpt.position or 0)
+    top = conn.execute("SELECT IFNULL(MAX(rowid), 0) FROM escrow_ledger").fetchone()[0]
+    folded = 0
+    while mark < top:
+        hi = min(top, mark + chunk)
+        with transaction(conn):
+            conn.execute(FOLD, {"lo": mark, "hi": hi, "now": now_iso()})
+            folded += conn.execute(
+                "SELECT COUNT(*) FROM escrow_ledger WHERE rowid > ? AND rowid <= ?", (mark, hi)
+            ).fetchone()[0]
+            ckpt.save(hi)
+        mark = hi
+    return folded, mark, time.perf_counter() - started
+
+
+def balance(conn, booking_id: str) -> dict:
+    """Snapshot plus the ledger tail above the high-water mark."""
+    mark = int(Checkpoint(conn, JOB).position or 0)
+    snap = conn.execute(
+        "SELECT held, released, refunded, entries FROM escrow_balances WHERE booking_id = ?", (booking_id,)
+    ).fetchone() or (0, 0, 0, 0)
+    tail = conn.execute(
+        f"SELECT {SUMS}, COUNT(*) FROM escrow_ledger WHERE booking_id = ? AND rowid > ?", (booking_id, mark)
+    ).fetchone()
+    held, released, refunded = (s + (t or 0) for s, t in zip(snap[:3], tail[:3]))
+    return {
+        "booking_id": booking_id,
+        "held": round(held, 2),
+        "released": round(released, 2),
+        "refunded": round(refunded, 2),
+        "remaining": round(held - released - refunded, 2),
+        "entries": snap[3] + tail[3],
+        "tail_entries": tail[3],
+    }
+
+
+# -- reconciliation ------------------------------------------------------------
+
+
+def merge_groups(*streams):
+    """Merge cursors sorted by their first column; yields (key, [rows per stream])."""
+    def tag(i, stream):
+        return ((row[0], i, row) for row in stream)
+
+    tagged = [tag(i, stream) for i, stream in enumerate(streams)]
+    for key, items in groupby(heapq.merge(*tagged, key=lambda t: t[0]), key=lambda t: t[0]):
+        groups = [[] for _ in streams]
+        for _, i, row in items:
+            groups[i].append(row)
+        yield key, groups
+
+
+def reconcile_payments(conn, report: Discrepancies, checked: Counter) -> None:
+    payments = conn.execute("SELECT id, booking_id, amount, status FROM payments ORDER BY id")
+    holds = conn.execute(
+        "SELECT payment_id, id, booking_id, amount FROM escrow_ledger "
+        "WHERE payment_id IS NOT NULL AND event_type = 'hold' ORDER BY payment_id"
+    )
+    for payment_id, (pays, held) in merge_groups(payments, holds):
+        checked["payments"] += len(pays)
+        held_total = sum(h[3] for h in held)
+        if not pays:
+            report.add("hold_without_payment", payment_id, held_total, ledger_ids=[h[1] for h in held])
+            continue
+        _, booking_id, amount, status = pays[0]
+        if status == "complete" and not held:
+            report.add("complete_payment_without_hold", payment_id, amount, booking_id=booking_id)
+        elif held and status in ("failed", "cancelled"):
+            report.add("hold_on_failed_payment", payment_id, held_total, booking_id=booking_id, status=status)
+        elif held and abs(held_total - amount) > CENT:
+            report.add("hold_amount_mismatch", payment_id, held_total - amount,
+                       booking_id=booking_id, held=held_total, paid=amount)
+        if len(held) > 1:
+            report.add("duplicate_hold", payment_id, held_total, ledger_ids=[h[1] for h in held])
+    for ledger_id, booking_id, amount in conn.execute(
+        "SELECT id, booking_id, amount FROM escrow_ledger WHERE payment_id IS NULL AND event_type = 'hold'"
+    ):
+        report.add("hold_without_payment_id", ledger_id, amount, booking_id=booking_id)
+
+
+def reconcile_bookings(conn, report: Discrepancies, checked: Counter) -> None:
+    mark = int(Checkpoint(conn, JOB).position or 0)
+    bookings = conn.execute("SELECT id, status FROM bookings ORDER BY id")
+    # GROUP BY booking_id streams in key order off idx_escrow_booking
+    ledger = conn.execute(
+        f"SELECT booking_id, {SUMS} FROM escrow_ledger WHERE rowid <= ? GROUP BY booking_id ORDER BY booking_id",
+        (mark,),
+    )
+    snapshots = conn.execute("SELECT booking_id, held, released, refunded FROM escrow_balances ORDER BY booking_id")
+    fees = conn.execute(
+        "SELECT booking_id, SUM(platform_fee) FROM payments WHERE status = 'complete' "
+        "GROUP BY booking_id ORDER BY booking_id"
+    )
+    for booking_id, (booking, totals, snap, fee) in merge_groups(bookings, ledger, snapshots, fees):
+        checked["bookings"] += len(booking)
+        if totals:
+            _, held, released, refunded = totals[0]
+        else:
+            held = released = refunded = 0.0
+        if snap and not totals:
+            report.add("snapshot_drift", booking_id, snap[0][1], snapshot=list(snap[0][1:]), ledger=None)
+        elif totals and (not snap or any(abs(a - b) > CENT for a, b in zip(snap[0][1:], totals[0][1:]))):
+            report.add("snapshot_drift", booking_id, held - (snap[0][1] if snap else 0),
+                       snapshot=list(snap[0][1:]) if snap else None, ledger=[held, released, refunded])
+        if not totals:
+            continue
+        if not booking:
+            report.add("ledger_for_missing_booking", booking_id, held)
+            continue
+        remaining = held - released - refunded
+        retained_fee = fee[0][1] if fee else 0.0
+        status = booking[0][1]
+        if remaining < -CENT:
+            report.add("overdrawn", booking_id, remaining, status=status,
+                       held=held, released=released, refunded=refunded)
+        elif status in ("completed", "cancelled") and remaining > CENT and abs(remaining - retained_fee) > CENT:
+            report.add("residual_on_settled_booking", booking_id, remaining, status=status, platform_fee=retained_fee)
+
+
+def reconcile_tickets(conn, report: Discrepancies, checked: Counter) -> None:
+    orders = conn.execute("SELECT id, status, total FROM ticket_orders ORDER BY id")
+    payments = conn.execute(
+        "SELECT ticket_order_id, id, amount, status FROM ticket_payments ORDER BY ticket_order_id"
+    )
+    for order_id, (order, pays) in merge_groups(orders, payments):
+        checked["ticket orders"] += len(order)
+        complete = [p for p in pays if p[3] == "complete"]
+        paid_total = sum(p[2] for p in complete)
+        if not order:
+            report.add("ticket_payment_for_missing_order", order_id, paid_total, payment_ids=[p[1] for p in pays])
+            continue
+        _, status, total = order[0]
+        if status == "paid" and not complete:
+            report.add("paid_order_without_payment", order_id, total)
+        elif complete and status != "paid":
+            report.add("payment_on_unpaid_order", order_id, paid_total, status=status)
+        elif complete and abs(paid_total - total) > CENT:
+            report.add("ticket_amount_mismatch", order_id, paid_total - total, paid=paid_total, total=total)
+        if len(complete) > 1:
+            report.add("duplicate_ticket_payment", order_id, paid_total, payment_ids=[p[1] for p in complete])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    snap = sub.add_parser("snapshot", help="fold new ledger entries into escrow_balances")
+    snap.add_argument("--full", action="store_true", help="discard snapshots and rebuild from the first entry")
+    snap.add_argument("--chunk", type=int, default=50_000, help="ledger rows per transaction")
+    bal = sub.add_parser("balance", help="print a booking's escrow balance")
+    bal.add_argument("booking_id")
+    rec = sub.add_parser("reconcile", help="cross-check the ledger, payments and ticket payments")
+    rec.add_argument("--out", type=Path, help="write every discrepancy here as JSON lines")
+    rec.add_argument("--show", type=int, default=3, help="examples printed per kind")
+    rec.add_argument("--no-snapshot", action="store_true", help="do not fold new entries first")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        require_tables(conn)
+        if args.cmd == "snapshot":
+            folded, mark, elapsed = snapshot(conn, args.chunk, args.full)
+            print(f"Folded {folded:,} ledger entries in {elapsed:.1f}s; high-water mark is rowid {mark:,}")
+        elif args.cmd == "balance":
+            print(json.dumps(balance(conn, args.booking_id), indent=2))
+        elif args.cmd == "reconcile":
+            if not args.no_snapshot:
+                snapshot(conn, 50_000, full=False)
+            started = time.perf_counter()
+            out = args.out.open("w", encoding="utf-8") if args.out else None
+            report = Discrepancies(out, args.show)
+            checked: Counter = Counter()
+            try:
+                reconcile_payments(conn, report, checked)
+                reconcile_bookings(conn, report, checked)
+                reconcile_tickets(conn, report, checked)
+            finally:
+                if out:
+                    out.close()
+            report.print(checked, time.perf_counter() - started)
+            if report.counts:
+                sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
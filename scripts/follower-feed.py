@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Maintain the materialized following feed (follower_feed) on a replica.
+
+    python scripts/follower-feed.py --db gearsh.sqlite backfill        # rebuild in chunks
+    python scripts/follower-feed.py --db gearsh.sqlite sync            # fan out what is new
+    python scripts/follower-feed.py --db gearsh.sqlite read --user user_123
+    python scripts/follower-feed.py --db load.sqlite bench             # vs the fan-in query
+
+Public activities are pushed into a row per follower (fan-out on write).
+Artists with more than --cap followers are not fanned out. They are listed
+in feed_pull_artists, and a read merges their newest activities in from
+idx_artist_activities_artist (pull fallback). A feed page is then one range
+scan of the follower_feed primary key, plus one short indexed scan per
+followed pull artist, in place of the artist_follows x artist_activities join
+that functions/api/activity/following.js runs.
+
+sync is incremental. It reads new activities and follows by rowid from a
+job checkpoint, reclassifies artists that crossed the cap, and (with
+--prune) drops rows for unfollows and activities that were hidden or
+deleted. --depth keeps only each follower's newest N rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+
+from jobs import Checkpoint, now_iso, transaction
+from migrate import connect
+
+FAN_IN = """
+SELECT aa.created_at, aa.id
+FROM artist_activities aa
+JOIN artist_follows af ON af.artist_id = aa.artist_id
+JOIN artist_profiles ap ON ap.id = aa.artist_id
+JOIN users u ON u.id = ap.user_id
+WHERE af.follower_user_id = ? AND aa.is_public = 1 AND aa.created_at < ?
+ORDER BY aa.created_at DESC LIMIT ?
+"""
+END = "\uffff"  # sorts after every ISO timestamp: "no cursor"
+
+
+def fan_out(conn, where: str, params: tuple) -> int:
+    """Push matching public activities to the followers of non-pull artists."""
+    conn.execute(
+        f"""INSERT OR IGNORE INTO follower_feed (follower_user_id, created_at, activity_id, artist_id)
+SELECT af.follower_user_id, aa.created_at, aa.id, aa.artist_id
+FROM artist_activities aa
+JOIN artist_follows af ON af.artist_id = aa.artist_id
+WHERE aa.is_public = 1 AND {where}
+  AND aa.artist_id NOT IN (SELECT artist_id FROM feed_pull_artists)""",
+        params,
+    )
+    return conn.execute("SELECT changes()").fetchone()[0]
+
+
+def classify(conn, cap: int) -> tuple[list[str], list[str]]:
+    """Refresh feed_pull_artists; returns (newly pull, newly push) artist ids."""
+    counts = dict(conn.execute(
+        "SELECT artist_id, COUNT(*) FROM artist_follows GROUP BY artist_id HAVING COUNT(*) > ?", (cap,)
+    ))
+    current = {a for (a,) in conn.execute("SELECT artist_id FROM feed_pull_artists")}
+    to_pull = sorted(set(counts) - current)
+    to_push = sorted(current - set(counts))
+    stamp = now_iso()
+    conn.executemany(
+        "INSERT INTO feed_pull_artists (artist_id, follower_count, updated_at) VALUES (?, ?, ?) "
+        "ON CONFLICT(artist_id) DO UPDATE SET follower_count = excluded.follower_count, updated_at = excluded.updated_at",
+        [(a, n, stamp) for a, n in counts.items()],
+    )
+    conn.executemany("DELETE FROM feed_pull_artists WHERE artist_id = ?", [(a,) for a in to_push])
+    return to_pull, to_push
+
+
+def trim(conn, depth: int, chunk: int) -> int:
+    """Keep each follower's newest ``depth`` rows, in follower key ranges."""
+    removed, lo = 0, ""
+    while True:
+        row = conn.execute(
+            "SELECT follower_user_id FROM follower_feed WHERE follower_user_id > ? "
+            "ORDER BY follower_user_id LIMIT 1 OFFSET ?",
+            (lo, chunk),
+        ).fetchone()
+        hi = row[0] if row else END
+        with transaction(conn):
+            conn.execute(
+                """DELETE FROM follower_feed WHERE (follower_user_id, created_at, activity_id) IN (
+  SELECT follower_user_id, created_at, activity_id FROM (
+    SELECT follower_user_id, created_at, activity_id,
+      ROW_NUMBER() OVER (PARTITION BY follower_user_id ORDER BY created_at DESC) AS n
+    FROM follower_feed WHERE follower_user_id > ? AND follower_user_id <= ?
+  ) WHERE n > ?
+)""",
+                (lo, hi, depth),
+            )
+            removed += conn.execute("SELECT changes()").fetchone()[0]
+        if not row:
+            return removed
+        lo = hi
+
+
+def backfill(conn, cap: int, chunk: int, depth: int) -> None:
+    started = time.perf_counter()
+    with transaction(conn):
+        conn.execute("DELETE FROM follower_feed")
+        conn.execute("DELETE FROM feed_pull_artists")
+        to_pull, _ = classify(conn, cap)
+        Checkpoint(conn, "follower-feed").clear()
+    tops = conn.execute(
+        "SELECT (SELECT IFNULL(MAX(rowid), 0) FROM artist_activities), (SELECT IFNULL(MAX(rowid), 0) FROM artist_follows)"
+    ).fetchone()
+    artists = [a for (a,) in conn.execute("SELECT DISTINCT artist_id FROM artist_activities ORDER BY artist_id")]
+    rows = 0
+    # Artist key ranges; `chunk` is a target number of feed rows per transaction
+    lo, i = "", 0
+    followers = dict(conn.execute("SELECT artist_id, COUNT(*) FROM artist_follows GROUP BY artist_id"))
+    activities = dict(conn.execute("SELECT artist_id, COUNT(*) FROM artist_activities GROUP BY artist_id"))
+    while i < len(artists):
+        size = 0
+        while i < len(artists) and (size == 0 or size < chunk):
+            size += followers.get(artists[i], 0) * activities.get(artists[i], 0)
+            i += 1
+        hi = artists[i - 1]
+        with transaction(conn):
+            rows += fan_out(conn, "aa.artist_id > ? AND aa.artist_id <= ?", (lo, hi))
+        lo = hi
+    with transaction(conn):
+        Checkpoint(conn, "follower-feed").save({"activities": tops[0], "follows": tops[1]})
+    trimmed = trim(conn, depth, chunk) if depth else 0
+    elapsed = time.perf_counter() - started
+    print(
+        f"backfill: {rows:,} feed rows for {len(artists):,} artists in {elapsed:.1f}s "
+        f"({rows / max(elapsed, 1e-9):,.0f} rows/s); {len(to_pull)} pull artists over {cap:,} followers"
+        + (f"; trimmed {trimmed:,} beyond depth {depth}" if depth else "")
+    )
+
+
+def sync(conn, cap: int, chunk: int, depth: int, prune: bool) -> None:
+    started = time.perf_counter()
+    ckpt = Checkpoint(conn, "follower-feed")
+    if ckpt.position is None:
+        raise SystemExit("follower_feed has not been backfilled yet (run backfill first)")
+    since = ckpt.position
+    tops = conn.execute(
+        "SELECT (SELECT IFNULL(MAX(rowid), 0) FROM artist_activities), (SELECT IFNULL(MAX(rowid), 0) FROM artist_follows)"
+    ).fetchone()
+    with transaction(conn):
+        to_pull, to_push = classify(conn, cap)
+        for artist in to_pull:
+            conn.execute("DELETE FROM follower_feed WHERE artist_id = ?", (artist,))
+        pushed = fan_out(conn, "aa.artist_id IN (SELECT value FROM json_each(?))", (json.dumps(to_push),))
+
+    new_activity_rows = 0
+    lo = since["activities"]
+    while lo < tops[0]:
+        hi = min(lo + max(1, chunk // 100), tops[0])
+        with transaction(conn):
+            new_activity_rows += fan_out(conn, "aa.rowid > ? AND aa.rowid <= ?", (lo, hi))
+        lo = hi
+
+    # New follows: pull the followed artist's recent history into that follower's feed
+    with transaction(conn):
+        conn.execute(
+            f"""INSERT OR IGNORE INTO follower_feed (follower_user_id, created_at, activity_id, artist_id)
+SELECT af.follower_user_id, aa.created_at, aa.id, aa.artist_id
+FROM artist_follows af
+JOIN artist_activities aa ON aa.artist_id = af.artist_id
+WHERE af.rowid > ? AND af.rowid <= ? AND aa.is_public = 1
+  AND af.artist_id NOT IN (SELECT artist_id FROM feed_pull_artists)
+  {"AND aa.created_at >= IFNULL((SELECT created_at FROM artist_activities x WHERE x.artist_id = af.artist_id ORDER BY created_at DESC LIMIT 1 OFFSET " + str(depth - 1) + "), '')" if depth else ""}""",
+            (since["follows"], tops[1]),
+        )
+        follow_rows = conn.execute("SELECT changes()").fetchone()[0]
+        ckpt.save({"activities": tops[0], "follows": tops[1]})
+
+    pruned = 0
+    if prune:
+        with transaction(conn):
+            conn.execute(
+                """DELETE FROM follower_feed WHERE NOT EXISTS (
+  SELECT 1 FROM artist_follows af
+  WHERE af.follower_user_id = follower_feed.follower_user_id AND af.artist_id = follower_feed.artist_id
+) OR NOT EXISTS (
+  SELECT 1 FROM artist_activities aa WHERE aa.id = follower_feed.activity_id AND aa.is_public = 1
+)"""
+            )
+            pruned = conn.execute("SELECT changes()").fetchone()[0]
+    trimmed = trim(conn, depth, chunk) if depth else 0
+    print(
+        f"sync: +{new_activity_rows:,} rows from new activities, +{follow_rows:,} from new follows, "
+        f"+{pushed:,} for {len(to_push)} artists back under the cap, {len(to_pull)} moved to pull, "
+        f"-{pruned:,} pruned, -{trimmed:,} trimmed in {time.perf_counter() - started:.2f}s"
+    )
+
+
+def read_page(conn, user: str, cursor: str | None = None, limit: int = 10) -> list[tuple[str, str]]:
+    """Newest-first (created_at, activity_id) for one feed page."""
+    before = cursor or END
+    push = conn.execute(
+        "SELECT created_at, activity_id FROM follower_feed "
+        "WHERE follower_user_id = ? AND created_at < ? ORDER BY created_at DESC LIMIT ?",
+        (user, before, limit),
+    ).fetchall()
+    streams = [push]
+    for (artist,) in conn.execute(
+        "SELECT af.artist_id FROM artist_follows af JOIN feed_pull_artists p ON p.artist_id = af.artist_id "
+        "WHERE af.follower_user_id = ?",
+        (user,),
+    ).fetchall():
+        streams.append(conn.execute(
+            "SELECT created_at, id FROM artist_activities "
+            "WHERE artist_id = ? AND is_public = 1 AND created_at < ? ORDER BY created_at DESC LIMIT ?",
+            (artist, before, limit),
+        ).fetchall())
+    merged = heapq.merge(*streams, reverse=True)
+    return [row for _, row in zip(range(limit), merged)]
+
+
+def percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def bench(conn, sample: int, limit: int, seed: int) -> None:
+    rng = random.Random(seed)
+    followers = [u for (u,) in conn.execute("SELECT DISTINCT follower_user_id FROM artist_follows")]
+    users = rng.sample(followers, min(sample, len(followers)))
+    timings: dict[str, list[float]] = {"fan-in join": [], "materialized": []}
+    mismatched = 0
+    for user in users:
+        started = time.perf_counter()
+        expected = conn.execute(FAN_IN, (user, END, limit)).fetchall()
+        timings["fan-in join"].append(1000 * (time.perf_counter() - started))
+        started = time.perf_counter()
+        got = read_page(conn, user, None, limit)
+        timings["materialized"].append(1000 * (time.perf_counter() - started))
+        mismatched += [r[0] for r in expected] != [r[0] for r in got]
+    rows = conn.execute("SELECT COUNT(*) FROM follower_feed").fetchone()[0]
+    pull = conn.execute("SELECT COUNT(*) FROM feed_pull_artists").fetchone()[0]
+    print(f"{len(users)} followers, page size {limit}; follower_feed {rows:,} rows, {pull} pull artists")
+    for name, ms in timings.items():
+        print(
+            f"  {name:13} p50 {statistics.median(ms):7.3f}ms  p95 {percentile(ms, 0.95):7.3f}ms  "
+            f"p99 {percentile(ms, 0.99):7.3f}ms"
+        )
+    speedup = statistics.median(timings["fan-in join"]) / max(statistics.median(timings["materialized"]), 1e-9)
+    print(f"  median speedup {speedup:.1f}x; {mismatched} page(s) differ from the join"
+          + (" (expected when --depth trims history)" if mismatched else ""))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    parser.add_argument("--cap", type=int, default=10_000, help="followers above which an artist is pulled, not pushed")
+    parser.add_argument("--chunk", type=int, default=200_000, help="target feed rows per transaction")
+    parser.add_argument("--depth", type=int, default=0, help="keep only the newest N rows per follower (0 = all)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("backfill", help="rebuild follower_feed from scratch")
+    sync_cmd = sub.add_parser("sync", help="apply activities and follows added since the last run")
+    sync_cmd.add_argument("--prune", action="store_true", help="also drop rows for unfollows and hidden activities")
+    read_cmd = sub.add_parser("read", help="print one feed page")
+    read_cmd.add_argument("--user", required=True)
+    read_cmd.add_argument("--cursor")
+    read_cmd.add_argument("--limit", type=int, default=10)
+    bench_cmd = sub.add_parser("bench", help="compare page reads with the fan-in join")
+    bench_cmd.add_argument("--sample", type=int, default=500)
+    bench_cmd.add_argument("--limit", type=int, default=11, help="rows per page (following.js reads limit + 1)")
+    bench_cmd.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'follower_feed'").fetchone():
+        raise SystemExit(f"{args.db} has no follower_feed table; run scripts/migrate.py --db {args.db} first")
+    try:
+        if args.command == "backfill":
+            backfill(conn, args.cap, args.chunk, args.depth)
+        elif args.command == "sync":
+            sync(conn, args.cap, args.chunk, args.depth, args.prune)
+        elif args.command == "read":
+            for created_at, activity_id in read_page(conn, args.user, args.cursor, args.limit):
+                print(f"{created_at}  {activity_id}")
+        else:
+            bench(conn, args.sample, args.limit, args.seed)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """Generate SA showcase artist data for Gearsh (100 claimable listings)."""
 
+import json
 from pathlib import Path
 
+from profiling import configure, stage
+
 FALLBACK = "assets/images/artists/artists.png"
+# Written by scripts/lqip.py — BlurHash + tiny preview per image file
+PLACEHOLDERS = Path("assets/images/artists/placeholders.json")
 
 # name, username, image file, category, genre label, location, mastery_hours
 ARTISTS = [
@@ -196,110 +201,126 @@ def hourly_rate(hours):
     return 3500
 
 
-lines = [
-    "// 100 South African artists — listed for discovery, claimable later via claim-profile",
-    "export const SA_SHOWCASE_ARTISTS = [",
-]
+def main():
+    configure()
+    placeholders = json.loads(PLACEHOLDERS.read_text(encoding="utf-8")) if PLACEHOLDERS.exists() else {}
 
-for name, username, image_file, category, genre, location, hours in ARTISTS:
-    badge, badge_class, large = badge_for(hours)
-    genre_slug = resolve_genre_slug(category, genre)
-    image = f"assets/images/artists/{image_file}" if image_file != FALLBACK else FALLBACK
-    if not image_file.startswith("assets/"):
-        image = f"assets/images/artists/{image_file}"
-    bio = f"{name} — available to book on Gearsh. Claim this profile to manage bookings and payments."
-    skills = [category]
-    if "Hip Hop" in genre or category == "Hip Hop":
-        skills = ["Hip Hop", "Rap", "Live Performance"]
-    elif "Amapiano" in genre or category == "Amapiano":
-        skills = ["Amapiano", "DJ", "Live Performance"]
-    elif category == "DJ":
-        skills = ["DJ", "House", "Live Performance"]
-    else:
-        skills = [category, "Live Performance"]
+    lines = [
+        "// 100 South African artists — listed for discovery, claimable later via claim-profile",
+        "export const SA_SHOWCASE_ARTISTS = [",
+    ]
 
-    lines.append("  {")
-    lines.append(f"    name: '{js_string(name)}',")
-    lines.append(f"    username: '{username}',")
-    lines.append(f"    image: '{image}',")
-    lines.append(f"    category: '{js_string(category)}',")
-    lines.append(f"    genre: '{js_string(genre)}',")
-    lines.append(f"    genreSlug: '{genre_slug}',")
-    lines.append(f"    location: '{js_string(location)}',")
-    lines.append("    country: 'South Africa',")
-    lines.append(f"    masteryHours: {hours},")
-    lines.append(f"    badge: '{badge}',")
-    lines.append(f"    badgeClass: '{badge_class}',")
-    if large:
-        lines.append("    large: true,")
-    lines.append(f"    hourlyRate: {hourly_rate(hours)},")
-    lines.append(f"    bio: '{js_string(bio)}',")
-    skills_js = ", ".join(f"'{js_string(s)}'" for s in skills)
-    lines.append(f"    skills: [{skills_js}],")
-    lines.append("  },")
+    for name, username, image_file, category, genre, location, hours in ARTISTS:
+        badge, badge_class, large = badge_for(hours)
+        genre_slug = resolve_genre_slug(category, genre)
+        image = f"assets/images/artists/{image_file}" if image_file != FALLBACK else FALLBACK
+        if not image_file.startswith("assets/"):
+            image = f"assets/images/artists/{image_file}"
+        placeholder = placeholders.get(Path(image).name) or placeholders.get(Path(FALLBACK).name)
+        bio = f"{name} — available to book on Gearsh. Claim this profile to manage bookings and payments."
+        skills = [category]
+        if "Hip Hop" in genre or category == "Hip Hop":
+            skills = ["Hip Hop", "Rap", "Live Performance"]
+        elif "Amapiano" in genre or category == "Amapiano":
+            skills = ["Amapiano", "DJ", "Live Performance"]
+        elif category == "DJ":
+            skills = ["DJ", "House", "Live Performance"]
+        else:
+            skills = [category, "Live Performance"]
 
-lines.append("];")
-lines.append("")
-lines.append("export const GENRE_FEED_CATEGORIES = [")
-lines.append("  {")
-lines.append("    id: 'mastery-legends',")
-lines.append("    title: 'Mastery legends',")
-lines.append("    subtitle: 'Top artists — 10,000 hours of craft and countless stages',")
-lines.append("    icon: 'ti ti-crown',")
-lines.append("  },")
-for slug, title, subtitle, icon in GENRE_SECTIONS:
+        lines.append("  {")
+        lines.append(f"    name: '{js_string(name)}',")
+        lines.append(f"    username: '{username}',")
+        lines.append(f"    image: '{image}',")
+        if placeholder:
+            lines.append(f"    blurhash: '{js_string(placeholder['blurhash'])}',")
+            lines.append(f"    preview: '{placeholder['preview']}',")
+        lines.append(f"    category: '{js_string(category)}',")
+        lines.append(f"    genre: '{js_string(genre)}',")
+        lines.append(f"    genreSlug: '{genre_slug}',")
+        lines.append(f"    location: '{js_string(location)}',")
+        lines.append("    country: 'South Africa',")
+        lines.append(f"    masteryHours: {hours},")
+        lines.append(f"    badge: '{badge}',")
+        lines.append(f"    badgeClass: '{badge_class}',")
+        if large:
+            lines.append("    large: true,")
+        lines.append(f"    hourlyRate: {hourly_rate(hours)},")
+        lines.append(f"    bio: '{js_string(bio)}',")
+        skills_js = ", ".join(f"'{js_string(s)}'" for s in skills)
+        lines.append(f"    skills: [{skills_js}],")
+        lines.append("  },")
+
+    lines.append("];")
+    lines.append("")
+    lines.append("export const GENRE_FEED_CATEGORIES = [")
     lines.append("  {")
-    lines.append(f"    id: 'genre-{slug}',")
-    lines.append(f"    title: '{js_string(title)}',")
-    lines.append(f"    subtitle: '{js_string(subtitle)}',")
-    lines.append(f"    icon: '{icon}',")
+    lines.append("    id: 'mastery-legends',")
+    lines.append("    title: 'Mastery legends',")
+    lines.append("    subtitle: 'Top artists — 10,000 hours of craft and countless stages',")
+    lines.append("    icon: 'ti ti-crown',")
     lines.append("  },")
-lines.append("];")
-lines.append("")
-lines.append("export function resolveArtistGenreSlug(category, genreLabel) {")
-lines.append("  const label = String(genreLabel || '').toLowerCase();")
-lines.append("  if (label.includes('amapiano')) return 'amapiano';")
-lines.append("  if (label.includes('hip hop') || label.includes('rap')) return 'hip-hop';")
-lines.append("  if (label.includes('house') || label.includes('afro house') || label.startsWith('dj')) return 'house';")
-lines.append("  if (label.includes('gospel')) return 'gospel';")
-lines.append("  if (label.includes('maskandi') || label.includes('bolobedu')) return 'maskandi';")
-lines.append("  if (label.includes('gqom') || label.includes('dance')) return 'gqom';")
-lines.append("  if (['afropop', 'r&b', 'soul', 'acapella', 'pop'].some(function(token) { return label.includes(token); })) return 'afropop';")
-lines.append("  const map = {")
-for cat, slug in sorted(CATEGORY_TO_GENRE.items()):
-    lines.append(f"    '{js_string(cat)}': '{slug}',")
-lines.append("  };")
-lines.append("  return map[String(category || '')] || 'other';")
-lines.append("}")
-lines.append("")
-lines.append("export function toMarketingShowcase(artist) {")
-lines.append("  return {")
-lines.append("    name: artist.name,")
-lines.append("    username: artist.username,")
-lines.append("    image: artist.image,")
-lines.append("    genre: artist.genre,")
-lines.append("    category: artist.category,")
-lines.append("    genreSlug: artist.genreSlug,")
-lines.append("    badge: artist.badge,")
-lines.append("    badgeClass: artist.badgeClass,")
-lines.append("    masteryHours: artist.masteryHours,")
-lines.append("    large: artist.large || false,")
-lines.append("  };")
-lines.append("}")
-lines.append("")
-lines.append("export const SHOWCASE = SA_SHOWCASE_ARTISTS.map(toMarketingShowcase);")
+    for slug, title, subtitle, icon in GENRE_SECTIONS:
+        lines.append("  {")
+        lines.append(f"    id: 'genre-{slug}',")
+        lines.append(f"    title: '{js_string(title)}',")
+        lines.append(f"    subtitle: '{js_string(subtitle)}',")
+        lines.append(f"    icon: '{icon}',")
+        lines.append("  },")
+    lines.append("];")
+    lines.append("")
+    lines.append("export function resolveArtistGenreSlug(category, genreLabel) {")
+    lines.append("  const label = String(genreLabel || '').toLowerCase();")
+    lines.append("  if (label.includes('amapiano')) return 'amapiano';")
+    lines.append("  if (label.includes('hip hop') || label.includes('rap')) return 'hip-hop';")
+    lines.append("  if (label.includes('house') || label.includes('afro house') || label.startsWith('dj')) return 'house';")
+    lines.append("  if (label.includes('gospel')) return 'gospel';")
+    lines.append("  if (label.includes('maskandi') || label.includes('bolobedu')) return 'maskandi';")
+    lines.append("  if (label.includes('gqom') || label.includes('dance')) return 'gqom';")
+    lines.append("  if (['afropop', 'r&b', 'soul', 'acapella', 'pop'].some(function(token) { return label.includes(token); })) return 'afropop';")
+    lines.append("  const map = {")
+    for cat, slug in sorted(CATEGORY_TO_GENRE.items()):
+        lines.append(f"    '{js_string(cat)}': '{slug}',")
+    lines.append("  };")
+    lines.append("  return map[String(category || '')] || 'other';")
+    lines.append("}")
+    lines.append("")
+    lines.append("export function toMarketingShowcase(artist) {")
+    lines.append("  return {")
+    lines.append("    name: artist.name,")
+    lines.append("    username: artist.username,")
+    lines.append("    image: artist.image,")
+    lines.append("    blurhash: artist.blurhash || '',")
+    lines.append("    preview: artist.preview || '',")
+    lines.append("    genre: artist.genre,")
+    lines.append("    category: artist.category,")
+    lines.append("    genreSlug: artist.genreSlug,")
+    lines.append("    badge: artist.badge,")
+    lines.append("    badgeClass: artist.badgeClass,")
+    lines.append("    masteryHours: artist.masteryHours,")
+    lines.append("    large: artist.large || false,")
+    lines.append("  };")
+    lines.append("}")
+    lines.append("")
+    lines.append("export const SHOWCASE = SA_SHOWCASE_ARTISTS.map(toMarketingShowcase);")
+
+    out_api = Path("functions/api/sa-showcase-data.js")
+    out_web = Path("web/sa-showcase-data.js")
+
+    api_content = "\n".join(lines)
+    web_content = api_content.replace("export const SA_SHOWCASE_ARTISTS", "const SA_SHOWCASE_ARTISTS")
+    web_content = web_content.replace("export const GENRE_FEED_CATEGORIES", "var GENRE_FEED_CATEGORIES")
+    web_content = web_content.replace("export function resolveArtistGenreSlug", "function resolveArtistGenreSlug")
+    web_content = web_content.replace("export function toMarketingShowcase", "function toMarketingShowcase")
+    web_content = web_content.replace("export const SHOWCASE", "var SHOWCASE")
+    web_content = "// Auto-generated — 100 SA artists for Gearsh homepage\n" + web_content
 
-out_api = Path("functions/api/sa-showcase-data.js")
-out_web = Path("web/sa-showcase-data.js")
+    with stage("write") as span:
+        out_api.write_text(api_content, encoding="utf-8")
+        out_web.write_text(web_content, encoding="utf-8")
+        span.record(bytes_out=lambda: len(api_content.encode()) + len(web_content.encode()))
+    print(f"Wrote {len(ARTISTS)} artists to {out_api} and {out_web}")
 
-api_content = "\n".join(lines)
-web_content = api_content.replace("export const SA_SHOWCASE_ARTISTS", "const SA_SHOWCASE_ARTISTS")
-web_content = web_content.replace("export const GENRE_FEED_CATEGORIES", "var GENRE_FEED_CATEGORIES")
-web_content = web_content.replace("export function resolveArtistGenreSlug", "function resolveArtistGenreSlug")
-web_content = web_content.replace("export function toMarketingShowcase", "function toMarketingShowcase")
-web_content = web_content.replace("export const SHOWCASE", "var SHOWCASE")
-web_content = "// Auto-generated — 100 SA artists for Gearsh homepage\n" + web_content
 
-out_api.write_text(api_content, encoding="utf-8")
-out_web.write_text(web_content, encoding="utf-8")
-print(f"Wrote {len(ARTISTS)} artists to {out_api} and {out_web}")
+if __name__ == "__main__":
+    main()
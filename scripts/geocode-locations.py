@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""Geocode free-text artist locations offline into coordinates and geohashes.
+
+    python scripts/geocode-locations.py check
+    python scripts/geocode-locations.py showcase
+    python scripts/geocode-locations.py --db gearsh.sqlite db
+    python scripts/geocode-locations.py --db gearsh.sqlite db --all --dry-run
+    python scripts/geocode-locations.py --db gearsh.sqlite db --sql database/geocode_users.sql
+    python scripts/geocode-locations.py --db gearsh.sqlite near -26.20 28.05 --radius 50
+
+Locations are free text ("Pretoria", "KwaZulu-Natal", "Swaziland / SA"), and
+location-utils.js used to match them against its place table on every
+request. This resolves them once, against the bundled gazetteer in
+scripts/sa-gazetteer.csv (places, provinces and countries with their
+aliases). A location is lower-cased, stripped of accents and punctuation and
+split on "/", "," and "&"; the most specific gazetteer entry named in it
+wins (a place over a province over a country, then the longest alias), and
+the country column is the fallback when the text names nothing known.
+
+Places and provinces get a GEOHASH_PRECISION geohash; a bare country only
+gets its centroid, which is good enough for distance sorting but would make
+every artist in the country "near" its middle. Geohashes share prefixes
+with their neighbours, so "artists within r km" is the 3x3 block of cells
+one size larger than r around the visitor, i.e. at most nine
+`location_geohash >= ? AND location_geohash < ?` range scans of
+idx_users_location_geohash (database/add_location_geohash.sql).
+geohashRanges() in functions/api/location-utils.js builds the same ranges
+for /api/search?sort=nearby.
+
+showcase writes functions/api/sa-showcase-geo.js, the showcase artists as a
+compact [geohash, username, lat, lng] list sorted by geohash. db fills
+users.location_lat/lng/geohash in a replica, skipping rows whose location
+has not changed since they were geocoded (location_geocoded holds the
+normalized text). With --sql it leaves the replica alone and writes the same
+updates as a file for `wrangler d1 execute gearsh_db --file=... --remote`;
+each statement only applies while the row still has the location and
+country it was geocoded from, so edits made in production since the replica
+was taken are not overwritten. The API fills the columns itself from its
+coarser place table whenever a location is saved (refreshUserLocation() in
+location-utils.js) and clears location_geocoded, so the next run refines
+those rows. check lists what the gazetteer cannot resolve yet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from jobs import transaction
+from migrate import connect
+from showcase import ROOT, load_artists
+
+GAZETTEER = ROOT / "scripts" / "sa-gazetteer.csv"
+SHOWCASE_JS = ROOT / "functions" / "api" / "sa-showcase-geo.js"
+
+GEOHASH_PRECISION = 7  # ~150 m cells; gazetteer entries are town centres anyway
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+RANK = {"place": 0, "province": 1, "country": 2}
+PAGE = 1000
+
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    kind: str
+    lat: float
+    lng: float
+
+
+# -- normalizing and matching ------------------------------------------------------
+
+
+def normalize(text: str | None) -> str:
+    """'KwaZulu-Natal ' -> 'kwazulu natal'; accents dropped, parts joined by ' / '."""
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode().lower()
+    parts = [re.sub(r"[^a-z0-9]+", " ", part).strip() for part in re.split(r"[/,&;|]", text)]
+    return " / ".join(p for p in parts if p)
+
+
+class Gazetteer:
+    def __init__(self, path: Path = GAZETTEER):
+        self.aliases: dict[str, Place] = {}
+        with path.open(encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                place = Place(row["name"], row["kind"], float(row["lat"]), float(row["lng"]))
+                for alias in [row["name"], *row["aliases"].split("|")]:
+                    key = normalize(alias)
+                    if key:
+                        self.aliases.setdefault(key, place)
+        self.max_words = max(len(alias.split()) for alias in self.aliases)
+
+    def find(self, text: str) -> Place | None:
+        """Most specific entry named anywhere in normalized ``text`` (whole words only)."""
+        best, best_key = None, None
+        for part in text.split(" / "):
+            words = part.split()
+            for n in range(min(self.max_words, len(words)), 0, -1):
+                for i in range(len(words) - n + 1):
+                    place = self.aliases.get(" ".join(words[i:i + n]))
+                    if place and (best is None or (RANK[place.kind], -n) < (RANK[best.kind], -best_key)):
+                        best, best_key = place, n
+        return best
+
+    def resolve(self, location: str | None, country: str | None) -> Place | None:
+        return self.find(normalize(location)) or self.find(normalize(country))
+
+
+def geocoded_key(location: str | None, country: str | None) -> str:
+    """What users.location_geocoded stores, to spot rows whose location changed."""
+    return f"{normalize(location)}|{normalize(country)}"
+
+
+# -- geohash -------------------------------------------------------------------------
+
+
+def geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_lo, lat_hi, lng_lo, lng_hi = -90.0, 90.0, -180.0, 180.0
+    out, bits, ch, even = [], 0, 0, True
+    while len(out) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            ch = ch << 1 | (lng >= mid)
+            lng_lo, lng_hi = (mid, lng_hi) if lng >= mid else (lng_lo, mid)
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            ch = ch << 1 | (lat >= mid)
+            lat_lo, lat_hi = (mid, lat_hi) if lat >= mid else (lat_lo, mid)
+        even = not even
+        bits += 1
+        if bits == 5:
+            out.append(BASE32[ch])
+            bits = ch = 0
+    return "".join(out)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """(lat, lng) span in degrees of a geohash cell."""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180 / 2 ** lat_bits, 360 / 2 ** lng_bits
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    d_lat, d_lng = math.radians(lat2 - lat1), math.radians(lng2 - lng1)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lng / 2) ** 2
+    return 6371 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def prefix_ranges(lat: float, lng: float, radius_km: float) -> list[tuple[str, str]]:
+    """[lo, hi) geohash ranges covering every point within ``radius_km`` of (lat, lng).
+
+    Mirrors geohashRanges() in functions/api/location-utils.js.
+    """
+    precision = 1
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        d_lat, d_lng = cell_size(p)
+        if min(d_lat * 111.32, d_lng * 111.32 * math.cos(math.radians(lat))) >= radius_km:
+            precision = p
+            break
+    d_lat, d_lng = cell_size(precision)
+    cells = sorted({
+        geohash(max(-90.0, min(90.0, lat + dy * d_lat)), (lng + dx * d_lng + 540) % 360 - 180, precision)
+        for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+    })
+    return [(cell, cell + "~") for cell in cells]
+
+
+def sql_literal(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def coordinates(place: Place | None) -> tuple:
+    """(lat, lng, geohash) for the users columns; no geohash for a bare country."""
+    if place is None:
+        return None, None, None
+    return place.lat, place.lng, geohash(place.lat, place.lng) if place.kind != "country" else None
+
+
+# -- commands ------------------------------------------------------------------------
+
+
+def cmd_check(args, gazetteer: Gazetteer) -> None:
+    seen: Counter = Counter()
+    kinds: Counter = Counter()
+    for artist in load_artists():
+        seen[(artist.get("location"), artist.get("country"))] += 1
+    if args.db:
+        conn = connect(args.db)
+        try:
+            seen.update(dict(((loc, country), n) for loc, country, n in conn.execute(
+                "SELECT location, country, COUNT(*) FROM users WHERE user_type = 'artist' GROUP BY 1, 2"
+            )))
+        finally:
+            conn.close()
+    unresolved = []
+    for (location, country), n in seen.items():
+        place = gazetteer.resolve(location, country)
+        kinds[place.kind if place else "unresolved"] += n
+        if place is None or (place.kind == "country" and normalize(location)):
+            unresolved.append((n, location, country, place.name if place else "-"))
+    print("Resolved: " + ", ".join(f"{kind} {n}" for kind, n in kinds.most_common()))
+    if unresolved:
+        print("Only resolved to a country, or not at all (add them to scripts/sa-gazetteer.csv):")
+        for n, location, country, fallback in sorted(unresolved, reverse=True):
+            print(f"  {n:>5}  {location or '-'!s:<30} {country or '-'!s:<20} -> {fallback}")
+
+
+def cmd_showcase(args, gazetteer: Gazetteer) -> None:
+    entries, missing = [], []
+    for artist in load_artists():
+        lat, lng, gh = coordinates(gazetteer.resolve(artist.get("location"), artist.get("country")))
+        if gh is None:
+            missing.append(artist["username"])
+            continue
+        entries.append((gh, artist["username"], lat, lng))
+    entries.sort()
+    rows = "".join(f"  ['{gh}', '{username}', {lat}, {lng}],\n" for gh, username, lat, lng in entries)
+    SHOWCASE_JS.write_text(
+        "// Auto-generated by scripts/geocode-locations.py from sa-showcase-data.js and scripts/sa-gazetteer.csv\n"
+        "// [geohash, username, lat, lng], sorted by geohash\n"
+        f"export const SA_SHOWCASE_GEO = [\n{rows}];\n",
+        encoding="utf-8",
+    )
+    print(f"Geocoded {len(entries)} showcase artists -> {SHOWCASE_JS.relative_to(ROOT)}")
+    if missing:
+        print(f"  no place or province for {len(missing)}: {', '.join(missing)} (see the check command)")
+
+
+def cmd_db(args, gazetteer: Gazetteer) -> None:
+    conn = connect(args.db)
+    started = time.perf_counter()
+    counts: Counter = Counter()
+    statements: list[str] = []
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(users)")}
+        if "location_geohash" not in columns:
+            sys.exit("users has no location_geohash; apply database/add_location_geohash.sql first")
+        last = ""
+        while True:
+            rows = conn.execute(
+                "SELECT id, location, country, location_geocoded FROM users WHERE id > ? ORDER BY id LIMIT ?",
+                (last, PAGE),
+            ).fetchall()
+            if not rows:
+                break
+            last = rows[-1][0]
+            updates = []
+            for user_id, location, country, done in rows:
+                key = geocoded_key(location, country)
+                if key == done and not args.all:
+                    counts["unchanged"] += 1
+                    continue
+                place = gazetteer.resolve(location, country)
+                counts[place.kind if place else "unresolved"] += 1
+                updates.append((*coordinates(place), key, user_id))
+                if args.sql:
+                    lat, lng, gh = coordinates(place)
+                    statements.append(
+                        f"UPDATE users SET location_lat = {sql_literal(lat)}, location_lng = {sql_literal(lng)},"
+                        f" location_geohash = {sql_literal(gh)}, location_geocoded = {sql_literal(key)}"
+                        f" WHERE id = {sql_literal(user_id)} AND location IS {sql_literal(location)}"
+                        f" AND country IS {sql_literal(country)};\n"
+                    )
+            if updates and not args.dry_run and not args.sql:
+                with transaction(conn):
+                    conn.executemany(
+                        "UPDATE users SET location_lat = ?, location_lng = ?, location_geohash = ?,"
+                        " location_geocoded = ? WHERE id = ?",
+                        updates,
+                    )
+            counts["written"] += len(updates)
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - started
+    if args.sql and not args.dry_run:
+        args.sql.write_text(
+            f"-- Generated by scripts/geocode-locations.py from {args.db.name}\n"
+            f'-- Run this with: wrangler d1 execute gearsh_db --file="{args.sql.as_posix()}" --remote\n\n'
+            + "".join(statements),
+            encoding="utf-8",
+        )
+    verb = "would write" if args.dry_run else f"wrote to {args.sql}" if args.sql else "wrote"
+    print(f"Geocoded users in {elapsed:.2f}s: {verb} {counts.pop('written'):,}, {counts.pop('unchanged', 0):,} unchanged")
+    if counts:
+        print("  " + ", ".join(f"{kind} {n:,}" for kind, n in counts.most_common()))
+
+
+def cmd_near(args, gazetteer: Gazetteer) -> None:
+    ranges = prefix_ranges(args.lat, args.lng, args.radius)
+    where = " OR ".join("(u.location_geohash >= ? AND u.location_geohash < ?)" for _ in ranges)
+    sql = (
+        "SELECT u.username, u.location, u.location_lat, u.location_lng FROM users u"
+        f" WHERE u.user_type = 'artist' AND ({where})"
+    )
+    params = [bound for r in ranges for bound in r]
+    conn = connect(args.db)
+    try:
+        plan = [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    hits = sorted(
+        (haversine_km(args.lat, args.lng, lat, lng), username, location)
+        for username, location, lat, lng in rows
+    )
+    print(f"{len(ranges)} range(s) of {len(ranges[0][0])}-char cells: {', '.join(lo for lo, _ in ranges)}")
+    for line in plan:
+        print(f"  plan: {line}")
+    within = [h for h in hits if h[0] <= args.radius]
+    print(f"{len(rows)} candidate(s), {len(within)} within {args.radius:g} km")
+    for km, username, location in within[: args.limit]:
+        print(f"  {km:7.1f} km  {username or '-':<24} {location or '-'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="replica with the users table (db, near; optional for check)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("check", help="list locations the gazetteer cannot place")
+    sub.add_parser("showcase", help=f"write {SHOWCASE_JS.relative_to(ROOT)}")
+
+    db = sub.add_parser("db", help="fill users.location_lat/lng/geohash")
+    db.add_argument("--all", action="store_true", help="re-geocode rows whose location is unchanged")
+    db.add_argument("--dry-run", action="store_true", help="count what would change without writing")
+    db.add_argument("--sql", type=Path, help="write the updates as SQL for wrangler d1 execute instead")
+
+    near = sub.add_parser("near", help="run the prefix-range nearby query")
+    near.add_argument("lat", type=float)
+    near.add_argument("lng", type=float)
+    near.add_argument("--radius", type=float, default=50, help="km (default 50)")
+    near.add_argument("--limit", type=int, default=20, help="rows to print")
+    args = parser.parse_args()
+
+    if args.command in ("db", "near") and not args.db:
+        parser.error(f"{args.command} needs --db")
+    gazetteer = Gazetteer()
+    {"check": cmd_check, "showcase": cmd_showcase, "db": cmd_db, "near": cmd_near}[args.command](args, gazetteer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Shared Pillow plumbing for the Gearsh asset scripts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PIL import Image, ImageFont
+
+ROOT = Path(__file__).resolve().parents[1]
+ARTISTS_DIR = ROOT / "assets" / "images" / "artists"
+FALLBACK_IMAGE = ARTISTS_DIR / "artists.png"
+FONTS_DIR = ROOT / "assets" / "fonts"
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif"}
+
+
+def is_image(path: Path) -> bool:
+    return path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+
+
+def list_images(directory: Path = ARTISTS_DIR) -> list[Path]:
+    if not directory.exists():
+        return []
+    return sorted(f for f in directory.iterdir() if is_image(f))
+
+
+def flatten_rgb(img: Image.Image, background: tuple[int, int, int] = (255, 255, 255)) -> Image.Image:
+    """Convert to RGB, compositing RGBA/LA/P images onto a solid background."""
+    if img.mode in ("RGBA", "LA", "P"):
+        if img.mode == "P":
+            img = img.convert("RGBA")
+        flat = Image.new("RGB", img.size, background)
+        flat.paste(img, mask=img.split()[-1])
+        return flat
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def open_rgb(path: Path) -> Image.Image:
+    with Image.open(path) as img:
+        img.load()
+        return flatten_rgb(img)
+
+
+def fit_within(img: Image.Image, longest: int) -> Image.Image:
+    """Downscale so the longest side is at most ``longest`` px, keeping aspect ratio."""
+    w, h = img.size
+    scale = longest / max(w, h)
+    if scale >= 1:
+        return img.copy()
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def save_image(img: Image.Image, path: Path, quality: int = 90) -> None:
+    """Save using the format implied by the file extension."""
+    ext = path.suffix.lower()
+    if ext == ".webp":
+        img.save(path, "WEBP", quality=quality)
+    elif ext == ".png":
+        img.save(path, "PNG", optimize=True)
+    else:  # .jpg, .jpeg
+        img.save(path, "JPEG", quality=quality)
+
+
+_fonts: dict = {}
+
+
+def font(weight: str, size: int) -> ImageFont.ImageFont:
+    """The app's Syne face at ``weight`` (Regular, Medium, SemiBold, Bold, ExtraBold), cached per size."""
+    key = (weight, size)
+    if key not in _fonts:
+        path = FONTS_DIR / f"Syne-{weight}.ttf"
+        _fonts[key] = ImageFont.truetype(str(path), size) if path.exists() else ImageFont.load_default()
+    return _fonts[key]
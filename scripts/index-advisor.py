@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""Propose composite/covering indexes for a weighted workload and validate them.
+
+    python scripts/index-advisor.py                                   # default workload + replica
+    python scripts/index-advisor.py --db load.sqlite --name ticket_indexes
+    python scripts/index-advisor.py --dry-run
+
+The workload (scripts/index-workload.json) lists hot statements, either
+inline or looked up in a functions/ file by SQL substring, with a per-minute
+frequency, plus per-table insert rates. Candidate indexes come from each
+statement's equality, range, ORDER BY/GROUP BY and selected columns. The
+advisor tries each one on a scratch copy of the replica and scores it as
+read time saved per minute, minus extra insert time per minute from
+maintaining the index. It picks the best candidate, keeps it, and repeats.
+The winners are written as database/add_<name>.sql.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from migrate import DB_DIR, connect
+from queryplan import ROOT, Sampler, aliases_of, bind_values, default_replica, extract, plan_of
+
+WORKLOAD = Path(__file__).resolve().parent / "index-workload.json"
+
+PREDICATE = re.compile(
+    r"(?:(\w+)\.)?(\w+)\s*(=|IN\s*\(|<=|>=|<|>|\bBETWEEN\b|\bIS\s+NOT\s+NULL\b)", re.IGNORECASE
+)
+QUALIFIED = re.compile(r"\b(\w+)\.(\w+|\*)")
+ORDERING = re.compile(r"\b(?:ORDER|GROUP)\s+BY\s+(.+?)(?=\bLIMIT\b|\bOFFSET\b|\bHAVING\b|\bORDER\b|\)|$)", re.IGNORECASE | re.DOTALL)
+MAX_COVERING = 6
+NOISE = 0.1  # timing changes smaller than this share of the baseline are ignored
+
+
+@dataclass
+class Query:
+    name: str
+    sql: str
+    freq: float
+    params: list = field(default_factory=list)
+    base_ms: float = 0.0
+
+    @property
+    def is_write(self) -> bool:
+        return self.sql.split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+@dataclass
+class Usage:
+    eq: list[str] = field(default_factory=list)
+    range: list[str] = field(default_factory=list)
+    order: list[str] = field(default_factory=list)
+    refs: set[str] = field(default_factory=set)
+    star: bool = False
+
+
+@dataclass
+class Candidate:
+    table: str
+    columns: tuple[str, ...]
+    queries: set[str] = field(default_factory=set)
+    score: float = 0.0
+    read_saved: float = 0.0
+    write_cost: float = 0.0
+    size_kb: float = 0.0
+    timings: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        # Covering candidates share their leading columns, so the hash keeps names unique
+        if len(self.columns) <= 3:
+            return f"idx_{self.table}_{'_'.join(self.columns)}"
+        digest = hashlib.sha1(",".join(self.columns).encode()).hexdigest()[:6]
+        return f"idx_{self.table}_{'_'.join(self.columns[:3])}_cover_{digest}"
+
+    @property
+    def sql(self) -> str:
+        return f"CREATE INDEX IF NOT EXISTS {self.name} ON {self.table}({', '.join(self.columns)})"
+
+
+# -- workload ------------------------------------------------------------------
+
+
+def load_workload(path: Path) -> tuple[list[Query], dict[str, float]]:
+    spec = json.loads(path.read_text(encoding="utf-8"))
+    queries = []
+    for item in spec["queries"]:
+        sql = item.get("sql")
+        if sql is None:
+            statements, _, _ = extract([ROOT / item["from"]])
+            match = " ".join(item["match"].split())
+            found = [st.sql for st in statements if match in " ".join(st.sql.split())]
+            if not found:
+                raise SystemExit(f"workload: no statement in {item['from']} matches {item['match']!r}")
+            sql = found[0]
+        queries.append(Query(item["name"], " ".join(sql.split()), float(item["freq"])))
+    return queries, {t: float(n) for t, n in spec.get("writes", {}).items()}
+
+
+def usage_of(sql: str, columns: dict[str, list[str]]) -> dict[str, Usage]:
+    """Columns each table in ``sql`` is filtered, ordered and read by."""
+    aliases = aliases_of(sql)
+    present = sorted({t for t in aliases.values() if t in columns})
+    usages = {t: Usage() for t in present}
+
+    def owner(qualifier: str | None, column: str) -> str | None:
+        if qualifier:
+            table = aliases.get(qualifier.lower())
+            return table if table in usages and column in columns[table] else None
+        owners = [t for t in present if column in columns[t]]
+        return owners[0] if len(owners) == 1 else None
+
+    for m in PREDICATE.finditer(sql):
+        table = owner(m.group(1), m.group(2))
+        if not table:
+            continue
+        bucket = usages[table].eq if m.group(3).strip().upper() in ("=", "IN (", "IN(") else usages[table].range
+        if m.group(2) not in bucket:
+            bucket.append(m.group(2))
+    for m in ORDERING.finditer(sql):
+        for term in m.group(1).split(","):
+            words = re.sub(r"\s+(ASC|DESC)\b.*", "", term.strip(), flags=re.IGNORECASE)
+            ref = re.fullmatch(r"(?:(\w+)\.)?(\w+)", words)
+            table = ref and owner(ref.group(1), ref.group(2))
+            if table and ref.group(2) not in usages[table].order:
+                usages[table].order.append(ref.group(2))
+    for m in QUALIFIED.finditer(sql):
+        table = aliases.get(m.group(1).lower())
+        if table in usages:
+            if m.group(2) == "*":
+                usages[table].star = True
+            elif m.group(2) in columns[table]:
+                usages[table].refs.add(m.group(2))
+    if len(present) == 1:
+        table = present[0]
+        words = set(re.findall(r"\b\w+\b", sql))
+        usages[table].refs |= words & set(columns[table])
+        usages[table].star |= bool(re.search(r"SELECT\s+\*", sql, re.IGNORECASE))
+    for u in usages.values():
+        u.range = [c for c in u.range if c not in u.eq]
+        u.order = [c for c in u.order if c not in u.eq]
+    return usages
+
+
+def candidates_for(usage: Usage, table: str, distinct) -> list[tuple[str, ...]]:
+    eq = sorted(usage.eq, key=lambda c: -distinct(table, c))
+    shapes = [eq, eq + usage.range[:1], eq + usage.order]
+    out = [tuple(dict.fromkeys(s)) for s in shapes if s]
+    if not usage.star and usage.refs and out:
+        widest = max(out, key=len)
+        covering = tuple(dict.fromkeys(list(widest) + sorted(usage.refs - set(widest))))
+        if len(covering) <= MAX_COVERING:
+            out.append(covering)
+    return list(dict.fromkeys(out))
+
+
+# -- measurement ---------------------------------------------------------------
+
+
+def scratch_copy(db: Path, workdir: Path) -> sqlite3.Connection:
+    target = workdir / "scratch.sqlite"
+    src = sqlite3.connect(str(db))
+    dst = sqlite3.connect(str(target))
+    src.backup(dst)
+    src.close()
+    dst.close()
+    conn = connect(target)  # not bulk: the savepoint rollbacks need a journal
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA foreign_keys = OFF")
+    return conn
+
+
+def timed(conn: sqlite3.Connection, query: Query, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        if query.is_write:
+            conn.execute("SAVEPOINT advisor")
+        started = time.perf_counter()
+        try:
+            conn.execute(query.sql, query.params).fetchall()
+        except sqlite3.Error:
+            pass
+        samples.append(1000 * (time.perf_counter() - started))
+        if query.is_write:
+            conn.execute("ROLLBACK TO advisor")
+            conn.execute("RELEASE advisor")
+    return statistics.median(samples)
+
+
+def insert_cost(conn: sqlite3.Connection, table: str, rows: int = 2000, runs: int = 3) -> float:
+    """Milliseconds per inserted row, using perturbed copies of existing rows."""
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    unique = {r[1] for r in info if r[5]}
+    for _, name, is_unique, *_ in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        if is_unique:
+            unique |= {r[2] for r in conn.execute(f"PRAGMA index_info({name})")}
+    select = ", ".join(
+        (f"CASE typeof({c}) WHEN 'integer' THEN {c} + 1000000000000 + rowid ELSE {c} || '~' || rowid END"
+         if c in unique else c)
+        for c in (r[1] for r in info)
+    )
+    samples = []
+    for _ in range(runs):
+        conn.execute("SAVEPOINT advisor")
+        started = time.perf_counter()
+        conn.execute(f"INSERT INTO {table} SELECT {select} FROM {table} LIMIT {rows}")
+        samples.append(1000 * (time.perf_counter() - started) / rows)
+        conn.execute("ROLLBACK TO advisor")
+        conn.execute("RELEASE advisor")
+    return statistics.median(samples)
+
+
+def uses_index(conn: sqlite3.Connection, query: Query, index: str) -> bool:
+    return any(index in line for line in plan_of(conn, query.sql, query.params))
+
+
+class Advisor:
+    def __init__(self, conn: sqlite3.Connection, queries: list[Query], writes: dict[str, float], runs: int):
+        self.conn = conn
+        self.queries = queries
+        self.writes = writes
+        self.runs = runs
+        self.columns = {
+            name: [r[1] for r in conn.execute(f"PRAGMA table_info({name})")]
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        self.distinct_cache: dict[tuple[str, str], int] = {}
+        self.write_base: dict[str, float] = {}
+        sampler = Sampler(conn)
+        for q in queries:
+            q.params = bind_values(q.sql, sampler)
+
+    def distinct(self, table: str, column: str) -> int:
+        key = (table, column)
+        if key not in self.distinct_cache:
+            self.distinct_cache[key] = self.conn.execute(
+                f"SELECT COUNT(DISTINCT {column}) FROM (SELECT {column} FROM {table} LIMIT 100000)"
+            ).fetchone()[0]
+        return self.distinct_cache[key]
+
+    def unique(self, table: str) -> set[str]:
+        return {idx[0] for idx in self.existing(table, unique=True) if len(idx) == 1}
+
+    def existing(self, table: str, unique: bool = False) -> list[tuple[str, ...]]:
+        out = []
+        for _, name, is_unique, *_ in self.conn.execute(f"PRAGMA index_list({table})").fetchall():
+            if unique and not is_unique:
+                continue
+            out.append(tuple(r[2] for r in self.conn.execute(f"PRAGMA index_info({name})")))
+        return out
+
+    def candidates(self) -> list[Candidate]:
+        found: dict[tuple, Candidate] = {}
+        for q in self.queries:
+            for table, usage in usage_of(q.sql, self.columns).items():
+                for cols in candidates_for(usage, table, self.distinct):
+                    # Already served by an index, or led by a key that finds one row anyway
+                    if cols[0] in self.unique(table) or any(idx[: len(cols)] == cols for idx in self.existing(table)):
+                        continue
+                    found.setdefault((table, cols), Candidate(table, cols)).queries.add(q.name)
+        return list(found.values())
+
+    def baseline(self) -> None:
+        for q in self.queries:
+            q.base_ms = timed(self.conn, q, self.runs)
+        for table in {c.table for c in self.candidates()} & set(self.writes):
+            self.write_base[table] = insert_cost(self.conn, table)
+
+    def pages_used(self) -> int:
+        total = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        return total - self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def evaluate(self, cand: Candidate) -> None:
+        pages = self.pages_used()
+        self.conn.execute(cand.sql)
+        self.conn.execute(f"ANALYZE {cand.name}")
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        cand.size_kb = (self.pages_used() - pages) * page_size / 1024
+        cand.timings.clear()
+        saved = 0.0
+        for q in self.queries:
+            if not uses_index(self.conn, q, cand.name):
+                continue
+            ms = timed(self.conn, q, self.runs)
+            cand.timings[q.name] = (q.base_ms, ms)
+            if abs(q.base_ms - ms) > NOISE * q.base_ms:
+                saved += q.freq * (q.base_ms - ms)
+        cost = 0.0
+        if cand.table in self.writes:
+            extra = insert_cost(self.conn, cand.table) - self.write_base.get(cand.table, 0.0)
+            cost = self.writes[cand.table] * max(extra, 0.0)
+        cand.read_saved, cand.write_cost, cand.score = saved, cost, saved - cost
+        self.conn.execute(f"DROP INDEX {cand.name}")
+
+    def accept(self, cand: Candidate) -> None:
+        self.conn.execute(cand.sql)
+        self.conn.execute(f"ANALYZE {cand.name}")
+        for q in self.queries:
+            if q.name in cand.timings:
+                q.base_ms = cand.timings[q.name][1]
+        if cand.table in self.writes:
+            self.write_base[cand.table] = insert_cost(self.conn, cand.table)
+
+    def run(self, limit: int, min_gain: float, log) -> list[Candidate]:
+        self.baseline()
+        total = sum(q.freq * q.base_ms for q in self.queries)
+        log(f"Workload: {len(self.queries)} statements, {total:,.0f} ms/min at baseline")
+        chosen: list[Candidate] = []
+        pool = self.candidates()
+        log(f"{len(pool)} candidate indexes")
+        while pool and len(chosen) < limit:
+            for cand in pool:
+                self.evaluate(cand)
+                log(f"  {cand.score:>10,.1f} ms/min  {cand.name}")
+            best = max(pool, key=lambda c: c.score)
+            if best.score < min_gain * total:
+                break
+            self.accept(best)
+            chosen.append(best)
+            log(f"+ {best.sql}  ({best.score:,.1f} ms/min saved)")
+            pool = [c for c in self.candidates() if (c.table, c.columns) != (best.table, best.columns)]
+        return chosen
+
+
+# -- output --------------------------------------------------------------------
+
+
+def migration_text(name: str, chosen: list[Candidate], db: Path) -> str:
+    lines = [
+        f"-- Migration: {name.replace('_', ' ')} (proposed by scripts/index-advisor.py)",
+        f'-- Run this with: wrangler d1 execute gearsh_db --file="database/add_{name}.sql" --remote',
+        f"-- Measured on {db.name}; ms/min = read time saved per minute minus extra insert time.",
+        "",
+    ]
+    for cand in chosen:
+        lines.append(
+            f"-- {cand.score:,.1f} ms/min (reads -{cand.read_saved:,.1f}, writes +{cand.write_cost:,.1f}), "
+            f"{cand.size_kb:,.0f} KB"
+        )
+        for qname, (before, after) in sorted(cand.timings.items()):
+            lines.append(f"--   {qname}: {before:.3f}ms -> {after:.3f}ms")
+        lines.append(cand.sql + ";")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="replica to measure on (copied; never modified)")
+    parser.add_argument("--scale", type=float, default=0.01, help="synthdata scale when --db is not given")
+    parser.add_argument("--workload", type=Path, default=WORKLOAD)
+    parser.add_argument("--runs", type=int, default=5, help="timed executions per statement")
+    parser.add_argument("--max", type=int, default=8, help="most indexes to propose")
+    parser.add_argument("--min-gain", type=float, default=0.01, help="smallest share of workload time worth an index")
+    parser.add_argument("--name", default="advised_indexes", help="migration is database/add_<name>.sql")
+    parser.add_argument("--dry-run", action="store_true", help="print the migration instead of writing it")
+    args = parser.parse_args()
+
+    db = args.db or default_replica(args.scale)
+    queries, writes = load_workload(args.workload)
+    with tempfile.TemporaryDirectory(prefix="gearsh-advisor-") as workdir:
+        conn = scratch_copy(db, Path(workdir))
+        try:
+            chosen = Advisor(conn, queries, writes, args.runs).run(args.max, args.min_gain, print)
+        finally:
+            conn.close()
+
+    if not chosen:
+        print("No index pays for itself on this workload")
+        return
+    text = migration_text(args.name, chosen, db)
+    if args.dry_run:
+        print(text)
+        return
+    out = DB_DIR / f"add_{args.name}.sql"
+    out.write_text(text, encoding="utf-8")
+    print(f"{len(chosen)} index(es) -> {out.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Issue ticket_instances for a gig in bulk and render printable QR tickets.
+
+    python scripts/issue-tickets.py --db gearsh.sqlite --event gig_123
+    python scripts/issue-tickets.py --db gearsh.sqlite --event gig_123 --format pdf --out tickets.zip
+    python scripts/issue-tickets.py --db gearsh.sqlite --event gig_123 --reprint
+    python scripts/issue-tickets.py --demo 50000 --workers 8              # throwaway replica
+
+Every paid order item of the event that has fewer instances than its
+quantity gets the missing ones, the same rows mintTicketInstances() in
+functions/api/tickets-utils.js writes one at a time. Codes keep the
+scanner's GRS-XXXXXXXX format (40 random bits in the 32-symbol alphabet).
+They are drawn with numpy, deduplicated in memory, and checked against
+idx_ticket_instances_code once per batch rather than once per ticket.
+Inserts run in --batch sized transactions.
+
+Rendering needs the optional qrcode package (pip install qrcode). It only
+computes the module matrix; the matrix is scaled to pixels with numpy and
+laid out with Pillow in a process pool. Finished files are written
+straight into the zip as workers return them, so memory stays flat however
+many tickets there are. Use --no-render to issue only.
+
+Batches are committed before their cards are rendered, so a run that stops
+while rendering (a qrcode error, a full disk, Ctrl+C) leaves tickets issued
+but not in the zip. --reprint issues nothing and renders every existing
+ticket_instances row of the event again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import secrets
+import sys
+import tempfile
+import time
+import zipfile
+from io import BytesIO
+from itertools import chain
+from multiprocessing import Pool
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from imaging import font
+from jobs import now_iso, transaction
+from migrate import build_replica, connect
+
+try:
+    import qrcode
+except ImportError:
+    qrcode = None
+
+CODE_PREFIX = "GRS-"
+CODE_CHARS = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+CODE_LEN = 8
+ALPHABET = np.frombuffer(CODE_CHARS.encode(), dtype=np.uint8)
+SHIFTS = np.arange(5 * (CODE_LEN - 1), -1, -5, dtype=np.uint64)
+
+CARD = (600, 900)
+QR_PX = 480
+INK = 17
+MUTED = 110
+
+PENDING = """
+SELECT oi.id, oi.order_id, oi.ticket_type_id, tt.name, o.buyer_name, o.buyer_email,
+  oi.quantity - (
+    SELECT COUNT(*) FROM ticket_instances ti WHERE ti.order_id = oi.order_id AND ti.order_item_id = oi.id
+  ) AS missing
+FROM ticket_orders o
+JOIN ticket_order_items oi ON oi.order_id = o.id
+JOIN gig_ticket_types tt ON tt.id = oi.ticket_type_id
+WHERE o.event_id = ? AND o.status = 'paid'
+ORDER BY o.paid_at, oi.id
+"""
+
+ISSUED = """
+SELECT ti.ticket_code, tt.name, ti.holder_name, ti.qr_payload
+FROM ticket_instances ti
+JOIN gig_ticket_types tt ON tt.id = ti.ticket_type_id
+WHERE ti.event_id = ?
+ORDER BY ti.rowid
+"""
+
+INSERT = """
+INSERT INTO ticket_instances (
+  id, order_id, order_item_id, event_id, ticket_type_id,
+  ticket_code, holder_name, holder_email, qr_payload
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class Minter:
+    """Hands out ticket codes that are unique within the run and against the table."""
+
+    def __init__(self, conn, seed: int | None = None):
+        self.conn = conn
+        self.rng = np.random.default_rng(secrets.randbits(128) if seed is None else seed)
+        self.seen: set[str] = set()
+        self.redrawn = 0
+
+    def draw(self, n: int) -> list[str]:
+        values = self.rng.integers(0, 32 ** CODE_LEN, size=n, dtype=np.uint64)
+        chars = ALPHABET[(values[:, None] >> SHIFTS) & np.uint64(31)]
+        return [CODE_PREFIX + c for c in chars.view(f"S{CODE_LEN}").ravel().astype(str)]
+
+    def take(self, n: int) -> list[str]:
+        codes: list[str] = []
+        while len(codes) < n:
+            fresh = [c for c in dict.fromkeys(self.draw(n - len(codes))) if c not in self.seen]
+            taken = {
+                row[0] for row in self.conn.execute(
+                    "SELECT ticket_code FROM ticket_instances WHERE ticket_code IN (SELECT value FROM json_each(?))",
+                    (json.dumps(fresh),),
+                )
+            }
+            fresh = [c for c in fresh if c not in taken]
+            self.redrawn += n - len(codes) - len(fresh)
+            self.seen.update(fresh)
+            codes.extend(fresh)
+        return codes
+
+
+def pending_tickets(conn, event_id: str):
+    """Yield (order_item_id, order_id, ticket_type_id, tier, holder_name, holder_email) per missing ticket."""
+    for item_id, order_id, type_id, tier, name, email, missing in conn.execute(PENDING, (event_id,)).fetchall():
+        for _ in range(max(0, missing)):
+            yield item_id, order_id, type_id, tier, name, email
+
+
+def issue(conn, event_id: str, batch: int, seed: int | None = None):
+    """Insert the missing instances in batches; yields each committed batch as (code, tier, holder, qr_payload)."""
+    minter = Minter(conn, seed)
+    todo = list(pending_tickets(conn, event_id))
+    serial = int(time.time() * 1000)
+    for start in range(0, len(todo), batch):
+        chunk = todo[start:start + batch]
+        issued = now_iso()
+        rows = []
+        with transaction(conn):
+            for (item_id, order_id, type_id, tier, name, email), code in zip(chunk, minter.take(len(chunk))):
+                payload = json.dumps(
+                    {"v": 1, "code": code, "event_id": event_id, "order_id": order_id, "issued": issued},
+                    separators=(",", ":"),
+                )
+                serial += 1
+                rows.append((
+                    f"tkt_{serial}_{secrets.token_hex(4)}", order_id, item_id, event_id, type_id,
+                    code, name, email, payload,
+                ))
+            conn.executemany(INSERT, rows)
+        yield [(row[5], tier, name, row[8]) for row, (_, _, _, tier, name, _) in zip(rows, chunk)]
+    if minter.redrawn:
+        print(f"  {minter.redrawn} code collision(s) redrawn", file=sys.stderr)
+
+
+def issued(conn, event_id: str, batch: int):
+    """Yield the event's existing instances in batches, in the shape issue() yields."""
+    cursor = conn.execute(ISSUED, (event_id,))
+    while rows := cursor.fetchmany(batch):
+        yield [tuple(row) for row in rows]
+
+
+# -- rendering (runs in worker processes) ------------------------------------
+
+_event: dict = {}
+
+
+def init_worker(event: dict) -> None:
+    _event.update(event)
+
+
+def qr_image(payload: str, size: int) -> Image.Image:
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, border=4)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    modules = np.asarray(qr.get_matrix(), dtype=bool)
+    scale = max(1, size // modules.shape[0])
+    pixels = np.where(np.kron(modules, np.ones((scale, scale), dtype=bool)), 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels, "L")
+
+
+def render(task: tuple[str, str, str | None, str, str]) -> tuple[str, bytes]:
+    code, tier, holder, payload, fmt = task
+    card = Image.new("L", CARD, 255)
+    draw = ImageDraw.Draw(card)
+    draw.text((40, 36), _event["title"], font=font("Bold", 34), fill=INK)
+    draw.text((40, 84), _event["when"], font=font("Medium", 20), fill=MUTED)
+    draw.text((40, 112), _event["where"], font=font("Medium", 20), fill=MUTED)
+    qr = qr_image(payload, QR_PX)
+    card.paste(qr, ((CARD[0] - qr.width) // 2, 160))
+    draw.text((40, 690), tier, font=font("SemiBold", 28), fill=INK)
+    if holder:
+        draw.text((40, 730), holder, font=font("Regular", 22), fill=MUTED)
+    draw.text((40, 800), code, font=font("ExtraBold", 34), fill=INK)
+    buf = BytesIO()
+    if fmt == "pdf":
+        card.save(buf, "PDF", resolution=150)
+    else:
+        card.save(buf, "PNG")
+    return f"{code}.{fmt}", buf.getvalue()
+
+
+def event_context(conn, event_id: str) -> dict:
+    row = conn.execute("SELECT title, starts_at, venue, city FROM gig_events WHERE id = ?", (event_id,)).fetchone()
+    if row is None:
+        sys.exit(f"No gig_events row with id {event_id}")
+    title, starts_at, venue, city = row
+    return {"title": title, "when": starts_at.replace("T", " ")[:16], "where": f"{venue}, {city}"}
+
+
+def seed_demo(db: Path, tickets: int) -> str:
+    conn = build_replica(db)
+    stamp = now_iso()
+    with transaction(conn):
+        conn.execute(
+            "INSERT INTO users (id, email, password_hash, user_type, first_name, last_name, created_at) "
+            "VALUES ('user_demo', 'demo@issue.test', '-', 'artist', 'Demo', 'Artist', ?)",
+            (stamp,),
+        )
+        conn.execute("INSERT INTO artist_profiles (id, user_id, category) VALUES ('artist_demo', 'user_demo', 'DJ')")
+        conn.execute(
+            "INSERT INTO gig_events (id, artist_id, author_user_id, slug, title, venue, city, starts_at, status) "
+            "VALUES ('gig_demo', 'artist_demo', 'user_demo', 'demo', 'Demo Night', 'The Venue', 'Johannesburg', ?, 'published')",
+            (stamp,),
+        )
+        conn.execute(
+            "INSERT INTO gig_ticket_types (id, event_id, name, price, quantity_total, quantity_sold) "
+            "VALUES ('tt_demo', 'gig_demo', 'General Admission', 150, ?, ?)",
+            (tickets, tickets),
+        )
+        orders = [(f"tord_{i:07d}", min(4, tickets - i)) for i in range(0, tickets, 4)]
+        conn.executemany(
+            "INSERT INTO ticket_orders (id, event_id, buyer_user_id, status, subtotal, total, buyer_name, buyer_email, paid_at) "
+            "VALUES (?, 'gig_demo', 'user_demo', 'paid', ?, ?, ?, ?, ?)",
+            [(o, 150.0 * q, 150.0 * q, f"Buyer {o[5:]}", f"{o}@issue.test", stamp) for o, q in orders],
+        )
+        conn.executemany(
+            "INSERT INTO ticket_order_items (id, order_id, ticket_type_id, quantity, unit_price, line_total) "
+            "VALUES (?, ?, 'tt_demo', ?, 150, ?)",
+            [(f"titem_{o[5:]}", o, q, 150.0 * q) for o, q in orders],
+        )
+    conn.close()
+    return "gig_demo"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path)
+    parser.add_argument("--event", help="gig_events.id to issue for")
+    parser.add_argument("--demo", type=int, metavar="N", help="issue N tickets for a synthetic event in a temp replica")
+    parser.add_argument("--batch", type=int, default=5000, help="tickets per insert transaction")
+    parser.add_argument("--format", choices=("png", "pdf"), default="png")
+    parser.add_argument("--out", type=Path, help="zip to write (default: tickets-<event>.zip)")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--no-render", action="store_true", help="insert instances only")
+    parser.add_argument("--reprint", action="store_true", help="render the event's already issued tickets again")
+    parser.add_argument("--seed", type=int, help="fixed code RNG seed (demo/benchmark runs only)")
+    args = parser.parse_args()
+
+    if args.demo:
+        args.db = Path(tempfile.mkdtemp(prefix="gearsh-issue-")) / "demo.sqlite"
+        args.event = seed_demo(args.db, args.demo)
+    elif not (args.db and args.event):
+        parser.error("--db and --event are required (or use --demo N)")
+    if args.reprint and args.no_render:
+        parser.error("--reprint renders; it cannot be combined with --no-render")
+    render_on = not args.no_render
+    if render_on and qrcode is None:
+        sys.exit("Rendering needs the qrcode package: pip install qrcode (or pass --no-render)")
+
+    conn = connect(args.db)
+    context = event_context(conn, args.event)
+    out = args.out or Path(f"tickets-{args.event}.zip")
+    started = time.perf_counter()
+    count = 0
+    try:
+        if args.reprint:
+            batches = issued(conn, args.event, args.batch)
+        else:
+            batches = issue(conn, args.event, args.batch, args.seed)
+        if not render_on:
+            count = sum(len(b) for b in batches)
+        else:
+            # The pool renders one committed batch while the next is inserted
+            with Pool(args.workers, initializer=init_worker, initargs=(context,)) as pool, \
+                    zipfile.ZipFile(out, "w", zipfile.ZIP_STORED) as archive:
+                rendering = None
+                for batch in chain(batches, [None]):
+                    queued = batch and pool.imap(render, [(*t, args.format) for t in batch], chunksize=64)
+                    for name, data in rendering or ():
+                        archive.writestr(name, data)
+                        count += 1
+                    rendering = queued
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    if not count:
+        if args.reprint:
+            print(f"Nothing to reprint for {args.event}: no tickets have been issued")
+        else:
+            print(f"Nothing to issue for {args.event}: every paid order already has its tickets")
+        return
+    done = "rendered" if args.reprint else "issued and rendered" if render_on else "issued"
+    print(f"{count:,} tickets {done} in {elapsed:.1f}s ({count / elapsed:,.0f} tickets/s)")
+    if render_on:
+        print(f"  -> {out} ({out.stat().st_size / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
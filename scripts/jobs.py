@@ -0,0 +1,139 @@
+"""Shared plumbing for the offline database jobs.
+
+    ckpt = Checkpoint(conn, "reliability")
+    since = ckpt.position or 0
+    ...
+    ckpt.save(last_rowid, users=n)
+
+    throttle = Throttle(rows_per_sec=500)
+    throttle.wait(len(batch))
+
+    found = Discrepancies(out=open("issues.jsonl", "w"))
+    found.add("amount_mismatch", key, delta, paid=paid)
+
+Checkpoints live in a job_checkpoints table that is created on first use,
+the same way the functions create their runtime tables. An interrupted job
+can then resume from its last committed chunk.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+CHECKPOINTS = """
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+  job TEXT PRIMARY KEY,
+  position TEXT,
+  state TEXT,
+  updated_at TEXT
+)
+"""
+
+
+def now_iso() -> str:
+    """Timestamp in the format the functions write (Date.toISOString)."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class Checkpoint:
+    """Last committed position of a resumable job.
+
+    ``save`` does not commit, so a caller that saves inside its chunk
+    transaction moves the checkpoint atomically with the chunk's writes.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, job: str):
+        self.conn = conn
+        self.job = job
+        conn.execute(CHECKPOINTS)
+        row = conn.execute("SELECT position, state FROM job_checkpoints WHERE job = ?", (job,)).fetchone()
+        self.position = json.loads(row[0]) if row and row[0] is not None else None
+        self.state = json.loads(row[1]) if row and row[1] else {}
+
+    def save(self, position, **state) -> None:
+        self.position = position
+        self.state.update(state)
+        self.conn.execute(
+            "INSERT INTO job_checkpoints (job, position, state, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(job) DO UPDATE SET position = excluded.position, state = excluded.state, "
+            "updated_at = excluded.updated_at",
+            (self.job, json.dumps(position), json.dumps(self.state), now_iso()),
+        )
+
+    def clear(self) -> None:
+        self.position, self.state = None, {}
+        self.conn.execute("DELETE FROM job_checkpoints WHERE job = ?", (self.job,))
+
+
+class Throttle:
+    """Sleep so the long-run rate stays under ``rows_per_sec`` (0 = unthrottled)."""
+
+    def __init__(self, rows_per_sec: float = 0):
+        self.rate = rows_per_sec
+        self.started = time.monotonic()
+        self.rows = 0
+
+    def wait(self, rows: int) -> None:
+        self.rows += rows
+        if self.rate <= 0:
+            return
+        ahead = self.rows / self.rate - (time.monotonic() - self.started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+class Discrepancies:
+    """Findings of a reconciliation job, tallied per kind with a few examples each.
+
+    Every finding is also written to ``out`` as a JSON line when given.
+    """
+
+    def __init__(self, out=None, show: int = 3):
+        self.out = out
+        self.show = show
+        self.counts: Counter = Counter()
+        self.amounts: Counter = Counter()
+        self.examples: dict[str, list[dict]] = {}
+
+    def add(self, kind: str, key: str, amount: float = 0.0, **detail) -> None:
+        self.counts[kind] += 1
+        self.amounts[kind] += abs(amount)
+        record = {"kind": kind, "key": key, "amount": round(amount, 2), **detail}
+        if self.out:
+            self.out.write(json.dumps(record) + "\n")
+        examples = self.examples.setdefault(kind, [])
+        if len(examples) < self.show:
+            examples.append(record)
+
+    def print(self, checked: Counter, elapsed: float) -> None:
+        print(", ".join(f"{n:,} {what}" for what, n in checked.items()) + f" checked in {elapsed:.1f}s")
+        if not self.counts:
+            print("No discrepancies")
+            return
+        for kind, n in self.counts.most_common():
+            print(f"  {kind:30} {n:>8,}  R {self.amounts[kind]:>14,.2f}")
+            for record in self.examples[kind]:
+                detail = {k: v for k, v in record.items() if k not in ("kind", "key")}
+                print(f"      {record['key']}  {json.dumps(detail)}")
+
+
+def transaction(conn: sqlite3.Connection):
+    """``with transaction(conn):`` for the autocommit connections migrate.connect opens."""
+    return _Transaction(conn)
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, *exc):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
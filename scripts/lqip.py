@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Generate BlurHash strings and tiny base64 previews for artist images.
+
+Writes assets/images/artists/placeholders.json, which the showcase generator
+and the Flutter app read so tiles can paint before the full image arrives.
+
+The showcase listings in functions/api/sa-showcase-data.js are curated by hand
+after the generator runs, so their previews go to a separate
+web/sa-showcase-previews.js (image path -> preview data URI) rather than into
+that file; artist-feed.js paints it behind each feed card's lazy image.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from imaging import ARTISTS_DIR, fit_within, flatten_rgb, list_images
+from profiling import configure, traced
+from showcase import ROOT, load_artists
+
+MANIFEST = ARTISTS_DIR / "placeholders.json"
+SHOWCASE_JS = ROOT / "web" / "sa-showcase-previews.js"
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+# BlurHash only needs a handful of cosine terms, so hash a small copy.
+HASH_SAMPLE_PX = 64
+PREVIEW_PX = 20
+PREVIEW_QUALITY = 40
+
+
+def encode_base83(value: int, length: int) -> str:
+    chars = []
+    for i in range(1, length + 1):
+        digit = (value // 83 ** (length - i)) % 83
+        chars.append(BASE83[digit])
+    return "".join(chars)
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    v = rgb.astype(np.float64) / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(value: float) -> int:
+    v = min(max(value, 0.0), 1.0)
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(rgb: np.ndarray, components_x: int = 4, components_y: int = 3) -> str:
+    """Encode an HxWx3 uint8 array as a BlurHash string.
+
+    All cosine basis projections are computed at once with a single einsum
+    instead of the reference per-pixel loops.
+    """
+    if not (1 <= components_x <= 9 and 1 <= components_y <= 9):
+        raise ValueError("BlurHash components must be between 1 and 9")
+    h, w, _ = rgb.shape
+    linear = srgb_to_linear(rgb)
+
+    basis_x = np.cos(np.pi * np.outer(np.arange(components_x), np.arange(w)) / w)
+    basis_y = np.cos(np.pi * np.outer(np.arange(components_y), np.arange(h)) / h)
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (w * h)
+    norm = np.full((components_y, components_x), 2.0)
+    norm[0, 0] = 1.0
+    factors = (factors * norm[..., None]).reshape(-1, 3)
+
+    dc, ac = factors[0], factors[1:]
+    out = encode_base83((components_x - 1) + (components_y - 1) * 9, 1)
+
+    if len(ac):
+        actual_max = float(np.abs(ac).max())
+        quantised_max = int(max(0, min(82, np.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+    else:
+        quantised_max, max_value = 0, 1.0
+    out += encode_base83(quantised_max, 1)
+
+    r, g, b = (linear_to_srgb(float(c)) for c in dc)
+    out += encode_base83((r << 16) + (g << 8) + b, 4)
+
+    if len(ac):
+        scaled = ac / max_value
+        quant = np.clip(np.floor(np.sign(scaled) * np.abs(scaled) ** 0.5 * 9 + 9.5), 0, 18).astype(int)
+        for qr, qg, qb in quant:
+            out += encode_base83(int(qr) * 19 * 19 + int(qg) * 19 + int(qb), 2)
+    return out
+
+
+def preview_data_uri(img: Image.Image, longest: int = PREVIEW_PX) -> str:
+    buf = BytesIO()
+    fit_within(img, longest).save(buf, "WEBP", quality=PREVIEW_QUALITY, method=6)
+    return "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+@traced()
+def placeholder_entry(path: Path, digest: str | None = None) -> dict:
+    data = path.read_bytes()
+    digest = digest or hashlib.sha1(data).hexdigest()
+    with Image.open(BytesIO(data)) as raw:
+        raw.load()
+        img = flatten_rgb(raw)
+    sample = np.asarray(fit_within(img, HASH_SAMPLE_PX))
+    mean = sample.reshape(-1, 3).mean(axis=0).astype(int)
+    return {
+        "sha1": digest,
+        "width": img.width,
+        "height": img.height,
+        "color": "#{:02x}{:02x}{:02x}".format(*mean),
+        "blurhash": blurhash(sample),
+        "preview": preview_data_uri(img),
+    }
+
+
+def load_manifest(path: Path = MANIFEST) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_manifest(entries: dict, path: Path = MANIFEST) -> None:
+    path.write_text(json.dumps(dict(sorted(entries.items())), indent=2) + "\n", encoding="utf-8")
+
+
+def write_showcase_previews(manifest: dict, path: Path = SHOWCASE_JS) -> int:
+    """Previews for the images the showcase artists use; returns how many."""
+    previews = {}
+    for artist in load_artists():
+        image = artist.get("image", "")
+        entry = manifest.get(Path(image).name) if (ROOT / image).parent == ARTISTS_DIR else None
+        if entry:
+            previews[image] = entry["preview"]
+    payload = json.dumps(dict(sorted(previews.items())), indent=0, separators=(",", ":"))
+    path.write_text(
+        "// Auto-generated by scripts/lqip.py — ~20px previews of the showcase images\n"
+        "// SHOWCASE_PREVIEWS[image] = data URI\n"
+        f"var SHOWCASE_PREVIEWS = {payload};\n",
+        encoding="utf-8",
+    )
+    return len(previews)
+
+
+def update_manifest(images: list[Path], manifest: dict) -> tuple[int, int]:
+    """Refresh entries for ``images`` in place; returns (generated, unchanged)."""
+    generated = unchanged = 0
+    for path in images:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        current = manifest.get(path.name)
+        if current and current.get("sha1") == digest:
+            unchanged += 1
+            continue
+        try:
+            manifest[path.name] = placeholder_entry(path, digest)
+            generated += 1
+        except Exception as e:
+            print(f"  skip {path.name}: {e}")
+    return generated, unchanged
+
+
+def main() -> None:
+    configure()
+    images = list_images()
+    if not images:
+        raise SystemExit(f"No images found in {ARTISTS_DIR}")
+
+    manifest = load_manifest()
+    names = {p.name for p in images}
+    stale = [name for name in manifest if name not in names]
+    for name in stale:
+        del manifest[name]
+
+    generated, unchanged = update_manifest(images, manifest)
+    write_manifest(manifest)
+    shown = write_showcase_previews(manifest)
+    print(f"Placeholders: {generated} generated, {unchanged} unchanged, {len(stale)} removed")
+    print(f"  manifest -> {MANIFEST}")
+    print(f"  {shown} showcase previews -> {SHOWCASE_JS.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
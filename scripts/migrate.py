@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Apply database/*.sql to a local SQLite (or wrangler D1 local) replica.
+
+    python scripts/migrate.py --db gearsh.sqlite            # apply pending
+    python scripts/migrate.py --db gearsh.sqlite --status   # list state
+    python scripts/migrate.py --db :fresh: --seed           # throwaway replica
+    python scripts/migrate.py --db prod-copy.sqlite --baseline
+
+Migrations are schema.sql followed by the add_*.sql files in name order.
+seed.sql (--seed) and one-off account scripts (--extra FILE) are applied
+and recorded the same way when asked for. Each file runs inside its own
+transaction, and its SHA-256 is stored in schema_migrations, so a file is
+never re-run and edits to an applied file are reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DB_DIR = ROOT / "database"
+SEED = DB_DIR / "seed.sql"
+
+TRACKING_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  name TEXT PRIMARY KEY,
+  checksum TEXT NOT NULL,
+  applied_at TEXT DEFAULT (datetime('now')),
+  duration_ms REAL
+)
+"""
+
+# SQLite (and D1) reject ADD COLUMN ... UNIQUE; apply it as column + unique index.
+ADD_UNIQUE_COLUMN = re.compile(
+    r"^ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)\s+(.*?)\s+UNIQUE\b(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+@dataclass
+class Migration:
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf-8-sig").replace("\r\n", "\n")
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+
+def discover(seed: bool = False, extra: list[Path] | None = None) -> list[Migration]:
+    files = [DB_DIR / "schema.sql"] + sorted(DB_DIR.glob("add_*.sql"))
+    if seed:
+        files.append(SEED)
+    files += list(extra or [])
+    return [Migration(f) for f in files]
+
+
+def connect(path: Path | str, bulk: bool = False) -> sqlite3.Connection:
+    """Open a replica in autocommit mode; ``bulk`` trades durability for load speed."""
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    conn.execute("PRAGMA foreign_keys = ON")
+    if bulk:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -262144")
+        conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+    else:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+def split_statements(sql: str) -> list[str]:
+    """Split a script into complete statements (trigger bodies stay intact)."""
+    statements, buf = [], ""
+    for line in sql.splitlines(keepends=True):
+        if not buf and (not line.strip() or line.lstrip().startswith("--")):
+            continue
+        buf += line
+        if sqlite3.complete_statement(buf):
+            statements.append(buf.strip())
+            buf = ""
+    if buf.strip() and not all(
+        not l.strip() or l.lstrip().startswith("--") for l in buf.splitlines()
+    ):
+        statements.append(buf.strip())
+    return statements
+
+
+def sqlite_compatible(statement: str) -> list[str]:
+    body = re.sub(r"^(\s*--[^\n]*\n)+", "", statement).rstrip().rstrip(";")
+    match = ADD_UNIQUE_COLUMN.match(body)
+    if not match:
+        return [statement]
+    table, column, before, after = match.groups()
+    return [
+        f"ALTER TABLE {table} ADD COLUMN {column} {before}{after}",
+        f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{table}_{column} ON {table}({column})",
+    ]
+
+
+def applied(conn: sqlite3.Connection) -> dict[str, str]:
+    conn.execute(TRACKING_TABLE)
+    return dict(conn.execute("SELECT name, checksum FROM schema_migrations"))
+
+
+def apply(conn: sqlite3.Connection, migration: Migration) -> float:
+    """Run one file in a single transaction and record it; returns elapsed ms."""
+    started = time.perf_counter()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in split_statements(migration.sql):
+            for sql in sqlite_compatible(statement):
+                conn.execute(sql)
+        elapsed = 1000 * (time.perf_counter() - started)
+        conn.execute(
+            "INSERT INTO schema_migrations (name, checksum, duration_ms) VALUES (?, ?, ?)",
+            (migration.name, migration.checksum, elapsed),
+        )
+        conn.execute("COMMIT")
+    except sqlite3.Error as e:
+        conn.execute("ROLLBACK")
+        raise MigrationError(f"{migration.name}: {e}") from e
+    return elapsed
+
+
+def pending(conn: sqlite3.Connection, migrations: list[Migration], accept_changed: bool = False) -> list[Migration]:
+    done = applied(conn)
+    changed = [m for m in migrations if m.name in done and done[m.name] != m.checksum]
+    if changed and not accept_changed:
+        names = ", ".join(m.name for m in changed)
+        raise MigrationError(f"applied migrations changed on disk: {names} (use --accept-changed)")
+    for m in changed:
+        conn.execute("UPDATE schema_migrations SET checksum = ? WHERE name = ?", (m.checksum, m.name))
+    return [m for m in migrations if m.name not in done]
+
+
+def migrate(conn: sqlite3.Connection, migrations: list[Migration], accept_changed: bool = False, quiet: bool = False) -> int:
+    todo = pending(conn, migrations, accept_changed)
+    for migration in todo:
+        elapsed = apply(conn, migration)
+        if not quiet:
+            print(f"  applied {migration.name} ({elapsed:.1f}ms)")
+    return len(todo)
+
+
+def build_replica(path: Path | str, seed: bool = False, bulk: bool = False) -> sqlite3.Connection:
+    """Create (or bring up to date) a replica at ``path`` and return it open."""
+    conn = connect(path, bulk=bulk)
+    migrate(conn, discover(seed=seed), quiet=True)
+    return conn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", required=True, help="SQLite file, or :fresh: for a temp replica")
+    parser.add_argument("--seed", action="store_true", help="also apply database/seed.sql")
+    parser.add_argument("--extra", type=Path, action="append", default=[], help="extra data script to apply")
+    parser.add_argument("--status", action="store_true", help="show applied/pending and exit")
+    parser.add_argument("--baseline", action="store_true", help="mark all as applied without running")
+    parser.add_argument("--accept-changed", action="store_true", help="re-record checksums of edited files")
+    args = parser.parse_args()
+
+    db = args.db
+    if db == ":fresh:":
+        db = Path(tempfile.mkdtemp(prefix="gearsh-replica-")) / "gearsh.sqlite"
+    migrations = discover(args.seed, [p.resolve() for p in args.extra])
+    conn = connect(db)
+    started = time.perf_counter()
+    try:
+        if args.status:
+            done = applied(conn)
+            for m in migrations:
+                state = "pending" if m.name not in done else "applied" if done[m.name] == m.checksum else "CHANGED"
+                print(f"  {state:8} {m.name}")
+            return
+        if args.baseline:
+            todo = pending(conn, migrations, args.accept_changed)
+            conn.executemany(
+                "INSERT INTO schema_migrations (name, checksum, duration_ms) VALUES (?, ?, 0)",
+                [(m.name, m.checksum) for m in todo],
+            )
+            print(f"Baselined {len(todo)} migrations in {db}")
+            return
+        count = migrate(conn, migrations, args.accept_changed)
+    except MigrationError as e:
+        print(f"Migration failed: {e}", file=sys.stderr)
+        raise SystemExit(1)
+    finally:
+        conn.close()
+    total = 1000 * (time.perf_counter() - started)
+    print(f"{count} migration(s) applied to {db} in {total:.0f}ms" if count else f"{db} is up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Render a 1200x630 Open Graph share card for every showcase artist.
+
+    python scripts/og-cards.py
+    python scripts/og-cards.py --only black-coffee --only tyla --force
+    python scripts/og-cards.py --workers 4
+
+Each card puts the artist photo beside the cleaned Gearsh logo, the artist
+name, genre and location, and the mastery badge the showcase shows. Cards
+are written to web/og/artists/<username>-<key>.jpg, where the key is a hash
+of everything the card is drawn from: the artist fields, the photo, logo and
+font files, and the layout version. An artist whose key is unchanged is not
+redrawn; the rest are rendered in a process pool.
+
+web/og/artists/cards.json keeps the keys between runs, and
+functions/_og-cards.js maps each username to its card so the share pages
+(functions/book/[username].js, via artistCardUrl() in _og-utils.js) can
+point og:image at a static, immutable file instead of the raw photo.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from functools import lru_cache
+from multiprocessing import Pool
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from imaging import FALLBACK_IMAGE, FONTS_DIR, font, open_rgb
+from profiling import configure, traced
+from showcase import ROOT, image_path, load_artists
+
+# Bump when the layout changes so every card is redrawn
+LAYOUT_VERSION = 1
+
+WIDTH, HEIGHT = 1200, 630
+PHOTO_PX = 600
+FADE_PX = 240
+PAD = 56
+QUALITY = 85
+
+BACKGROUND = (10, 10, 10)
+INK = (255, 255, 255)
+MUTED = (163, 163, 163)
+ACCENT = (0, 191, 255)
+# .fb-* badge colours from web/discovery.css: (background rgba, text)
+BADGES = {
+    "fb-new": ((0, 191, 255, 0.25), (125, 211, 252)),
+    "fb-rise": ((139, 92, 246, 0.25), (196, 181, 253)),
+    "fb-feat": ((251, 191, 36, 0.25), (253, 230, 138)),
+    "fb-deal": ((52, 211, 153, 0.25), (110, 231, 183)),
+}
+
+LOGO = ROOT / "assets" / "images" / "gearsh-logo.png"
+CARDS_DIR = ROOT / "web" / "og" / "artists"
+CARDS_INDEX = CARDS_DIR / "cards.json"
+CARDS_JS = ROOT / "functions" / "_og-cards.js"
+WEB_PREFIX = "/og/artists"
+
+FIELDS = ("name", "username", "genre", "location", "badge", "badgeClass", "masteryHours", "image")
+
+
+@lru_cache(maxsize=None)
+def digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest() if path.is_file() else ""
+
+
+def card_key(artist: dict) -> str:
+    h = hashlib.sha1(f"{LAYOUT_VERSION}:{WIDTH}x{HEIGHT}:{PHOTO_PX}:{FADE_PX}:{QUALITY}".encode())
+    h.update(json.dumps([artist.get(f) for f in FIELDS]).encode())
+    photo = image_path(artist)
+    h.update(digest(photo if photo.is_file() else FALLBACK_IMAGE).encode())
+    h.update(digest(LOGO).encode())
+    for weight in ("Medium", "SemiBold", "ExtraBold"):
+        h.update(digest(FONTS_DIR / f"Syne-{weight}.ttf").encode())
+    return h.hexdigest()
+
+
+# -- rendering (runs in worker processes) ------------------------------------
+
+_logo: list = []
+
+
+def logo(height: int) -> Image.Image | None:
+    if not _logo:
+        _logo.append(Image.open(LOGO).convert("RGBA") if LOGO.exists() else None)
+    img = _logo[0]
+    if img is None:
+        return None
+    return img.resize((round(img.width * height / img.height), height), Image.Resampling.LANCZOS)
+
+
+def photo(artist: dict) -> Image.Image:
+    """Crop the artist photo to the card's left column, faded into the background on its right edge."""
+    path = image_path(artist)
+    img = open_rgb(path if path.is_file() else FALLBACK_IMAGE)
+    scale = max(PHOTO_PX / img.width, HEIGHT / img.height)
+    w, h = round(PHOTO_PX / scale), round(HEIGHT / scale)
+    # Keep the top of portrait shots, where faces are
+    left, top = (img.width - w) // 2, (img.height - h) // 4
+    img = img.crop((left, top, left + w, top + h)).resize((PHOTO_PX, HEIGHT), Image.Resampling.LANCZOS)
+    mask = Image.linear_gradient("L").rotate(-90, expand=True).resize((FADE_PX, HEIGHT))
+    alpha = Image.new("L", (PHOTO_PX, HEIGHT), 255)
+    alpha.paste(mask, (PHOTO_PX - FADE_PX, 0))
+    faded = Image.new("RGB", img.size, BACKGROUND)
+    faded.paste(img, mask=alpha)
+    return faded
+
+
+def fit_name(draw: ImageDraw.ImageDraw, name: str, width: int) -> tuple:
+    """Largest ExtraBold size at which the name fits ``width`` in at most two lines."""
+    words = name.split()
+    for size in range(84, 39, -4):
+        face = font("ExtraBold", size)
+        lines = [""]
+        for word in words:
+            candidate = f"{lines[-1]} {word}".strip()
+            if draw.textlength(candidate, font=face) <= width or not lines[-1]:
+                lines[-1] = candidate
+            else:
+                lines.append(word)
+        if len(lines) <= 2 and all(draw.textlength(line, font=face) <= width for line in lines):
+            return face, lines
+    return face, lines[:2]
+
+
+def blend(rgba: tuple) -> tuple:
+    *rgb, a = rgba
+    return tuple(round(b + (c - b) * a) for c, b in zip(rgb, BACKGROUND))
+
+
+@traced()
+def render(artist: dict) -> Image.Image:
+    card = Image.new("RGB", (WIDTH, HEIGHT), BACKGROUND)
+    card.paste(photo(artist), (0, 0))
+    draw = ImageDraw.Draw(card)
+    x = PHOTO_PX
+    width = WIDTH - x - PAD
+
+    mark = logo(72)
+    if mark is not None:
+        card.paste(mark, (x, PAD), mark)
+
+    face, lines = fit_name(draw, artist["name"], width)
+    line_h = round(face.size * 1.1)
+    y = HEIGHT // 2 - line_h * len(lines) // 2 - 30
+    for line in lines:
+        draw.text((x, y), line, font=face, fill=INK)
+        y += line_h
+
+    y += 14
+    genre = artist.get("genre") or artist.get("category") or ""
+    if genre:
+        draw.text((x, y), genre, font=font("SemiBold", 30), fill=ACCENT)
+        y += 44
+    if artist.get("location"):
+        draw.text((x, y), artist["location"], font=font("Medium", 26), fill=MUTED)
+        y += 40
+
+    badge = artist.get("badge")
+    if badge:
+        hours = artist.get("masteryHours") or 0
+        label = f"{badge} · {hours:,} hrs" if hours else badge
+        fill, text = BADGES.get(artist.get("badgeClass"), BADGES["fb-new"])
+        face = font("SemiBold", 24)
+        w = draw.textlength(label, font=face)
+        y += 16
+        draw.rounded_rectangle((x, y, x + w + 36, y + 44), radius=22, fill=blend(fill))
+        draw.text((x + 18, y + 22), label, font=face, fill=text, anchor="lm")
+
+    draw.text(
+        (x, HEIGHT - PAD), f"thegearsh.com/book/{artist['username']}",
+        font=font("Medium", 22), fill=MUTED, anchor="ls",
+    )
+    return card
+
+
+def render_card(job: tuple[dict, str]) -> tuple[str, str]:
+    artist, key = job
+    name = f"{artist['username']}-{key[:10]}.jpg"
+    render(artist).save(CARDS_DIR / name, "JPEG", quality=QUALITY, optimize=True, progressive=True)
+    return artist["username"], name
+
+
+# -- manifest ------------------------------------------------------------------
+
+
+def write_js(cards: dict) -> None:
+    entries = "".join(f"  '{username}': '{WEB_PREFIX}/{card['file']}',\n" for username, card in sorted(cards.items()))
+    CARDS_JS.write_text(
+        "// Auto-generated by scripts/og-cards.py — pre-rendered 1200x630 share cards\n"
+        "// OG_CARDS[username] = path under the site root\n"
+        f"export const OG_CARDS = {{\n{entries}}};\n",
+        encoding="utf-8",
+    )
+
+
+def build(only: set[str] | None, force: bool, workers: int | None) -> tuple[int, int, int]:
+    """Render changed cards; returns (rendered, unchanged, removed)."""
+    CARDS_DIR.mkdir(parents=True, exist_ok=True)
+    cards = json.loads(CARDS_INDEX.read_text(encoding="utf-8")) if CARDS_INDEX.exists() else {}
+    artists = {a["username"]: a for a in load_artists()}
+
+    removed = 0
+    for username in [u for u in cards if u not in artists]:
+        (CARDS_DIR / cards.pop(username)["file"]).unlink(missing_ok=True)
+        removed += 1
+
+    jobs, unchanged = [], 0
+    for username, artist in artists.items():
+        if only is not None and username not in only:
+            continue
+        key = card_key(artist)
+        current = cards.get(username)
+        if not force and current and current["key"] == key and (CARDS_DIR / current["file"]).exists():
+            unchanged += 1
+            continue
+        jobs.append((artist, key))
+
+    if jobs:
+        with Pool(workers) as pool:
+            for (artist, key), (username, name) in zip(jobs, pool.imap(render_card, jobs)):
+                previous = cards.get(username)
+                if previous and previous["file"] != name:
+                    (CARDS_DIR / previous["file"]).unlink(missing_ok=True)
+                cards[username] = {"key": key, "file": name}
+
+    CARDS_INDEX.write_text(json.dumps(dict(sorted(cards.items())), indent=2) + "\n", encoding="utf-8")
+    write_js(cards)
+    return len(jobs), unchanged, removed
+
+
+def main() -> None:
+    configure()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", metavar="USERNAME", help="only render this artist (repeatable)")
+    parser.add_argument("--force", action="store_true", help="render cards even if unchanged")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    args = parser.parse_args()
+
+    rendered, unchanged, removed = build(set(args.only) if args.only else None, args.force, args.workers)
+    print(
+        f"OG cards: {rendered} rendered, {unchanged} unchanged, {removed} removed "
+        f"-> {CARDS_JS.relative_to(ROOT)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Fingerprint, precompress and cache-tag the Flutter web build before deploy.
+
+    python scripts/optimize-web-build.py
+    python scripts/optimize-web-build.py build/web --workers 4
+    python scripts/optimize-web-build.py my_web_build --dry-run
+
+Run it on the output of `flutter build web` (deploy.ps1 does, right after
+the build). It walks the output and:
+
+  * copies every local script and stylesheet an HTML page loads to
+    static/<path>.<hash>.<ext> and points the page at the copy. The
+    originals stay where they were, so anything that still names them (Pages
+    Functions, scripts that inject other scripts) keeps working;
+  * copies main.dart.js to main.dart.<hash>.js, points the buildConfig in
+    flutter_bootstrap.js at it, and makes flutter_service_worker.js precache
+    that name instead, with fresh md5s for every file this run rewrote;
+  * writes .gz and, when the brotli package is installed, .br siblings of
+    every text file, in a process pool, keeping a variant only when it saves
+    at least MIN_SAVING;
+  * appends a block to the build's _headers (copied from web/_headers) that
+    makes the hashed files immutable for a year and keeps the entry points
+    (HTML, the bootstrap and the service worker) on a short TTL.
+
+It finishes with the transfer size of the build before and after, and of
+the first load of the Flutter app on its own. Running it again on the same
+output is a no-op apart from the report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import re
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+from profiling import configure, traced
+from showcase import ROOT
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = "static"
+MAIN_JS = "main.dart.js"
+BOOTSTRAP = "flutter_bootstrap.js"
+SERVICE_WORKER = "flutter_service_worker.js"
+# Never renamed: their URLs are what everything else is reached through
+ENTRY_POINTS = (BOOTSTRAP, "flutter.js", SERVICE_WORKER, "manifest.json", "version.json")
+# Already long-cached by path in web/_headers
+SKIP_DIRS = ("assets", "canvaskit", "icons")
+
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".xml", ".wasm", ".map", ".ttf", ".otf"}
+MIN_BYTES = 1024
+MIN_SAVING = 0.05
+# What the browser fetches before the Flutter app draws its first frame
+FIRST_LOAD = ("index.html", BOOTSTRAP, MAIN_JS, "canvaskit/canvaskit.js", "canvaskit/canvaskit.wasm")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+ENTRY_TTL = "public, max-age=0, must-revalidate"
+HEADERS_BEGIN = "# build (scripts/optimize-web-build.py)"
+HEADERS_END = "# end build"
+
+REF_RE = re.compile(r'''(?P<attr>\b(?:src|href)=)(?P<q>["'])(?P<url>[^"'?#]+\.(?:js|css))(?P<query>[?#][^"']*)?(?P=q)''')
+MAIN_JS_RE = re.compile(r'("mainJsPath":\s*")([^"]+)(")')
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def hashed_name(path: str, data: bytes) -> str:
+    stem, dot, ext = path.rpartition(".")
+    return f"{stem}.{content_hash(data)}{dot}{ext}"
+
+
+def is_local(url: str) -> bool:
+    return not re.match(r"^(?:[a-z][a-z0-9+.-]*:|//)", url, re.I)
+
+
+def skipped(rel: str) -> bool:
+    return rel.split("/", 1)[0] in SKIP_DIRS + (STATIC_DIR,) or rel in ENTRY_POINTS
+
+
+# -- fingerprinting --------------------------------------------------------------
+
+
+class Fingerprinter:
+    def __init__(self, build: Path, dry_run: bool):
+        self.build = build
+        self.dry_run = dry_run
+        self.copies: dict[str, str] = {}
+        self.rewritten: list[str] = []
+
+    def fingerprint(self, rel: str) -> str | None:
+        """Hashed copy of ``rel`` under static/ (created once), or None if it is not a file we rename."""
+        if rel in self.copies:
+            return self.copies[rel]
+        source = self.build / rel
+        if skipped(rel) or not source.is_file():
+            return None
+        data = source.read_bytes()
+        target = f"{STATIC_DIR}/{hashed_name(rel, data)}"
+        if not self.dry_run:
+            (self.build / target).parent.mkdir(parents=True, exist_ok=True)
+            (self.build / target).write_bytes(data)
+        self.copies[rel] = target
+        return target
+
+    def resolve(self, page: Path, url: str) -> str | None:
+        base = self.build if url.startswith("/") else page.parent
+        try:
+            target = (base / url.lstrip("/")).resolve().relative_to(self.build.resolve())
+        except ValueError:
+            return None
+        return target.as_posix()
+
+    def rewrite_page(self, page: Path) -> None:
+        # Some pages carry stray Windows-1252 bytes; pass them through untouched
+        text = page.read_text(encoding="utf-8", errors="surrogateescape")
+
+        def swap(m: re.Match) -> str:
+            url = m.group("url")
+            if not is_local(url) or url.lstrip("/").startswith(f"{STATIC_DIR}/"):
+                return m.group(0)
+            rel = self.resolve(page, url)
+            target = rel and self.fingerprint(rel)
+            if not target:
+                return m.group(0)
+            # The hash replaces cache-busting query strings like ?v=2
+            return f"{m.group('attr')}{m.group('q')}/{target}{m.group('q')}"
+
+        updated = REF_RE.sub(swap, text)
+        if updated != text:
+            self.write(page, updated)
+
+    def rewrite_main_js(self) -> None:
+        """Point the bootstrap's buildConfig at a hashed main.dart.js next to the original."""
+        bootstrap = self.build / BOOTSTRAP
+        if not bootstrap.exists() or not (self.build / MAIN_JS).exists():
+            return
+        text = bootstrap.read_text(encoding="utf-8")
+        if not MAIN_JS_RE.search(text):
+            return
+        data = (self.build / MAIN_JS).read_bytes()
+        target = hashed_name(MAIN_JS, data)
+        self.copies[MAIN_JS] = target
+        if not self.dry_run and not (self.build / target).exists():
+            (self.build / target).write_bytes(data)
+        updated = MAIN_JS_RE.sub(lambda m: f"{m.group(1)}{target}{m.group(3)}", text)
+        if updated != text:
+            self.write(bootstrap, updated)
+
+    def update_service_worker(self) -> None:
+        """Precache the hashed main.dart.js and refresh the md5s of the files this run rewrote."""
+        worker = self.build / SERVICE_WORKER
+        if not worker.exists() or self.dry_run:
+            return
+        text = worker.read_text(encoding="utf-8")
+        if MAIN_JS in self.copies:
+            # Both the RESOURCES key and the CORE list entry
+            text = text.replace(f'"{MAIN_JS}"', f'"{self.copies[MAIN_JS]}"')
+        for rel in self.rewritten:
+            md5 = hashlib.md5((self.build / rel).read_bytes()).hexdigest()
+            keys = [rel, "/"] if rel == "index.html" else [rel]
+            for key in keys:
+                text = re.sub(rf'("{re.escape(key)}":\s*")[0-9a-f]{{32}}(")', rf"\g<1>{md5}\g<2>", text)
+        worker.write_text(text, encoding="utf-8")
+
+    def write(self, path: Path, text: str) -> None:
+        self.rewritten.append(path.relative_to(self.build).as_posix())
+        if not self.dry_run:
+            path.write_text(text, encoding="utf-8", errors="surrogateescape")
+
+
+@traced()
+def fingerprint(build: Path, dry_run: bool) -> Fingerprinter:
+    fp = Fingerprinter(build, dry_run)
+    for page in sorted(build.rglob("*.html")):
+        rel = page.relative_to(build).as_posix()
+        if rel.split("/", 1)[0] not in SKIP_DIRS:
+            fp.rewrite_page(page)
+    fp.rewrite_main_js()
+    fp.update_service_worker()
+    return fp
+
+
+# -- precompression (runs in worker processes) -----------------------------------
+
+
+def compress_file(path: Path) -> tuple[str, int, int, int]:
+    """Write the variants worth keeping; returns (path, raw, gzip, brotli) sizes, 0 for a dropped variant."""
+    data = path.read_bytes()
+    sizes = []
+    for suffix, packed in (
+        (".gz", gzip.compress(data, compresslevel=9, mtime=0)),
+        (".br", brotli.compress(data, quality=11) if brotli is not None else None),
+    ):
+        sibling = path.with_name(path.name + suffix)
+        if packed is None or len(packed) > len(data) * (1 - MIN_SAVING):
+            sibling.unlink(missing_ok=True)
+            sizes.append(0)
+            continue
+        if not sibling.exists() or sibling.read_bytes() != packed:
+            sibling.write_bytes(packed)
+        sizes.append(len(packed))
+    return str(path), len(data), *sizes
+
+
+@traced()
+def precompress(build: Path, workers: int | None) -> dict[str, tuple[int, int, int]]:
+    paths = [
+        p for p in sorted(build.rglob("*"))
+        if p.is_file() and p.suffix in COMPRESSIBLE and p.stat().st_size >= MIN_BYTES
+    ]
+    sizes = {}
+    with Pool(workers) as pool:
+        for path, *variants in pool.imap_unordered(compress_file, paths, chunksize=8):
+            sizes[Path(path).relative_to(build).as_posix()] = tuple(variants)
+    return sizes
+
+
+# -- _headers --------------------------------------------------------------------
+
+
+def headers_block(build: Path, copies: dict[str, str]) -> str:
+    rules = [f"/{STATIC_DIR}/*\n  ! Cache-Control\n  Cache-Control: {IMMUTABLE}\n"]
+    if MAIN_JS in copies:
+        rules.append(f"/{copies[MAIN_JS]}\n  ! Cache-Control\n  Cache-Control: {IMMUTABLE}\n")
+    for name in ("/", "/index.html") + tuple(f"/{e}" for e in ENTRY_POINTS):
+        if name == "/" or (build / name.lstrip("/")).exists():
+            rules.append(f"{name}\n  ! Cache-Control\n  Cache-Control: {ENTRY_TTL}\n")
+    for suffix, encoding in ((".gz", "gzip"), (".br", "br")):
+        rules.append(f"/{STATIC_DIR}/*{suffix}\n  Content-Encoding: {encoding}\n")
+    return f"{HEADERS_BEGIN}\n" + "\n".join(rules) + f"{HEADERS_END}\n"
+
+
+def write_headers(build: Path, copies: dict[str, str]) -> int:
+    """Replace the generated block in the build's _headers; returns the total rule count."""
+    path = build / "_headers"
+    if path.exists():
+        text = path.read_text(encoding="utf-8")
+    else:
+        text = (ROOT / "web" / "_headers").read_text(encoding="utf-8")
+    text = re.sub(rf"\n*{re.escape(HEADERS_BEGIN)}.*?{re.escape(HEADERS_END)}\n?", "\n", text, flags=re.S)
+    text = text.rstrip("\n") + "\n\n" + headers_block(build, copies)
+    path.write_text(text, encoding="utf-8")
+    return sum(1 for line in text.splitlines() if line.startswith("/"))
+
+
+# -- report ----------------------------------------------------------------------
+
+
+def transfer(sizes: tuple[int, int, int]) -> int:
+    return min(s for s in sizes if s)
+
+
+def report(build: Path, sizes: dict[str, tuple[int, int, int]]) -> None:
+    raw = sum(s[0] for s in sizes.values())
+    gz = sum(s[1] or s[0] for s in sizes.values())
+    best = sum(transfer(s) for s in sizes.values())
+    print(f"  compressible files: {len(sizes)}, {raw:,} B raw")
+    print(f"  gzip:              {gz:,} B ({1 - gz / max(raw, 1):.1%} smaller)")
+    if brotli is not None:
+        print(f"  best of gzip/br:   {best:,} B ({1 - best / max(raw, 1):.1%} smaller)")
+    else:
+        print("  brotli is not installed; skipped the .br variants (pip install brotli)")
+
+    first = [(name, sizes.get(name) or ((build / name).stat().st_size,) * 3) for name in FIRST_LOAD if (build / name).exists()]
+    if first:
+        before = sum(s[0] for _, s in first)
+        after = sum(transfer(s) for _, s in first)
+        print(f"  first load of the app: {before:,} B -> {after:,} B ({1 - after / max(before, 1):.1%} smaller)")
+        for name, s in first:
+            print(f"    {name:<28} {s[0]:>12,} -> {transfer(s):>12,}")
+
+
+def main() -> None:
+    configure()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("build", type=Path, nargs="?", default=ROOT / "build" / "web", help="flutter build output")
+    parser.add_argument("--workers", type=int, default=None, help="compression processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="list what would be renamed without writing")
+    args = parser.parse_args()
+
+    build = args.build.resolve()
+    if build == (ROOT / "web").resolve():
+        sys.exit("web/ is the source tree; run this on the output of flutter build web")
+    if not (build / "index.html").exists():
+        sys.exit(f"{build} has no index.html; run flutter build web first")
+
+    fp = fingerprint(build, args.dry_run)
+    for rel, target in sorted(fp.copies.items()):
+        print(f"  {rel} -> /{target}")
+    print(f"Fingerprinted {len(fp.copies)} file(s), rewrote {len(fp.rewritten)} page(s)")
+    if args.dry_run:
+        return
+
+    rules = write_headers(build, fp.copies)
+    print(f"Wrote {build / '_headers'} ({rules} rules; Pages allows 100)")
+    sizes = precompress(build, args.workers)
+    print("Transfer size:")
+    report(build, sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Prerender a static profile page and JSON document for every showcase artist.
+
+    python scripts/prerender-showcase.py
+    python scripts/prerender-showcase.py --only black-coffee --force
+
+Profiles come from buildShowcaseArtistResponse() in
+functions/api/showcase-profile.js, exported through node in one call, so
+the static JSON is exactly what GET /api/artists/:id answers for an
+unseeded showcase artist. For each artist this writes:
+
+    web/showcase/<username>/index.html     profile page with Open Graph tags
+    web/showcase/<username>.json           {"success": true, "data": ...}
+    web/showcase/img/<username>-<w>.<hash>.webp   srcset widths of the photo
+
+The page and JSON also get .gz and, when the brotli package is installed,
+.br variants. og:image is the artist's share card from og-cards.py when one
+has been rendered, otherwise the photo.
+
+web/showcase/manifest.json keeps a key per artist: a hash of the profile,
+the photo bytes, the share card and the template version. Only artists whose
+key changed are rendered again, and artists that left the showcase are
+removed. web/sitemap-showcase.xml lists every page, with lastmod set to the
+day its key last changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+from datetime import date
+from html import escape
+from pathlib import Path
+
+from imaging import FALLBACK_IMAGE, fit_within, open_rgb
+from profiling import configure, traced
+from showcase import ROOT
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bump when the page template changes so every artist is rendered again
+TEMPLATE_VERSION = 1
+
+SITE_ORIGIN = "https://thegearsh.com"
+OUT_DIR = ROOT / "web" / "showcase"
+IMG_DIR = OUT_DIR / "img"
+MANIFEST = OUT_DIR / "manifest.json"
+SITEMAP = ROOT / "web" / "sitemap-showcase.xml"
+OG_CARDS = ROOT / "web" / "og" / "artists" / "cards.json"
+WEB_PREFIX = "/showcase"
+
+SRCSET_WIDTHS = (240, 480, 960)
+QUALITY = 80
+
+EXPORT_JS = """
+import { SA_SHOWCASE_ARTISTS } from './functions/api/sa-showcase-data.js';
+import { buildShowcaseArtistResponse } from './functions/api/showcase-profile.js';
+process.stdout.write(JSON.stringify(SA_SHOWCASE_ARTISTS.map(buildShowcaseArtistResponse)));
+"""
+
+
+def export_profiles() -> list[dict]:
+    try:
+        result = subprocess.run(
+            ["node", "--input-type=module", "-e", EXPORT_JS], cwd=ROOT, capture_output=True, text=True,
+        )
+    except FileNotFoundError:
+        sys.exit("node is needed to build the profiles from functions/api/showcase-profile.js")
+    if result.returncode != 0:
+        sys.exit(f"exporting showcase profiles failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout)
+
+
+def source_image(profile: dict) -> Path:
+    path = ROOT / str(profile.get("image") or "").lstrip("/")
+    return path if path.is_file() else FALLBACK_IMAGE
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def profile_key(profile: dict, card: str | None) -> str:
+    h = hashlib.sha1(f"{TEMPLATE_VERSION}:{SRCSET_WIDTHS}:{QUALITY}".encode())
+    h.update(json.dumps(profile, sort_keys=True).encode())
+    h.update(file_digest(source_image(profile)).encode())
+    h.update(str(card).encode())
+    return h.hexdigest()
+
+
+def write_variants(path: Path, data: bytes) -> list[Path]:
+    """Write ``data`` plus its precompressed variants; returns every file written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    written = [path, path.with_name(path.name + ".gz")]
+    written[1].write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        written.append(path.with_name(path.name + ".br"))
+        written[2].write_bytes(brotli.compress(data, quality=11))
+    return written
+
+
+@traced()
+def render_srcset(profile: dict) -> tuple[list[tuple[str, int]], list[Path]]:
+    """WebP copies of the photo at each width up to its own; returns ([(url, width)], files)."""
+    img = open_rgb(source_image(profile))
+    widths = [w for w in SRCSET_WIDTHS if w < img.width] + [min(img.width, SRCSET_WIDTHS[-1])]
+    IMG_DIR.mkdir(parents=True, exist_ok=True)
+    entries, files = [], []
+    for width in dict.fromkeys(widths):
+        variant = fit_within(img, max(width, round(width * img.height / img.width)))
+        path = IMG_DIR / f"{profile['username']}-{width}.tmp.webp"
+        variant.save(path, "WEBP", quality=QUALITY, method=6)
+        final = path.with_name(f"{profile['username']}-{width}.{file_digest(path)[:10]}.webp")
+        path.replace(final)
+        entries.append((f"{WEB_PREFIX}/img/{final.name}", variant.width))
+        files.append(final)
+    return entries, files
+
+
+def zar(amount) -> str:
+    return f"R {int(amount or 0):,}".replace(",", " ")
+
+
+def render_page(profile: dict, srcset: list[tuple[str, int]], card: str | None) -> str:
+    name = escape(profile["name"])
+    username = profile["username"]
+    url = f"{SITE_ORIGIN}{WEB_PREFIX}/{username}"
+    book_url = f"/book-gig?artist={username}"
+    summary = " · ".join(
+        str(v) for v in (profile.get("genre") or profile.get("category"), profile.get("location")) if v
+    )
+    description = escape((profile.get("bio") or f"Book {profile['name']} on Gearsh.")[:200])
+    image = escape(card or f"{SITE_ORIGIN}{srcset[-1][0]}")
+    # The share cards are 1200x630; a bare photo has no fixed size to declare
+    image_size = (
+        '\n  <meta property="og:image:width" content="1200">\n  <meta property="og:image:height" content="630">'
+        if card else ""
+    )
+    srcset_attr = ", ".join(f"{src} {width}w" for src, width in srcset)
+    skills = "".join(f"<li>{escape(str(skill))}</li>" for skill in profile.get("skills") or [])
+    services = "".join(
+        f'<li><strong>{escape(s["name"])}</strong> <span class="price">{zar(s.get("price"))}</span>'
+        f'<p>{escape(s.get("description") or "")}</p></li>'
+        for s in profile.get("services") or []
+    )
+    if profile.get("is_bookable"):
+        action = f'<a class="book" href="{escape(book_url)}">Book {name}</a>'
+    else:
+        action = f'<p class="unavailable">{escape(profile.get("unavailable_reason") or "Currently unavailable.")}</p>'
+    claim = f'<a class="claim" href="{escape(profile["claim_url"])}">Are you {name}? Claim this profile</a>' \
+        if profile.get("is_claimable") else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>{name} | Gearsh</title>
+  <meta name="description" content="{description}">
+  <link rel="canonical" href="{url}">
+  <meta property="og:type" content="profile">
+  <meta property="og:site_name" content="Gearsh">
+  <meta property="og:title" content="Book {name} | Gearsh">
+  <meta property="og:description" content="{description}">
+  <meta property="og:url" content="{url}">
+  <meta property="og:image" content="{image}">{image_size}
+  <meta name="twitter:card" content="summary_large_image">
+  <meta name="twitter:site" content="@thegearsh">
+  <meta name="twitter:title" content="Book {name} | Gearsh">
+  <meta name="twitter:description" content="{description}">
+  <meta name="twitter:image" content="{image}">
+  <link rel="preload" as="image" imagesrcset="{srcset_attr}" imagesizes="(max-width: 640px) 100vw, 480px">
+  <link rel="stylesheet" href="/gearsh-brand.css">
+  <style>
+    body {{ margin: 0; background: var(--g-black); color: var(--g-text); font-family: var(--g-font); }}
+    main {{ max-width: 960px; margin: 0 auto; padding: 32px 20px; display: grid; gap: 32px; grid-template-columns: minmax(0, 480px) 1fr; }}
+    img {{ width: 100%; height: auto; border-radius: 16px; background: var(--g-surface); }}
+    h1 {{ font-family: var(--g-serif); font-size: 3rem; margin: 0 0 8px; color: var(--g-white); }}
+    .meta {{ color: var(--g-accent); margin: 0 0 16px; }}
+    .skills {{ display: flex; flex-wrap: wrap; gap: 8px; padding: 0; list-style: none; }}
+    .skills li {{ background: var(--g-surface-3); border-radius: 999px; padding: 4px 12px; font-size: .9rem; }}
+    .services {{ padding: 0; list-style: none; }}
+    .services li {{ border-top: 1px solid var(--g-border); padding: 12px 0; }}
+    .services p {{ color: var(--g-text-muted); margin: 4px 0 0; }}
+    .price {{ float: right; color: var(--g-white); }}
+    .book {{ display: inline-block; background: var(--g-accent); color: var(--g-black); padding: 12px 24px; border-radius: 999px; font-weight: 700; text-decoration: none; }}
+    .claim {{ display: block; margin-top: 16px; color: var(--g-text-muted); }}
+    @media (max-width: 720px) {{ main {{ grid-template-columns: 1fr; }} }}
+  </style>
+</head>
+<body>
+  <main>
+    <img src="{srcset[-1][0]}" srcset="{srcset_attr}" sizes="(max-width: 640px) 100vw, 480px"
+         width="{srcset[-1][1]}" alt="{name}" fetchpriority="high">
+    <section>
+      <h1>{name}</h1>
+      <p class="meta">{escape(summary)}</p>
+      <p>{escape(profile.get("bio") or "")}</p>
+      <ul class="skills">{skills}</ul>
+      {action}
+      <ul class="services">{services}</ul>
+      {claim}
+    </section>
+  </main>
+</body>
+</html>
+"""
+
+
+def remove(files: list[str]) -> None:
+    for name in files:
+        (OUT_DIR / name).unlink(missing_ok=True)
+
+
+def write_sitemap(entries: dict) -> None:
+    urls = "".join(
+        f"  <url>\n    <loc>{SITE_ORIGIN}{WEB_PREFIX}/{username}</loc>\n"
+        f"    <lastmod>{entry['lastmod']}</lastmod>\n    <changefreq>weekly</changefreq>\n"
+        f"    <priority>0.7</priority>\n  </url>\n"
+        for username, entry in sorted(entries.items())
+    )
+    SITEMAP.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        f"{urls}</urlset>\n",
+        encoding="utf-8",
+    )
+
+
+def build(only: set[str] | None, force: bool) -> tuple[int, int, int]:
+    """Render changed profiles; returns (rendered, unchanged, removed)."""
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = json.loads(MANIFEST.read_text(encoding="utf-8")) if MANIFEST.exists() else {}
+    cards = json.loads(OG_CARDS.read_text(encoding="utf-8")) if OG_CARDS.exists() else {}
+    profiles = {p["username"]: p for p in export_profiles()}
+
+    removed = 0
+    for username in [u for u in manifest if u not in profiles]:
+        remove(manifest.pop(username)["files"])
+        shutil.rmtree(OUT_DIR / username, ignore_errors=True)
+        removed += 1
+
+    rendered = unchanged = 0
+    today = date.today().isoformat()
+    for username, profile in profiles.items():
+        if only is not None and username not in only:
+            continue
+        card = f"{SITE_ORIGIN}/og/artists/{cards[username]['file']}" if username in cards else None
+        key = profile_key(profile, card)
+        current = manifest.get(username)
+        if not force and current and current["key"] == key and (OUT_DIR / username / "index.html").exists():
+            unchanged += 1
+            continue
+
+        srcset, images = render_srcset(profile)
+        document = json.dumps({"success": True, "data": profile}, ensure_ascii=False, separators=(",", ":"))
+        files = images
+        files += write_variants(OUT_DIR / username / "index.html", render_page(profile, srcset, card).encode())
+        files += write_variants(OUT_DIR / f"{username}.json", document.encode())
+        names = [f.relative_to(OUT_DIR).as_posix() for f in files]
+        if current:
+            remove([name for name in current["files"] if name not in names])
+        manifest[username] = {"key": key, "lastmod": today, "files": names}
+        rendered += 1
+
+    MANIFEST.write_text(json.dumps(dict(sorted(manifest.items())), indent=2) + "\n", encoding="utf-8")
+    write_sitemap(manifest)
+    return rendered, unchanged, removed
+
+
+def main() -> None:
+    configure()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", metavar="USERNAME", help="only render this artist (repeatable)")
+    parser.add_argument("--force", action="store_true", help="render profiles even if unchanged")
+    args = parser.parse_args()
+
+    rendered, unchanged, removed = build(set(args.only) if args.only else None, args.force)
+    print(
+        f"Showcase profiles: {rendered} rendered, {unchanged} unchanged, {removed} removed "
+        f"-> {OUT_DIR.relative_to(ROOT)}/, {SITEMAP.relative_to(ROOT)}"
+    )
+    if brotli is None:
+        print("  brotli is not installed; only .gz variants were written (pip install brotli)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Opt-in per-stage tracing for the Gearsh tooling scripts.
+
+    with stage("strict_white_flood") as span:
+        ...
+        span.record(bytes_out=len(data))
+
+    @traced("encode")
+    def save_png(...): ...
+
+Tracing is off unless GEARSH_PROFILE is set (1 for the default path, or an
+output .json path) or a script passes ``--profile[=PATH]``. When off, stage()
+hands back a shared no-op span and @traced calls straight through. Values
+that cost something to measure (a stat(), a reduction over an array) go to
+record() as zero-argument callables, which only a live span calls.
+
+When on, each stage records wall time, bytes in/out and peak traced memory.
+At exit they are written as Chrome trace-event JSON (chrome://tracing or
+ui.perfetto.dev). GEARSH_CPROFILE / ``--cprofile=PATH`` also dumps cProfile
+stats.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TRACE_DIR = ROOT / "bench-results" / "traces"
+
+_events: list[dict] = []
+_stack = threading.local()
+_enabled = False
+_trace_path: Path | None = None
+_cprofile = None
+_cprofile_path: Path | None = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def record(self, **values) -> None:
+        pass
+
+
+_NULL = _NullSpan()
+
+
+class Span:
+    __slots__ = ("name", "args", "start", "peak_seen")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.peak_seen = 0
+
+    def record(self, **values) -> None:
+        """Attach values such as bytes_in / bytes_out to this stage; callables are called first."""
+        for key, value in values.items():
+            if callable(value):
+                value = value()
+            self.args[key] = self.args.get(key, 0) + value if isinstance(value, int) else value
+
+    def __enter__(self):
+        spans = _spans()
+        _, peak = tracemalloc.get_traced_memory()
+        if spans:
+            spans[-1].peak_seen = max(spans[-1].peak_seen, peak)
+        tracemalloc.reset_peak()
+        spans.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        spans = _spans()
+        spans.pop()
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(self.peak_seen, peak)
+        if spans:
+            spans[-1].peak_seen = max(spans[-1].peak_seen, peak)
+        tracemalloc.reset_peak()
+        self.args["peak_mb"] = round(peak / 2**20, 3)
+        _events.append(
+            {
+                "name": self.name,
+                "ph": "X",
+                "ts": self.start / 1000,
+                "dur": (end - self.start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": self.args,
+            }
+        )
+        return False
+
+
+def _spans() -> list[Span]:
+    if not hasattr(_stack, "spans"):
+        _stack.spans = []
+    return _stack.spans
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def stage(name: str, **args):
+    """Context manager timing one pipeline stage; free when profiling is off."""
+    if not _enabled:
+        return _NULL
+    return Span(name, dict(args))
+
+
+def traced(name: str | None = None):
+    """Decorator form of stage(); the stage name defaults to the function name."""
+
+    def wrap(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def inner(*a, **kw):
+            if not _enabled:
+                return fn(*a, **kw)
+            with Span(label, {}):
+                return fn(*a, **kw)
+
+        return inner
+
+    return wrap
+
+
+def enable(trace_path: Path | None = None, cprofile_path: Path | None = None) -> None:
+    global _enabled, _trace_path, _cprofile, _cprofile_path
+    if _enabled:
+        return
+    script = Path(sys.argv[0]).stem or "python"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    _trace_path = trace_path or TRACE_DIR / f"{script}-{stamp}.json"
+    _enabled = True
+    tracemalloc.start()
+    if cprofile_path:
+        import cProfile
+
+        _cprofile_path = cprofile_path
+        _cprofile = cProfile.Profile()
+        _cprofile.enable()
+    atexit.register(finish)
+
+
+def finish() -> None:
+    """Write the trace (and cProfile dump); safe to call more than once."""
+    global _enabled, _cprofile
+    if not _enabled:
+        return
+    _enabled = False
+    if _cprofile is not None:
+        _cprofile.disable()
+        _cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+        _cprofile.dump_stats(str(_cprofile_path))
+        print(f"cProfile stats -> {_cprofile_path}", file=sys.stderr)
+        _cprofile = None
+    tracemalloc.stop()
+    _trace_path.parent.mkdir(parents=True, exist_ok=True)
+    trace = {
+        "traceEvents": sorted(_events, key=lambda e: e["ts"]),
+        "displayTimeUnit": "ms",
+        "otherData": {"argv": sys.argv, "peak_rss_mb": _peak_rss_mb()},
+    }
+    _trace_path.write_text(json.dumps(trace, indent=1) + "\n", encoding="utf-8")
+    print(f"Trace ({len(_events)} stages) -> {_trace_path}", file=sys.stderr)
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 2**20 if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def configure(argv: list[str] | None = None) -> None:
+    """Enable from GEARSH_PROFILE / GEARSH_CPROFILE or --profile / --cprofile.
+
+    The profiling flags are removed from ``argv`` (default sys.argv) so the
+    calling script's own argument parsing never sees them.
+    """
+    argv = sys.argv if argv is None else argv
+    trace = os.environ.get("GEARSH_PROFILE")
+    cprof = os.environ.get("GEARSH_CPROFILE")
+    for arg in list(argv[1:]):
+        if arg == "--profile" or arg.startswith("--profile="):
+            trace = arg.partition("=")[2] or "1"
+            argv.remove(arg)
+        elif arg.startswith("--cprofile="):
+            cprof = arg.partition("=")[2]
+            argv.remove(arg)
+    trace = None if trace in ("0", "false") else trace
+    if trace or cprof:
+        enable(
+            None if trace in (None, "", "1") else Path(trace),
+            Path(cprof) if cprof else None,
+        )
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Publish content_live as static, content-hashed JSON for the edge cache.
+
+    python scripts/publish-content.py --db gearsh.sqlite publish
+    python scripts/publish-content.py --db gearsh.sqlite publish --force
+    python scripts/publish-content.py list
+
+publish reads the live copy and theme (database/add_renovation_v4.sql) and,
+when content_live.version has not been published yet, writes the bundle to
+web/content/content.<hash>.json in the shape GET /api/content returns, with
+.gz and, when the brotli package is installed, .br variants next to it. The
+hashed files never change, so they are served with a one-year immutable
+Cache-Control; web/content/live.json is the small, short-lived pointer to
+the current one. The files only reach the edge with the next deploy, so
+publishing here means publish, then redeploy.
+
+functions/api/content.js serves the bundle the pointer names only while
+content_live still has the version and published_at it was cut from (one
+primary-key read). A founder publish or rollback changes both, so from that
+moment the API answers from D1 again until the new state is published here
+and deployed; the database stays the source of truth and rollbacks go
+through the founder dashboard.
+
+Every published version stays listed in web/content/versions.json, and the
+last --keep versions keep their files for clients still holding their URLs.
+
+The cache rules live in web/_headers between the "content" markers; publish
+writes them there if they are missing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from migrate import connect
+from showcase import ROOT
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CONTENT_DIR = ROOT / "web" / "content"
+VERSIONS = CONTENT_DIR / "versions.json"
+POINTER = CONTENT_DIR / "live.json"
+HEADERS = ROOT / "web" / "_headers"
+WEB_PREFIX = "/content"
+
+DEFAULTS_JS = """
+import { DEFAULT_COPY, DEFAULT_THEME } from './functions/api/content-seed.js';
+process.stdout.write(JSON.stringify({ copy: DEFAULT_COPY, theme: DEFAULT_THEME }));
+"""
+
+HEADERS_BEGIN = "# content (scripts/publish-content.py)"
+HEADERS_END = "# end content"
+HEADERS_BLOCK = f"""{HEADERS_BEGIN}
+{WEB_PREFIX}/live.json
+  Cache-Control: public, max-age=60, must-revalidate
+  Access-Control-Allow-Origin: *
+
+{WEB_PREFIX}/content.*
+  Cache-Control: public, max-age=31536000, immutable
+  Access-Control-Allow-Origin: *
+
+{WEB_PREFIX}/*.json.gz
+  Content-Type: application/json; charset=utf-8
+  Content-Encoding: gzip
+
+{WEB_PREFIX}/*.json.br
+  Content-Type: application/json; charset=utf-8
+  Content-Encoding: br
+{HEADERS_END}
+"""
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def load_versions() -> dict:
+    if not VERSIONS.exists():
+        return {"live": None, "versions": {}}
+    return json.loads(VERSIONS.read_text(encoding="utf-8"))
+
+
+def save_versions(state: dict) -> None:
+    state["versions"] = dict(sorted(state["versions"].items(), key=lambda kv: int(kv[0])))
+    write_atomic(VERSIONS, (json.dumps(state, indent=2) + "\n").encode())
+
+
+def point_at(state: dict, version: str) -> None:
+    entry = state["versions"][version]
+    pointer = {
+        "version": int(version),
+        "published_at": entry["published_at"],
+        "url": f"{WEB_PREFIX}/{entry['file']}",
+        "sha256": entry["sha256"],
+    }
+    write_atomic(POINTER, (json.dumps(pointer) + "\n").encode())
+    state["live"] = version
+
+
+def ensure_headers() -> bool:
+    text = HEADERS.read_text(encoding="utf-8")
+    if HEADERS_BEGIN in text:
+        return False
+    HEADERS.write_text(text.rstrip("\n") + "\n\n" + HEADERS_BLOCK, encoding="utf-8")
+    return True
+
+
+def seed_defaults() -> dict:
+    """DEFAULT_COPY / DEFAULT_THEME from functions/api/content-seed.js, through node."""
+    try:
+        result = subprocess.run(
+            ["node", "--input-type=module", "-e", DEFAULTS_JS], cwd=ROOT, capture_output=True, text=True,
+        )
+    except FileNotFoundError:
+        sys.exit("node is needed to read the default copy and theme from functions/api/content-seed.js")
+    if result.returncode != 0:
+        sys.exit(f"reading the default copy and theme failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout)
+
+
+def parse_or_default(text: str | None, key: str, defaults: dict) -> object:
+    """JSON.parse with loadLiveContent()'s fallback for empty or invalid JSON."""
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        if not defaults:
+            defaults.update(seed_defaults())
+        return defaults[key]
+
+
+def bundle(row: tuple) -> bytes:
+    """Same fields and fallbacks as loadLiveContent() in functions/api/content.js."""
+    copy_json, theme_json, version, published_at = row
+    defaults: dict = {}
+    data = {
+        "copy": parse_or_default(copy_json, "copy", defaults),
+        "theme": parse_or_default(theme_json, "theme", defaults),
+        "version": version or 1,
+        "published_at": published_at,
+    }
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()
+
+
+def prune(state: dict, keep: int) -> int:
+    """Delete files of all but the newest ``keep`` versions (never the live one)."""
+    removed = 0
+    for version in sorted(state["versions"], key=int)[:-keep or None]:
+        entry = state["versions"][version]
+        if version == state["live"] or not entry.get("files"):
+            continue
+        for name in entry["files"]:
+            (CONTENT_DIR / name).unlink(missing_ok=True)
+        entry["files"] = []
+        removed += 1
+    return removed
+
+
+def cmd_publish(args) -> None:
+    conn = connect(args.db)
+    try:
+        row = conn.execute(
+            "SELECT copy_json, theme_json, version, published_at FROM content_live WHERE id = 'live'"
+        ).fetchone()
+    finally:
+        conn.close()
+    if not row:
+        sys.exit("content_live has no 'live' row; publish from the founder dashboard first")
+
+    CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+    state = load_versions()
+    version = str(row[2] or 1)
+    data = bundle(row)
+    sha = hashlib.sha256(data).hexdigest()
+    current = state["versions"].get(version)
+    if current and current["sha256"] == sha and current.get("files") and not args.force:
+        if state["live"] != version:
+            point_at(state, version)
+            save_versions(state)
+        print(f"Version {version} is already published as {current['file']}")
+        return
+
+    name = f"content.{sha[:12]}.json"
+    files = {name: data, f"{name}.gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        files[f"{name}.br"] = brotli.compress(data, quality=11)
+    for file_name, payload in files.items():
+        write_atomic(CONTENT_DIR / file_name, payload)
+
+    state["versions"][version] = {
+        "file": name,
+        "sha256": sha,
+        "published_at": row[3],
+        "bytes": {file_name: len(payload) for file_name, payload in files.items()},
+        "files": list(files),
+    }
+    point_at(state, version)
+    removed = prune(state, args.keep)
+    save_versions(state)
+    added_headers = ensure_headers()
+
+    sizes = ", ".join(f"{Path(n).suffix.lstrip('.')} {len(p):,} B" for n, p in files.items())
+    print(f"Published version {version} -> {WEB_PREFIX}/{name} ({sizes}); redeploy to serve it")
+    if brotli is None:
+        print("  brotli is not installed; skipped the .br variant (pip install brotli)")
+    if removed:
+        print(f"  pruned the files of {removed} old version(s)")
+    if added_headers:
+        print(f"  added the content cache rules to {HEADERS.relative_to(ROOT)}")
+
+
+def cmd_list(args) -> None:
+    state = load_versions()
+    for version, entry in state["versions"].items():
+        marker = "*" if version == state["live"] else " "
+        kept = "" if entry.get("files") else "  (pruned)"
+        print(f"{marker} {version:>5}  {entry['file']}  {entry['published_at'] or '-'}{kept}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="replica to read content_live from (publish only)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    publish = sub.add_parser("publish", help="export content_live if its version is new")
+    publish.add_argument("--force", action="store_true", help="rewrite the bundle even if it is unchanged")
+    publish.add_argument("--keep", type=int, default=20, help="versions whose files are kept")
+
+    sub.add_parser("list", help="show published versions")
+    args = parser.parse_args()
+
+    if args.command == "publish":
+        if not args.db:
+            parser.error("publish needs --db")
+        cmd_publish(args)
+    else:
+        cmd_list(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""Check the query plans of the SQL in functions/ against a large replica.
+
+    python scripts/queryplan.py                          # synthdata replica at --scale 0.01
+    python scripts/queryplan.py --db load.sqlite         # an existing replica
+    python scripts/queryplan.py --compare bench-results/queryplan/latest.json
+
+Every ``prepare(...)`` string literal is extracted statically. Template
+placeholders are resolved against string constants in the same file, and
+``?`` parameters are bound to real values sampled from the replica. Each
+statement then gets EXPLAIN QUERY PLAN plus timed runs; writes run inside a
+savepoint that is rolled back. Full table scans, automatic indexes, temp
+B-trees and non-covering index lookups are flagged.
+
+The JSON report is keyed by file and SQL hash, so line moves do not show up
+as changes. --compare reports new flags, plan changes and slowdowns against
+an earlier report, and exits 1 if any flag is new.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from migrate import connect, sqlite_compatible
+
+ROOT = Path(__file__).resolve().parents[1]
+FUNCTIONS = ROOT / "functions"
+OUT_DIR = ROOT / "bench-results" / "queryplan"
+
+PREPARE = re.compile(r"\.prepare\(\s*")
+STRING_CONST = re.compile(r"\b(?:const|let|var)\s+(\w+)\s*=\s*(?=[`'\"])")
+INTERPOLATION = re.compile(r"\$\{\s*([^}]*?)\s*\}")
+PLUS = re.compile(r"\s*\+\s*")
+OPERAND = re.compile(r"[\w.]+(?:\([^()]*\))?")
+DDL_LITERAL = re.compile(r"[`'\"](?=\s*(?:CREATE\s+(?:UNIQUE\s+)?(?:TABLE|INDEX)|ALTER\s+TABLE)\b)", re.IGNORECASE)
+PARAM = re.compile(r"\?(\d*)")
+COMPARED_COLUMN = re.compile(
+    r"(?:(\w+)\.)?(\w+)\)?\s*(?:=|==|!=|<>|<=|>=|<|>|\bLIKE|\bIN\s*\(|\bIS)\s*(?:LOWER\()?\s*$", re.IGNORECASE
+)
+ALIAS = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|SET\b|JOIN\b|LEFT\b|INNER\b|ORDER\b|GROUP\b|LIMIT\b|VALUES\b)(\w+))?", re.IGNORECASE)
+INSERT_COLUMNS = re.compile(r"INSERT\s+(?:OR\s+\w+\s+)?INTO\s+(\w+)\s*\(([^)]*)\)", re.IGNORECASE)
+SET_COLUMN = re.compile(r"(\w+)\s*=\s*$")
+
+FLAGS = {
+    "full_scan": "reads every row of a table",
+    "auto_index": "SQLite builds a transient index for this query",
+    "temp_btree": "sorts or de-duplicates in a temp B-tree",
+    "index_scan": "walks a whole index instead of seeking",
+    "non_covering": "index lookup needs a second table fetch",
+}
+
+
+@dataclass
+class Statement:
+    file: str
+    line: int
+    sql: str
+    unresolved: list[str] = field(default_factory=list)
+
+    @property
+    def kind(self) -> str:
+        word = self.sql.split(None, 1)[0].upper() if self.sql.strip() else ""
+        return {"WITH": "SELECT", "REPLACE": "INSERT"}.get(word, word)
+
+    @property
+    def key(self) -> str:
+        digest = hashlib.sha1(" ".join(self.sql.split()).encode("utf-8")).hexdigest()[:10]
+        return f"{self.file}#{digest}"
+
+
+# -- extraction ----------------------------------------------------------------
+
+
+def read_literal(src: str, i: int) -> tuple[str, list[str], int] | None:
+    """Decode the JS string literal starting at ``src[i]``.
+
+    Returns (text, interpolations, end) where template ``${expr}`` parts are
+    left in ``text`` as-is and their expressions listed separately.
+    """
+    quote = src[i]
+    if quote not in "`'\"":
+        return None
+    out, exprs, i = [], [], i + 1
+    while i < len(src):
+        c = src[i]
+        if c == "\\":
+            nxt = src[i + 1]
+            out.append({"n": "\n", "t": "\t"}.get(nxt, nxt))
+            i += 2
+            continue
+        if c == quote:
+            return "".join(out), exprs, i + 1
+        if quote == "`" and src.startswith("${", i):
+            depth, j = 1, i + 2
+            while depth:
+                depth += {"{": 1, "}": -1}.get(src[j], 0)
+                j += 1
+            exprs.append(src[i + 2 : j - 1].strip())
+            out.append(src[i:j])
+            i = j
+            continue
+        out.append(c)
+        i += 1
+    return None
+
+
+def read_concatenation(src: str, i: int) -> tuple[str, list[str], int] | None:
+    """Read ``'a' + name + `c```; variable operands become ``${name}``."""
+    first = read_literal(src, i)
+    if not first:
+        return None
+    text, exprs, end = first
+    while True:
+        m = PLUS.match(src, end)
+        if not m:
+            return text, exprs, end
+        nxt = read_literal(src, m.end())
+        if not nxt:
+            operand = OPERAND.match(src, m.end())
+            if not operand or not PLUS.match(src, operand.end()):
+                return text, exprs, end
+            name = operand.group(0)
+            nxt = ("${" + name + "}", [name], operand.end())
+        text, exprs, end = text + nxt[0], exprs + nxt[1], nxt[2]
+
+
+def string_constants(src: str) -> dict[str, str]:
+    """First literal assigned to each const/let/var in the file."""
+    consts: dict[str, str] = {}
+    for m in STRING_CONST.finditer(src):
+        lit = read_concatenation(src, m.end())
+        if lit and m.group(1) not in consts:
+            consts[m.group(1)] = lit[0]
+    return consts
+
+
+def resolve(text: str, consts: dict[str, str], unresolved: list[str], depth: int = 0) -> str:
+    def sub(m: re.Match) -> str:
+        expr = m.group(1)
+        if expr in consts and depth < 3:
+            return resolve(consts[expr], consts, unresolved, depth + 1)
+        before = text[: m.start()].rstrip().upper()
+        if re.search(r"\bIN\s*\($", before):
+            unresolved.append(expr)
+            return "?"
+        if before.endswith("SET"):
+            unresolved.append(expr)
+            return "rowid = rowid"
+        if before.endswith(("WHERE", "AND", "OR", "(")):
+            unresolved.append(expr)
+            return "1 = 1"
+        if re.search(r"\b(FROM|JOIN)$", before) is None and before.endswith(("SELECT", ",")):
+            unresolved.append(expr)
+            return "1"
+        unresolved.append(expr)
+        return ""
+
+    return INTERPOLATION.sub(sub, text)
+
+
+def extract(paths: list[Path]) -> tuple[list[Statement], list[str], list[str]]:
+    """Return (statements, runtime DDL, sites whose SQL is not a resolvable literal).
+
+    Runtime DDL is every CREATE/ALTER literal in the file, including the ones
+    kept in arrays and run through ``prepare(sql)`` in a loop.
+    """
+    statements, ddl, dynamic = [], [], []
+    for path in paths:
+        src = path.read_text(encoding="utf-8")
+        consts = string_constants(src)
+        rel = path.relative_to(ROOT).as_posix()
+        for m in DDL_LITERAL.finditer(src):
+            lit = read_concatenation(src, m.start())
+            if lit and not lit[1]:
+                ddl.append(lit[0].strip().rstrip(";"))
+        for m in PREPARE.finditer(src):
+            line = src.count("\n", 0, m.start()) + 1
+            lit = read_concatenation(src, m.end())
+            if lit is None:
+                name = re.match(r"\w+", src[m.end() :])
+                if not name or name.group(0) not in consts:
+                    dynamic.append(f"{rel}:{line}")
+                    continue
+                text = consts[name.group(0)]
+            else:
+                text = lit[0]
+            unresolved: list[str] = []
+            sql = resolve(text, consts, unresolved).strip().rstrip(";").strip()
+            if sql:
+                statements.append(Statement(rel, line, sql, unresolved))
+    return statements, ddl, dynamic
+
+
+# -- binding -------------------------------------------------------------------
+
+
+class Sampler:
+    """Real values from the replica for ``table.column`` placeholders."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.tables = {
+            name: [r[1] for r in conn.execute(f"PRAGMA table_info({name})")]
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        self.cache: dict[tuple[str, str], object] = {}
+        self.issued = 0
+
+    def unique(self, table: str) -> set[str]:
+        """Columns that are unique on their own (so inserts need new values)."""
+        columns = {r[1] for r in self.conn.execute(f"PRAGMA table_info({table})") if r[5]}
+        columns = columns if len(columns) == 1 else set()
+        for _, name, is_unique, *_ in self.conn.execute(f"PRAGMA index_list({table})"):
+            info = self.conn.execute(f"PRAGMA index_info({name})").fetchall()
+            if is_unique and len(info) == 1:
+                columns.add(info[0][2])
+        return columns
+
+    def fresh(self, table: str, column: str):
+        self.issued += 1
+        sample = self.value(table, column)
+        return -self.issued if isinstance(sample, int) else f"queryplan_{self.issued}"
+
+    def value(self, table: str | None, column: str):
+        owners = [table] if table in self.tables and column in self.tables[table] else [
+            t for t, cols in self.tables.items() if column in cols
+        ]
+        for owner in owners:
+            cached = self.cache.get((owner, column))
+            if cached is None:
+                row = self.conn.execute(
+                    f"SELECT {column} FROM {owner} WHERE {column} IS NOT NULL "
+                    f"LIMIT 1 OFFSET (SELECT COUNT(*) / 2 FROM {owner})"
+                ).fetchone() or self.conn.execute(
+                    f"SELECT {column} FROM {owner} WHERE {column} IS NOT NULL LIMIT 1"
+                ).fetchone()
+                cached = self.cache[(owner, column)] = row[0] if row else ""
+            if cached != "":
+                return cached
+        return None
+
+
+def aliases_of(sql: str) -> dict[str, str]:
+    """Map lower-cased table names and aliases to table names."""
+    aliases = {}
+    for m in ALIAS.finditer(sql):
+        aliases[m.group(1).lower()] = m.group(1)
+        if m.group(2):
+            aliases[m.group(2).lower()] = m.group(1)
+    return aliases
+
+
+def bind_values(sql: str, sampler: Sampler) -> list:
+    aliases = aliases_of(sql)
+    default_table = next(iter(aliases.values()), None)
+    insert = INSERT_COLUMNS.search(sql)
+    insert_columns = [c.strip() for c in insert.group(2).split(",")] if insert else []
+    insert_seen = 0
+
+    values: dict[int, object] = {}
+    position = 0
+    for m in PARAM.finditer(sql):
+        index = int(m.group(1)) if m.group(1) else position + 1
+        position = index
+        if index in values:
+            continue
+        before = sql[: m.start()]
+        upper = before.rstrip().upper()
+        value = None
+        if upper.endswith("LIMIT"):
+            value = 50
+        elif upper.endswith("OFFSET"):
+            value = 0
+        else:
+            table, column = None, None
+            compared = COMPARED_COLUMN.search(before) or SET_COLUMN.search(before)
+            if compared:
+                groups = compared.groups()
+                table = aliases.get((groups[0] or "").lower(), default_table) if len(groups) == 2 else default_table
+                column = groups[-1]
+            elif insert and m.start() > insert.end() and insert_seen < len(insert_columns):
+                table, column = insert.group(1), insert_columns[insert_seen]
+                if column in sampler.unique(table):
+                    value = sampler.fresh(table, column)
+            if insert and m.start() > insert.end():
+                insert_seen += 1
+            if column and value is None:
+                value = sampler.value(table, column)
+        values[index] = "synthetic" if value is None else value
+    return [values[i] for i in range(1, max(values, default=0) + 1)] if values else []
+
+
+# -- analysis ------------------------------------------------------------------
+
+
+def plan_of(conn: sqlite3.Connection, sql: str, params) -> list[str]:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    depth = {0: -1}
+    lines = []
+    for node, parent, _, detail in rows:
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return lines
+
+
+def flags_of(plan: list[str], tables: set[str], aliases: dict[str, str], kind: str) -> list[str]:
+    flags = []
+    for line in (l.strip() for l in plan):
+        temp = re.search(r"USE TEMP B-TREE FOR (.+)", line)
+        if temp:
+            flags.append(f"temp_btree:{temp.group(1).lower()}")
+        step = re.match(r"(SCAN|SEARCH) (\w+)(.*)", line)
+        if not step:
+            continue
+        op, name, how = step.groups()
+        table = aliases.get(name.lower(), name)
+        if table not in tables:
+            continue
+        if "AUTOMATIC" in how:
+            flags.append(f"auto_index:{table}")
+        elif op == "SCAN" and "USING" not in how:
+            flags.append(f"full_scan:{table}")
+        elif op == "SCAN" and "COVERING" not in how:
+            flags.append(f"index_scan:{table}")
+        elif op == "SEARCH" and kind == "SELECT" and "USING INDEX" in how and "sqlite_autoindex" not in how:
+            flags.append(f"non_covering:{table}")
+    return sorted(set(flags))
+
+
+def bootstrap(conn: sqlite3.Connection, ddl: list[str]) -> int:
+    """Apply the schema the functions create at request time.
+
+    Failures are ignored, as they are in the functions themselves (columns
+    that already exist, tables the migrations created first).
+    """
+    applied = 0
+    for statement in ddl:
+        try:
+            for sql in sqlite_compatible(statement):
+                conn.execute(sql)
+            applied += 1
+        except sqlite3.Error:
+            pass
+    return applied
+
+
+def measure(conn: sqlite3.Connection, st: Statement, sampler: Sampler, tables: set[str], runs: int) -> dict:
+    entry: dict = {"file": st.file, "line": st.line, "kind": st.kind, "sql": " ".join(st.sql.split())}
+    if st.unresolved:
+        entry["unresolved"] = st.unresolved
+    params = bind_values(st.sql, sampler)
+    try:
+        entry["plan"] = plan_of(conn, st.sql, params)
+    except sqlite3.Error as e:
+        entry["error"] = str(e)
+        return entry
+    entry["flags"] = flags_of(entry["plan"], tables, aliases_of(st.sql), st.kind)
+
+    timings = []
+    for _ in range(runs):
+        write = st.kind != "SELECT"
+        if write:
+            conn.execute("SAVEPOINT queryplan")
+        started = time.perf_counter()
+        try:
+            rows = conn.execute(st.sql, params).fetchall()
+        except sqlite3.Error as e:
+            entry["exec_error"] = str(e)
+            rows = None
+        timings.append(1000 * (time.perf_counter() - started))
+        if write:
+            conn.execute("ROLLBACK TO queryplan")
+            conn.execute("RELEASE queryplan")
+        if rows is None:
+            break
+        entry["rows"] = len(rows)
+    entry["ms"] = round(statistics.median(timings), 3)
+    return entry
+
+
+def run(db: Path, runs: int) -> dict:
+    paths = sorted(FUNCTIONS.rglob("*.js"))
+    statements, ddl, dynamic = extract(paths)
+    conn = connect(db)
+    created = bootstrap(conn, ddl)
+    tables = {n for (n,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    sampler = Sampler(conn)
+
+    queries = {}
+    for st in statements:
+        if st.kind in ("CREATE", "ALTER", "DROP", "PRAGMA"):
+            continue
+        entry = measure(conn, st, sampler, tables, runs)
+        key, n = st.key, 2
+        while key in queries:
+            key, n = f"{st.key}~{n}", n + 1
+        queries[key] = entry
+    rows = {t: n for t, n in row_counts(conn).items() if n}
+    conn.close()
+
+    counts = {f: sum(any(x.startswith(f + ":") for x in q.get("flags", ())) for q in queries.values()) for f in FLAGS}
+    return {
+        "db": str(db),
+        "rows": rows,
+        "statements": len(statements),
+        "ddl_applied": created,
+        "dynamic_sites": dynamic,
+        "errors": sum("error" in q for q in queries.values()),
+        "exec_errors": sum("exec_error" in q for q in queries.values()),
+        "flag_counts": counts,
+        "queries": queries,
+    }
+
+
+def row_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    counts = {}
+    for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+        "AND sql NOT LIKE 'CREATE VIRTUAL%' ORDER BY name"
+    ).fetchall():
+        try:
+            counts[name] = conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+        except sqlite3.Error:
+            pass
+    return counts
+
+
+def compare(old: dict, new: dict, slowdown: float) -> int:
+    added = 0
+    for key, q in sorted(new["queries"].items()):
+        prev = old["queries"].get(key)
+        where = f"{q['file']}:{q['line']}"
+        if prev is None:
+            if q.get("flags"):
+                print(f"  NEW     {where}  {' '.join(q['flags'])}")
+                added += 1
+            continue
+        gained = sorted(set(q.get("flags", ())) - set(prev.get("flags", ())))
+        lost = sorted(set(prev.get("flags", ())) - set(q.get("flags", ())))
+        if gained:
+            print(f"  WORSE   {where}  +{' +'.join(gained)}")
+            added += len(gained)
+        if lost:
+            print(f"  BETTER  {where}  -{' -'.join(lost)}")
+        if not gained and not lost and q.get("plan") != prev.get("plan"):
+            print(f"  PLAN    {where}  plan changed")
+        if prev.get("ms") and q.get("ms", 0) > prev["ms"] * (1 + slowdown) and q["ms"] - prev["ms"] > 1:
+            print(f"  SLOWER  {where}  {prev['ms']:.1f}ms -> {q['ms']:.1f}ms")
+    gone = set(old["queries"]) - set(new["queries"])
+    if gone:
+        print(f"  {len(gone)} statement(s) no longer present")
+    return added
+
+
+def default_replica(scale: float) -> Path:
+    import synthdata
+
+    db = OUT_DIR / f"replica-{scale:g}.sqlite"
+    if not db.exists():
+        OUT_DIR.mkdir(parents=True, exist_ok=True)
+        print(f"Building replica at scale {scale:g} -> {db}")
+        synthdata.generate(db, scale=scale)
+    return db
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="replica to plan against (default: build one with synthdata)")
+    parser.add_argument("--scale", type=float, default=0.01, help="synthdata scale when --db is not given")
+    parser.add_argument("--runs", type=int, default=3, help="timed executions per statement")
+    parser.add_argument("--out", type=Path, help="report path (default bench-results/queryplan/<stamp>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier report to diff against")
+    parser.add_argument("--slowdown", type=float, default=0.5, help="relative slowdown reported by --compare")
+    parser.add_argument("--show", choices=sorted(FLAGS), action="append", help="list queries with these flags")
+    args = parser.parse_args()
+
+    db = args.db or default_replica(args.scale)
+    report = run(db, args.runs)
+    out = args.out or OUT_DIR / f"queryplan-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(report, indent=1, sort_keys=True, ensure_ascii=False) + "\n"
+    out.write_text(text, encoding="utf-8")
+    if not args.out:
+        (OUT_DIR / "latest.json").write_text(text, encoding="utf-8")
+
+    queries = report["queries"]
+    print(
+        f"{len(queries)} statements planned ({report['errors']} plan errors, "
+        f"{report['exec_errors']} execution errors, "
+        f"{len(report['dynamic_sites'])} dynamic sites skipped) -> {out}"
+    )
+    for flag, count in report["flag_counts"].items():
+        print(f"  {flag:13} {count:4}  {FLAGS[flag]}")
+    slow = sorted(queries.values(), key=lambda q: q.get("ms", 0), reverse=True)[:10]
+    print("Slowest:")
+    for q in slow:
+        print(f"  {q.get('ms', 0):9.2f}ms  {q['file']}:{q['line']}  {' '.join(q.get('flags', []))}")
+    for flag in args.show or ():
+        print(f"{flag}:")
+        for q in queries.values():
+            if any(x.startswith(flag + ":") for x in q.get("flags", ())):
+                print(f"  {q['file']}:{q['line']}  {q['sql'][:110]}")
+                for line in q["plan"]:
+                    print(f"      {line}")
+
+    if args.compare:
+        print(f"Compared with {args.compare}:")
+        added = compare(json.loads(args.compare.read_text(encoding="utf-8")), report, args.slowdown)
+        if added:
+            print(f"{added} new plan flag(s)", file=sys.stderr)
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Recompute reliability_indices from reliability_events in set-based chunks.
+
+    python scripts/recompute-reliability.py --db gearsh.sqlite           # incremental
+    python scripts/recompute-reliability.py --db gearsh.sqlite --full    # rebuild everything
+    python scripts/recompute-reliability.py --db gearsh.sqlite --dry-run --full
+
+The counters mirror EVENT_MAP in functions/api/reliability-utils.js. Each
+counter is the number of events of its type, total_bookings counts the
+completed and cancelled events, and the rates are percentages of
+total_bookings.
+
+Incremental runs look only at events appended since the last run, found by
+rowid from a job checkpoint. They pick up every user whose events are newer
+than their last_updated high-water mark and recompute those users from all
+of their events. --full walks every user in user_id ranges of about --chunk
+events, so memory stays bounded at any table size. Every chunk is one
+aggregate INSERT ... ON CONFLICT in its own transaction, and only rows whose
+values changed are written. The report shows how much drift was corrected,
+per counter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter
+from pathlib import Path
+
+from jobs import Checkpoint, transaction
+from migrate import connect
+
+# Mirrors EVENT_MAP in functions/api/reliability-utils.js
+EVENT_MAP = {
+    "booking_completed": "completed_bookings",
+    "booking_cancelled": "cancelled_bookings",
+    "booking_disputed": "disputed_bookings",
+    "booking_rescheduled": "rescheduled_bookings",
+    "arrived_on_time": "on_time_arrivals",
+    "arrived_late": "late_arrivals",
+    "no_show": "no_shows",
+}
+INC_TOTAL = ("booking_completed", "booking_cancelled")
+COUNTERS = ["total_bookings", *EVENT_MAP.values()]
+RATES = {
+    "completion_rate": "completed_bookings",
+    "cancellation_rate": "cancelled_bookings",
+    "dispute_rate": "disputed_bookings",
+}
+FIELDS = COUNTERS + list(RATES)
+
+AGGREGATE = ",\n  ".join(
+    [f"SUM(event_type IN ({', '.join(repr(e) for e in INC_TOTAL)})) AS total_bookings"]
+    + [f"SUM(event_type = '{event}') AS {field}" for event, field in EVENT_MAP.items()]
+)
+RATE_EXPRS = ",\n  ".join(
+    f"CASE WHEN total_bookings > 0 THEN {field} * 100.0 / total_bookings ELSE 0 END AS {rate}"
+    for rate, field in RATES.items()
+)
+DIFFERS = " OR ".join(
+    [f"r.{c} IS NOT f.{c}" for c in COUNTERS] + [f"ROUND(r.{c}, 6) IS NOT ROUND(f.{c}, 6)" for c in RATES]
+)
+
+
+def stage_fresh(conn, where: str, params: tuple, zero_where: str | None = None) -> None:
+    """Fill temp table ``fresh`` with recomputed rows for the selected users."""
+    conn.execute("DROP TABLE IF EXISTS temp.fresh")
+    conn.execute(
+        f"""CREATE TEMP TABLE fresh AS
+SELECT user_id, last_updated, {', '.join(COUNTERS)},
+  {RATE_EXPRS}
+FROM (
+  SELECT user_id, MAX(created_at) AS last_updated,
+  {AGGREGATE}
+  FROM reliability_events
+  WHERE {where}
+  GROUP BY user_id
+)""",
+        params,
+    )
+    if zero_where:
+        # Indexed users with no events left at all
+        conn.execute(
+            f"""INSERT INTO fresh (user_id, last_updated, {', '.join(FIELDS)})
+SELECT user_id, last_updated, {', '.join('0' for _ in FIELDS)}
+FROM reliability_indices
+WHERE {zero_where} AND user_id NOT IN (SELECT user_id FROM fresh)""",
+            params,
+        )
+
+
+def drift(conn) -> tuple[int, int, Counter]:
+    """(new rows, changed rows, per-field absolute drift) of fresh vs stored."""
+    row = conn.execute(
+        f"""SELECT
+  SUM(r.user_id IS NULL),
+  SUM(r.user_id IS NOT NULL AND ({DIFFERS})),
+  {', '.join(f'SUM(ABS(IFNULL(r.{c}, 0) - f.{c}))' for c in FIELDS)}
+FROM fresh f LEFT JOIN reliability_indices r ON r.user_id = f.user_id"""
+    ).fetchone()
+    per_field = Counter({c: v for c, v in zip(FIELDS, row[2:]) if v})
+    return row[0] or 0, row[1] or 0, per_field
+
+
+def apply_fresh(conn) -> int:
+    columns = ", ".join(FIELDS)
+    updates = ", ".join(f"{c} = excluded.{c}" for c in FIELDS + ["last_updated"])
+    conn.execute(
+        f"""INSERT INTO reliability_indices (user_id, user_role, last_updated, {columns})
+SELECT f.user_id, CASE WHEN u.user_type = 'artist' THEN 'artist' ELSE 'client' END, f.last_updated,
+  {', '.join('f.' + c for c in FIELDS)}
+FROM fresh f
+LEFT JOIN users u ON u.id = f.user_id
+LEFT JOIN reliability_indices r ON r.user_id = f.user_id
+WHERE r.user_id IS NULL OR {DIFFERS}
+ON CONFLICT(user_id) DO UPDATE SET {updates}"""
+    )
+    return conn.execute("SELECT changes()").fetchone()[0]
+
+
+class Report:
+    def __init__(self):
+        self.users = self.inserted = self.changed = self.written = self.chunks = 0
+        self.per_field: Counter = Counter()
+        self.started = time.perf_counter()
+
+    def add(self, conn, dry_run: bool) -> None:
+        self.users += conn.execute("SELECT COUNT(*) FROM fresh").fetchone()[0]
+        inserted, changed, per_field = drift(conn)
+        self.inserted += inserted
+        self.changed += changed
+        self.per_field += per_field
+        if not dry_run:
+            self.written += apply_fresh(conn)
+        self.chunks += 1
+
+    def print(self, mode: str) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(
+            f"{mode}: {self.users:,} users in {self.chunks} chunk(s), {elapsed:.1f}s — "
+            f"{self.inserted:,} missing, {self.changed:,} drifted, {self.written:,} rows written"
+        )
+        for field, amount in sorted(self.per_field.items()):
+            shown = f"{amount:,.2f} points" if field in RATES else f"{int(amount):,}"
+            print(f"  {field:22} {shown}")
+
+
+def full_rebuild(conn, chunk: int, dry_run: bool) -> Report:
+    report = Report()
+    lo = ""
+    while True:
+        # Upper user_id bound about `chunk` events ahead, read off idx_reliability_events_user
+        row = conn.execute(
+            "SELECT user_id FROM reliability_events WHERE user_id > ? ORDER BY user_id LIMIT 1 OFFSET ?",
+            (lo, chunk),
+        ).fetchone()
+        hi = row[0] if row else None
+        where = "user_id > ?" + (" AND user_id <= ?" if hi else "")
+        params = (lo, hi) if hi else (lo,)
+        with transaction(conn):
+            stage_fresh(conn, where, params, zero_where=where)
+            report.add(conn, dry_run)
+        if hi is None:
+            break
+        lo = hi
+    conn.execute("DROP TABLE IF EXISTS temp.fresh")
+    return report
+
+
+def incremental(conn, chunk: int, dry_run: bool) -> Report:
+    report = Report()
+    ckpt = Checkpoint(conn, "recompute-reliability")
+    since = ckpt.position or 0
+    top = conn.execute("SELECT IFNULL(MAX(rowid), 0) FROM reliability_events").fetchone()[0]
+    conn.execute("DROP TABLE IF EXISTS temp.dirty")
+    conn.execute(
+        """CREATE TEMP TABLE dirty AS
+SELECT e.user_id FROM reliability_events e
+LEFT JOIN reliability_indices r ON r.user_id = e.user_id
+WHERE e.rowid > ? AND e.rowid <= ?
+GROUP BY e.user_id
+HAVING r.user_id IS NULL OR MAX(e.created_at) > IFNULL(MAX(r.last_updated), '')""",
+        (since, top),
+    )
+    # Batch users so a chunk covers roughly `chunk` events in total
+    batches, batch, size = [], [], 0
+    for user, events in conn.execute(
+        "SELECT d.user_id, COUNT(*) FROM dirty d JOIN reliability_events e ON e.user_id = d.user_id "
+        "GROUP BY d.user_id ORDER BY d.user_id"
+    ):
+        batch.append((user,))
+        size += events
+        if size >= chunk:
+            batches.append(batch)
+            batch, size = [], 0
+    if batch:
+        batches.append(batch)
+    for batch in batches:
+        with transaction(conn):
+            conn.execute("DROP TABLE IF EXISTS temp.batch")
+            conn.execute("CREATE TEMP TABLE batch (user_id TEXT PRIMARY KEY)")
+            conn.executemany("INSERT INTO batch VALUES (?)", batch)
+            stage_fresh(conn, "user_id IN (SELECT user_id FROM batch)", ())
+            report.add(conn, dry_run)
+    if not dry_run:
+        with transaction(conn):
+            ckpt.save(top, users=report.users)
+    for table in ("fresh", "dirty", "batch"):
+        conn.execute(f"DROP TABLE IF EXISTS temp.{table}")
+    return report
+
+
+def check_bookings(conn) -> int:
+    """Artists whose completed_bookings disagrees with bookings.status (reported, not corrected)."""
+    return conn.execute(
+        """SELECT COUNT(*) FROM reliability_indices r
+JOIN artist_profiles ap ON ap.user_id = r.user_id
+LEFT JOIN (
+  SELECT artist_id, SUM(status = 'completed') AS completed FROM bookings GROUP BY artist_id
+) b ON b.artist_id = ap.id
+WHERE r.user_role = 'artist' AND r.completed_bookings != IFNULL(b.completed, 0)"""
+    ).fetchone()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    parser.add_argument("--full", action="store_true", help="rebuild every user instead of new events only")
+    parser.add_argument("--chunk", type=int, default=50_000, help="events per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without writing")
+    parser.add_argument("--check-bookings", action="store_true", help="also compare with bookings.status")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        if args.full:
+            report = full_rebuild(conn, args.chunk, args.dry_run)
+        else:
+            report = incremental(conn, args.chunk, args.dry_run)
+        report.print(("full rebuild" if args.full else "incremental") + (" (dry run)" if args.dry_run else ""))
+        if args.check_bookings:
+            print(f"  {check_bookings(conn):,} artists' completed_bookings differ from bookings.status")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Repair artist_activities.like_count / comment_count from the source tables.
+
+    python scripts/reconcile-counters.py --db gearsh.sqlite
+    python scripts/reconcile-counters.py --db gearsh.sqlite --rate 2000     # rows/sec
+    python scripts/reconcile-counters.py --db gearsh.sqlite --dry-run --restart
+
+Activities are walked in id order in chunks of --chunk. For each chunk, the
+true counts come from one grouped COUNT(*) per source table over the same
+id range, served by idx_activity_likes_activity and
+idx_activity_comments_activity. Only rows whose cached value differs are
+updated, in one executemany per chunk.
+
+Each UPDATE also matches on the value that was read, so a like or comment
+written by the live API in the meantime is never overwritten; the next run
+picks that row up instead. Progress is checkpointed in job_checkpoints
+inside each chunk's transaction, so an interrupted run resumes where it
+stopped. --rate caps the rows examined per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from jobs import Checkpoint, Throttle, transaction
+from migrate import connect
+
+JOB = "reconcile-counters"
+COUNTERS = {
+    "like_count": "activity_likes",
+    "comment_count": "activity_comments",
+}
+
+
+def counts(conn, table: str, lo: str, hi: str) -> dict[str, int]:
+    return dict(conn.execute(
+        f"SELECT activity_id, COUNT(*) FROM {table} WHERE activity_id > ? AND activity_id <= ? GROUP BY activity_id",
+        (lo, hi),
+    ))
+
+
+def reconcile_chunk(conn, lo: str, size: int, dry_run: bool) -> tuple[str | None, int, dict[str, int], dict[str, int]]:
+    """Returns (last id, rows examined, rows fixed per counter, total absolute drift per counter)."""
+    rows = conn.execute(
+        f"SELECT id, {', '.join(COUNTERS)} FROM artist_activities WHERE id > ? ORDER BY id LIMIT ?",
+        (lo, size),
+    ).fetchall()
+    if not rows:
+        return None, 0, {}, {}
+    hi = rows[-1][0]
+    fixed, drift = {}, {}
+    for position, (column, table) in enumerate(COUNTERS.items(), start=1):
+        truth = counts(conn, table, lo, hi)
+        stale = [
+            (truth.get(row[0], 0), row[0], row[position])
+            for row in rows
+            if (row[position] or 0) != truth.get(row[0], 0)
+        ]
+        drift[column] = sum(abs(new - (old or 0)) for new, _, old in stale)
+        if stale and not dry_run:
+            conn.executemany(
+                f"UPDATE artist_activities SET {column} = ? WHERE id = ? AND {column} IS ?", stale
+            )
+        fixed[column] = len(stale)
+    return hi, len(rows), fixed, drift
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    parser.add_argument("--chunk", type=int, default=2000, help="activities per transaction")
+    parser.add_argument("--rate", type=float, default=0, help="max activities examined per second (0 = no limit)")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without writing")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start from the first id")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    ckpt = Checkpoint(conn, JOB)
+    if args.restart or args.dry_run:
+        lo = ""
+    else:
+        lo = ckpt.position or ""
+        if lo:
+            print(f"Resuming after {lo}")
+    throttle = Throttle(args.rate)
+    started = time.perf_counter()
+    examined = 0
+    fixed = dict.fromkeys(COUNTERS, 0)
+    drift = dict.fromkeys(COUNTERS, 0)
+    try:
+        while True:
+            with transaction(conn):
+                hi, n, chunk_fixed, chunk_drift = reconcile_chunk(conn, lo, args.chunk, args.dry_run)
+                if hi is None:
+                    if not args.dry_run:
+                        ckpt.clear()
+                    break
+                if not args.dry_run:
+                    ckpt.save(hi)
+            for column in COUNTERS:
+                fixed[column] += chunk_fixed[column]
+                drift[column] += chunk_drift[column]
+            examined += n
+            lo = hi
+            throttle.wait(n)
+    except KeyboardInterrupt:
+        print(f"Interrupted after {lo}; rerun to resume")
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    verb = "would fix" if args.dry_run else "fixed"
+    print(f"{examined:,} activities in {elapsed:.1f}s ({examined / max(elapsed, 1e-9):,.0f}/s)")
+    for column in COUNTERS:
+        print(f"  {column:13} {verb} {fixed[column]:,} rows (total drift {drift[column]:,})")
+
+
+if __name__ == "__main__":
+    main()
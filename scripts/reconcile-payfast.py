@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""Reconcile a PayFast settlement CSV against payments and ticket_payments.
+
+    python scripts/reconcile-payfast.py --db gearsh.sqlite --csv payfast-2026-09.csv
+    python scripts/reconcile-payfast.py --db gearsh.sqlite --csv sep.csv --out issues.jsonl --workers 8
+    python scripts/reconcile-payfast.py --db gearsh.sqlite --csv sep.csv --column pf_payment_id="PF Ref"
+
+Rows are matched on the PayFast payment id (pf_payment_id). The CSV and both
+payment tables are streamed once each into spill files partitioned by a hash
+of that id, sized so one partition holds about --partition-rows rows. Each
+partition is then joined through an in-memory hash index on the database
+side. Memory stays bounded by the partition size, not the export size.
+
+The stored ITN (raw_payload) of every payment is re-verified in a process
+pool while the database side is spilled. Verification follows
+buildSignature() in functions/api/payfast-utils.js: keys sorted, empty
+values dropped, encodeURIComponent with '+' for spaces, then the passphrase.
+The passphrase is --passphrase, or PAYFAST_PASSPHRASE, or the sandbox
+default the functions use. Reported: rows missing on either side, duplicate
+ids, amount and status mismatches, bad signatures, and payloads that
+disagree with their own row.
+
+Database rows are limited to the CSV's date span unless --from/--to are
+given, so a month's export is not flagged against every other month.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from urllib.parse import quote
+
+from jobs import Discrepancies
+from migrate import connect
+
+# getPayfastConfig() falls back to the PayFast sandbox passphrase
+SANDBOX_PASSPHRASE = "jt7NOE43FZPn"
+CENT = 0.005
+BLOCK = 8192
+# Two spill files are open per partition
+MAX_PARTITIONS = 256
+
+# Settlement export header -> field; override with --column field=Header
+COLUMNS = {
+    "pf_payment_id": ("pf payment id", "pf_payment_id", "payfast payment id"),
+    "m_payment_id": ("m payment id", "m_payment_id", "merchant payment id"),
+    "gross": ("gross", "amount_gross", "amount"),
+    "fee": ("fee", "amount_fee"),
+    "net": ("net", "amount_net"),
+    "type": ("type", "transaction type"),
+    "date": ("date", "transaction date", "created"),
+}
+
+PAYMENTS = """
+SELECT 'booking', id, booking_id, payfast_payment_id, amount, status, raw_payload, updated_at
+FROM payments
+WHERE payfast_payment_id IS NOT NULL AND updated_at >= :since AND updated_at < :until
+UNION ALL
+SELECT 'ticket', id, ticket_order_id, payfast_payment_id, amount, status, raw_payload, updated_at
+FROM ticket_payments
+WHERE payfast_payment_id IS NOT NULL AND updated_at >= :since AND updated_at < :until
+"""
+
+
+def encode_uri_component(value: str) -> str:
+    return quote(value, safe="!~*'()").replace("%20", "+")
+
+
+def build_signature(data: dict, passphrase: str | None) -> str:
+    """Python port of buildSignature() in functions/api/payfast-utils.js."""
+    pairs = [
+        f"{key}={encode_uri_component(str(data[key]).strip())}"
+        for key in sorted(data)
+        if data[key] is not None and str(data[key]).strip() != ""
+    ]
+    text = "&".join(pairs)
+    if passphrase:
+        text += f"&passphrase={encode_uri_component(passphrase.strip())}"
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+_passphrase: str | None = None
+
+
+def init_worker(passphrase: str | None) -> None:
+    global _passphrase
+    _passphrase = passphrase
+
+
+def check_row(row: tuple) -> dict:
+    """Runs in the pool: parse and verify one stored ITN."""
+    kind, row_id, ref, pf_id, amount, status, raw, updated_at = row
+    record = {"source": kind, "id": row_id, "ref": ref, "pf": pf_id, "amount": amount, "status": status}
+    if not raw:
+        record["payload"] = None
+        return record
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        record["payload"] = "unparseable"
+        return record
+    received = str(payload.get("signature") or "").lower()
+    unsigned = {k: v for k, v in payload.items() if k != "signature"}
+    record["payload"] = "ok"
+    record["signature_ok"] = bool(received) and received == build_signature(unsigned, _passphrase)
+    record["itn"] = {
+        "pf": payload.get("pf_payment_id"),
+        "m": payload.get("m_payment_id"),
+        "gross": payload.get("amount_gross"),
+        "status": payload.get("payment_status"),
+    }
+    return record
+
+
+def money(text: str | None) -> float | None:
+    if text is None or str(text).strip() == "":
+        return None
+    cleaned = str(text).replace("R", "").replace(" ", "").replace(",", "")
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def resolve_columns(header: list[str], overrides: dict[str, str]) -> dict[str, str]:
+    by_name = {h.strip().lower(): h for h in header}
+    resolved = {}
+    for field, aliases in COLUMNS.items():
+        if field in overrides:
+            if overrides[field] not in header:
+                sys.exit(f"--column {field}={overrides[field]!r} is not in the CSV header")
+            resolved[field] = overrides[field]
+            continue
+        for alias in aliases:
+            if alias in by_name:
+                resolved[field] = by_name[alias]
+                break
+    if "pf_payment_id" not in resolved or "gross" not in resolved:
+        sys.exit(f"CSV needs a PayFast payment id and a gross amount column; header is {header}")
+    return resolved
+
+
+class Spill:
+    """JSON-lines files partitioned by a hash of the key."""
+
+    def __init__(self, directory: Path, name: str, partitions: int):
+        self.paths = [directory / f"{name}-{i:04d}.jsonl" for i in range(partitions)]
+        self.files = [p.open("w", encoding="utf-8") for p in self.paths]
+        self.rows = 0
+
+    def write(self, key: str, record: dict) -> None:
+        self.files[zlib.crc32(key.encode()) % len(self.files)].write(json.dumps(record) + "\n")
+        self.rows += 1
+
+    def close(self) -> None:
+        for f in self.files:
+            f.close()
+
+    def read(self, partition: int):
+        with self.paths[partition].open(encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def spill_csv(path: Path, spill: Spill, overrides: dict[str, str]) -> tuple[str | None, str | None]:
+    """Partition the export; returns its (first, last) date, when there is a date column."""
+    first = last = None
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        cols = resolve_columns(reader.fieldnames or [], overrides)
+        for line, row in enumerate(reader, start=2):
+            pf_id = (row.get(cols["pf_payment_id"]) or "").strip()
+            if not pf_id:
+                continue
+            record = {field: row.get(header) for field, header in cols.items()}
+            record["pf_payment_id"] = pf_id
+            record["line"] = line
+            spill.write(pf_id, record)
+            day = (record.get("date") or "")[:10]
+            if len(day) == 10 and day[4] == "-":
+                first = day if first is None or day < first else first
+                last = day if last is None or day > last else last
+    return first, last
+
+
+def spill_db(conn, spill: Spill, since: str, until: str, workers: int | None, passphrase: str | None) -> None:
+    # The cursor stays on this thread; each block is verified while the next is read
+    cursor = conn.execute(PAYMENTS, {"since": since, "until": until})
+    with Pool(workers, initializer=init_worker, initargs=(passphrase,)) as pool:
+        pending = None
+        while True:
+            block = cursor.fetchmany(BLOCK)
+            if pending:
+                for record in pending.get():
+                    spill.write(record["pf"], record)
+            if not block:
+                break
+            pending = pool.map_async(check_row, block, chunksize=256)
+
+
+def check_payload(record: dict, report: Discrepancies) -> None:
+    key = record["pf"]
+    if record["payload"] is None:
+        if record["status"] == "complete":
+            report.add("complete_without_itn", key, record["amount"], source=record["source"], id=record["id"])
+        return
+    if record["payload"] == "unparseable":
+        report.add("unparseable_itn", key, record["amount"], source=record["source"], id=record["id"])
+        return
+    if not record["signature_ok"]:
+        report.add("bad_signature", key, record["amount"], source=record["source"], id=record["id"])
+    itn = record["itn"]
+    gross = money(itn["gross"])
+    problems = []
+    if itn["pf"] and str(itn["pf"]) != key:
+        problems.append(f"pf_payment_id {itn['pf']}")
+    if itn["m"] and str(itn["m"]) != record["ref"]:
+        problems.append(f"m_payment_id {itn['m']} != {record['ref']}")
+    if gross is not None and abs(gross - record["amount"]) > CENT:
+        problems.append(f"amount_gross {gross} != {record['amount']}")
+    if itn["status"] == "COMPLETE" and record["status"] != "complete":
+        problems.append(f"ITN COMPLETE but row is {record['status']}")
+    if problems:
+        report.add("itn_disagrees_with_row", key, record["amount"], source=record["source"], id=record["id"],
+                   problems=problems)
+
+
+def join_partition(db_rows, csv_rows, report: Discrepancies, checked: Counter) -> None:
+    index: dict[str, list[dict]] = {}
+    for record in db_rows:
+        index.setdefault(record["pf"], []).append(record)
+        checked["payment rows"] += 1
+        check_payload(record, report)
+    for pf_id, records in index.items():
+        if len(records) > 1:
+            report.add("duplicate_in_db", pf_id, sum(r["amount"] for r in records),
+                       rows=[f"{r['source']}:{r['id']}" for r in records])
+
+    settled: dict[str, list[dict]] = {}
+    for row in csv_rows:
+        checked["settlement rows"] += 1
+        settled.setdefault(row["pf_payment_id"], []).append(row)
+    for pf_id, rows in settled.items():
+        credits = [r for r in rows if (money(r["gross"]) or 0) > 0]
+        gross = sum(money(r["gross"]) or 0 for r in credits)
+        if len(credits) > 1:
+            report.add("duplicate_in_settlement", pf_id, gross, lines=[r["line"] for r in credits])
+        matches = index.pop(pf_id, None)
+        if not matches:
+            if credits:
+                report.add("missing_in_db", pf_id, gross, lines=[r["line"] for r in credits],
+                           m_payment_id=credits[0].get("m_payment_id"))
+            continue
+        record = matches[0]
+        first = money(credits[0]["gross"]) if credits else None
+        if first is not None and abs(first - record["amount"]) > CENT:
+            report.add("amount_mismatch", pf_id, first - record["amount"], settled=first, recorded=record["amount"],
+                       source=record["source"], id=record["id"])
+        if credits and record["status"] != "complete":
+            report.add("settled_but_not_complete", pf_id, gross, status=record["status"],
+                       source=record["source"], id=record["id"])
+    for pf_id, records in index.items():
+        for record in records:
+            if record["status"] == "complete":
+                report.add("missing_in_settlement", pf_id, record["amount"], source=record["source"],
+                           id=record["id"], ref=record["ref"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    parser.add_argument("--csv", type=Path, required=True, help="PayFast settlement / transaction export")
+    parser.add_argument("--from", dest="since", help="first date of payments to compare (default: CSV's first)")
+    parser.add_argument("--to", dest="until", help="last date of payments to compare (default: CSV's last)")
+    parser.add_argument("--passphrase", default=os.environ.get("PAYFAST_PASSPHRASE", SANDBOX_PASSPHRASE))
+    parser.add_argument("--column", action="append", default=[], metavar="FIELD=HEADER",
+                        help=f"map a CSV header to one of: {', '.join(COLUMNS)}")
+    parser.add_argument("--partition-rows", type=int, default=200_000, help="rows per in-memory hash partition")
+    parser.add_argument("--workers", type=int, default=None, help="signature processes (default: CPU count)")
+    parser.add_argument("--out", type=Path, help="write every discrepancy here as JSON lines")
+    parser.add_argument("--show", type=int, default=3, help="examples printed per kind")
+    args = parser.parse_args()
+
+    overrides = dict(c.split("=", 1) for c in args.column)
+    unknown = set(overrides) - set(COLUMNS)
+    if unknown:
+        parser.error(f"unknown --column field(s): {', '.join(sorted(unknown))}")
+
+    started = time.perf_counter()
+    conn = connect(args.db)
+    # Upper bound on rows per side, to size the partitions
+    csv_bytes = args.csv.stat().st_size
+    db_rows = sum(
+        conn.execute(f"SELECT COUNT(*) FROM {t} WHERE payfast_payment_id IS NOT NULL").fetchone()[0]
+        for t in ("payments", "ticket_payments")
+    )
+    partitions = min(MAX_PARTITIONS, max(1, -(-max(db_rows, csv_bytes // 60) // args.partition_rows)))
+    out = args.out.open("w", encoding="utf-8") if args.out else None
+    report = Discrepancies(out, args.show)
+    checked: Counter = Counter()
+    try:
+        with tempfile.TemporaryDirectory(prefix="gearsh-payfast-") as tmp:
+            settlement = Spill(Path(tmp), "csv", partitions)
+            first, last = spill_csv(args.csv, settlement, overrides)
+            settlement.close()
+            since = args.since or first or ""
+            until = (args.until or last or "9999-12-31") + "￿"
+            recorded = Spill(Path(tmp), "db", partitions)
+            spill_db(conn, recorded, since, until, args.workers, args.passphrase)
+            recorded.close()
+            print(
+                f"{settlement.rows:,} settlement rows and {recorded.rows:,} payment rows "
+                f"({since or 'start'} .. {args.until or last or 'end'}) in {partitions} partition(s)"
+            )
+            for p in range(partitions):
+                join_partition(recorded.read(p), settlement.read(p), report, checked)
+    finally:
+        conn.close()
+        if out:
+            out.close()
+    report.print(checked, time.perf_counter() - started)
+    if report.counts:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Read the SA showcase data for the Python asset tooling.
+
+functions/api/sa-showcase-data.js is the source of truth (it is hand-curated
+after generate-sa-showcase.py runs), so artist records are parsed from it
+rather than from the generator's ARTISTS table.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parents[1]
+API_DATA = ROOT / "functions" / "api" / "sa-showcase-data.js"
+WEB_DATA = ROOT / "web" / "sa-showcase-data.js"
+GENERATOR = ROOT / "scripts" / "generate-sa-showcase.py"
+
+PROPERTY = re.compile(r"^    (\w+): (.*),$")
+STRING_ITEM = re.compile(r"'((?:[^'\\]|\\.)*)'")
+
+
+def load_script(path: Path, name: str | None = None) -> ModuleType:
+    """Import a hyphen-named script (e.g. generate-sa-showcase.py) as a module."""
+    name = name or path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # dataclasses look their module up here
+    spec.loader.exec_module(module)
+    return module
+
+
+@lru_cache(maxsize=1)
+def generator() -> ModuleType:
+    return load_script(GENERATOR)
+
+
+def genre_sections() -> list[tuple[str, str, str, str]]:
+    """(slug, title, subtitle, icon) for each genre feed row."""
+    return list(generator().GENRE_SECTIONS)
+
+
+def _unquote(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _parse_value(raw: str):
+    if raw.startswith("'") and raw.endswith("'"):
+        return _unquote(raw[1:-1])
+    if raw.startswith("["):
+        return [_unquote(s) for s in STRING_ITEM.findall(raw)]
+    if raw in ("true", "false"):
+        return raw == "true"
+    try:
+        return int(raw)
+    except ValueError:
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+
+
+def parse_artists(text: str) -> list[dict]:
+    """Parse SA_SHOWCASE_ARTISTS into dicts of its top-level scalar fields."""
+    start = text.index("SA_SHOWCASE_ARTISTS = [")
+    artists: list[dict] = []
+    current: dict | None = None
+    for line in text[start:].splitlines()[1:]:
+        if line == "];":
+            break
+        if line == "  {":
+            current = {}
+        elif line == "  }," and current is not None:
+            artists.append(current)
+            current = None
+        elif current is not None:
+            match = PROPERTY.match(line)
+            if match:
+                current[match.group(1)] = _parse_value(match.group(2))
+    return artists
+
+
+def load_artists(path: Path = API_DATA) -> list[dict]:
+    return parse_artists(path.read_text(encoding="utf-8"))
+
+
+def image_path(artist: dict) -> Path:
+    return ROOT / artist.get("image", "")
+
+
+def artists_by_genre(artists: list[dict]) -> dict[str, list[dict]]:
+    """Group artists into the GENRE_SECTIONS rows, preserving data order."""
+    groups: dict[str, list[dict]] = {slug: [] for slug, *_ in genre_sections()}
+    for artist in artists:
+        slug = artist.get("genreSlug") or "other"
+        groups.setdefault(slug, []).append(artist)
+    return groups
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Subset the bundled Syne weights to the characters Gearsh actually draws.
+
+    python scripts/subset-fonts.py
+    python scripts/subset-fonts.py build/web --workers 2
+    python scripts/subset-fonts.py --chars
+
+pubspec.yaml bundles five full Syne weights, and the Flutter web engine
+downloads every font in FontManifest.json before the first frame. This scans
+the Dart sources (lib/), the static pages and their scripts (web/) and the
+showcase data for the characters they use, adds Basic Latin, and cuts each
+weight down to those glyphs plus a Latin-extended fallback (Latin-1,
+Latin Extended-A/B and Additional, general punctuation and currency signs)
+so names typed by users still render in Syne. Greek, arrows, maths, the
+stylistic alternates and the rest of the font are dropped.
+
+Run it on the output of `flutter build web`, before optimize-web-build.py
+(deploy.ps1 does both). It writes:
+
+  * assets/assets/fonts/Syne-<weight>.ttf in the build, replaced in place
+    by the subset and with its md5 refreshed in flutter_service_worker.js.
+    Flutter cannot load a face by unicode-range, so the fallback is merged
+    into these;
+  * static/fonts/Syne-<weight>.<hash>.woff2 and Syne-<weight>-ext.<hash>.woff2
+    (WOFF when the brotli package is missing) plus fonts/syne.css, whose
+    @font-face rules split the two by unicode-range so a static page only
+    fetches the fallback file when it shows such a character. landing.html
+    links fonts/syne.css (optimize-web-build.py then gives it a hashed
+    static/ name) after the Google Fonts Syne, which it overrides; that
+    stays as the fallback for unbuilt pages and builds without fontTools.
+
+The originals in assets/fonts are never touched; imaging.font() and the
+card renderers keep using the full faces. fontTools is optional (pip
+install fonttools); without it the build keeps the full fonts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import sys
+from io import BytesIO
+from multiprocessing import Pool
+from pathlib import Path
+
+from imaging import FONTS_DIR
+from profiling import configure, traced
+from showcase import API_DATA, ROOT, load_artists
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = TTFont = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BUILD_FONTS = "assets/assets/fonts"
+STATIC_FONTS = "static/fonts"
+CSS = "fonts/syne.css"
+SERVICE_WORKER = "flutter_service_worker.js"
+
+# Weight names as in pubspec.yaml, with their CSS weights
+WEIGHTS = {"Regular": 400, "Medium": 500, "SemiBold": 600, "Bold": 700, "ExtraBold": 800}
+
+BASIC_LATIN = range(0x20, 0x7F)
+LATIN_EXT = (
+    range(0xA0, 0x250),      # Latin-1 Supplement, Latin Extended-A and -B
+    range(0x1E00, 0x1F00),   # Latin Extended Additional
+    range(0x2000, 0x2070),   # General Punctuation
+    range(0x20A0, 0x20D0),   # Currency Symbols
+    range(0x2100, 0x2130),   # Letterlike Symbols (™, №)
+)
+
+SOURCES = (
+    (ROOT / "lib", "*.dart"),
+    (ROOT / "web", "*.html"),
+    (ROOT / "web", "*.js"),
+)
+# Build output and generated files that live next to the web sources
+SKIP_FILES = {"main.dart.js", "flutter.js", "flutter_bootstrap.js", SERVICE_WORKER}
+SKIP_DIRS = {"assets", "canvaskit", "content", "og", "showcase", "static"}
+
+ESCAPE_RE = re.compile(r"\\u\{([0-9a-fA-F]{1,6})\}|\\u([0-9a-fA-F]{4})")
+
+
+# -- character scan --------------------------------------------------------------
+
+
+def characters(text: str) -> set[int]:
+    """Code points in ``text``, including \\uXXXX / \\u{X} escapes and HTML entities."""
+    found = {ord(c) for c in html.unescape(text)}
+    for braced, plain in ESCAPE_RE.findall(text):
+        found.add(int(braced or plain, 16))
+    return {c for c in found if c >= 0x20}
+
+
+def source_files() -> list[Path]:
+    files = []
+    for base, pattern in SOURCES:
+        for path in sorted(base.rglob(pattern)):
+            rel = path.relative_to(base).parts
+            if path.name not in SKIP_FILES and not SKIP_DIRS.intersection(rel[:-1]):
+                files.append(path)
+    return files
+
+
+@traced()
+def used_characters() -> set[int]:
+    used = set(BASIC_LATIN)
+    for path in source_files():
+        used |= characters(path.read_text(encoding="utf-8", errors="ignore"))
+    used |= characters(API_DATA.read_text(encoding="utf-8"))
+    used |= characters(json.dumps(load_artists(), ensure_ascii=False))
+    return used
+
+
+def unicode_range(codepoints: set[int]) -> str:
+    """U+0020-007E, U+00E9, ... for a @font-face rule."""
+    spans, start, prev = [], None, None
+    for c in sorted(codepoints):
+        if prev is not None and c == prev + 1:
+            prev = c
+            continue
+        if start is not None:
+            spans.append((start, prev))
+        start = prev = c
+    if start is not None:
+        spans.append((start, prev))
+    return ", ".join(f"U+{a:04X}" if a == b else f"U+{a:04X}-{b:04X}" for a, b in spans)
+
+
+# -- subsetting (runs in worker processes) ---------------------------------------
+
+
+def cut(source: Path, codepoints: set[int], flavor: str | None) -> bytes:
+    # fontTools' default layout features (kern, liga, mark, locl, ...); nothing
+    # in lib/ or the stylesheets asks for stylistic sets or alternates
+    options = subset.Options()
+    font = TTFont(source)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    font.flavor = flavor
+    out = BytesIO()
+    font.save(out)
+    return out.getvalue()
+
+
+def subset_weight(job: tuple[str, set[int]]) -> dict:
+    weight, used = job
+    source = FONTS_DIR / f"Syne-{weight}.ttf"
+    cmap = set(TTFont(source).getBestCmap())
+    core = used & cmap
+    ext = {c for r in LATIN_EXT for c in r} & cmap - core
+    flavor = "woff2" if brotli is not None else "woff"
+    return {
+        "weight": weight,
+        "source": source.stat().st_size,
+        "ttf": cut(source, core | ext, None),
+        "web": cut(source, core, flavor),
+        "web_ext": cut(source, ext, flavor),
+        "core": core,
+        "ext": ext,
+        "missing": len(used - cmap),
+        "flavor": flavor,
+    }
+
+
+@traced()
+def subset_all(used: set[int], workers: int | None) -> list[dict]:
+    weights = [w for w in WEIGHTS if (FONTS_DIR / f"Syne-{w}.ttf").exists()]
+    with Pool(workers) as pool:
+        return pool.map(subset_weight, [(w, used) for w in weights])
+
+
+# -- output ----------------------------------------------------------------------
+
+
+def write_build(build: Path, results: list[dict]) -> list[str]:
+    """Replace the build's TTFs and write the web fonts; returns the TTFs replaced."""
+    replaced = []
+    for r in results:
+        target = build / BUILD_FONTS / f"Syne-{r['weight']}.ttf"
+        if target.exists():
+            target.write_bytes(r["ttf"])
+            replaced.append(target.relative_to(build).as_posix())
+
+    static = build / STATIC_FONTS
+    static.mkdir(parents=True, exist_ok=True)
+    rules = []
+    for r in results:
+        for key, suffix, codepoints in (("web", "", r["core"]), ("web_ext", "-ext", r["ext"])):
+            if not codepoints:
+                continue
+            data = r[key]
+            name = f"Syne-{r['weight']}{suffix}.{hashlib.sha256(data).hexdigest()[:10]}.{r['flavor']}"
+            (static / name).write_bytes(data)
+            rules.append(
+                "@font-face {\n"
+                "  font-family: 'Syne';\n"
+                "  font-style: normal;\n"
+                f"  font-weight: {WEIGHTS[r['weight']]};\n"
+                "  font-display: swap;\n"
+                f"  src: url('/{STATIC_FONTS}/{name}') format('{r['flavor']}');\n"
+                f"  unicode-range: {unicode_range(codepoints)};\n"
+                "}\n"
+            )
+    (build / CSS).parent.mkdir(parents=True, exist_ok=True)
+    (build / CSS).write_text(
+        "/* Auto-generated by scripts/subset-fonts.py — Syne subsets for the static pages */\n\n" + "\n".join(rules),
+        encoding="utf-8",
+    )
+    return replaced
+
+
+def update_service_worker(build: Path, replaced: list[str]) -> None:
+    worker = build / SERVICE_WORKER
+    if not worker.exists():
+        return
+    text = worker.read_text(encoding="utf-8")
+    for rel in replaced:
+        md5 = hashlib.md5((build / rel).read_bytes()).hexdigest()
+        text = re.sub(rf'("{re.escape(rel)}":\s*")[0-9a-f]{{32}}(")', rf"\g<1>{md5}\g<2>", text)
+    worker.write_text(text, encoding="utf-8")
+
+
+def report(results: list[dict], replaced: list[str]) -> None:
+    before = sum(r["source"] for r in results)
+    after = sum(len(r["ttf"]) for r in results)
+    print(f"Subset {len(results)} Syne weight(s): {len(results[0]['core'])} used code points, "
+          f"{len(results[0]['ext'])} in the Latin-extended fallback")
+    for r in results:
+        print(
+            f"  {r['weight']:<10} ttf {r['source']:>8,} -> {len(r['ttf']):>8,} B   "
+            f"{r['flavor']} {len(r['web']):>7,} + {len(r['web_ext']):>7,} B ext"
+        )
+    print(f"  app fonts: {before:,} -> {after:,} B ({1 - after / max(before, 1):.1%} smaller)")
+    if results[0]["missing"]:
+        print(f"  {results[0]['missing']} used character(s) are not in Syne and fall back to other fonts")
+    if not replaced:
+        print(f"  no Syne fonts under {BUILD_FONTS} in the build; only the web fonts were written")
+    if brotli is None:
+        print("  brotli is not installed; wrote WOFF instead of WOFF2 (pip install brotli)")
+
+
+def main() -> None:
+    configure()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("build", type=Path, nargs="?", default=ROOT / "build" / "web", help="flutter build output")
+    parser.add_argument("--workers", type=int, default=None, help="subsetting processes (default: CPU count)")
+    parser.add_argument("--chars", action="store_true", help="print the characters the scan found and exit")
+    args = parser.parse_args()
+
+    used = used_characters()
+    if args.chars:
+        print("".join(chr(c) for c in sorted(used)))
+        return
+    if subset is None:
+        print("fontTools is not installed; the build keeps the full Syne fonts (pip install fonttools)")
+        return
+
+    build = args.build.resolve()
+    if build == (ROOT / "web").resolve():
+        sys.exit("web/ is the source tree; run this on the output of flutter build web")
+    if not (build / "index.html").exists():
+        sys.exit(f"{build} has no index.html; run flutter build web first")
+
+    results = subset_all(used, args.workers)
+    if not results:
+        sys.exit(f"no Syne fonts in {FONTS_DIR.relative_to(ROOT)}")
+    replaced = write_build(build, results)
+    update_service_worker(build, replaced)
+    report(results, replaced)
+
+
+if __name__ == "__main__":
+    main()
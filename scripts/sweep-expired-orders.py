@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Expire unpaid ticket orders past expires_at and hand their tickets back.
+
+    python scripts/sweep-expired-orders.py --db gearsh.sqlite                  # run forever
+    python scripts/sweep-expired-orders.py --db gearsh.sqlite --once           # drain the backlog and exit
+    python scripts/sweep-expired-orders.py --db gearsh.sqlite --metrics sweeps.jsonl --notify-log waitlist.jsonl
+
+Each sweep is one transaction. It flips up to --batch pending_payment
+orders to expired, oldest expires_at first, read off
+idx_ticket_orders_status_expires (database/add_ticket_expiry_indexes.sql).
+The UPDATE's RETURNING list is the bookkeeping: quantity_reserved is released
+for exactly those orders, the same clamped decrement releaseTicketInventory()
+does. Freed tickets then go to the event's waitlist, oldest first, marking
+entries notified until the freed quantity is used up. A sold_out event with
+tickets available again goes back to published.
+
+The batch size adapts: it doubles while full sweeps finish under half of
+--target-ms, and halves when a sweep runs over it. While sweeps come back
+full the loop goes again at once; otherwise it sleeps --interval. Every
+sweep writes one JSON line of metrics: rows expired, tickets released,
+waitlist promotions, latency, and the backlog still overdue. Promoted
+waitlist entries can be appended to --notify-log for the mailer.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from jobs import now_iso, transaction
+from migrate import connect
+
+EXPIRE = """
+UPDATE ticket_orders SET status = 'expired', updated_at = :now
+WHERE id IN (
+  SELECT id FROM ticket_orders
+  WHERE status = 'pending_payment' AND expires_at < :now
+  ORDER BY expires_at
+  LIMIT :batch
+)
+RETURNING id, event_id
+"""
+
+FREED = """
+SELECT oi.ticket_type_id, tt.event_id, SUM(oi.quantity)
+FROM ticket_order_items oi
+JOIN gig_ticket_types tt ON tt.id = oi.ticket_type_id
+WHERE oi.order_id IN (SELECT value FROM json_each(?))
+GROUP BY oi.ticket_type_id
+"""
+
+RELEASE = """
+UPDATE gig_ticket_types
+SET quantity_reserved = CASE WHEN quantity_reserved - :qty < 0 THEN 0 ELSE quantity_reserved - :qty END
+WHERE id = :id
+"""
+
+AVAILABLE = """
+SELECT COALESCE(SUM(quantity_total - quantity_sold - quantity_reserved), 0)
+FROM gig_ticket_types WHERE event_id = ? AND is_active = 1
+"""
+
+PROMOTE = """
+UPDATE gig_waitlist SET notified = 1
+WHERE id IN (
+  SELECT id FROM (
+    SELECT id, SUM(quantity) OVER (ORDER BY created_at, id) AS running
+    FROM gig_waitlist WHERE event_id = :event AND notified = 0
+  ) WHERE running <= :freed
+)
+RETURNING id, event_id, user_id, email, phone, quantity
+"""
+
+REOPEN = """
+UPDATE gig_events SET status = 'published', updated_at = ? WHERE id = ? AND status = 'sold_out'
+"""
+
+BACKLOG = """
+SELECT COUNT(*), MIN(expires_at) FROM ticket_orders WHERE status = 'pending_payment' AND expires_at < ?
+"""
+
+
+def seconds_since(stamp: str | None, now: datetime) -> float:
+    if not stamp:
+        return 0.0
+    then = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+    if then.tzinfo is None:
+        then = then.replace(tzinfo=timezone.utc)
+    return round((now - then).total_seconds(), 1)
+
+
+def sweep(conn, batch: int) -> tuple[Counter, list[tuple]]:
+    """Expire one batch; returns (counts, promoted waitlist rows)."""
+    now = now_iso()
+    counts: Counter = Counter()
+    with transaction(conn):
+        expired = conn.execute(EXPIRE, {"now": now, "batch": batch}).fetchall()
+        counts["expired"] = len(expired)
+        if not expired:
+            return counts, []
+        freed_by_event: Counter = Counter()
+        released = []
+        for type_id, event_id, qty in conn.execute(FREED, (json.dumps([order for order, _ in expired]),)):
+            released.append({"id": type_id, "qty": qty})
+            freed_by_event[event_id] += qty
+        conn.executemany(RELEASE, released)
+        counts["tickets_released"] = sum(freed_by_event.values())
+        promoted = []
+        for event_id, freed in freed_by_event.items():
+            available = conn.execute(AVAILABLE, (event_id,)).fetchone()[0]
+            if available <= 0:
+                continue
+            promoted += conn.execute(PROMOTE, {"event": event_id, "freed": min(freed, available)}).fetchall()
+            counts["events_reopened"] += conn.execute(REOPEN, (now, event_id)).rowcount
+        counts["waitlist_promoted"] = len(promoted)
+    return counts, promoted
+
+
+class Sweeper:
+    def __init__(self, conn, batch: int, min_batch: int, max_batch: int, target_ms: float):
+        self.conn = conn
+        self.batch = batch
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.target_ms = target_ms
+        self.totals: Counter = Counter()
+
+    def run_once(self) -> tuple[dict, list[tuple]]:
+        size = self.batch
+        started = time.perf_counter()
+        counts, promoted = sweep(self.conn, size)
+        latency_ms = (time.perf_counter() - started) * 1000
+        full = counts["expired"] == size
+        if full and latency_ms < self.target_ms / 2:
+            self.batch = min(self.max_batch, size * 2)
+        elif latency_ms > self.target_ms:
+            self.batch = max(self.min_batch, size // 2)
+        backlog, oldest = self.conn.execute(BACKLOG, (now_iso(),)).fetchone()
+        self.totals.update(counts)
+        self.totals["sweeps"] += 1
+        metrics = {
+            "at": now_iso(),
+            "batch": size,
+            "expired": counts["expired"],
+            "tickets_released": counts["tickets_released"],
+            "waitlist_promoted": counts["waitlist_promoted"],
+            "events_reopened": counts["events_reopened"],
+            "latency_ms": round(latency_ms, 2),
+            "backlog": backlog,
+            "oldest_overdue_s": seconds_since(oldest, datetime.now(timezone.utc)),
+            "full": full,
+        }
+        return metrics, promoted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    parser.add_argument("--once", action="store_true", help="exit once the overdue backlog is drained")
+    parser.add_argument("--interval", type=float, default=30, help="seconds between sweeps when caught up")
+    parser.add_argument("--batch", type=int, default=500, help="starting orders per sweep")
+    parser.add_argument("--min-batch", type=int, default=50)
+    parser.add_argument("--max-batch", type=int, default=20_000)
+    parser.add_argument("--target-ms", type=float, default=100, help="sweep latency the batch size adapts to")
+    parser.add_argument("--metrics", type=Path, help="append per-sweep JSON lines here instead of stdout")
+    parser.add_argument("--notify-log", type=Path, help="append promoted waitlist entries here as JSON lines")
+    parser.add_argument("--quiet", action="store_true", help="only write metrics for sweeps that expired something")
+    args = parser.parse_args()
+
+    stopping = False
+
+    def stop(*_):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    conn = connect(args.db)
+    sweeper = Sweeper(conn, args.batch, args.min_batch, args.max_batch, args.target_ms)
+    metrics_out = args.metrics.open("a", encoding="utf-8") if args.metrics else sys.stdout
+    notify_out = args.notify_log.open("a", encoding="utf-8") if args.notify_log else None
+    try:
+        while not stopping:
+            metrics, promoted = sweeper.run_once()
+            if metrics["expired"] or not args.quiet:
+                metrics_out.write(json.dumps(metrics) + "\n")
+                metrics_out.flush()
+            if notify_out and promoted:
+                for waitlist_id, event_id, user_id, email, phone, quantity in promoted:
+                    notify_out.write(json.dumps({
+                        "id": waitlist_id, "event_id": event_id, "user_id": user_id,
+                        "email": email, "phone": phone, "quantity": quantity, "promoted_at": metrics["at"],
+                    }) + "\n")
+                notify_out.flush()
+            if metrics["full"]:
+                continue
+            if args.once:
+                break
+            deadline = time.monotonic() + args.interval
+            while not stopping and time.monotonic() < deadline:
+                time.sleep(min(1.0, deadline - time.monotonic()))
+    finally:
+        conn.close()
+        if args.metrics:
+            metrics_out.close()
+        if notify_out:
+            notify_out.close()
+
+    t = sweeper.totals
+    print(
+        f"{t['sweeps']:,} sweep(s): {t['expired']:,} orders expired, {t['tickets_released']:,} tickets released, "
+        f"{t['waitlist_promoted']:,} waitlist entries promoted, {t['events_reopened']:,} events reopened",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""Fill a local SQLite replica with large, referentially consistent data.
+
+    python scripts/synthdata.py --db load.sqlite                 # scale 0.01
+    python scripts/synthdata.py --db load.sqlite --scale 1       # 1M users, 10M bookings
+    python scripts/synthdata.py --db load.sqlite --only bookings # one table family
+
+The schema comes from scripts/migrate.py. Rows are produced by streaming
+generators and written through batched executemany inside large
+transactions, with bulk-load PRAGMAs. Secondary indexes are dropped during
+the load and rebuilt afterwards. Output is deterministic for a given --seed
+and --scale, and rows/sec is reported per table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import time
+from pathlib import Path
+
+from migrate import build_replica
+
+# Row counts at --scale 1
+VOLUMES = {
+    "users": 1_000_000,
+    "artist_profiles": 100_000,
+    "services": 250_000,
+    "bookings": 10_000_000,
+    "messages": 5_000_000,
+    "artist_follows": 5_000_000,
+    "artist_activities": 1_000_000,
+    "activity_likes": 10_000_000,
+    "activity_comments": 2_000_000,
+    "gig_events": 5_000,
+    "ticket_orders": 1_000_000,
+    "gig_waitlist": 100_000,
+}
+
+# --only families -> tables they write (children are generated with parents)
+FAMILIES = {
+    "users": ("users", "artist_profiles", "services"),
+    "bookings": ("bookings", "payments", "escrow_ledger", "reviews", "disputes", "reliability_events"),
+    "messages": ("messages",),
+    "activity": ("artist_follows", "artist_activities", "activity_likes", "activity_comments"),
+    "tickets": (
+        "gig_events", "gig_ticket_types", "ticket_orders", "ticket_order_items",
+        "ticket_instances", "ticket_payments", "gig_waitlist",
+    ),
+    "content": ("content_live",),
+}
+
+COLUMNS = {
+    "users": (
+        "id", "email", "password_hash", "user_type", "first_name", "last_name", "display_name",
+        "username", "location", "country", "is_verified", "is_active", "created_at", "updated_at",
+    ),
+    "artist_profiles": (
+        "id", "user_id", "category", "genre", "base_rate", "hourly_rate", "skills",
+        "avg_rating", "total_reviews", "created_at", "updated_at",
+    ),
+    "services": ("id", "artist_id", "name", "price", "duration_hours", "created_at"),
+    "bookings": (
+        "id", "client_id", "artist_id", "service_id", "event_date", "event_time", "event_location",
+        "event_type", "duration_hours", "total_price", "status", "created_at", "updated_at",
+    ),
+    "payments": (
+        "id", "booking_id", "payfast_payment_id", "amount", "platform_fee", "status", "created_at", "updated_at",
+    ),
+    "escrow_ledger": ("id", "booking_id", "payment_id", "event_type", "amount", "created_by", "created_at"),
+    "reviews": ("id", "booking_id", "reviewer_id", "artist_id", "rating", "comment", "created_at"),
+    "disputes": ("id", "booking_id", "reporter_id", "subject", "severity", "status", "created_at", "updated_at"),
+    "reliability_events": ("id", "user_id", "event_type", "booking_id", "metadata", "created_at"),
+    "messages": ("id", "sender_id", "receiver_id", "booking_id", "content", "is_read", "created_at"),
+    "artist_follows": ("id", "follower_user_id", "artist_id", "created_at"),
+    "artist_activities": (
+        "id", "artist_id", "author_user_id", "activity_type", "title", "location", "is_public",
+        "like_count", "comment_count", "created_at", "updated_at",
+    ),
+    "activity_likes": ("id", "activity_id", "user_id", "created_at"),
+    "activity_comments": ("id", "activity_id", "user_id", "body", "created_at"),
+    "gig_events": (
+        "id", "artist_id", "author_user_id", "slug", "title", "venue", "city", "starts_at",
+        "capacity", "status", "created_at", "updated_at",
+    ),
+    "gig_ticket_types": (
+        "id", "event_id", "name", "tier_kind", "price", "quantity_total", "quantity_sold",
+        "quantity_reserved", "sort_order", "created_at",
+    ),
+    "ticket_orders": (
+        "id", "event_id", "buyer_user_id", "status", "subtotal", "platform_fee", "total",
+        "buyer_email", "expires_at", "paid_at", "created_at", "updated_at",
+    ),
+    "ticket_order_items": ("id", "order_id", "ticket_type_id", "quantity", "unit_price", "line_total"),
+    "ticket_instances": (
+        "id", "order_id", "order_item_id", "event_id", "ticket_type_id", "ticket_code", "holder_email",
+        "status", "qr_payload", "created_at",
+    ),
+    "ticket_payments": (
+        "id", "ticket_order_id", "payfast_payment_id", "amount", "platform_fee", "status", "created_at", "updated_at",
+    ),
+    "gig_waitlist": ("id", "event_id", "user_id", "email", "quantity", "created_at"),
+    "content_live": ("id", "copy_json", "theme_json", "version", "published_at", "updated_at"),
+}
+
+CATEGORIES = ["DJ", "Amapiano", "Hip Hop", "Afropop", "Gospel", "Maskandi", "Gqom", "Photographer", "MC"]
+TOWNS = ["Johannesburg", "Pretoria", "Durban", "Cape Town", "Soweto", "Polokwane", "Gqeberha", "Bloemfontein"]
+ACTIVITY_TYPES = ["gig", "collaboration", "photoshoot", "studio", "travel", "press", "milestone", "custom"]
+TIERS = [("General", "general", 1.0), ("Early Bird", "early_bird", 0.7), ("VIP", "vip", 3.0)]
+CODE_CHARS = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+PLATFORM_FEE_RATE = 0.1
+
+EPOCH = 1_704_067_200  # 2024-01-01T00:00:00Z — fixed so output is reproducible
+SPAN = 2 * 365 * 86_400
+PASSWORD_HASH = "synthetic$not-a-real-hash"
+
+
+def iso(ts: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(ts))
+
+
+def key(prefix: str, i: int) -> str:
+    return f"{prefix}_{i:09d}"
+
+
+class Loader:
+    """Buffer rows per table and write them with executemany in batches."""
+
+    def __init__(self, conn: sqlite3.Connection, batch: int = 50_000, commit_every: int = 1_000_000):
+        self.conn = conn
+        self.batch = batch
+        self.commit_every = commit_every
+        self.buffers: dict[str, list[tuple]] = {}
+        self.counts: dict[str, int] = {}
+        self.since_commit = 0
+        self.sql = {
+            t: f"INSERT INTO {t} ({', '.join(c)}) VALUES ({', '.join('?' * len(c))})" for t, c in COLUMNS.items()
+        }
+        conn.execute("BEGIN")
+
+    def add(self, table: str, row: tuple) -> None:
+        buf = self.buffers.setdefault(table, [])
+        buf.append(row)
+        if len(buf) >= self.batch:
+            self.flush(table)
+
+    def flush(self, table: str) -> None:
+        rows = self.buffers.get(table)
+        if not rows:
+            return
+        self.conn.executemany(self.sql[table], rows)
+        self.counts[table] = self.counts.get(table, 0) + len(rows)
+        self.since_commit += len(rows)
+        rows.clear()
+        if self.since_commit >= self.commit_every:
+            self.conn.execute("COMMIT")
+            self.conn.execute("BEGIN")
+            self.since_commit = 0
+
+    def close(self) -> None:
+        for table in list(self.buffers):
+            self.flush(table)
+        self.conn.execute("COMMIT")
+
+
+class Synth:
+    def __init__(self, loader: Loader, scale: float, seed: int):
+        self.out = loader
+        self.rng = random.Random(seed)
+        self.n = {t: max(1, int(v * scale)) for t, v in VOLUMES.items()}
+        self.n["artist_profiles"] = min(self.n["artist_profiles"], self.n["users"] // 2)
+        self.n_artists = self.n["artist_profiles"]
+        self.n_users = self.n["users"]
+
+    # -- sampling helpers ----------------------------------------------------
+
+    def artist(self) -> int:
+        # Popularity is heavily skewed: a few artists get most bookings/follows.
+        return int(self.n_artists * self.rng.random() ** 3)
+
+    def client(self) -> int:
+        return self.rng.randrange(self.n_artists, self.n_users)
+
+    def ts(self, i: int, n: int) -> float:
+        """Timestamps increase with row number, with a little jitter."""
+        return EPOCH + SPAN * (i / n) + self.rng.random() * 3600
+
+    # -- families ------------------------------------------------------------
+
+    def users(self) -> None:
+        rng, out = self.rng, self.out
+        for i in range(self.n_users):
+            is_artist = i < self.n_artists
+            town = rng.choice(TOWNS)
+            created = iso(self.ts(i, self.n_users))
+            user_id = key("user", i)
+            out.add("users", (
+                user_id, f"user{i}@synthetic.gearsh.test", PASSWORD_HASH,
+                "artist" if is_artist else "client", f"First{i}", f"Last{i}",
+                f"Artist {i}" if is_artist else None, f"u{i}", town, "South Africa",
+                int(is_artist and rng.random() < 0.3), 1, created, created,
+            ))
+            if not is_artist:
+                continue
+            category = rng.choice(CATEGORIES)
+            rate = rng.choice([1500, 2500, 5000, 12000, 25000, 45000])
+            out.add("artist_profiles", (
+                key("artist", i), user_id, category, category, rate * 2, rate,
+                json.dumps([category, "Live Performance"]), round(3 + 2 * rng.random(), 2), 0, created, created,
+            ))
+        per_artist = self.n["services"] / self.n_artists
+        svc = 0
+        for a in range(self.n_artists):
+            for _ in range(max(1, int(per_artist + rng.random()))):
+                out.add("services", (
+                    key("svc", svc), key("artist", a), f"Service {svc}",
+                    rng.choice([1500, 3000, 8000, 20000]), rng.choice([1, 2, 3, 4]), iso(EPOCH),
+                ))
+                svc += 1
+        self.n["services"] = svc
+
+    def bookings(self) -> None:
+        rng, out = self.rng, self.out
+        n = self.n["bookings"]
+        statuses = ["completed"] * 55 + ["confirmed"] * 20 + ["pending"] * 12 + ["cancelled"] * 10 + ["disputed"] * 3
+        review = dispute = event = 0
+        for i in range(n):
+            a = self.artist()
+            client = self.client()
+            booking_id, payment_id = key("book", i), key("pay", i)
+            created_ts = self.ts(i, n)
+            created = iso(created_ts)
+            status = rng.choice(statuses)
+            price = float(rng.choice([1500, 3000, 5000, 8000, 15000, 45000]))
+            fee = round(price * PLATFORM_FEE_RATE, 2)
+            out.add("bookings", (
+                booking_id, key("user", client), key("artist", a), None,
+                iso(created_ts + rng.randrange(7, 120) * 86_400)[:10], "20:00", rng.choice(TOWNS),
+                "Private Event", 2, price, status, created, created,
+            ))
+            pay_status = "pending" if status == "pending" else "complete"
+            out.add("payments", (payment_id, booking_id, f"pf_{i}", price, fee, pay_status, created, created))
+            if pay_status == "complete":
+                out.add("escrow_ledger", (key("esc", 2 * i), booking_id, payment_id, "hold", price, "payfast", created))
+                settle = iso(created_ts + 30 * 86_400)
+                if status == "completed":
+                    out.add("escrow_ledger", (key("esc", 2 * i + 1), booking_id, payment_id, "release", price, "system", settle))
+                elif status == "cancelled":
+                    out.add("escrow_ledger", (key("esc", 2 * i + 1), booking_id, payment_id, "refund", price, "system", settle))
+
+            artist_user = key("user", a)
+            outcome = {
+                "completed": "booking_completed", "cancelled": "booking_cancelled", "disputed": "booking_disputed",
+            }.get(status)
+            if outcome:
+                out.add("reliability_events", (key("rix", event), artist_user, outcome, booking_id, None, created))
+                event += 1
+            if status == "completed":
+                arrival = "arrived_on_time" if rng.random() < 0.9 else "arrived_late"
+                out.add("reliability_events", (key("rix", event), artist_user, arrival, booking_id, None, created))
+                event += 1
+                if rng.random() < 0.3:
+                    out.add("reviews", (
+                        key("rev", review), booking_id, key("user", client), key("artist", a),
+                        rng.choice([3, 4, 4, 5, 5, 5]), "Great set", created,
+                    ))
+                    review += 1
+            elif status == "disputed":
+                out.add("disputes", (
+                    key("dsp", dispute), booking_id, key("user", client), "Service not delivered",
+                    "medium", "open", created, created,
+                ))
+                dispute += 1
+
+    def messages(self) -> None:
+        rng, out = self.rng, self.out
+        n, n_bookings = self.n["messages"], self.n["bookings"]
+        for i in range(n):
+            sender, receiver = self.client(), self.artist()
+            if rng.random() < 0.5:
+                sender, receiver = receiver, sender
+            booking = key("book", rng.randrange(n_bookings)) if rng.random() < 0.7 else None
+            out.add("messages", (
+                key("msg", i), key("user", sender), key("user", receiver), booking,
+                f"Message {i}", int(rng.random() < 0.8), iso(self.ts(i, n)),
+            ))
+
+    def activity(self) -> None:
+        rng, out = self.rng, self.out
+        n_follows = self.n["artist_follows"]
+        follows = 0
+        follower = self.n_artists
+        while follows < n_follows:
+            wanted = min(n_follows - follows, 1 + int(rng.expovariate(1 / 8)))
+            artists = {self.artist() for _ in range(wanted)}
+            for a in sorted(artists):
+                out.add("artist_follows", (
+                    key("fol", follows), key("user", follower), key("artist", a), iso(self.ts(follows, n_follows)),
+                ))
+                follows += 1
+            follower = follower + 1 if follower + 1 < self.n_users else self.n_artists
+
+        n_act = self.n["artist_activities"]
+        likes_per = self.n["activity_likes"] / n_act
+        comments_per = self.n["activity_comments"] / n_act
+        like = comment = 0
+        for i in range(n_act):
+            a = self.artist()
+            created_ts = self.ts(i, n_act)
+            activity_id = key("act", i)
+            likers = {self.client() for _ in range(int(rng.expovariate(1 / likes_per)))}
+            n_comments = int(rng.expovariate(1 / comments_per)) if comments_per else 0
+            out.add("artist_activities", (
+                activity_id, key("artist", a), key("user", a), rng.choice(ACTIVITY_TYPES), f"Update {i}",
+                rng.choice(TOWNS), int(rng.random() < 0.95), len(likers), n_comments,
+                iso(created_ts), iso(created_ts),
+            ))
+            for u in sorted(likers):
+                out.add("activity_likes", (key("lik", like), activity_id, key("user", u), iso(created_ts + 60)))
+                like += 1
+            for _ in range(n_comments):
+                out.add("activity_comments", (
+                    key("cmt", comment), activity_id, key("user", self.client()), "🔥", iso(created_ts + 120),
+                ))
+                comment += 1
+
+    def tickets(self) -> None:
+        rng, out = self.rng, self.out
+        n_events, n_orders = self.n["gig_events"], self.n["ticket_orders"]
+        types = []
+        for e in range(n_events):
+            a = self.artist()
+            starts = self.ts(e, n_events) + 30 * 86_400
+            event_id = key("gig", e)
+            out.add("gig_events", (
+                event_id, key("artist", a), key("user", a), f"gig-{e}", f"Gig {e}", "Venue", rng.choice(TOWNS),
+                iso(starts), 0, "published", iso(starts - 60 * 86_400), iso(starts - 60 * 86_400),
+            ))
+            for sort, (name, kind, mult) in enumerate(TIERS):
+                types.append((key("tt", len(types)), event_id, 150.0 * mult))
+                out.add("gig_ticket_types", (
+                    types[-1][0], event_id, name, kind, types[-1][2], 10_000, 0, 0, sort, iso(starts - 60 * 86_400),
+                ))
+
+        issued = set()
+        sold: dict[str, int] = {}
+        instance = 0
+        for o in range(n_orders):
+            type_id, event_id, price = types[int(len(types) * rng.random() ** 2)]
+            qty = rng.choice([1, 1, 1, 2, 2, 4])
+            created_ts = self.ts(o, n_orders)
+            status = rng.choices(["paid", "pending_payment", "expired", "cancelled"], [80, 8, 10, 2])[0]
+            subtotal = price * qty
+            fee = round(subtotal * PLATFORM_FEE_RATE, 2)
+            order_id, item_id = key("tord", o), key("titem", o)
+            out.add("ticket_orders", (
+                order_id, event_id, key("user", self.client()), status, subtotal, fee, subtotal + fee,
+                f"buyer{o}@synthetic.gearsh.test", iso(created_ts + 900),
+                iso(created_ts + 120) if status == "paid" else None, iso(created_ts), iso(created_ts),
+            ))
+            out.add("ticket_order_items", (item_id, order_id, type_id, qty, price, subtotal))
+            if status != "paid":
+                continue
+            sold[type_id] = sold.get(type_id, 0) + qty
+            out.add("ticket_payments", (
+                key("tpay", o), order_id, f"pft_{o}", subtotal + fee, fee, "complete",
+                iso(created_ts + 120), iso(created_ts + 120),
+            ))
+            for _ in range(qty):
+                code = "GRS-" + "".join(rng.choices(CODE_CHARS, k=8))
+                while code in issued:
+                    code = "GRS-" + "".join(rng.choices(CODE_CHARS, k=8))
+                issued.add(code)
+                payload = json.dumps({"v": 1, "code": code, "event_id": event_id, "order_id": order_id})
+                out.add("ticket_instances", (
+                    key("tix", instance), order_id, item_id, event_id, type_id, code,
+                    f"buyer{o}@synthetic.gearsh.test", "valid", payload, iso(created_ts + 120),
+                ))
+                instance += 1
+        self.out.flush("gig_ticket_types")
+        self.out.conn.executemany(
+            "UPDATE gig_ticket_types SET quantity_sold = ? WHERE id = ?", [(q, t) for t, q in sold.items()]
+        )
+
+        n_wait = self.n["gig_waitlist"]
+        for w in range(n_wait):
+            user = self.client()
+            out.add("gig_waitlist", (
+                key("wait", w), key("gig", rng.randrange(n_events)), key("user", user),
+                f"user{user}@synthetic.gearsh.test", rng.choice([1, 2]), iso(self.ts(w, n_wait)),
+            ))
+
+    def content(self) -> None:
+        self.out.add("content_live", ("live", json.dumps({"hero": "Book SA talent"}), "{}", 1, iso(EPOCH), iso(EPOCH)))
+
+
+def secondary_indexes(conn: sqlite3.Connection, tables: set[str]) -> list[tuple[str, str]]:
+    rows = conn.execute(
+        "SELECT name, tbl_name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ).fetchall()
+    return [(name, sql) for name, table, sql in rows if table in tables]
+
+
+def generate(db: Path | str, scale: float = 0.01, seed: int = 7, only: list[str] | None = None,
+             defer_indexes: bool = True, quiet: bool = False) -> dict[str, int]:
+    """Build the replica at ``db`` and load it; returns rows written per table."""
+    conn = build_replica(db, bulk=True)
+    families = only or list(FAMILIES)
+    tables = {t for f in families for t in FAMILIES[f]}
+    conn.execute("PRAGMA foreign_keys = OFF")  # rows are consistent by construction
+
+    dropped = secondary_indexes(conn, tables) if defer_indexes else []
+    for name, _ in dropped:
+        conn.execute(f"DROP INDEX {name}")
+
+    loader = Loader(conn)
+    synth = Synth(loader, scale, seed)
+    started = time.perf_counter()
+    for family in FAMILIES:
+        if family not in families:
+            continue
+        t0 = time.perf_counter()
+        before = sum(loader.counts.values())
+        getattr(synth, family)()
+        for table in FAMILIES[family]:
+            loader.flush(table)
+        rows = sum(loader.counts.values()) - before
+        elapsed = time.perf_counter() - t0
+        if not quiet:
+            print(f"  {family:9} {rows:>12,} rows  {elapsed:7.1f}s  {rows / max(elapsed, 1e-9):>10,.0f} rows/s")
+    loader.close()
+
+    t0 = time.perf_counter()
+    for _, sql in dropped:
+        conn.execute(sql)
+    conn.execute("ANALYZE")
+    conn.close()
+    total = sum(loader.counts.values())
+    if not quiet:
+        print(f"  indexes   {len(dropped):>12} rebuilt  {time.perf_counter() - t0:7.1f}s")
+        elapsed = time.perf_counter() - started
+        print(f"Loaded {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s) -> {db}")
+    return loader.counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True)
+    parser.add_argument("--scale", type=float, default=0.01, help="1.0 = 1M users / 10M bookings")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--only", choices=sorted(FAMILIES), action="append")
+    parser.add_argument("--keep-indexes", action="store_true", help="load with indexes in place")
+    parser.add_argument("--fresh", action="store_true", help="delete --db first")
+    args = parser.parse_args()
+
+    if args.fresh:
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            Path(f"{args.db}{suffix}").unlink(missing_ok=True)
+    generate(args.db, args.scale, args.seed, args.only, not args.keep_indexes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""Replay a flash-sale ticket drop against a local SQLite stand-in.
+
+    python scripts/ticket-sim.py                              # all strategies, 5k buyers
+    python scripts/ticket-sim.py --buyers 20000 --threads 64 --strategy atomic
+    python scripts/ticket-sim.py --capacity 500 --pay-rate 0.6 --ttl 0.5 --json
+
+Buyer threads run reserve -> (think) -> pay, or abandon, against a fresh
+replica built by migrate.py. An expirer thread releases stale
+pending_payment orders the way expireStaleOrders() in
+functions/api/tickets-utils.js does. Connections use busy_timeout=0 and an
+explicit retry loop, so every lock wait is counted and timed.
+
+Strategies:
+  naive   read availability, then write quantity_reserved (check-then-act)
+  js      the current functions flow: a conditional UPDATE per item, separate
+          statements for the order, and a fulfil step that does not recheck
+          the order status
+  atomic  reserve and order in one BEGIN IMMEDIATE transaction; paying is a
+          compare-and-set from pending_payment, and a late payment re-reserves
+          or is refunded
+
+Reported per strategy: throughput, p50/p99 latency per step, lock waits,
+tickets sold beyond quantity_total (oversell), and quantity_reserved drift
+against the pending orders.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from migrate import build_replica
+
+STRATEGIES = ("naive", "js", "atomic")
+ROOT = Path(__file__).resolve().parents[1]
+OUT_DIR = ROOT / "bench-results"
+
+
+def iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency: dict[str, list[float]] = defaultdict(list)
+        self.counts: dict[str, int] = defaultdict(int)
+        self.lock_waits = 0
+        self.lock_wait_s = 0.0
+
+    def time(self, step: str, seconds: float) -> None:
+        with self.lock:
+            self.latency[step].append(seconds * 1000)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self.lock:
+            self.counts[name] += n
+
+    def waited(self, seconds: float) -> None:
+        with self.lock:
+            self.lock_waits += 1
+            self.lock_wait_s += seconds
+
+
+class Sim:
+    def __init__(self, db: Path, strategy: str, ttl: float, metrics: Metrics):
+        self.db = db
+        self.strategy = strategy
+        self.ttl = ttl
+        self.metrics = metrics
+        self.local = threading.local()
+        self.ids = 0
+        self.id_lock = threading.Lock()
+
+    def conn(self) -> sqlite3.Connection:
+        if not hasattr(self.local, "conn"):
+            conn = sqlite3.connect(str(self.db), isolation_level=None, timeout=0, check_same_thread=False)
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self.local.conn = conn
+        return self.local.conn
+
+    def new_id(self, prefix: str) -> str:
+        with self.id_lock:
+            self.ids += 1
+            return f"{prefix}_{self.ids:08d}"
+
+    def retry(self, fn):
+        """Run ``fn(conn)``; SQLITE_BUSY is retried with backoff and counted as a lock wait."""
+        conn = self.conn()
+        delay = 0.0005
+        while True:
+            try:
+                return fn(conn)
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) and "busy" not in str(e):
+                    raise
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                started = time.perf_counter()
+                time.sleep(delay * random.random())
+                delay = min(delay * 2, 0.05)
+                self.metrics.waited(time.perf_counter() - started)
+
+    def txn(self, fn):
+        def run(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return result
+
+        return self.retry(run)
+
+    # -- reserve ---------------------------------------------------------------
+
+    def reserve(self, buyer: str, event: str, items: list[tuple[str, int, float]]) -> str | None:
+        return getattr(self, f"reserve_{self.strategy}")(buyer, event, items)
+
+    def _order_rows(self, conn, order: str, buyer: str, event: str, items) -> None:
+        now = time.time()
+        subtotal = sum(q * p for _, q, p in items)
+        conn.execute(
+            "INSERT INTO ticket_orders (id, event_id, buyer_user_id, status, subtotal, total, expires_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, 'pending_payment', ?, ?, ?, ?, ?)",
+            (order, event, buyer, subtotal, subtotal, iso(now + self.ttl), iso(now), iso(now)),
+        )
+        conn.executemany(
+            "INSERT INTO ticket_order_items (id, order_id, ticket_type_id, quantity, unit_price, line_total) VALUES (?, ?, ?, ?, ?, ?)",
+            [(self.new_id("ordi"), order, t, q, p, q * p) for t, q, p in items],
+        )
+
+    def reserve_naive(self, buyer, event, items):
+        taken = []
+        for type_id, qty, _ in items:
+            row = self.retry(lambda c: c.execute(
+                "SELECT quantity_total - quantity_sold - quantity_reserved, quantity_reserved FROM gig_ticket_types WHERE id = ?",
+                (type_id,),
+            ).fetchone())
+            if row[0] < qty:
+                self._release(taken)
+                return None
+            self.retry(lambda c: c.execute(
+                "UPDATE gig_ticket_types SET quantity_reserved = ? WHERE id = ?", (row[1] + qty, type_id)
+            ))
+            taken.append((type_id, qty))
+        order = self.new_id("tord")
+        self.txn(lambda c: self._order_rows(c, order, buyer, event, items))
+        return order
+
+    def reserve_js(self, buyer, event, items):
+        taken = []
+        for type_id, qty, _ in items:
+            changed = self.retry(lambda c: c.execute(
+                "UPDATE gig_ticket_types SET quantity_reserved = quantity_reserved + ? "
+                "WHERE id = ? AND is_active = 1 AND (quantity_sold + quantity_reserved + ?) <= quantity_total",
+                (qty, type_id, qty),
+            ).rowcount)
+            if changed != 1:
+                self._release(taken)
+                return None
+            taken.append((type_id, qty))
+        order = self.new_id("tord")
+        self.retry(lambda c: self._order_rows(c, order, buyer, event, items))
+        return order
+
+    def reserve_atomic(self, buyer, event, items):
+        order = self.new_id("tord")
+
+        def run(conn):
+            for type_id, qty, _ in items:
+                cur = conn.execute(
+                    "UPDATE gig_ticket_types SET quantity_reserved = quantity_reserved + ? "
+                    "WHERE id = ? AND is_active = 1 AND (quantity_sold + quantity_reserved + ?) <= quantity_total",
+                    (qty, type_id, qty),
+                )
+                if cur.rowcount != 1:
+                    raise _SoldOut
+            self._order_rows(conn, order, buyer, event, items)
+            return order
+
+        try:
+            return self.txn(run)
+        except _SoldOut:
+            return None
+
+    def _release(self, taken) -> None:
+        for type_id, qty in taken:
+            self.retry(lambda c: c.execute(
+                "UPDATE gig_ticket_types SET quantity_reserved = CASE WHEN quantity_reserved - ? < 0 THEN 0 "
+                "ELSE quantity_reserved - ? END WHERE id = ?",
+                (qty, qty, type_id),
+            ))
+
+    # -- pay -------------------------------------------------------------------
+
+    def pay(self, order: str) -> str:
+        if self.strategy == "atomic":
+            return self.pay_atomic(order)
+        return self.pay_js(order)
+
+    def pay_js(self, order):
+        # fulfillTicketOrder: returns early only if already paid
+        status = self.retry(lambda c: c.execute("SELECT status FROM ticket_orders WHERE id = ?", (order,)).fetchone()[0])
+        if status == "paid":
+            return "already"
+        items = self.retry(lambda c: c.execute(
+            "SELECT ticket_type_id, quantity FROM ticket_order_items WHERE order_id = ?", (order,)
+        ).fetchall())
+        for type_id, qty in items:
+            self.retry(lambda c: c.execute(
+                "UPDATE gig_ticket_types SET quantity_sold = quantity_sold + ?, quantity_reserved = CASE WHEN "
+                "quantity_reserved - ? < 0 THEN 0 ELSE quantity_reserved - ? END WHERE id = ?",
+                (qty, qty, qty, type_id),
+            ))
+        self.retry(lambda c: c.execute(
+            "UPDATE ticket_orders SET status = 'paid', paid_at = ?, updated_at = ? WHERE id = ?",
+            (iso(time.time()), iso(time.time()), order),
+        ))
+        return "paid_after_expiry" if status == "expired" else "paid"
+
+    def pay_atomic(self, order):
+        def run(conn):
+            now = iso(time.time())
+            items = conn.execute(
+                "SELECT ticket_type_id, quantity FROM ticket_order_items WHERE order_id = ?", (order,)
+            ).fetchall()
+            if conn.execute(
+                "UPDATE ticket_orders SET status = 'paid', paid_at = ?, updated_at = ? WHERE id = ? AND status = 'pending_payment'",
+                (now, now, order),
+            ).rowcount == 1:
+                for type_id, qty in items:
+                    conn.execute(
+                        "UPDATE gig_ticket_types SET quantity_sold = quantity_sold + ?, quantity_reserved = quantity_reserved - ? WHERE id = ?",
+                        (qty, qty, type_id),
+                    )
+                return "paid"
+            # Expired under us: take fresh inventory if there is any, otherwise refund
+            for type_id, qty in items:
+                if conn.execute(
+                    "UPDATE gig_ticket_types SET quantity_sold = quantity_sold + ? "
+                    "WHERE id = ? AND (quantity_sold + quantity_reserved + ?) <= quantity_total",
+                    (qty, type_id, qty),
+                ).rowcount != 1:
+                    raise _SoldOut
+            conn.execute(
+                "UPDATE ticket_orders SET status = 'paid', paid_at = ?, updated_at = ? WHERE id = ?", (now, now, order)
+            )
+            return "paid_after_expiry"
+
+        try:
+            return self.txn(run)
+        except _SoldOut:
+            self.retry(lambda c: c.execute(
+                "UPDATE ticket_orders SET status = 'refunded', updated_at = ? WHERE id = ?", (iso(time.time()), order)
+            ))
+            return "refunded"
+
+    # -- expire ----------------------------------------------------------------
+
+    def expire(self) -> int:
+        now = iso(time.time())
+        if self.strategy == "atomic":
+            def run(conn):
+                stale = conn.execute(
+                    "UPDATE ticket_orders SET status = 'expired', updated_at = ? "
+                    "WHERE status = 'pending_payment' AND expires_at < ? RETURNING id",
+                    (now, now),
+                ).fetchall()
+                conn.execute(
+                    "UPDATE gig_ticket_types SET quantity_reserved = quantity_reserved - IFNULL(("
+                    "  SELECT SUM(oi.quantity) FROM ticket_order_items oi JOIN json_each(?) j ON j.value = oi.order_id"
+                    "  WHERE oi.ticket_type_id = gig_ticket_types.id), 0)",
+                    (json.dumps([s[0] for s in stale]),),
+                )
+                return len(stale)
+
+            return self.txn(run)
+        # expireStaleOrders: release per row, then one UPDATE — not atomic
+        stale = self.retry(lambda c: c.execute(
+            "SELECT o.id, oi.ticket_type_id, oi.quantity FROM ticket_orders o JOIN ticket_order_items oi ON oi.order_id = o.id "
+            "WHERE o.status = 'pending_payment' AND o.expires_at IS NOT NULL AND o.expires_at < ?",
+            (now,),
+        ).fetchall())
+        self._release([(t, q) for _, t, q in stale])
+        return self.retry(lambda c: c.execute(
+            "UPDATE ticket_orders SET status = 'expired', updated_at = ? "
+            "WHERE status = 'pending_payment' AND expires_at IS NOT NULL AND expires_at < ?",
+            (now, now),
+        ).rowcount)
+
+
+class _SoldOut(Exception):
+    pass
+
+
+def setup(db: Path, buyers: int, tiers: list[tuple[str, int, float]]) -> tuple[str, list[tuple[str, float]], list[str]]:
+    conn = build_replica(db)
+    now = iso(time.time())
+    conn.execute("BEGIN")
+    conn.execute(
+        "INSERT INTO users (id, email, password_hash, user_type, first_name, last_name, username, created_at) "
+        "VALUES ('user_artist', 'artist@sim.test', '-', 'artist', 'Sim', 'Artist', 'simartist', ?)",
+        (now,),
+    )
+    conn.execute("INSERT INTO artist_profiles (id, user_id, category) VALUES ('artist_sim', 'user_artist', 'DJ')")
+    conn.execute(
+        "INSERT INTO gig_events (id, artist_id, author_user_id, slug, title, venue, city, starts_at, status) "
+        "VALUES ('gig_sim', 'artist_sim', 'user_artist', 'sim-drop', 'Flash sale', 'Venue', 'Johannesburg', ?, 'published')",
+        (now,),
+    )
+    types = []
+    for i, (name, quantity, price) in enumerate(tiers):
+        type_id = f"tt_{i}"
+        conn.execute(
+            "INSERT INTO gig_ticket_types (id, event_id, name, price, quantity_total, sort_order) VALUES (?, 'gig_sim', ?, ?, ?, ?)",
+            (type_id, name, price, quantity, i),
+        )
+        types.append((type_id, price))
+    users = [f"user_b{i:06d}" for i in range(buyers)]
+    conn.executemany(
+        "INSERT INTO users (id, email, password_hash, user_type, first_name, last_name, username, created_at) "
+        "VALUES (?, ? || '@sim.test', '-', 'client', 'Buyer', 'Sim', ?, ?)",
+        [(u, u, u, now) for u in users],
+    )
+    conn.execute("COMMIT")
+    conn.close()
+    return "gig_sim", types, users
+
+
+def percentile(samples: list[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def run(strategy: str, args) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix="gearsh-ticket-sim-"))
+    db = workdir / "sim.sqlite"
+    tiers = [("General", args.capacity, 150.0), ("VIP", max(1, args.capacity // 10), 600.0)]
+    event, types, users = setup(db, args.buyers, tiers)
+    metrics = Metrics()
+    sim = Sim(db, strategy, args.ttl, metrics)
+    rng = random.Random(args.seed)
+    plans = [
+        (
+            user,
+            [(t, rng.choice([1, 1, 2, 2, 4]), p) for t, p in (types if rng.random() < 0.2 else types[:1])],
+            rng.random() < args.pay_rate,
+            rng.random() * args.think,
+        )
+        for user in users
+    ]
+
+    stop = threading.Event()
+
+    def expirer():
+        while not stop.is_set():
+            started = time.perf_counter()
+            n = sim.expire()
+            metrics.time("expire", time.perf_counter() - started)
+            metrics.count("expired", n)
+            stop.wait(args.sweep)
+
+    def buyer(plan):
+        user, items, pays, think = plan
+        started = time.perf_counter()
+        order = sim.reserve(user, event, items)
+        metrics.time("reserve", time.perf_counter() - started)
+        if order is None:
+            metrics.count("sold_out")
+            return
+        metrics.count("reserved")
+        if not pays:
+            metrics.count("abandoned")
+            return
+        time.sleep(think)
+        started = time.perf_counter()
+        outcome = sim.pay(order)
+        metrics.time("pay", time.perf_counter() - started)
+        metrics.count(outcome)
+
+    sweeper = threading.Thread(target=expirer, daemon=True)
+    sweeper.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        list(pool.map(buyer, plans))
+    elapsed = time.perf_counter() - started
+    time.sleep(args.ttl)
+    stop.set()
+    sweeper.join()
+    sim.expire()
+
+    conn = sqlite3.connect(str(db))
+    oversold = conn.execute(
+        "SELECT IFNULL(SUM(sold - total), 0), COUNT(*) FROM ("
+        "  SELECT t.quantity_total AS total, IFNULL(SUM(oi.quantity), 0) AS sold"
+        "  FROM gig_ticket_types t LEFT JOIN ticket_order_items oi ON oi.ticket_type_id = t.id"
+        "  LEFT JOIN ticket_orders o ON o.id = oi.order_id AND o.status = 'paid'"
+        "  WHERE o.id IS NOT NULL OR oi.id IS NULL GROUP BY t.id) WHERE sold > total"
+    ).fetchone()
+    drift = conn.execute(
+        "SELECT IFNULL(SUM(ABS(t.quantity_reserved - IFNULL(p.qty, 0))), 0) FROM gig_ticket_types t LEFT JOIN ("
+        "  SELECT oi.ticket_type_id, SUM(oi.quantity) AS qty FROM ticket_order_items oi"
+        "  JOIN ticket_orders o ON o.id = oi.order_id AND o.status = 'pending_payment' GROUP BY oi.ticket_type_id"
+        ") p ON p.ticket_type_id = t.id"
+    ).fetchone()[0]
+    sold = conn.execute("SELECT SUM(quantity_sold), SUM(quantity_total) FROM gig_ticket_types").fetchone()
+    conn.close()
+
+    steps = {
+        step: {"n": len(ms), "p50_ms": round(percentile(ms, 0.5), 3), "p99_ms": round(percentile(ms, 0.99), 3)}
+        for step, ms in sorted(metrics.latency.items())
+    }
+    return {
+        "strategy": strategy,
+        "buyers": args.buyers,
+        "threads": args.threads,
+        "elapsed_s": round(elapsed, 3),
+        "buyers_per_s": round(args.buyers / elapsed, 1),
+        "steps": steps,
+        "lock_waits": metrics.lock_waits,
+        "lock_wait_s": round(metrics.lock_wait_s, 3),
+        "outcomes": dict(sorted(metrics.counts.items())),
+        "capacity": sold[1],
+        "quantity_sold": sold[0],
+        "oversold_tickets": oversold[0],
+        "oversold_tiers": oversold[1],
+        "reserved_drift": drift,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strategy", choices=STRATEGIES, action="append", help="default: all")
+    parser.add_argument("--buyers", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=32, help="concurrent buyers")
+    parser.add_argument("--capacity", type=int, default=1000, help="General tickets (VIP is a tenth)")
+    parser.add_argument("--pay-rate", type=float, default=0.7, help="share of reservations that pay")
+    parser.add_argument("--think", type=float, default=1.0, help="max seconds between reserve and pay")
+    parser.add_argument("--ttl", type=float, default=0.6, help="seconds a reservation is held (15 min in production)")
+    parser.add_argument("--sweep", type=float, default=0.1, help="seconds between expiry sweeps")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="also write bench-results/ticket-sim-<stamp>.json")
+    args = parser.parse_args()
+
+    results = []
+    for strategy in args.strategy or STRATEGIES:
+        result = run(strategy, args)
+        results.append(result)
+        steps = "  ".join(f"{s} p50 {v['p50_ms']:.2f}/p99 {v['p99_ms']:.2f}ms" for s, v in result["steps"].items())
+        print(
+            f"{strategy:7} {result['buyers_per_s']:>8,.0f} buyers/s  sold {result['quantity_sold']}/{result['capacity']}  "
+            f"oversold {result['oversold_tickets']}  reserved drift {result['reserved_drift']}  "
+            f"lock waits {result['lock_waits']:,} ({result['lock_wait_s']:.2f}s)"
+        )
+        print(f"        {steps}")
+        print(f"        {', '.join(f'{k} {v:,}' for k, v in result['outcomes'].items())}")
+    if args.json:
+        OUT_DIR.mkdir(parents=True, exist_ok=True)
+        out = OUT_DIR / f"ticket-sim-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        out.write_text(json.dumps({"args": vars(args), "results": results}, indent=2) + "\n", encoding="utf-8")
+        print(f"-> {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@
 import re
 from pathlib import Path
 
+from profiling import configure, traced
+
 ROOT = Path(__file__).resolve().parents[1]
 
 VERIFIED_RATES = {
@@ -75,6 +77,7 @@ def tier_rate(mastery_hours: int) -> int:
     return 12000
 
 
+@traced()
 def patch_file(path: Path) -> int:
     text = path.read_text(encoding="utf-8")
     pattern = re.compile(
@@ -109,6 +112,7 @@ def patch_file(path: Path) -> int:
 
 
 def main() -> None:
+    configure()
     targets = [
         ROOT / "functions" / "api" / "sa-showcase-data.js",
         ROOT / "web" / "sa-showcase-data.js",
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Watch artist images and showcase sources, rebuilding only what changed.
+
+    python scripts/watch-assets.py            # watchdog (inotify) if installed
+    python scripts/watch-assets.py --poll 1   # mtime polling fallback
+
+File events are debounced into batches. Each batch walks a small dependency
+graph — resize -> placeholders, and placeholders or an edit to
+functions/api/sa-showcase-data.js -> sync -> previews, atlas and prerender —
+and only runs the stages (and atlas rows, and profiles) the changed files
+actually affect.
+
+generate-sa-showcase.py and update-showcase-rates.py are never run from here:
+sa-showcase-data.js is curated by hand after the generator runs, and
+regenerating it would drop listings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from PIL import Image
+
+import atlas
+import lqip
+from imaging import ARTISTS_DIR, is_image, list_images
+from showcase import API_DATA, ROOT, load_artists, load_script
+
+SYNC = ROOT / "scripts" / "sync-showcase-data.mjs"
+TARGET_PX = 400
+
+# stage -> stages that consume its output
+GRAPH = {
+    "resize": ("placeholders",),
+    "placeholders": ("previews", "atlas", "prerender"),
+    "sync": ("previews", "atlas", "prerender"),
+    "previews": (),
+    "atlas": (),
+    "prerender": (),
+}
+ORDER = ("resize", "placeholders", "sync", "previews", "atlas", "prerender")
+
+
+@dataclass
+class Batch:
+    images: set[Path] = field(default_factory=set)
+    stages: set[str] = field(default_factory=set)
+
+
+def digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+class Pipeline:
+    def __init__(self) -> None:
+        self.resizer = load_script(ROOT / "resize_images.py")
+        self.prerender = load_script(ROOT / "scripts" / "prerender-showcase.py")
+        # Content we wrote ourselves; events carrying it are echoes, not edits.
+        self.known: dict[Path, str] = {p: digest(p) for p in list_images()}
+        self.known[API_DATA] = digest(API_DATA)
+
+    def classify(self, paths: set[Path]) -> Batch:
+        batch = Batch()
+        for path in paths:
+            if not path.exists():
+                if path.parent == ARTISTS_DIR and self.known.pop(path, None):
+                    batch.stages.add("placeholders")
+                continue
+            if path.parent == ARTISTS_DIR and is_image(path):
+                if self.known.get(path) != digest(path):
+                    batch.images.add(path)
+                    batch.stages.add("resize")
+            elif path == API_DATA and self.known.get(path) != digest(path):
+                batch.stages.add("sync")
+        return batch
+
+    def plan(self, batch: Batch) -> list[str]:
+        pending = set(batch.stages)
+        frontier = list(pending)
+        while frontier:
+            for nxt in GRAPH[frontier.pop()]:
+                if nxt not in pending:
+                    pending.add(nxt)
+                    frontier.append(nxt)
+        if batch.images and "sync" not in batch.stages:
+            # New photos nobody references yet only need their placeholder.
+            names = {p.name for p in batch.images}
+            if not any(Path(a.get("image", "")).name in names for a in load_artists()):
+                pending -= {"previews", "atlas", "prerender"}
+        return [stage for stage in ORDER if stage in pending]
+
+    def run(self, batch: Batch) -> None:
+        stages = self.plan(batch)
+        if not stages:
+            return
+        started = time.perf_counter()
+        timings = []
+        for stage in stages:
+            t0 = time.perf_counter()
+            ok = getattr(self, f"stage_{stage}")(batch)
+            timings.append(f"{stage} {1000 * (time.perf_counter() - t0):.0f}ms{'' if ok else ' (failed)'}")
+            if not ok:
+                break
+        self.known[API_DATA] = digest(API_DATA)
+        total = 1000 * (time.perf_counter() - started)
+        print(f"rebuild {total:.0f}ms: " + ", ".join(timings), flush=True)
+
+    def stage_resize(self, batch: Batch) -> bool:
+        for path in sorted(batch.images):
+            with Image.open(path) as img:
+                needs_resize = img.size != (TARGET_PX, TARGET_PX)
+            if needs_resize and not self.resizer.resize_image(path, path, size=TARGET_PX):
+                continue
+            self.known[path] = digest(path)
+        return True
+
+    def stage_placeholders(self, batch: Batch) -> bool:
+        manifest = lqip.load_manifest()
+        live = {p.name for p in list_images()}
+        for name in [n for n in manifest if n not in live]:
+            del manifest[name]
+        lqip.update_manifest(sorted(p for p in batch.images if p.exists()), manifest)
+        lqip.write_manifest(manifest)
+        return True
+
+    def stage_previews(self, batch: Batch) -> bool:
+        lqip.write_showcase_previews(lqip.load_manifest())
+        return True
+
+    def stage_sync(self, batch: Batch) -> bool:
+        return self._exec(["node", str(SYNC)])
+
+    def stage_atlas(self, batch: Batch) -> bool:
+        # Row keys cover artists and image bytes, so only affected rows repack.
+        atlas.build()
+        return True
+
+    def stage_prerender(self, batch: Batch) -> bool:
+        # Profile keys cover the exported profile and photo bytes, so only changed artists re-render.
+        self.prerender.build(None, False)
+        return True
+
+    @staticmethod
+    def _exec(cmd: list[str]) -> bool:
+        try:
+            result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+        except FileNotFoundError as e:
+            print(f"  {cmd[0]} not found: {e}")
+            return False
+        if result.returncode != 0:
+            print(f"  {' '.join(cmd[:2])} failed:\n{result.stderr.strip()}")
+        return result.returncode == 0
+
+
+class Debouncer:
+    """Collect paths and flush them once no event has arrived for ``delay`` seconds."""
+
+    def __init__(self, delay: float, flush) -> None:
+        self.delay = delay
+        self.flush = flush
+        self.paths: set[Path] = set()
+        self.lock = threading.Lock()
+        self.timer: threading.Timer | None = None
+
+    def add(self, path: Path) -> None:
+        with self.lock:
+            self.paths.add(path)
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.delay, self._fire)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _fire(self) -> None:
+        with self.lock:
+            paths, self.paths = self.paths, set()
+        self.flush(paths)
+
+
+def watch_paths() -> list[Path]:
+    return [ARTISTS_DIR, API_DATA.parent]
+
+
+def snapshot() -> dict[Path, int]:
+    files = list_images() + [API_DATA]
+    return {p: p.stat().st_mtime_ns for p in files if p.exists()}
+
+
+def poll(debouncer: Debouncer, interval: float) -> None:
+    before = snapshot()
+    while True:
+        time.sleep(interval)
+        after = snapshot()
+        for path in set(before) | set(after):
+            if before.get(path) != after.get(path):
+                debouncer.add(path)
+        before = after
+
+
+def observe(debouncer: Debouncer) -> bool:
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return False
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            if event.is_directory:
+                return
+            for attr in ("src_path", "dest_path"):
+                raw = getattr(event, attr, "")
+                if raw:
+                    debouncer.add(Path(raw).resolve())
+
+    observer = Observer()
+    for directory in watch_paths():
+        observer.schedule(Handler(), str(directory), recursive=False)
+    observer.start()
+    try:
+        while observer.is_alive():
+            observer.join(1)
+    finally:
+        observer.stop()
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debounce", type=float, default=0.5, help="quiet period in seconds")
+    parser.add_argument("--poll", type=float, metavar="SECONDS", help="force mtime polling")
+    args = parser.parse_args()
+
+    pipeline = Pipeline()
+    lock = threading.Lock()
+
+    def flush(paths: set[Path]) -> None:
+        with lock:
+            try:
+                pipeline.run(pipeline.classify(paths))
+            except Exception as e:
+                print(f"rebuild failed: {e}", flush=True)
+
+    debouncer = Debouncer(args.debounce, flush)
+    print(f"Watching {', '.join(str(p.relative_to(ROOT)) for p in watch_paths())} (Ctrl+C to stop)")
+    try:
+        if args.poll is not None or not observe(debouncer):
+            print(f"  polling every {args.poll or 1.0}s")
+            poll(debouncer, args.poll or 1.0)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+if __name__ == "__main__":
+    main()
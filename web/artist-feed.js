@@ -377,6 +377,12 @@
     });
   }
 
+  // ~20px preview from scripts/lqip.py, painted behind the lazy image until it loads
+  function previewStyle(image) {
+    if (typeof SHOWCASE_PREVIEWS === 'undefined' || !SHOWCASE_PREVIEWS[image]) return '';
+    return ' style="background-image:url(\'' + SHOWCASE_PREVIEWS[image] + '\')"';
+  }
+
   function lazyImgTag(src, alt) {
     return '<img src="' + PLACEHOLDER + '" data-src="' + escapeHtml(src) + '" alt="' + escapeHtml(alt) + '" loading="lazy" decoding="async" class="lazy-img" width="168" height="168">';
   }
@@ -394,7 +400,7 @@
     }
 
     var inner =
-      '<div class="feed-card-media">' +
+      '<div class="feed-card-media"' + previewStyle(item.image) + '>' +
         lazyImgTag(item.image, item.name) +
         '<span class="feed-card-badge ' + item.badgeClass + '">' + escapeHtml(item.badge) + '</span>' +
         (item.bookable && href
@@ -451,11 +457,34 @@
     '</section>';
   }
 
+  // Avatar tile in the genre row's sprite sheet (scripts/atlas.py), as a CSS background
+  // sized in percent so it scales with the element. Only while the card still shows the
+  // showcase image the sheet was cut from.
+  function atlasTileStyle(item) {
+    if (typeof SHOWCASE_ATLAS === 'undefined' || !item.username) return '';
+    var row = SHOWCASE_ATLAS.rows[item.genreSlug];
+    var tile = row && row.artists[item.username];
+    var record = tile && findShowcaseRecord(item);
+    if (!record || record.image !== item.image) return '';
+    var sheet = row.sheets[tile[0]];
+    var size = SHOWCASE_ATLAS.size;
+    function pct(offset, extent) {
+      return extent > size ? (offset / (extent - size)) * 100 : 0;
+    }
+    return 'background-image:url(\'' + sheet.src + '\');' +
+      'background-size:' + (sheet.width / size) * 100 + '% ' + (sheet.height / size) * 100 + '%;' +
+      'background-position:' + pct(tile[1], sheet.width) + '% ' + pct(tile[2], sheet.height) + '%';
+  }
+
   function renderStory(item) {
     if (!item.image || !item.name) return '';
     var href = bookUrl(item) || '#cat-mastery-legends';
+    var tileStyle = atlasTileStyle(item);
+    var avatar = tileStyle
+      ? '<span class="story-avatar" role="img" aria-label="' + escapeHtml(item.name) + '" style="' + tileStyle + '"></span>'
+      : lazyImgTag(item.image, item.name);
     return '<a class="story-item" href="' + href + '">' +
-      '<div class="story-ring">' + lazyImgTag(item.image, item.name) + '</div>' +
+      '<div class="story-ring">' + avatar + '</div>' +
       '<span class="story-name">' + escapeHtml(item.name) + '</span></a>';
   }
 
@@ -0,0 +1,3 @@
+// Auto-generated by scripts/atlas.py — avatar sprite sheets per genre row
+// SHOWCASE_ATLAS.rows[genreSlug].artists[username] = [sheetIndex, x, y]
+var SHOWCASE_ATLAS = {"size":96,"rows":{"afropop":{"sheets":[{"src":"assets/atlas/afropop-0.webp?v=a3c8d7d01b","width":880,"height":96}],"artists":{"tyla":[0,0,0],"makhadzi":[0,98,0],"sjava":[0,196,0],"lloyiso":[0,294,0],"blaq-diamond":[0,392,0],"elaine":[0,490,0],"shekhinah":[0,490,0],"nomfundo-moh":[0,490,0],"azana":[0,490,0],"mlindo-the-vocalist":[0,490,0],"lwah-ndlunkulu":[0,490,0],"mafikizolo":[0,490,0],"the-soil":[0,490,0],"nomcebo-zikode":[0,490,0],"kelly-khumalo":[0,490,0],"q-twins":[0,490,0],"megan-woods":[0,490,0],"empress-ngqama":[0,588,0],"scotts-maphuma":[0,686,0],"oxii-moron":[0,784,0]}},"amapiano":{"sheets":[{"src":"assets/atlas/amapiano-0.webp?v=1546bd17b3","width":978,"height":292}],"artists":{"kabza-de-small":[0,0,0],"dj-maphorisa":[0,98,0],"uncle-waffles":[0,196,0],"focalistic":[0,294,0],"kelvin-momo":[0,392,0],"tyler-icu":[0,490,0],"mr-jazziq":[0,588,0],"major-league-djz":[0,686,0],"vigro-deep":[0,784,0],"young-stunna":[0,882,0],"sir-trill":[0,882,0],"felo-le-tee":[0,0,98],"de-mthuda":[0,882,0],"busta-929":[0,98,98],"mellow-sleazy":[0,196,98],"mawhoo":[0,294,98],"aymos":[0,392,98],"simmy":[0,882,0],"pabi-cooper":[0,490,98],"nkosazana-daughter":[0,588,98],"zee-nxumalo":[0,686,98],"kharishma":[0,784,98],"babalwa-m":[0,882,98],"dj-stokie":[0,0,196],"daliwonga":[0,882,0],"toss":[0,882,0],"leemckrazy":[0,882,0],"titom":[0,882,0],"sam-deep":[0,882,0],"sha-sha":[0,882,0],"dbn-gogo":[0,882,0],"boohle":[0,98,196],"mas-musiq":[0,882,0],"2point1":[0,882,0],"bassie":[0,882,0],"zj90":[0,196,196],"rixelton":[0,294,196],"dj-buhle":[0,882,0]}},"creative-arts":{"sheets":[{"src":"assets/atlas/creative-arts-0.webp?v=8ab08b3419","width":292,"height":96}],"artists":{"vanz":[0,0,0],"dripmaker":[0,98,0],"rich-mnisi":[0,196,0],"thebe-magugu":[0,196,0],"david-tlale":[0,196,0],"trevor-stuurman":[0,196,0],"jurie-matthee":[0,196,0],"babalwa-ndlovu":[0,196,0],"lebo-mokoena":[0,196,0],"inxolo-m":[0,196,0],"zandile-dlamini":[0,196,0],"don-packwood":[0,196,0],"lukhanyo-mdingi":[0,196,0],"clout-cassette":[0,196,0],"soul-clap-studios":[0,196,0],"morgeez-visuals":[0,196,0],"ke-tabz":[0,196,0],"mashbeatz":[0,196,0],"kaizerbeatz":[0,196,0],"gemini-major":[0,196,0],"lunatik":[0,196,0],"zoocci-coke-dope":[0,196,0],"tempo-visuals":[0,196,0]}},"gospel":{"sheets":[{"src":"assets/atlas/gospel-0.webp?v=6e25d81aea","width":292,"height":96}],"artists":{"joyous-celebration":[0,0,0],"benjamin-dube":[0,98,0],"deborah-lukalu":[0,196,0],"dumi-mkokstad":[0,196,0],"lebo-sekgobela":[0,196,0]}},"gqom":{"sheets":[{"src":"assets/atlas/gqom-0.webp?v=07da441b44","width":292,"height":96}],"artists":{"sho-madjozi":[0,0,0],"kamo-mphela":[0,98,0],"dlala-thukzin":[0,196,0],"dj-tira":[0,196,0]}},"hip-hop":{"sheets":[{"src":"assets/atlas/hip-hop-0.webp?v=6d2be42121","width":978,"height":96}],"artists":{"cassper-nyovest":[0,0,0],"nasty-c":[0,98,0],"yung-swiss":[0,196,0],"a-reece":[0,294,0],"die-antwoord":[0,392,0],"emtee":[0,490,0],"ko":[0,588,0],"kwesta":[0,686,0],"nadia-nakai":[0,588,0],"blxckie":[0,784,0],"sol-phenduka":[0,588,0],"yde":[0,882,0]}},"house":{"sheets":[{"src":"assets/atlas/house-0.webp?v=88f81122c7","width":880,"height":96}],"artists":{"black-coffee":[0,0,0],"shimza":[0,98,0],"master-kg":[0,196,0],"prince-kaybee":[0,294,0],"dj-zinhle":[0,392,0],"sun-el-musician":[0,490,0],"caiiro":[0,588,0],"oscar-mbo":[0,686,0],"txc":[0,490,0],"artwork-sounds":[0,784,0],"sir-lsg":[0,490,0]}},"maskandi":{"sheets":[{"src":"assets/atlas/maskandi-0.webp?v=5d84e0315f","width":292,"height":96}],"artists":{"big-zulu":[0,0,0],"usimamane":[0,98,0],"mduduzi-ncube":[0,196,0],"mthandeni-sk":[0,196,0]}},"other":{"sheets":[{"src":"assets/atlas/other-0.webp?v=c82dcb2185","width":194,"height":96}],"artists":{"the-kiffness":[0,0,0],"seether":[0,98,0]}},"xigaza-lekompo":{"sheets":[{"src":"assets/atlas/xigaza-lekompo-0.webp?v=21184ff6f8","width":194,"height":96}],"artists":{"king-monada":[0,0,0],"thomas-chauke":[0,98,0],"penny-penny":[0,98,0],"joe-shirimani":[0,98,0],"benny-mayengani":[0,98,0],"ba-bethe-gashoazen":[0,98,0],"shandesh":[0,98,0],"dj-janisto":[0,98,0],"naqua-sa":[0,98,0],"master-chuza":[0,98,0],"mr-six21-dj-dance":[0,98,0],"janesh":[0,98,0],"shebeshxt":[0,98,0]}}}};
@@ -0,0 +1,61 @@
+// Auto-generated by scripts/lqip.py — ~20px previews of the showcase images
+// SHOWCASE_PREVIEWS[image] = data URI
+var SHOWCASE_PREVIEWS = {
+"assets/images/artists/P9-Kabza-de-Small.webp":"data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAADQAwCdASoUAA0APu1iqU2ppaOiMAgBMB2JZgCdMvIC7CIbQilbNIAA/uZIIDAacIdWFR06m6ZMyjJNfC9D7kqQ3PRvaznmyfFUXloFep9mpDp1w1v9gFxQdOOp22wYE3XHPZSVcerLg5dMqry6SdNBm0jg44mIqeMHL1adIARVx7A/ij4i1VAA",
+"assets/images/artists/ZJ90.jpg":"data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAABQBACdASoUAA0APu1iqU2ppaOiMAgBMB2JbACdIHGJ/gMlBegnOlATfPfgAPzXYkxQlPQ2SxruJeLbk/k72bQHVLmU6TWcJxb4Arc011OhBwctfjpBbJrKxIiRuYjXmErMpIhspboCO/l/P42diaZo6IERG8Jn5CwBcgAAAAA=",
+"assets/images/artists/a-reece.png":"data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAADwAwCdASoPABQAPu1iqU2ppaOiMAgBMB2JZwAAWsWNAggNyLf4i+tMAP2aFNnF7iTZXbw+Hfs5+f3eBnzv04vmvtUpPk+bxbMbHCsN1f6E88TCP9BPV9YvccMojyV2KYiWJRlZJ8n10f5u1eIUQIxzh7SOqY+LQ2T21ECWPoXQAAAA",
+"assets/images/artists/antwoord.png":"data:image/webp;base64,UklGRq4AAABXRUJQVlA4IKIAAAAwBACdASoUAA0APu1iqU2ppaOiMAgBMB2JbACdMoRwABmP/bM1p3vRB4AA/uv49FMefpMSYSaXje7FTPeSg0A2FijOjD5Ssuigm6BVTD6H/HWFpTVNDk+d6zv+ujJMaargGyW8Ky+io1gguOLZXyXchGIu5gGw3i3YNaPsnlaMqgMsxiAew4PZ4c0Ev/1Bjcy4BbffcPNPgXI/sO4whgnhpAA=",
+"assets/images/artists/artists.png":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAwCdASoLABQAPu1iqU2ppaOiMAgBMB2JZQCdB2gAPKnJAbGfUZ9gAP7p91IF/HXzXD+GuQeJW/jE4DjSnEadxoHJ15UoVatFeOaIw+YxVeIdyl2FSI9M4nvmcIZ+Uz+AAA==",
+"assets/images/artists/artwork-sounds.jpg":"data:image/webp;base64,UklGRpwAAABXRUJQVlA4IJAAAABQBACdASoUAA8APu1iqU2ppaOiMAgBMB2JYgC+Z8GJ/gPeC/C/Ahe038mgAP7ka0+fNJQBSBD59uamS29s47AEIJbwAnJ4BHvVwcmdRTkD+P8XX2g3Etz+VDwF/s3IcJ9+G/FyrJp11Wli37VZ5xRp8tmN3nsd6JsCzYFZ/BBju1GGOfJDWamvVKsCmOb1gAA=",
+"assets/images/artists/aymos.png":"data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABwBACdASoTABQAPu1mqk8ppa0iKA1RoB2JZwAAJcVwd2JUtrctCZtq1f0++AD+6PBfSKOqdknFCVQ9oLoGzbHjBAiiYzHnlpx6Zq2bQVhCdq18oIXPzK9mPgxIAA==",
+"assets/images/artists/babalwa.png":"data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAACQBACdASoUABQAPu1srVEppaQiqAqpMB2JQBajW0g1QoQTSPz9wCH2SUhF4IAA/tkTtaPXP1XA/b3N2R3oInxCCsLXlPnCKTeqj/+v2SiaLVifFheXGpT9PyHEyAw5+ZHv9/vt3RPvmQ4xCw7myXBzA30pOpRUHWyV1AAA",
+"assets/images/artists/benjamin-dube.jpg":"data:image/webp;base64,UklGRqoAAABXRUJQVlA4IJ4AAAAwBQCdASoUABQAPu1urlKppiQiqAgBMB2JZQDDkQSgowiztCq7Xl0mCM7tJI4s+uk8AAD+84GfChiB57Tebfsv+76Dbt9lF4s+vOd7LnrLqwVE6oIGJESSUmTkeI/0JBD5AbcR2r/iRuB1hHgCOvtM5BpnDwdrnWVioSaILdVWWiSf2RRGhii5NFu/BRX0zk4T+zYrUSl+/IKYS6AAAA==",
+"assets/images/artists/bigzulu.png":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAABwAwCdASoUAAsAPu1iqk4ppaQiMAgBMB2JagDG9CHwz42ATIAA/vKpGYLg2cMwo3d6QS3KMWpZcKk7SdxU1FgJoOVJSzmdpB2Tyq9ZS9BxgAAA",
+"assets/images/artists/blaq.png":"data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAADQAwCdASoUAAwAPu1iqU2ppaOiMAgBMB2JbACxGwABFasbmdGhY3oA9VlOGhH/gO82BU6n/4JxWjRK4y4tfToHc/OqPRaQX2gvoH9z3Da1T/tagRf6uHvW6Vk7Zb8ZkP1WP/Shq88XEibNcKKfu09PD9bjzr3AAAA=",
+"assets/images/artists/boohle.png":"data:image/webp;base64,UklGRsQAAABXRUJQVlA4ILgAAAAQBQCdASoTABQAPu1sqlEppaOiqAqpMB2JbACdL9VAYBysSDQ6kEg1EoPDW3RrjWIAAP7en3nVZB17zjO9UPqRNOjk6xr3G0J8QGwvGMFpzQ2L2IQMjWH6XYOLOLBs/QA+UhSp/+MIG5un37z7DW70XTN0GU7r3LxLYJ9vE8rFivIGdk+xjLsT433/Yb+5FceAjb2LS/+KYRZTAWZ6GtZ14CzPQszLqGJYPHG3vTs8urHL+vfiAAAA",
+"assets/images/artists/busta.png":"data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAADwBACdASoRABQAPu1iq1AppSOisBgIATAdiWMAwzQPPwSKrpS5KFqJhlV9L2KuCOAA/p7Dev38Nub6hWzXVCgxnrSoZpV5M+haO0GGawg4rYWeSpYMxDNtsTbpmzjj6nTQ6eUHciMF/FiI+s2VhGysqoNbAAAA",
+"assets/images/artists/caiiro.png":"data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABwBACdASoUABQAPu1ur1IppiQnqAgBMB2JZQC06AxYo1ntNFsztV4+nBnqAAD+nvwvdF1P6R70fRzyIUAuoM6TAqE45lzrk63XYYXpiBuPA2p2KQT4PnoHtXxlh+JFlEUfGoAA",
+"assets/images/artists/cassper.png":"data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAAAQBQCdASoUABQAPu1usFIppiSiqAgBMB2JZwCo9YwcUg6LH2kPIj9SffYgZKhLrIuAAP7vxr2BFkqMrhFCdTCsMt16r9BRAJ2rf4v0l/6FXECn9VPl/mASlNK6WYUORV7ldoBqH3ith6Eple/yBiwmkWl1O0G6SDcQzSQujMtDKXBHIcZ/qGOkl5my8Bk+IipOiAwtgAA=",
+"assets/images/artists/coffee.png":"data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAwAwCdASoUABQAPu1mrE+ppSQiMBgIATAdiWkAz2QWqO3AAP7vBP99IxfshdjSlYmlBsXapQAVa7ifTnVfgTkfhFqAKBMSxKDyNojg/gHyxQoJCV7RYAAA",
+"assets/images/artists/dripmaker.png":"data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAAAQBACdASoNABQAPu1iqU2ppaOiMAgBMB2JbACdL1yByTxOVCo4Lr81MADK8Yy36bme1ao2kq6SfibYskiPo+jAaQlUYDhX1zqZpRo8MiUefl2FDm24TJNmg1qAoDju1osFd7Yzwzv3CwPi/0TXamQR5ZijT7/zPKlnrMeJ6rXUnn64AAA=",
+"assets/images/artists/empress-ngqama.jpg":"data:image/webp;base64,UklGRsAAAABXRUJQVlA4ILQAAADQBACdASoQABQAPu1iqU2ppaOiMAgBMB2JbACdMoMYHYAby4BZQvt0JDUCUCLYAAD+72Hf0RIkBJshpPyczWtnG0nCqF+Ptgi+hCohwEfFyF5K9IrJWrJKuqkV5/J6IZSbNHdI1G3Na6FyGdfU9yT9vlI7ZIKBiwFjbD8YZQiCbAIjvhAT/CD9f+yTMk44mtrKEip+e4fh1HK5uXHT8VwHNf/M//vgJXCjM9Ct9vx7/E8AAAA=",
+"assets/images/artists/emtee.webp":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAwCdASoUAA4APu1iqU2ppaOiMAgBMB2JaQAAWmGEKjS+vcp+AAAA/vQlNi28ZUyXFzSKHnHF6ClpkM5diOWk0V4Yqj/0c7pOtyUFj548K8uuPm/gWRp2NVA1KJAAAAA=",
+"assets/images/artists/felo-le-tee.png":"data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAADQAwCdASoUABAAPu1iqU2ppaOiMAgBMB2JQAAIXAd50KtAHRcTjdAA/sN19lTYzIP6qpQXY+tLspGygyURggbWf8ersx3kBZmbTl0eJhyVZFDCwKpccof++iSMun74X45f6VwEv+8MtetrXuKv7f9VpcRvGMAA",
+"assets/images/artists/focalistic.png":"data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAAAQBACdASoUAAsAPu1iqU2ppaOiMAgBMB2JZwC06CB2XkPNvshNeV/HgAD+r2TS6rMq+UK7xo/Dj7AvF4v/YSOgdcxT82Qj3TWkMWQH7IK4xPpZmh2YpiKKjGUR5p3iYwxuy0jHAAA=",
+"assets/images/artists/game.png":"data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAABQBACdASoUAAsAPu1iqU2ppaOiMAgBMB2JYgC7AB6ycKl1J61olpxx6FjAAP7u7vam7JwbrGPW/hYnWmIXZh2YFk6E4zqCFrFtnINRQa7mfvLRzcHCHMmyACEx4mAmxPOTig5yMILLnCWDzsUIc/cOK8Mp1Pnyx7mcQkfpoYPoEQi4oAA=",
+"assets/images/artists/icu.png":"data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADwAwCdASoUABQAPu1ur1IppiQjqAgBMB2JaQAALkJn0E6anvLeXXaAAP70I7zzftkOwrBROtUWr8a/ARFIYAAA",
+"assets/images/artists/jazziq.png":"data:image/webp;base64,UklGRqwAAABXRUJQVlA4IKAAAADQBACdASoUABQAPu1srVIppaQiqAgBMB2JaAC2yBDQuknfWNzg4EKWMZzq2VVnaAD+8qQyv4X2LF8upPQZPMTH6MSRZJX/rQaA9DSmqTleU/8WX6zqDVWgD5OGY7It4nnL8oljEdPKdDZHmo5lVEY4G3lvrHMbH148xkc0YJINxLtQfD6mphdYJXFi0ER5jWfjyoCbsaaIdKQt6nvgwAAA",
+"assets/images/artists/joyous.png":"data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAABQBACdASoUAA0APu1iqU2ppaOiMAgBMB2JbACdMoR4OsB9qwFmBooE/qGwAP7ByK1ikxd5scoc0LcKz5KZLzx3YUmT4G19nU0M6l0/ogmKGHKyiKvs9q/XfzvXKhB742OX6eUgL4HvTnl4CWRqeaSnJEBUKQBDbDg8kwL42MAMvaGx6i3Gf58CAAA=",
+"assets/images/artists/kamo.png":"data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAACQBACdASoUABQAPu1qr1AppaSiqAqpMB2JZQBWOVvrnfefAT6BY79Wxnh9YAAA/vADpqvUrW92S0tyV+HVJEgsfHSg8MNJvIxHTC8JefwzUcpw9rLmTEnhB0zDWWUGBlqbESmhIkwAtildLUGmqh4zwjylqd5oF0/HTucnXirwUMAA",
+"assets/images/artists/kelvin-momo.png":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQBACdASoUAAwAPu1iqU2ppaOiMAgBMB2JZgCdMoADQxohvC0t9xyCAAD+7pPM1QQHL0oct8Jv5YXRj+/+EpqhJe1/TUKFKiY5d8ar1Tfmxfx9+qmUIPBw/Zp0qC9fEMAAAA==",
+"assets/images/artists/kg.png":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQBACdASoUAAwAPu1iqU2ppaOiMAgBMB2JZgCdMoADQMZJVBDWAM7QAAD+Uv6snYwkSOIEl57o1N/7DI5YY6CXQgAJvdRsacVVFvOq5M188+2nN6E4gr9XmVUiu8OasnkQAA==",
+"assets/images/artists/kharishma.png":"data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAADwAwCdASoUAA4APu1iqU2ppaOiMAgBMB2JbAAAXqjd+26C74HAj+pAAP7evyzl2d/ioH82qk5CizDbVQbAh94ZZTf2Kn9Uvj7BUjJXZUsiDKrldQrDSOO96/caXWEyYvvBScUn1xjGqP3deEcozAqoDcQQSRNP8DVaiPuucqgZ47Wn9f2NuBA0pJfG0ogA",
+"assets/images/artists/kiffness.png":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAwBACdASoUAA0APu1iqk2ppaQiMAgBMB2JQBdgBD1qBo4+UU74twj66gAA/up1aQ26M+d8m+uxWnJK75x6NKEvhgI2fKFCa/AgZcgYDhkVx5+L0V3cSom2olA8Mt4sdSY28ZEOpAAAAA==",
+"assets/images/artists/kwesta.png":"data:image/webp;base64,UklGRq4AAABXRUJQVlA4IKIAAABQBQCdASoUABQAPu1wsFIppiSiqAgBMB2JagCdMswBq6oTvqwFo5F0clupIIgreZeFkYwA/stZQhRc2vfKR/0c+FeaTU1UgMnGHwI9BfTXzDewh4XNCwLNvQapb3hTqj2smoo6Z9//W17ZbYG3imskxCr9HqwNG2brLj91r//LC5x8zuoUa4T7y5q9MMNyXxxv+5kK+emvkBICmAWEfbIuAAA=",
+"assets/images/artists/lloyiso.png":"data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAADQAwCdASoNABQAPu1iqU2ppaOiMAgBMB2JZQDCgBjdRxganj9VDQAA/uqQ/jpLBMYw6dSuZ/d5PpL9VjHJEZoZk3InKqHwpFXuR07gD6yB9cQfp855u3VyOLJXidh0Pj9O70H2Qxf35hxvDAPCem6+JbIAAA==",
+"assets/images/artists/makhadzi.png":"data:image/webp;base64,UklGRrgAAABXRUJQVlA4IKwAAAAQBQCdASoUABQAPu1urlIppiQiqAgBMB2JYgDH5A44oOwtySIXsk+rbghlldt7D+OwAPynQy9sO2c79PD1Bs+ct4kiYZiyEBI529cRMs8MskBqy/9J0lbdVPO53OpHarhha/JJSbeH+ApQ3RdLQ8QA9MHElSf3TTah3RJtQZXF83urpi8ZUu8tLU47U3egfJhEZEmF78bh8udPWssF8prOsK50j3ipDYfLf4AA",
+"assets/images/artists/maphorisa.png":"data:image/webp;base64,UklGRsYAAABXRUJQVlA4ILoAAAAQBQCdASoNABQAPu1iqU2ppaOiMAgBMB2JbACdMoMYPYDeQCntF+/ZbTu9x/daKKGwAP7Yyjq7+FGaMGXMhWJeE8cWS1qm/bsRTyMHO7Dcc8vS1cdomlkxWh8LfUefiALIN5z6NCmaJ02896gMX/RzFOc5vtJdamUc2fmttXi2IP93ZziQHvS8zh3EvxMDg6RABVFIdGogpLL5Py6/ikwnj+Cx2rmNxlb/BqqFdd/kuMfmLKXd/I76WAA=",
+"assets/images/artists/mawhoo.png":"data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAADQAwCdASoUAA4APu1iqU2ppaOiMAgBMB2JYgC7H8ABpXV8QZm+7+gA/FEJhPG5/aKG1C4RmSxiKLv6KyRotFzU79WPVG5Vds+tDslDyVQrUoyoxJHCvtTBi/SzN65TR8jOCQQI9ybHWQAA",
+"assets/images/artists/mbo.png":"data:image/webp;base64,UklGRs4AAABXRUJQVlA4IMIAAABwBQCdASoUABQAPu1usFIppiSiqAgBMB2JbACdIOdaAD0kjNlDnKPcKQRPc2ZVYr2PwAOAAP5l7fwdSKdnAcNLadl5xs/ry3ngKeK5nhFSKkHNLnipvniVATIAFZStkcs1GdmYyJ1YlfX8tgnIcvbgjDsQlCMxhP5dL757R0JtGeWglMnQS3z9gZn0ivjsVgwTlmWaphWYFX2/GtQpCCYhsby+dM//eIZZtEm2zurB71HB0traFMM54vSQaTx/wVAAAA==",
+"assets/images/artists/mellows.png":"data:image/webp;base64,UklGRqAAAABXRUJQVlA4IJQAAACQBACdASoRABQAPu1mqk8ppaOiKA1RMB2JagDE2BEc8aRmNLGwWrr39inUNQAA/vQgVN441rhr7MUaiFiFquc8OA9oJ9BQw0YVx5JB6KetNYq9WnbnFfVMsxcwmt7PnoaEzlf/jKFmvll2/ByneJe8nxhWFha/hdoc6DsRKUW6cJW2UQFv+Ysr5n/dq0y8ncsAAAAA",
+"assets/images/artists/nastyc.png":"data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAQBACdASoUAAsAPu1iqU2ppaOiMAgBMB2JYwDCgYu4pL4HNrWlgOOiAAD+3uAbGwuGUmviuX2ane3d4wR05TYC0E4BNKx/VFQ0kE2HBiEMLy4KM9GICXbnAxl5erx7HxwYsL3RYcZ064FykIJMoAAA",
+"assets/images/artists/nkosazanadaughter.png":"data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABQBACdASoUAAwAPu1iqU2ppaQiMAgBMB2JQBOmUGXSiT9rFiD3QVnRrJyAAP6x2CDev81CxAP3nnkbpqbw82RoyQZBGhASFXDjd2NA+XT2dNOpERmlBqiSqIBxXP89VK0f77pjHcNUnjyva8mT38TfmfJRtd7uIVfAAA==",
+"assets/images/artists/oxii-moron.jpg":"data:image/webp;base64,UklGRrgAAABXRUJQVlA4IKwAAAAwBQCdASoUABQAPu1wsVIppiSiqAgBMB2JQBdgMXcO9wxyCocgDZ6si6yhdE55BnVUAAD+xWEx9X4IF+3tzHeHRxsMOxEscvZKlE2qdBPyhh8ekhO0qx0ofyHQo0793kMcsPu8tuzPSfjs2FMvZEZJVrxoXYoBPhDEnARXrYXHUC7aw2DiH065/AEcoyKIgLF9mlRi4hVXfFHVWUrGpI4CIA0Tzl9RNZ1TAAAA",
+"assets/images/artists/pabicooper.png":"data:image/webp;base64,UklGRp4AAABXRUJQVlA4IJIAAACQBACdASoPABQAPu1iqU2ppaOiMAgBMB2JagBTBA0e6AATMVQVlKdFMK9qygAA/tqRZZ9MJ+35+RIBA0Jvbohjub0wL9I2ljOGjH7rx3lP1fVqm4DIOHj7NlnrSE/+DpbCXYNzhTJSn16kTtv9Fv+c54Sxh4hqaOUcNP/un62pmtbw40L+/cemLKTS3pChlWEAAA==",
+"assets/images/artists/rixelton.jpg":"data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAADwBACdASoPABQAPu1iqU2ppaOiMAgBMB2JbACdMoRwG//0ZKBOt1XZTgBVnbqsdQAA/rNg6xk+3TkPjPnmdKvLh6Ayhufc2yP2whxRT0SkH9d2pHthPkpPL/HCX7oOWQa3ndHYQarEb7uYlj2l5MLliNYvLuyin/Dfugr+9rgu0k8yzjgu0kCAAAA=",
+"assets/images/artists/scotts.png":"data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAABwAwCdASoUAA0APu1iqU2ppaQiMAgBMB2JQBdgBEHRKGR+PnAA/q6j27NVTixl9uWGhLgyL6kAKqrJZ9v4VlekCO4jDIdWk0eUE/UjYAA=",
+"assets/images/artists/seether.png":"data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAQBACdASoUAA4APu1iqU2ppaOiMAgBMB2JYwCsABh2r05hu0He4rWoAAD+7L6Ne8WlWI1CkLSd1CzHn7WZ78xEI1H16mujXUZZxczobay+13MAfer25E2dR+wzeET//gc0umO2852L8QAA",
+"assets/images/artists/shimza.jpg":"data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAACwAwCdASoUAA4APu1iqU2ppaOiMAgBMB2JaQAASor/FYnjN6ZZ/AD2vDPLQcvYCVO9/eb+ewRdthiez7jOf9w34RvSafKKn8dmd+fkPSFztRdsI+zT0c7s3aw7HxKJZsrzV3VYrfKXZoc35Cvnp6BQzRYyaxXx4AA=",
+"assets/images/artists/sho.png":"data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAAAwBACdASoUAA0APu1iqU2ppaOiMAgBMB2JYgC21iAAH4BZ5j35KH2+wAAA/uv/T4UC5JA28UDsOvubLfAGyv19Ovgu1JvDIhfJVNQ0OUbkVXROi4amvLlRy4g2UewV4doPAiwKyzony9W74f7ZB6oD5E/0hpXgNwDEdTuma92oY1qAAAA=",
+"assets/images/artists/sjava.png":"data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAADQBACdASoRABQAPu1qr1CppaSiqAqpMB2JYwCxHvIBtMrrosM8U6wJpLR9PXEaAAD+kCDiyd7AgGrVyW9ZfaZIo9i2Qo6YsE0kpGtL8USkPelc5oKJarjk65OcmxnqZc8/2PGKnzfYPpZ7pqQlqrT92pNXUxx8OX2gNbeWjhTyBNzeAAA=",
+"assets/images/artists/stokie.png":"data:image/webp;base64,UklGRrYAAABXRUJQVlA4IKoAAADQBACdASoRABQAPu1ur1IppiQiqAgBMB2JbACxHuGPMAOkYoyBxq2FZQPJTtCStgD9dXEkQ2BmxV28vLKT6uwJbJxd4Mu2w+V8sOHjZba12VcfCVW1i/4u3CfG5OMVHlpMqtiff2F6lggZrFXsvm51fjtpQ7z8msp9j+dZmL5ENQsflPRy/9v71HEzc8xSbLapLBR4Q6uqFhfZPhHkXWYNXKvDBIpqlPggAA==",
+"assets/images/artists/tyla.jpg":"data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAAAwBACdASoUAA0APu1iqU2ppaOiMAgBMB2JbACdACHrXg1eX8vk27d7GAAA/twrxVaU3/G/j2qfmHIC/1UeBru3QMUHkt5ZOkHyIzGSshyCCfnreOHGVem1XlQXoa3cM2di9dw+DMLtrHl5+Z/QP2R1oDw8+riaPAAAAA==",
+"assets/images/artists/usimamane.png":"data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAABwBACdASoNABQAPu1iqU2ppaOiMAgBMB2JbACdMoMYAEQO2lC1D1TR35Y7/gD+04PmpppCp0g+Vtjhsuji2IeB3fLRcFmOmJ9GMwvW8R6xW3CyAKqeFros/VrQAbNHW+/cZUq64HfyOPIccI0l/Kp9ZN+4X5yZl1e/xkDcpQolYkGK/NGAQAAA",
+"assets/images/artists/vanz.jpg":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAACwAwCdASoJABQAPu1iqU2ppaQiMAgBMB2JYgC7ABuleCJL95uboAD+8N73kco+B9oR6H227LKM56pBbtVJwSurBUP8qZUnRKvOGc0EXoAAAA==",
+"assets/images/artists/vigro.png":"data:image/webp;base64,UklGRqoAAABXRUJQVlA4IJ4AAAAwBQCdASoUABQAPu1ur1IppiQiqAgBMB2JYwCxBaYAL+uGx71qn4jtLRoJoIvQrxACwAD+01PPK7nzmtebIo+5F6bjrL4Kva6Z6qrpFlKHul9XstdthcgQBXO9Qx+gkvoC/yQZ8Y3pmSMNkC7utwWTUI+Dvt+t1GzOZxvWXPbV4fomHhop+i5q2Hut/tLAm7hXg85PD6MH31TtJjmAAA==",
+"assets/images/artists/waffles.png":"data:image/webp;base64,UklGRpwAAABXRUJQVlA4IJAAAADQBACdASoUABQAPu1cqU6ppKOiMBgMATAdiWMAwzQPk8jlOBNhyNxvI0SROHLDoAD+8rSWEJpam58omhBBrxPJDhKgwtjkyT9asx8KlyN6Xs/lgNNVfr/l+Yaz0uae4jVXmzhLTzqSdlo0RgaegLBFBDfrQwgZz93r92vANnvcBibAgKyPE34CW2Fr80dewAA=",
+"assets/images/artists/yde.png":"data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAADQAwCdASoLABQAPu1iqU2ppaOiMAgBMB2JagC7ACFoFZusKdZD6MAAzIj/Flxl9X5WFwETHKqhfMZgxh3qcEGfZsUn/YlqBYBcsn8OqRVmM3lXiPjDIVITpgfvAruP45wm27t4QUgi70digsIlrHcuK8nmbczEpEVXVQAA",
+"assets/images/artists/yung-swiss.jpg":"data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAACwBACdASoUABQAPu1mqk8ppaOiKA1RMB2JZAC2+4CBpYmU3NfUsWpxVl+0v8PAAP7wyWgyA7pqetAx2wBOe2pn9q1EaG1Q5b5x+YKTcy3oj959f9l+ysy6zL4vu3xf1K/UdKtHK4uBoX+R2K8ucHcw3KjDiCDy1WLTDBmLGzSdXIC4OQKGPA8Dcd+rkAAA",
+"assets/images/artists/zee.png":"data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAABQBACdASoUABQAPu1qrlCppaQiqAqpMB2JZgCdMtpBqf0nWi7k2wsQDbQAAP6KwdN1uAyGLYiyDzArQx+shGWSPiFmy+oG9Aq1ZroJ2LBZ4CIBISrvihYe3+zDr1y9pxUtPzj8Kc+3y+yvRrcn41E5Pj0ZVgfDbi2LGp06q/a4Rcfl+jecpw5ZsAA=",
+"assets/images/artists/zinhle_dj.png":"data:image/webp;base64,UklGRr4AAABXRUJQVlA4ILIAAAAwBQCdASoUABQAPu1ur1KppiQiqAgBMB2JYgC/OYxsUtkwgjvO20MgM/JP6Ndg19tlgAD+6pdyCbL7AJYKviA4V0YXZN9QKr3QQP6L291pM1P7O8CQ6o9BlhphaCUh6ZmJr2roMtyPnjYq3pkZepE+eBK0gqseuHD/Y0OVHHk8bwBpgx/tEe0530TlP76sigcL11x+HVZcOfwENMYRRp0Y6fitrzeHCVJkoGybgd1AAAAA"
+};